@@ -0,0 +1,5 @@
+"""
+Performance benchmarks.
+
+Each module can be run directly with ``python -m benchmarks.<module>``.
+"""
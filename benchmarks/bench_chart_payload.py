@@ -0,0 +1,160 @@
+"""
+Benchmark the size of the forecast comparison chart payload.
+
+Builds the chart for 10 forecast versions over 10 years of monthly history
+(with confidence intervals) and reports the serialized JSON size and build
+time for each rendering option.
+
+Usage:
+    python -m benchmarks.bench_chart_payload
+    python -m benchmarks.bench_chart_payload --versions 20 --years 15 --output payload.json
+"""
+
+import argparse
+import json
+import time
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+import plotly.io as pio
+
+from src.visualization.components.time_series_chart import create_forecast_comparison_chart
+
+
+# Chart options compared by the benchmark
+CONFIGURATIONS = {
+    'default': dict(use_webgl=False, compact_payload=False),
+    'webgl': dict(use_webgl=True, compact_payload=False),
+    'compact': dict(use_webgl=False, compact_payload=True),
+    'webgl+compact': dict(use_webgl=True, compact_payload=True),
+}
+
+
+def make_chart_inputs(
+    n_versions: int = 10,
+    n_years: int = 10,
+    forecast_horizon: int = 12,
+    seed: int = 0
+) -> Dict:
+    """
+    Generate deterministic chart inputs.
+    
+    Parameters
+    ----------
+    n_versions : int, default=10
+        Number of forecast versions (each with a confidence interval).
+    n_years : int, default=10
+        Years of monthly history, the last one being the test period.
+    forecast_horizon : int, default=12
+        Number of test/forecast months.
+    seed : int, default=0
+        Random seed.
+    
+    Returns
+    -------
+    Dict
+        Keyword arguments for create_forecast_comparison_chart.
+    """
+    rng = np.random.default_rng(seed)
+    n_months = n_years * 12
+    dates = pd.date_range('2010-01-01', periods=n_months, freq='MS')
+    values = 10000 + np.cumsum(rng.normal(0, 500, n_months))
+    
+    train_series = pd.Series(values[:-forecast_horizon], index=dates[:-forecast_horizon])
+    test_series = pd.Series(values[-forecast_horizon:], index=dates[-forecast_horizon:])
+    
+    forecasts, lower, upper = {}, {}, {}
+    for i in range(n_versions):
+        name = f"Version-{i + 1}"
+        median = test_series.values + rng.normal(0, 800, forecast_horizon)
+        forecasts[name] = pd.Series(median, index=test_series.index)
+        lower[name] = pd.Series(median - 1000, index=test_series.index)
+        upper[name] = pd.Series(median + 1000, index=test_series.index)
+    
+    return dict(
+        train_series=train_series,
+        test_series=test_series,
+        forecast_series_dict=forecasts,
+        title="Payload benchmark",
+        forecast_lower_dict=lower,
+        forecast_upper_dict=upper,
+    )
+
+
+def run_benchmark(n_versions: int = 10, n_years: int = 10, repeats: int = 5) -> List[Dict]:
+    """
+    Measure payload size and build time for each chart configuration.
+    
+    Parameters
+    ----------
+    n_versions : int, default=10
+        Number of forecast versions.
+    n_years : int, default=10
+        Years of monthly history.
+    repeats : int, default=5
+        Number of builds per configuration (the best time is kept).
+    
+    Returns
+    -------
+    List[Dict]
+        One result per configuration with 'configuration', 'payload_bytes',
+        'n_traces' and 'build_seconds'.
+    """
+    inputs = make_chart_inputs(n_versions=n_versions, n_years=n_years)
+    results = []
+    
+    for name, options in CONFIGURATIONS.items():
+        timings = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            fig = create_forecast_comparison_chart(**inputs, **options)
+            payload = pio.to_json(fig)
+            timings.append(time.perf_counter() - start)
+        
+        results.append({
+            'configuration': name,
+            'payload_bytes': len(payload.encode('utf-8')),
+            'n_traces': len(fig.data),
+            'build_seconds': min(timings),
+        })
+    
+    return results
+
+
+def main():
+    """Run the benchmark and print a summary."""
+    parser = argparse.ArgumentParser(description="Benchmark forecast chart payload size")
+    parser.add_argument('--versions', type=int, default=10, help='Number of forecast versions (default: 10)')
+    parser.add_argument('--years', type=int, default=10, help='Years of monthly history (default: 10)')
+    parser.add_argument('--repeats', type=int, default=5, help='Builds per configuration (default: 5)')
+    parser.add_argument('--output', type=str, default=None, help='Optional JSON file for the results')
+    args = parser.parse_args()
+    
+    results = run_benchmark(n_versions=args.versions, n_years=args.years, repeats=args.repeats)
+    baseline = results[0]['payload_bytes']
+    
+    print(f"Chart payload: {args.versions} versions x {args.years} years")
+    print(f"{'configuration':<16}{'bytes':>12}{'ratio':>8}{'traces':>8}{'build ms':>10}")
+    for result in results:
+        print(
+            f"{result['configuration']:<16}"
+            f"{result['payload_bytes']:>12,}"
+            f"{result['payload_bytes'] / baseline:>8.2f}"
+            f"{result['n_traces']:>8}"
+            f"{result['build_seconds'] * 1000:>10.1f}"
+        )
+    
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({
+                'benchmark': 'chart_payload',
+                'versions': args.versions,
+                'years': args.years,
+                'results': results,
+            }, f, indent=2)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,165 @@
+"""
+Benchmark concurrent client-mode forecasting against the local stand-in server.
+
+Forecasts the same set of companies with an increasing number of requests in
+flight and reports throughput, retries and server rejections, without network
+access.
+
+Usage:
+    python -m benchmarks.bench_client_concurrency
+    python -m benchmarks.bench_client_concurrency --companies 40 --latency 0.5 --in-flight 1 4 8 16
+    python -m benchmarks.bench_client_concurrency --max-concurrency 6 --requests-per-second 10
+"""
+
+import argparse
+import json
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.stand_in_server import StandInPredictServer
+from src.forecasting.concurrent_client import ConcurrentForecastClient, RetryPolicy
+from src.forecasting.tabpfn_forecaster import TabPFNForecaster
+
+
+def make_company_frames(n_companies: int = 20, n_accounts: int = 30, n_months: int = 48, seed: int = 0) -> List[pd.DataFrame]:
+    """
+    Generate deterministic wide-format inputs, one per company.
+
+    Parameters
+    ----------
+    n_companies : int, default=20
+        Number of companies.
+    n_accounts : int, default=30
+        Accounts per company.
+    n_months : int, default=48
+        Months of history.
+    seed : int, default=0
+        Random seed.
+
+    Returns
+    -------
+    List[pd.DataFrame]
+        Wide-format DataFrames (ds index × account columns).
+    """
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range('2021-01-01', periods=n_months, freq='MS', name='ds')
+    accounts = [f"{600000 + i * 10}" for i in range(n_accounts)]
+    return [
+        pd.DataFrame(rng.gamma(2.0, 1000.0, size=(n_months, n_accounts)), index=dates, columns=accounts)
+        for _ in range(n_companies)
+    ]
+
+
+def run_benchmark(
+    frames: List[pd.DataFrame],
+    in_flight_values: List[int],
+    latency: float = 0.2,
+    latency_per_item: float = 0.0,
+    max_concurrency: Optional[int] = None,
+    failure_rate: float = 0.0,
+    requests_per_second: Optional[float] = None,
+    prediction_length: int = 12
+) -> List[Dict]:
+    """
+    Forecast all frames once per max_in_flight value.
+
+    Parameters
+    ----------
+    frames : List[pd.DataFrame]
+        Company inputs.
+    in_flight_values : List[int]
+        max_in_flight settings to compare.
+    latency, latency_per_item, max_concurrency, failure_rate
+        Stand-in server settings (see StandInPredictServer).
+    requests_per_second : Optional[float], default=None
+        Client-side rate limit.
+    prediction_length : int, default=12
+        Forecast horizon.
+
+    Returns
+    -------
+    List[Dict]
+        One result per setting with wall time, throughput, client counters
+        and server rejections.
+    """
+    results = []
+    for max_in_flight in in_flight_values:
+        server = StandInPredictServer(
+            latency=latency,
+            latency_per_item=latency_per_item,
+            max_concurrency=max_concurrency,
+            failure_rate=failure_rate
+        )
+        client = ConcurrentForecastClient(
+            TabPFNForecaster(mode='client', pipeline=server),
+            max_in_flight=max_in_flight,
+            requests_per_second=requests_per_second,
+            retry_policy=RetryPolicy(max_attempts=5, initial_backoff=latency / 2)
+        )
+
+        start = time.perf_counter()
+        with client:
+            futures = [client.submit(data_wide=frame, prediction_length=prediction_length) for frame in frames]
+            succeeded = sum(1 for future in futures if future.exception() is None)
+        wall = time.perf_counter() - start
+
+        results.append({
+            'max_in_flight': max_in_flight,
+            'companies': len(frames),
+            'succeeded': succeeded,
+            'wall_seconds': wall,
+            'companies_per_second': len(frames) / wall,
+            'server_rejections': server.rejected,
+            'server_peak_concurrency': server.peak_concurrency,
+            **client.stats.to_dict(),
+        })
+    return results
+
+
+def main():
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description="Benchmark concurrent client-mode forecasting on a local stand-in server")
+    parser.add_argument('--companies', type=int, default=20, help='Number of companies (default: 20)')
+    parser.add_argument('--accounts', type=int, default=30, help='Accounts per company (default: 30)')
+    parser.add_argument('--in-flight', type=int, nargs='+', default=[1, 2, 4, 8], help='max_in_flight values (default: 1 2 4 8)')
+    parser.add_argument('--latency', type=float, default=0.2, help='Server latency per request in seconds (default: 0.2)')
+    parser.add_argument('--latency-per-item', type=float, default=0.0, help='Server latency per series in seconds (default: 0)')
+    parser.add_argument('--max-concurrency', type=int, default=None, help='Server concurrency limit (default: none)')
+    parser.add_argument('--failure-rate', type=float, default=0.0, help='Probability of a transient failure (default: 0)')
+    parser.add_argument('--requests-per-second', type=float, default=None, help='Client rate limit (default: none)')
+    parser.add_argument('--output', default=None, metavar='PATH', help='Write results as JSON')
+    args = parser.parse_args()
+
+    frames = make_company_frames(args.companies, args.accounts)
+    results = run_benchmark(
+        frames,
+        args.in_flight,
+        latency=args.latency,
+        latency_per_item=args.latency_per_item,
+        max_concurrency=args.max_concurrency,
+        failure_rate=args.failure_rate,
+        requests_per_second=args.requests_per_second
+    )
+
+    print(f"{'in flight':>10}{'ok':>6}{'wall s':>9}{'cos/s':>8}{'retries':>9}{'rejected':>10}{'throttled s':>13}")
+    for result in results:
+        print(
+            f"{result['max_in_flight']:>10}"
+            f"{result['succeeded']:>6}"
+            f"{result['wall_seconds']:>9.2f}"
+            f"{result['companies_per_second']:>8.1f}"
+            f"{result['retries']:>9}"
+            f"{result['server_rejections']:>10}"
+            f"{result['throttled_seconds']:>13.1f}"
+        )
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
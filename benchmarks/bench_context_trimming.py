@@ -0,0 +1,203 @@
+"""
+Benchmark the latency/accuracy tradeoff of TabPFN context trimming.
+
+Forecasts the synthetic companies (see synthetic_fec.py) with several context
+settings: the full history, leading NaN months trimmed, and the history capped
+to the last N months. For each setting, reports the context rows sent, the
+forecast time and the aggregate WAPE against the held-out last year.
+
+By default the model is the local stand-in server (a naive mean-of-context
+forecast with a per-row latency), which needs no model weights: its latency
+follows the context size and its accuracy depends on how much history it
+sees, but only a real TabPFN run (--engine) tells the actual accuracy cost.
+
+Usage:
+    python -m benchmarks.bench_context_trimming
+    python -m benchmarks.bench_context_trimming --companies 5 --years 6 --max-months 24 36
+    python -m benchmarks.bench_context_trimming --engine local --companies 2
+"""
+
+import argparse
+import json
+import tempfile
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.stand_in_server import StandInPredictServer
+from benchmarks.synthetic_fec import SyntheticFECConfig, generate_dataset
+from src.data.account_classifier import load_classification_charges
+from src.data.fec_loader import load_fecs
+from src.data.preprocessing import fec_to_monthly_totals, preprocess_data
+from src.forecasting.data_converter import wide_to_tabpfn_format
+from src.forecasting.tabpfn_forecaster import TabPFNForecaster
+
+
+def load_company_inputs(
+    data_folder: str,
+    company_ids: List[str],
+    accounting_up_to_date: pd.Timestamp,
+    forecast_horizon: int = 12
+) -> List[Tuple[pd.DataFrame, pd.DataFrame]]:
+    """
+    Build the forecasting input and the held-out actuals of each company.
+
+    Parameters
+    ----------
+    data_folder : str
+        Root folder of the synthetic companies.
+    company_ids : List[str]
+        Companies to load.
+    accounting_up_to_date : pd.Timestamp
+        Accounting date of the companies.
+    forecast_horizon : int, default=12
+        Number of held-out months.
+
+    Returns
+    -------
+    List[Tuple[pd.DataFrame, pd.DataFrame]]
+        (preprocessed wide-format training data, wide-format actuals of the
+        test period) per company.
+    """
+    classification = load_classification_charges()
+    inputs = []
+    for company_id in company_ids:
+        fecs_train, fecs_test = load_fecs(
+            company_id, data_folder, accounting_up_to_date,
+            train_test_split=True, forecast_horizon=forecast_horizon
+        )
+        data_wide = preprocess_data(
+            fec_to_monthly_totals(fecs_train), accounting_up_to_date, classification
+        ).filtered_data_wide_format
+        actual_df = fec_to_monthly_totals(fecs_test).pivot(
+            index='PieceDate', columns='CompteNum', values='Solde'
+        ).fillna(0)
+        inputs.append((data_wide, actual_df))
+    return inputs
+
+
+def _wape(forecast_df: pd.DataFrame, actual_df: pd.DataFrame) -> Tuple[float, float]:
+    """Return (sum of absolute errors, sum of absolute actuals) over the common accounts."""
+    accounts = forecast_df.columns.intersection(actual_df.columns)
+    forecast = forecast_df[accounts].to_numpy(dtype=float)
+    actual = actual_df[accounts].reindex(forecast_df.index, fill_value=0).to_numpy(dtype=float)
+    return float(np.nansum(np.abs(forecast - actual))), float(np.abs(actual).sum())
+
+
+def run_benchmark(
+    inputs: List[Tuple[pd.DataFrame, pd.DataFrame]],
+    settings: List[Tuple[str, bool, Optional[int]]],
+    make_pipeline,
+    prediction_length: int = 12
+) -> List[Dict]:
+    """
+    Forecast every company once per context setting.
+
+    Parameters
+    ----------
+    inputs : List[Tuple[pd.DataFrame, pd.DataFrame]]
+        Output of load_company_inputs.
+    settings : List[Tuple[str, bool, Optional[int]]]
+        (label, trim_leading_nan, max_context_months) to compare.
+    make_pipeline : Callable[[], object]
+        Returns the pipeline passed to TabPFNForecaster (None builds TabPFN).
+    prediction_length : int, default=12
+        Forecast horizon.
+
+    Returns
+    -------
+    List[Dict]
+        One result per setting with the context rows, the forecast time and
+        the aggregate WAPE (%).
+    """
+    results = []
+    for label, trim_leading_nan, max_context_months in settings:
+        forecaster = TabPFNForecaster(
+            mode='local',
+            pipeline=make_pipeline(),
+            max_rows_per_call=None,
+            trim_leading_nan=trim_leading_nan,
+            max_context_months=max_context_months
+        )
+
+        rows = 0
+        errors = 0.0
+        total = 0.0
+        start = time.perf_counter()
+        for data_wide, actual_df in inputs:
+            rows += len(wide_to_tabpfn_format(data_wide, trim_leading_nan, max_context_months))
+            result = forecaster.forecast(data_wide, prediction_length=prediction_length)
+            error, actual = _wape(result.forecast_df, actual_df)
+            errors += error
+            total += actual
+        wall = time.perf_counter() - start
+
+        results.append({
+            'setting': label,
+            'trim_leading_nan': trim_leading_nan,
+            'max_context_months': max_context_months,
+            'context_rows': rows,
+            'wall_seconds': wall,
+            'wape': errors / total * 100 if total else None,
+        })
+    return results
+
+
+def main():
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description="Benchmark TabPFN context trimming on synthetic companies")
+    parser.add_argument('--companies', type=int, default=3, help='Number of synthetic companies (default: 3)')
+    parser.add_argument('--years', type=int, default=6, help='Fiscal years per company (default: 6)')
+    parser.add_argument('--accounts', type=int, default=40, help='Accounts per company (default: 40)')
+    parser.add_argument('--lines-per-month', type=int, default=60,
+                        help='FEC lines per month; few lines leave sparse, late-starting accounts (default: 60)')
+    parser.add_argument('--max-months', type=int, nargs='+', default=[36, 24],
+                        help='History caps to compare, in months (default: 36 24)')
+    parser.add_argument('--engine', choices=['stand-in', 'local', 'client'], default='stand-in',
+                        help='stand-in (no model weights) or a real TabPFN mode (default: stand-in)')
+    parser.add_argument('--latency-per-row', type=float, default=2e-5,
+                        help='Stand-in latency per context row in seconds (default: 2e-5)')
+    parser.add_argument('--data-folder', default=None, metavar='PATH',
+                        help='Folder for the synthetic data (default: temporary folder)')
+    parser.add_argument('--output', default=None, metavar='PATH', help='Write results as JSON')
+    args = parser.parse_args()
+
+    config = SyntheticFECConfig(
+        n_companies=args.companies,
+        n_years=args.years,
+        n_accounts=args.accounts,
+        lines_per_month=args.lines_per_month
+    )
+    settings = [('full history', False, None), ('trimmed', True, None)]
+    settings += [(f'trimmed, last {months} months', True, months) for months in args.max_months]
+
+    if args.engine == 'stand-in':
+        def make_pipeline():
+            return StandInPredictServer(latency=0.0, latency_per_row=args.latency_per_row, method='mean')
+    else:
+        # One model for all settings, so that loading it is not timed
+        pipeline = TabPFNForecaster(mode=args.engine).pipeline
+
+        def make_pipeline():
+            return pipeline
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        folder = args.data_folder or tmp_dir
+        company_ids = generate_dataset(folder, config, with_forecast=False)
+        inputs = load_company_inputs(folder, company_ids, pd.Timestamp(f"{config.end_year}-12-31"))
+        results = run_benchmark(inputs, settings, make_pipeline)
+
+    print(f"{'setting':<28}{'rows':>9}{'wall s':>9}{'WAPE %':>9}")
+    for result in results:
+        wape = f"{result['wape']:.2f}" if result['wape'] is not None else 'n/a'
+        print(f"{result['setting']:<28}{result['context_rows']:>9}{result['wall_seconds']:>9.2f}{wape:>9}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+"""
+Benchmark parsing FEC date columns.
+
+Parses the four date columns of synthetic FEC lines (see synthetic_fec.py)
+in two ways:
+
+- full column: pd.to_datetime(format="%Y%m%d") on every line, as formatage
+  used to do,
+- unique values: parse_fec_dates, which parses each distinct date once and
+  takes the parsed dates back to the lines.
+
+A ledger has a few thousand distinct dates whatever its number of lines, so
+the gap grows with the lines per month. Both results are checked to be
+identical (unlettered lines have an empty DateLet).
+
+Usage:
+    python -m benchmarks.bench_date_parsing
+    python -m benchmarks.bench_date_parsing --years 6 --lines-per-month 20000 --repeat 5
+"""
+
+import argparse
+import json
+import time
+from typing import Dict, List
+
+import pandas as pd
+
+from benchmarks.synthetic_fec import SyntheticFECConfig, generate_company_fec
+from src.data.fec_loader import FEC_DATE_COLUMNS, parse_fec_dates
+
+
+METHODS = {
+    'full column': lambda values: pd.to_datetime(values, format="%Y%m%d"),
+    'unique values': parse_fec_dates,
+}
+
+
+def run_benchmark(fec: pd.DataFrame, repeat: int = 3) -> List[Dict]:
+    """
+    Parse the date columns of a FEC with each method.
+
+    Parameters
+    ----------
+    fec : pd.DataFrame
+        Raw FEC DataFrame (YYYYMMDD strings).
+    repeat : int, default=3
+        Number of timed runs per method (the best is reported).
+
+    Returns
+    -------
+    List[Dict]
+        One result per method with the lines, the distinct dates and the
+        best wall time, plus whether its dates equal the full column parse.
+    """
+    reference = {column: pd.to_datetime(fec[column], format="%Y%m%d") for column in FEC_DATE_COLUMNS}
+    distinct = sum(fec[column].nunique() for column in FEC_DATE_COLUMNS)
+
+    results = []
+    for method, parse in METHODS.items():
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            parsed = {column: parse(fec[column]) for column in FEC_DATE_COLUMNS}
+            times.append(time.perf_counter() - start)
+        results.append({
+            'method': method,
+            'lines': len(fec),
+            'distinct_dates': int(distinct),
+            'wall_seconds': min(times),
+            'identical': all(parsed[column].equals(reference[column]) for column in FEC_DATE_COLUMNS),
+        })
+    return results
+
+
+def main():
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description="Benchmark parsing FEC date columns")
+    parser.add_argument('--years', type=int, default=4, help='Fiscal years (default: 4)')
+    parser.add_argument('--accounts', type=int, default=40, help='Accounts (default: 40)')
+    parser.add_argument('--lines-per-month', type=int, default=5000, help='FEC lines per month (default: 5000)')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed runs per method (default: 3)')
+    parser.add_argument('--output', default=None, metavar='PATH', help='Write results as JSON')
+    args = parser.parse_args()
+
+    config = SyntheticFECConfig(
+        n_companies=1,
+        n_years=args.years,
+        n_accounts=args.accounts,
+        lines_per_month=args.lines_per_month
+    )
+    fec = generate_company_fec(config)['fec']
+    results = run_benchmark(fec, repeat=args.repeat)
+
+    print(f"{'method':<15}{'lines':>10}{'dates':>8}{'wall s':>9}  identical")
+    for result in results:
+        print(
+            f"{result['method']:<15}{result['lines']:>10}{result['distinct_dates']:>8}"
+            f"{result['wall_seconds']:>9.3f}  {result['identical']}"
+        )
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,187 @@
+"""
+Benchmark passing wide matrices to another process.
+
+Sends the same wide-format DataFrames to a worker process in three ways:
+
+- json: the JSON payload the forecasting daemon used to receive,
+- pickle: what a multiprocessing pool sends for a DataFrame argument,
+- shared memory: a SharedFrame descriptor (see shared_frames), the values
+  staying in a shared memory block.
+
+For each, reports the bytes sent through the pipe, the round trip time
+(serialize, send, rebuild the DataFrame and read every value in the worker)
+and the growth of the worker's private memory (RssAnon, Linux only). Values
+in shared memory are mapped, not copied, so they do not add to it.
+
+Usage:
+    python -m benchmarks.bench_shared_frames
+    python -m benchmarks.bench_shared_frames --months 120 --accounts 5000 --repeat 5
+"""
+
+import argparse
+import json
+import multiprocessing
+import pickle
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.forecasting.daemon import _frame_from_payload, _frame_to_payload
+from src.forecasting.shared_frames import attach_frame, share_frame
+
+
+METHODS = ['json', 'pickle', 'shared memory']
+
+
+def _private_memory_kb() -> Optional[int]:
+    """Private anonymous memory of the process (None outside Linux)."""
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('RssAnon:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def _worker(conn, method: str) -> None:
+    """Rebuild each received frame, read all its values and report the memory it took."""
+    conn.send('ready')
+    while True:
+        # Memory taken by the message and the rebuilt frame
+        before = _private_memory_kb()
+        message = conn.recv_bytes()
+        if not message:
+            return
+        if method == 'json':
+            frame = _frame_from_payload(json.loads(message))
+        elif method == 'pickle':
+            frame = pickle.loads(message)
+        else:
+            with attach_frame(json.loads(message)) as frame:
+                total = float(frame.to_numpy().sum())
+                after = _private_memory_kb()
+                del frame
+            conn.send((total, after - before if before is not None else None))
+            continue
+        total = float(frame.to_numpy().sum())
+        after = _private_memory_kb()
+        conn.send((total, after - before if before is not None else None))
+        del frame, message
+
+
+def make_frame(n_months: int = 60, n_accounts: int = 2000, seed: int = 0) -> pd.DataFrame:
+    """
+    Generate a deterministic wide-format DataFrame.
+
+    Parameters
+    ----------
+    n_months : int, default=60
+        Months of history.
+    n_accounts : int, default=2000
+        Number of account columns.
+    seed : int, default=0
+        Random seed.
+
+    Returns
+    -------
+    pd.DataFrame
+        Wide-format DataFrame (ds index × account columns).
+    """
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range('2020-01-01', periods=n_months, freq='MS', name='ds')
+    accounts = [f"{600000 + i}" for i in range(n_accounts)]
+    return pd.DataFrame(rng.gamma(2.0, 1000.0, size=(n_months, n_accounts)), index=dates, columns=accounts)
+
+
+def run_benchmark(frames: List[pd.DataFrame], methods: List[str] = METHODS) -> List[Dict]:
+    """
+    Send every frame to a new worker process with each method.
+
+    Parameters
+    ----------
+    frames : List[pd.DataFrame]
+        Frames to send.
+    methods : List[str], default=METHODS
+        Methods to compare.
+
+    Returns
+    -------
+    List[Dict]
+        One result per method with the bytes sent, the total round trip
+        time and the largest private memory growth of the worker (KB).
+    """
+    # Fresh workers (not forked copies of this process) for comparable memory figures
+    context = multiprocessing.get_context('spawn')
+    results = []
+    for method in methods:
+        parent, child = context.Pipe()
+        worker = context.Process(target=_worker, args=(child, method), daemon=True)
+        worker.start()
+        parent.recv()
+
+        sent = 0
+        growth = []
+        start = time.perf_counter()
+        try:
+            for frame in frames:
+                shared = None
+                if method == 'json':
+                    message = json.dumps(_frame_to_payload(frame)).encode('utf-8')
+                elif method == 'pickle':
+                    message = pickle.dumps(frame, protocol=pickle.HIGHEST_PROTOCOL)
+                else:
+                    shared = share_frame(frame)
+                    message = json.dumps(shared.descriptor).encode('utf-8')
+                try:
+                    parent.send_bytes(message)
+                    total, worker_growth = parent.recv()
+                finally:
+                    if shared is not None:
+                        shared.close()
+                sent += len(message)
+                growth.append(worker_growth)
+            wall = time.perf_counter() - start
+        finally:
+            parent.send_bytes(b'')
+            worker.join(timeout=10)
+
+        results.append({
+            'method': method,
+            'frames': len(frames),
+            'bytes_sent': sent,
+            'wall_seconds': wall,
+            'worker_memory_growth_kb': max(growth) if None not in growth else None,
+            'checksum': total,
+        })
+    return results
+
+
+def main():
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description="Benchmark sending wide matrices to a worker process")
+    parser.add_argument('--months', type=int, default=60, help='Months per frame (default: 60)')
+    parser.add_argument('--accounts', type=int, default=2000, help='Accounts per frame (default: 2000)')
+    parser.add_argument('--repeat', type=int, default=10, help='Frames sent per method (default: 10)')
+    parser.add_argument('--output', default=None, metavar='PATH', help='Write results as JSON')
+    args = parser.parse_args()
+
+    frames = [make_frame(args.months, args.accounts, seed=i) for i in range(args.repeat)]
+    results = run_benchmark(frames)
+
+    print(f"{'method':<15}{'MB sent':>10}{'wall s':>9}{'worker +MB':>12}")
+    for result in results:
+        growth = result['worker_memory_growth_kb']
+        growth = f"{growth / 1024:.1f}" if growth is not None else 'n/a'
+        print(f"{result['method']:<15}{result['bytes_sent'] / 1e6:>10.2f}{result['wall_seconds']:>9.2f}{growth:>12}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,399 @@
+"""
+End-to-end benchmark suite on synthetic FEC data.
+
+Generates a deterministic synthetic data folder (see synthetic_fec.py), then
+times each pipeline stage over all companies and writes the results to a
+JSON file so that runs can be compared.
+
+Usage:
+    python -m benchmarks.run_benchmarks
+    python -m benchmarks.run_benchmarks --companies 5 --years 6 --lines-per-month 2000
+    python -m benchmarks.run_benchmarks --scenarios import_fecs fec_to_monthly_totals
+    python -m benchmarks.run_benchmarks --compare benchmarks/results/previous.json
+"""
+
+import argparse
+import json
+import platform
+import shutil
+import statistics
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.synthetic_fec import SYNTHETIC_PROCESS_ID, SyntheticFECConfig, generate_dataset
+from src.data.account_classifier import load_classification_charges
+from src.data.fec_loader import import_fecs, load_fecs
+from src.data.preprocessing import fec_to_monthly_totals, preprocess_data
+from src.forecasting.batch_processor import BatchProcessor
+from src.forecasting.data_converter import tabpfn_output_to_wide_format, wide_to_tabpfn_format
+from src.forecasting.tabpfn_forecaster import TabPFNForecaster
+from src.metrics.pipeline import compute_metrics_for_company
+from src.visualization.data_loader import load_company_dashboard_data
+
+
+DEFAULT_RESULTS_DIR = Path(__file__).parent / 'results'
+
+
+@dataclass
+class BenchmarkContext:
+    """
+    Synthetic data shared by all scenarios.
+
+    Attributes
+    ----------
+    data_folder : str
+        Root folder of the synthetic companies.
+    company_ids : List[str]
+        Generated company identifiers.
+    accounting_up_to_date : pd.Timestamp
+        Accounting date of every synthetic company.
+    forecast_horizon : int
+        Forecast horizon in months.
+    """
+
+    data_folder: str
+    company_ids: List[str]
+    accounting_up_to_date: pd.Timestamp
+    forecast_horizon: int = 12
+
+
+@dataclass
+class Scenario:
+    """
+    A timed benchmark scenario.
+
+    Attributes
+    ----------
+    name : str
+        Scenario name.
+    setup : Callable[[BenchmarkContext], Any]
+        Prepares the inputs (not timed).
+    run : Callable[[BenchmarkContext, Any], int]
+        Timed function; returns the number of rows (or items) processed.
+    teardown : Optional[Callable[[Any], None]]
+        Releases the inputs after the timed runs (not timed).
+    """
+
+    name: str
+    setup: Callable[[BenchmarkContext], Any]
+    run: Callable[[BenchmarkContext, Any], int]
+    teardown: Optional[Callable[[Any], None]] = None
+
+
+def _company_folders(ctx: BenchmarkContext) -> List[str]:
+    return [str(Path(ctx.data_folder) / company_id) for company_id in ctx.company_ids]
+
+
+def _load_train_fecs(ctx: BenchmarkContext) -> List[pd.DataFrame]:
+    return [
+        load_fecs(company_id, ctx.data_folder, ctx.accounting_up_to_date,
+                  forecast_horizon=ctx.forecast_horizon)[0]
+        for company_id in ctx.company_ids
+    ]
+
+
+def _load_train_fecs_in_cents(ctx: BenchmarkContext) -> List[pd.DataFrame]:
+    return [
+        load_fecs(company_id, ctx.data_folder, ctx.accounting_up_to_date,
+                  forecast_horizon=ctx.forecast_horizon, amounts_in_cents=True)[0]
+        for company_id in ctx.company_ids
+    ]
+
+
+def _monthly_totals(ctx: BenchmarkContext) -> List[pd.DataFrame]:
+    return [fec_to_monthly_totals(fecs) for fecs in _load_train_fecs(ctx)]
+
+
+def _wide_frames(ctx: BenchmarkContext) -> List[pd.DataFrame]:
+    classification = load_classification_charges()
+    return [
+        preprocess_data(monthly, ctx.accounting_up_to_date, classification).filtered_data_wide_format
+        for monthly in _monthly_totals(ctx)
+    ]
+
+
+def _run_import_fecs(ctx: BenchmarkContext, folders: List[str]) -> int:
+    return sum(len(import_fecs(folder)) for folder in folders)
+
+
+def _run_monthly_totals(ctx: BenchmarkContext, fecs_list: List[pd.DataFrame]) -> int:
+    return sum(len(fec_to_monthly_totals(fecs)) for fecs in fecs_list)
+
+
+def _setup_preprocess(ctx: BenchmarkContext):
+    return load_classification_charges(), _monthly_totals(ctx)
+
+
+def _run_preprocess(ctx: BenchmarkContext, inputs) -> int:
+    classification, monthly_list = inputs
+    rows = 0
+    for monthly in monthly_list:
+        result = preprocess_data(monthly, ctx.accounting_up_to_date, classification)
+        rows += result.filtered_data_wide_format.size
+    return rows
+
+
+def _setup_converters(ctx: BenchmarkContext):
+    frames = _wide_frames(ctx)
+    outputs = []
+    for wide in frames:
+        # Fake model output: the context itself relabelled as a forecast
+        long_df = wide_to_tabpfn_format(wide)
+        outputs.append((wide, long_df, list(wide.columns)))
+    return outputs
+
+
+def _run_converters(ctx: BenchmarkContext, inputs) -> int:
+    rows = 0
+    for wide, long_df, accounts in inputs:
+        rows += len(wide_to_tabpfn_format(wide))
+        rows += tabpfn_output_to_wide_format(long_df, accounts).size
+    return rows
+
+
+def _setup_batch_forecasting(ctx: BenchmarkContext) -> Tuple[BatchProcessor, str]:
+    # Saved versions go to a copy of the data, so that the other scenarios
+    # always read the same companies
+    copy_folder = tempfile.mkdtemp(prefix='bench_batch_')
+    shutil.copytree(ctx.data_folder, copy_folder, dirs_exist_ok=True)
+    # The stub engine stands in for the model: everything around it is timed
+    processor = BatchProcessor(
+        data_folder=copy_folder,
+        forecast_horizon=ctx.forecast_horizon,
+        forecaster=TabPFNForecaster(mode='local', engine='stub')
+    )
+    return processor, copy_folder
+
+
+def _run_batch_forecasting(ctx: BenchmarkContext, inputs: Tuple[BatchProcessor, str]) -> int:
+    processor, _ = inputs
+    return sum(
+        outcome.result['accounts_forecasted']
+        for outcome in processor.iter_companies(ctx.company_ids)
+    )
+
+
+def _teardown_batch_forecasting(inputs: Tuple[BatchProcessor, str]) -> None:
+    shutil.rmtree(inputs[1], ignore_errors=True)
+
+
+def _run_metrics(ctx: BenchmarkContext, _) -> int:
+    accounts = 0
+    for company_id in ctx.company_ids:
+        metrics = compute_metrics_for_company(
+            company_id=company_id,
+            process_id=SYNTHETIC_PROCESS_ID,
+            data_folder=ctx.data_folder,
+            forecast_horizon=ctx.forecast_horizon
+        )
+        accounts += len(metrics['account_metrics'])
+    return accounts
+
+
+def _run_dashboard_loading(ctx: BenchmarkContext, _) -> int:
+    accounts = 0
+    for company_id in ctx.company_ids:
+        data = load_company_dashboard_data(company_id, data_folder=ctx.data_folder,
+                                           forecast_horizon=ctx.forecast_horizon)
+        accounts += len(data.all_accounts)
+    return accounts
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    scenario.name: scenario for scenario in [
+        Scenario('import_fecs', _company_folders, _run_import_fecs),
+        Scenario('fec_to_monthly_totals', _load_train_fecs, _run_monthly_totals),
+        Scenario('fec_to_monthly_totals_cents', _load_train_fecs_in_cents, _run_monthly_totals),
+        Scenario('preprocess_data', _setup_preprocess, _run_preprocess),
+        Scenario('data_converters', _setup_converters, _run_converters),
+        Scenario('batch_forecasting', _setup_batch_forecasting, _run_batch_forecasting,
+                 _teardown_batch_forecasting),
+        Scenario('compute_metrics_for_company', lambda ctx: None, _run_metrics),
+        Scenario('dashboard_loading', lambda ctx: None, _run_dashboard_loading),
+    ]
+}
+
+
+def run_scenario(scenario: Scenario, ctx: BenchmarkContext, repeats: int = 3) -> Dict[str, Any]:
+    """
+    Time a scenario.
+
+    Parameters
+    ----------
+    scenario : Scenario
+        Scenario to run.
+    ctx : BenchmarkContext
+        Synthetic data.
+    repeats : int, default=3
+        Number of timed runs.
+
+    Returns
+    -------
+    Dict[str, Any]
+        Result with 'scenario', 'repeats', 'items', 'best_seconds',
+        'mean_seconds' and 'items_per_second' (based on the best run).
+    """
+    inputs = scenario.setup(ctx)
+    timings = []
+    items = 0
+    try:
+        for _ in range(repeats):
+            start = time.perf_counter()
+            items = scenario.run(ctx, inputs)
+            timings.append(time.perf_counter() - start)
+    finally:
+        if scenario.teardown is not None:
+            scenario.teardown(inputs)
+
+    best = min(timings)
+    return {
+        'scenario': scenario.name,
+        'repeats': repeats,
+        'items': int(items),
+        'best_seconds': best,
+        'mean_seconds': statistics.mean(timings),
+        'items_per_second': items / best if best > 0 else None,
+    }
+
+
+def run_benchmarks(
+    config: SyntheticFECConfig,
+    scenario_names: Optional[List[str]] = None,
+    repeats: int = 3,
+    data_folder: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Generate synthetic data and run the selected scenarios.
+
+    Parameters
+    ----------
+    config : SyntheticFECConfig
+        Synthetic dataset parameters.
+    scenario_names : Optional[List[str]], default=None
+        Scenarios to run (all if None).
+    repeats : int, default=3
+        Number of timed runs per scenario.
+    data_folder : Optional[str], default=None
+        Folder for the synthetic data (a temporary folder if None).
+
+    Returns
+    -------
+    Dict[str, Any]
+        Report with 'timestamp', 'config', 'environment' and 'results'.
+
+    Raises
+    ------
+    ValueError
+        If an unknown scenario is requested.
+    """
+    scenario_names = scenario_names or list(SCENARIOS)
+    unknown = [name for name in scenario_names if name not in SCENARIOS]
+    if unknown:
+        raise ValueError(f"Unknown scenarios: {', '.join(unknown)}")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        folder = data_folder or tmp_dir
+        company_ids = generate_dataset(folder, config)
+        ctx = BenchmarkContext(
+            data_folder=folder,
+            company_ids=company_ids,
+            accounting_up_to_date=pd.Timestamp(f"{config.end_year}-12-31"),
+        )
+        results = [run_scenario(SCENARIOS[name], ctx, repeats=repeats) for name in scenario_names]
+
+    return {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'config': asdict(config),
+        'environment': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'pandas': pd.__version__,
+            'numpy': np.__version__,
+        },
+        'results': results,
+    }
+
+
+def compare_reports(current: Dict[str, Any], previous: Dict[str, Any]) -> Dict[str, float]:
+    """
+    Compute the speedup of each scenario relative to a previous report.
+
+    Parameters
+    ----------
+    current : Dict[str, Any]
+        Report from run_benchmarks.
+    previous : Dict[str, Any]
+        Earlier report loaded from JSON.
+
+    Returns
+    -------
+    Dict[str, float]
+        Previous best time / current best time, per common scenario.
+    """
+    previous_best = {r['scenario']: r['best_seconds'] for r in previous.get('results', [])}
+    return {
+        r['scenario']: previous_best[r['scenario']] / r['best_seconds']
+        for r in current['results']
+        if r['scenario'] in previous_best and r['best_seconds'] > 0
+    }
+
+
+def main():
+    """Run the benchmark suite from the command line."""
+    defaults = SyntheticFECConfig()
+    parser = argparse.ArgumentParser(description="Run the pipeline benchmark suite on synthetic FEC data")
+    parser.add_argument('--companies', type=int, default=defaults.n_companies, help='Number of companies')
+    parser.add_argument('--years', type=int, default=defaults.n_years, help='Number of fiscal years')
+    parser.add_argument('--accounts', type=int, default=defaults.n_accounts, help='6xx/7xx accounts per company')
+    parser.add_argument('--lines-per-month', type=int, default=defaults.lines_per_month, help='6xx/7xx lines per month')
+    parser.add_argument('--seed', type=int, default=defaults.seed, help='Random seed')
+    parser.add_argument('--repeats', type=int, default=3, help='Timed runs per scenario (default: 3)')
+    parser.add_argument('--scenarios', nargs='+', choices=list(SCENARIOS), default=None, help='Scenarios to run (default: all)')
+    parser.add_argument('--output', default=None, metavar='PATH', help='Results JSON file (default: benchmarks/results/<timestamp>.json)')
+    parser.add_argument('--compare', default=None, metavar='PATH', help='Previous results JSON to compare against')
+    args = parser.parse_args()
+
+    config = SyntheticFECConfig(
+        n_companies=args.companies,
+        n_years=args.years,
+        n_accounts=args.accounts,
+        lines_per_month=args.lines_per_month,
+        seed=args.seed,
+    )
+    report = run_benchmarks(config, scenario_names=args.scenarios, repeats=args.repeats)
+
+    speedups = {}
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            speedups = compare_reports(report, json.load(f))
+
+    print(f"{'scenario':<30}{'items':>10}{'best s':>10}{'mean s':>10}{'items/s':>12}{'speedup':>9}")
+    for result in report['results']:
+        speedup = speedups.get(result['scenario'])
+        print(
+            f"{result['scenario']:<30}"
+            f"{result['items']:>10,}"
+            f"{result['best_seconds']:>10.3f}"
+            f"{result['mean_seconds']:>10.3f}"
+            f"{result['items_per_second'] or 0:>12,.0f}"
+            f"{f'{speedup:.2f}x' if speedup else '-':>9}"
+        )
+
+    output = Path(args.output) if args.output else (
+        DEFAULT_RESULTS_DIR / f"benchmark_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults written to {output}")
+
+
+if __name__ == '__main__':
+    main()
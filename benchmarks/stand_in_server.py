@@ -0,0 +1,161 @@
+"""
+Local stand-in for the TabPFN client API.
+
+StandInPredictServer exposes the predict_df method of TabPFNTSPipeline and
+mimics the behaviour of the remote API that matters for client-side
+concurrency: a fixed round-trip latency plus a per-series cost, a limit on
+simultaneous requests (rejected like an HTTP 429) and random transient
+failures. Forecasts are naive (last observed value, or the mean of the
+context), so throughput can be measured without network access or model
+weights:
+
+    >>> server = StandInPredictServer(latency=0.2, max_concurrency=4)
+    >>> forecaster = TabPFNForecaster(mode='client', pipeline=server)
+"""
+
+import threading
+import time
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+
+class ServerBusyError(ConnectionError):
+    """Raised when the stand-in server has too many requests in flight (HTTP 429)."""
+
+
+class TransientServerError(ConnectionError):
+    """Raised randomly to simulate network or server hiccups."""
+
+
+class StandInPredictServer:
+    """
+    In-process stand-in for the TabPFN client API.
+
+    Parameters
+    ----------
+    latency : float, default=0.5
+        Fixed duration of a request (seconds).
+    latency_per_item : float, default=0.0
+        Additional duration per time series of the request (seconds).
+    latency_per_row : float, default=0.0
+        Additional duration per context row of the request (seconds).
+    max_concurrency : Optional[int], default=None
+        Requests above this number of simultaneous requests are rejected
+        with ServerBusyError (no limit if None).
+    failure_rate : float, default=0.0
+        Probability that a request fails with TransientServerError.
+    seed : int, default=0
+        Random seed of the failures.
+    method : str, default='last'
+        Naive forecast: 'last' repeats the last observed value, 'mean' the
+        mean of the observed context (which depends on the context length).
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.5,
+        latency_per_item: float = 0.0,
+        max_concurrency: Optional[int] = None,
+        failure_rate: float = 0.0,
+        seed: int = 0,
+        latency_per_row: float = 0.0,
+        method: str = 'last'
+    ):
+        """Initialize the server and its counters."""
+        if method not in ('last', 'mean'):
+            raise ValueError("method must be 'last' or 'mean'")
+
+        self.latency = latency
+        self.latency_per_item = latency_per_item
+        self.latency_per_row = latency_per_row
+        self.method = method
+        self.max_concurrency = max_concurrency
+        self.failure_rate = failure_rate
+        self._rng = np.random.default_rng(seed)
+        self._lock = threading.Lock()
+        self.active = 0
+        self.peak_concurrency = 0
+        self.calls = 0
+        self.rejected = 0
+        self.failed = 0
+        self.rows = 0
+
+    def predict_df(
+        self,
+        context_df: pd.DataFrame,
+        prediction_length: int,
+        quantiles: List[float] = [0.1, 0.5, 0.9]
+    ) -> pd.DataFrame:
+        """
+        Return naive quantile forecasts after a simulated delay.
+
+        Parameters
+        ----------
+        context_df : pd.DataFrame
+            Long-format context with timestamp, target and item_id columns.
+        prediction_length : int
+            Number of future periods.
+        quantiles : List[float], default=[0.1, 0.5, 0.9]
+            Quantiles to return.
+
+        Returns
+        -------
+        pd.DataFrame
+            Output indexed by (item_id, timestamp) with a 'target' column and
+            one column per quantile, like TabPFNTSPipeline.predict_df.
+
+        Raises
+        ------
+        ServerBusyError
+            If max_concurrency requests are already in flight.
+        TransientServerError
+            Randomly, with probability failure_rate.
+        """
+        with self._lock:
+            self.calls += 1
+            if self.max_concurrency is not None and self.active >= self.max_concurrency:
+                self.rejected += 1
+                raise ServerBusyError("Too many requests")
+            if self.failure_rate and self._rng.random() < self.failure_rate:
+                self.failed += 1
+                raise TransientServerError("Connection reset by peer")
+            self.active += 1
+            self.peak_concurrency = max(self.peak_concurrency, self.active)
+            self.rows += len(context_df)
+
+        try:
+            items = pd.unique(context_df['item_id'])
+            time.sleep(self.latency + self.latency_per_item * len(items) + self.latency_per_row * len(context_df))
+            return _naive_forecast(context_df, items, prediction_length, quantiles, self.method)
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def _naive_forecast(
+    context_df: pd.DataFrame,
+    items: np.ndarray,
+    prediction_length: int,
+    quantiles: List[float],
+    method: str = 'last'
+) -> pd.DataFrame:
+    """Repeat the last observed value (or the mean) of each series, with a ±10% band."""
+    observed = context_df.dropna(subset=['target'])
+    grouped = observed.groupby('item_id', sort=False)['target']
+    values = grouped.mean() if method == 'mean' else grouped.last()
+    last_values = values.reindex(items).fillna(0.0)
+
+    timestamps = pd.DatetimeIndex(context_df['timestamp'].unique()).sort_values()
+    freq = pd.infer_freq(timestamps) if len(timestamps) >= 3 else None
+    future = pd.date_range(timestamps[-1], periods=prediction_length + 1, freq=freq or 'MS')[1:]
+
+    index = pd.MultiIndex.from_product([items, future], names=['item_id', 'timestamp'])
+    median = np.repeat(last_values.to_numpy(dtype=float), prediction_length)
+    spread = np.abs(median) * 0.1
+
+    output = pd.DataFrame({'target': median}, index=index)
+    for quantile in quantiles:
+        output[quantile] = median + (quantile - 0.5) * 2 * spread
+    return output
@@ -0,0 +1,398 @@
+"""
+Deterministic synthetic FEC generator for benchmarks.
+
+Generates company folders with the same layout as the real data folder:
+
+    <data_folder>/
+        <company_id>/
+            company.json
+            2021_12_31.tsv, 2022_12_31.tsv, ...   (one FEC per fiscal year)
+            <process_id>/gather_result(_lower/_upper)   (optional forecast)
+
+Each sale or purchase is written as a balanced pair of lines: the 7xx/6xx
+account and its 411/401 counterpart. Every fiscal year also starts with
+opening balance (AN) entries and ends with a few adjustment (AD) entries,
+which formatage() removes. The same seed always yields the same files.
+
+Usage:
+    python -m benchmarks.synthetic_fec --output /tmp/synthetic_data --companies 5
+"""
+
+import argparse
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from src.forecasting.result_saver import save_forecast_result_with_ci, update_company_metadata
+
+
+FEC_COLUMNS = [
+    'JournalCode', 'JournalLib', 'EcritureNum', 'EcritureDate', 'CompteNum',
+    'CompteLib', 'CompAuxNum', 'CompAuxLib', 'PieceRef', 'PieceDate',
+    'EcritureLib', 'Debit', 'Credit', 'EcritureLet', 'DateLet', 'ValidDate',
+    'Montantdevise', 'Idevise',
+]
+
+# Account prefixes drawn for the generated chart of accounts
+REVENUE_PREFIXES = ['706', '707', '708', '704', '709']
+EXPENSE_PREFIXES = [
+    '601', '602', '604', '606', '607', '611', '613', '615', '616', '622',
+    '623', '625', '626', '627', '628', '635', '641', '645', '661', '681',
+]
+
+# Balance sheet accounts used by AN (opening balance) entries
+BALANCE_SHEET_ACCOUNTS = ['101000', '164000', '401000', '411000', '445660', '512000']
+
+# Process identifier of the synthetic forecast version
+SYNTHETIC_PROCESS_ID = 'synthetic-forecast'
+SYNTHETIC_VERSION_NAME = 'Synthetic-v1.0'
+
+
+@dataclass
+class SyntheticFECConfig:
+    """
+    Parameters of a synthetic dataset.
+
+    Attributes
+    ----------
+    n_companies : int
+        Number of company folders.
+    n_years : int
+        Number of fiscal years (calendar years ending on Dec 31).
+    n_accounts : int
+        Number of 6xx/7xx accounts per company.
+    lines_per_month : int
+        Number of 6xx/7xx FEC lines per month (each with a counterpart line).
+    revenue_share : float
+        Fraction of accounts that are revenue (7xx) accounts.
+    end_year : int
+        Last fiscal year.
+    seed : int
+        Random seed.
+    """
+
+    n_companies: int = 3
+    n_years: int = 4
+    n_accounts: int = 30
+    lines_per_month: int = 400
+    revenue_share: float = 0.2
+    end_year: int = 2024
+    seed: int = 0
+
+
+def _make_accounts(rng: np.random.Generator, n_accounts: int, revenue_share: float) -> List[str]:
+    """Draw a chart of 6xx/7xx accounts with at least one of each kind."""
+    n_revenue = min(max(1, int(round(n_accounts * revenue_share))), n_accounts - 1)
+    n_expense = n_accounts - n_revenue
+
+    accounts = []
+    for prefixes, count in ((REVENUE_PREFIXES, n_revenue), (EXPENSE_PREFIXES, n_expense)):
+        for i in range(count):
+            prefix = prefixes[i % len(prefixes)]
+            suffix = (i // len(prefixes)) * 100 + int(rng.integers(0, 10)) * 10
+            accounts.append(f"{prefix}{suffix:03d}")
+
+    # Duplicated draws are made unique by bumping the last digit
+    seen = set()
+    unique_accounts = []
+    for account in accounts:
+        while account in seen:
+            account = f"{account[:5]}{(int(account[5]) + 1) % 10}"
+        seen.add(account)
+        unique_accounts.append(account)
+    return unique_accounts
+
+
+def _format_amounts(values: np.ndarray) -> np.ndarray:
+    """Format amounts with two decimals and a comma decimal separator."""
+    return np.char.replace(np.char.mod('%.2f', values), '.', ',')
+
+
+def generate_company_fec(
+    config: SyntheticFECConfig,
+    company_index: int = 0
+) -> Dict[str, object]:
+    """
+    Generate the raw FEC lines and expected monthly levels of one company.
+
+    Parameters
+    ----------
+    config : SyntheticFECConfig
+        Dataset parameters.
+    company_index : int, default=0
+        Company number, combined with the seed.
+
+    Returns
+    -------
+    Dict[str, object]
+        - 'fec': raw FEC DataFrame (string columns, as read from a TSV file)
+        - 'expected': wide DataFrame of expected monthly balances per account
+    """
+    rng = np.random.default_rng([config.seed, company_index])
+    accounts = _make_accounts(rng, config.n_accounts, config.revenue_share)
+    is_revenue = np.array([acc.startswith('7') for acc in accounts])
+
+    months = pd.date_range(f"{config.end_year - config.n_years + 1}-01-01", periods=config.n_years * 12, freq='MS')
+    n_months = len(months)
+
+    # Expected monthly balance: level × trend × yearly seasonality
+    level = rng.lognormal(mean=8.0, sigma=1.0, size=len(accounts))
+    level[is_revenue] *= 4
+    trend = 1 + rng.normal(0.03, 0.05, size=len(accounts))[None, :] * (np.arange(n_months)[:, None] / 12)
+    phase = rng.uniform(0, 2 * np.pi, size=len(accounts))
+    amplitude = rng.uniform(0, 0.4, size=len(accounts))
+    season = 1 + amplitude[None, :] * np.sin(2 * np.pi * np.arange(n_months)[:, None] / 12 + phase[None, :])
+    expected = level[None, :] * trend.clip(min=0.1) * season
+
+    # Spread each month's lines over accounts (popular accounts get more lines)
+    weights = rng.dirichlet(np.ones(len(accounts)) * 0.8)
+    n_lines = config.lines_per_month * n_months
+    month_idx = np.repeat(np.arange(n_months), config.lines_per_month)
+    account_idx = rng.choice(len(accounts), size=n_lines, p=weights)
+    lines_per_account_month = np.maximum(weights * config.lines_per_month, 1.0)
+    amounts = (
+        expected[month_idx, account_idx] / lines_per_account_month[account_idx]
+        * rng.lognormal(0, 0.35, size=n_lines)
+    ).round(2)
+
+    # Occasional credit notes (refunds) flip the usual side of the line
+    refund = rng.random(n_lines) < 0.02
+    days = rng.integers(0, 28, size=n_lines)
+    piece_dates = months.values[month_idx] + days.astype('timedelta64[D]')
+
+    revenue_line = is_revenue[account_idx]
+    counterpart = np.where(revenue_line, '411000', '401000')
+    journal = np.where(revenue_line, 'VT', 'AC')
+    main_debit = np.where(revenue_line == refund, amounts, 0.0)
+    main_credit = np.where(revenue_line != refund, amounts, 0.0)
+
+    piece_str = pd.DatetimeIndex(piece_dates).strftime('%Y%m%d').to_numpy()
+    valid_str = pd.DatetimeIndex(piece_dates + np.timedelta64(3, 'D')).strftime('%Y%m%d').to_numpy()
+    lettered = rng.random(n_lines) < 0.7
+    let_str = pd.DatetimeIndex(piece_dates + np.timedelta64(30, 'D')).strftime('%Y%m%d').to_numpy()
+    entry_num = np.arange(1, n_lines + 1)
+    labels = np.array(accounts)[account_idx]
+
+    main_lines = pd.DataFrame({
+        'JournalCode': journal,
+        'JournalLib': np.where(revenue_line, 'Ventes', 'Achats'),
+        'EcritureNum': entry_num,
+        'EcritureDate': piece_str,
+        'CompteNum': labels,
+        'CompteLib': np.char.add('Compte ', labels),
+        'CompAuxNum': '',
+        'CompAuxLib': '',
+        'PieceRef': np.char.add(journal, entry_num.astype(str)),
+        'PieceDate': piece_str,
+        'EcritureLib': np.where(revenue_line, 'Vente', 'Achat'),
+        'Debit': _format_amounts(main_debit),
+        'Credit': _format_amounts(main_credit),
+        'EcritureLet': '',
+        'DateLet': '',
+        'ValidDate': valid_str,
+        'Montantdevise': '',
+        'Idevise': 'EUR',
+    })
+    counterpart_lines = main_lines.assign(
+        CompteNum=counterpart,
+        CompteLib=np.where(revenue_line, 'Clients', 'Fournisseurs'),
+        Debit=main_lines['Credit'],
+        Credit=main_lines['Debit'],
+        EcritureLet=np.where(lettered, 'A', ''),
+        DateLet=np.where(lettered, let_str, ''),
+    )
+
+    # AN opening balances and AD adjustments for every fiscal year
+    management_lines = []
+    for year in sorted(set(months.year)):
+        opening = rng.lognormal(9, 1, size=len(BALANCE_SHEET_ACCOUNTS)).round(2)
+        management_lines.append(pd.DataFrame({
+            'JournalCode': 'AN',
+            'JournalLib': 'A nouveaux',
+            'EcritureNum': 0,
+            'EcritureDate': f"{year}0101",
+            'CompteNum': BALANCE_SHEET_ACCOUNTS,
+            'CompteLib': 'Report',
+            'PieceRef': 'AN',
+            'PieceDate': f"{year}0101",
+            'EcritureLib': 'Report a nouveau',
+            'Debit': _format_amounts(opening),
+            'Credit': _format_amounts(np.zeros(len(opening))),
+            'ValidDate': f"{year}0101",
+            'Idevise': 'EUR',
+        }))
+        adjusted = np.array(accounts)[rng.choice(len(accounts), size=3)]
+        management_lines.append(pd.DataFrame({
+            'JournalCode': 'AD',
+            'JournalLib': 'Ajustements',
+            'EcritureNum': 0,
+            'EcritureDate': f"{year}1231",
+            'CompteNum': adjusted,
+            'CompteLib': 'Ajustement',
+            'PieceRef': 'AD',
+            'PieceDate': f"{year}1231",
+            'EcritureLib': 'Ajustement',
+            'Debit': _format_amounts(rng.lognormal(7, 1, size=3).round(2)),
+            'Credit': _format_amounts(np.zeros(3)),
+            'ValidDate': f"{year}1231",
+            'Idevise': 'EUR',
+        }))
+
+    fec = pd.concat([*management_lines, main_lines, counterpart_lines], ignore_index=True)
+    fec = fec.reindex(columns=FEC_COLUMNS).fillna('')
+
+    expected_df = pd.DataFrame(expected, index=months, columns=accounts)
+    expected_df.index.name = 'ds'
+
+    return {'fec': fec, 'expected': expected_df}
+
+
+def write_company(
+    data_folder: str,
+    company_id: str,
+    config: SyntheticFECConfig,
+    company_index: int = 0,
+    with_forecast: bool = True,
+    forecast_horizon: int = 12
+) -> Path:
+    """
+    Write one synthetic company folder.
+
+    Parameters
+    ----------
+    data_folder : str
+        Root data folder.
+    company_id : str
+        Company identifier (folder name).
+    config : SyntheticFECConfig
+        Dataset parameters.
+    company_index : int, default=0
+        Company number, combined with the seed.
+    with_forecast : bool, default=True
+        Also write a forecast version (gather_result with confidence
+        intervals) for the last forecast_horizon months, registered in
+        company.json, so that metrics and the dashboard can be run.
+    forecast_horizon : int, default=12
+        Number of months covered by the synthetic forecast.
+
+    Returns
+    -------
+    Path
+        Path to the company folder.
+    """
+    company_path = Path(data_folder) / company_id
+    company_path.mkdir(parents=True, exist_ok=True)
+
+    generated = generate_company_fec(config, company_index)
+    fec = generated['fec']
+    expected = generated['expected']
+
+    # One FEC file per fiscal year
+    fiscal_year = fec['PieceDate'].str[:4]
+    for year, year_fec in fec.groupby(fiscal_year):
+        year_fec.to_csv(company_path / f"{year}_12_31.tsv", sep='\t', index=False)
+
+    company_json = {
+        'id': company_id,
+        'name': f"Synthetic company {company_index + 1}",
+        'accounting_up_to_date': f"{config.end_year}-12-31T00:00:00",
+        'forecast_versions': [],
+    }
+    with open(company_path / 'company.json', 'w', encoding='utf-8') as f:
+        json.dump(company_json, f, indent=2)
+
+    if with_forecast:
+        rng = np.random.default_rng([config.seed, company_index, 1])
+        median = expected.iloc[-forecast_horizon:] * rng.lognormal(0, 0.1, size=(forecast_horizon, expected.shape[1]))
+        save_forecast_result_with_ci(
+            median_df=median,
+            lower_df=median * 0.85,
+            upper_df=median * 1.15,
+            company_id=company_id,
+            process_id=SYNTHETIC_PROCESS_ID,
+            data_folder=data_folder
+        )
+        account_metadata = {
+            account: {
+                'account_type': 'revenue' if account.startswith('7') else 'expense',
+                'forecast_type': 'TabPFN'
+            }
+            for account in expected.columns
+        }
+        update_company_metadata(
+            company_id=company_id,
+            process_id=SYNTHETIC_PROCESS_ID,
+            account_metadata=account_metadata,
+            data_folder=data_folder,
+            version_name=SYNTHETIC_VERSION_NAME
+        )
+
+    return company_path
+
+
+def generate_dataset(
+    data_folder: str,
+    config: SyntheticFECConfig,
+    with_forecast: bool = True
+) -> List[str]:
+    """
+    Write config.n_companies synthetic companies.
+
+    Parameters
+    ----------
+    data_folder : str
+        Root data folder.
+    config : SyntheticFECConfig
+        Dataset parameters.
+    with_forecast : bool, default=True
+        Also write a synthetic forecast version for every company.
+
+    Returns
+    -------
+    List[str]
+        Generated company identifiers.
+
+    Examples
+    --------
+    >>> config = SyntheticFECConfig(n_companies=2, n_years=3, lines_per_month=100)
+    >>> generate_dataset("/tmp/synthetic_data", config)
+    ['SYNTH - 1', 'SYNTH - 2']
+    """
+    company_ids = []
+    for index in range(config.n_companies):
+        company_id = f"SYNTH - {index + 1}"
+        write_company(data_folder, company_id, config, company_index=index, with_forecast=with_forecast)
+        company_ids.append(company_id)
+    return company_ids
+
+
+def main():
+    """Generate a synthetic data folder from the command line."""
+    defaults = SyntheticFECConfig()
+    parser = argparse.ArgumentParser(description="Generate synthetic FEC company folders")
+    parser.add_argument('--output', required=True, metavar='PATH', help='Data folder to write')
+    parser.add_argument('--companies', type=int, default=defaults.n_companies, help='Number of companies')
+    parser.add_argument('--years', type=int, default=defaults.n_years, help='Number of fiscal years')
+    parser.add_argument('--accounts', type=int, default=defaults.n_accounts, help='6xx/7xx accounts per company')
+    parser.add_argument('--lines-per-month', type=int, default=defaults.lines_per_month, help='6xx/7xx lines per month')
+    parser.add_argument('--seed', type=int, default=defaults.seed, help='Random seed')
+    parser.add_argument('--no-forecast', action='store_true', help='Do not write a synthetic forecast version')
+    args = parser.parse_args()
+
+    config = SyntheticFECConfig(
+        n_companies=args.companies,
+        n_years=args.years,
+        n_accounts=args.accounts,
+        lines_per_month=args.lines_per_month,
+        seed=args.seed,
+    )
+    company_ids = generate_dataset(args.output, config, with_forecast=not args.no_forecast)
+    print(f"Generated {len(company_ids)} companies in {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+"""
+Forecasting runtime configuration for TabPFNApproach.
+
+Contains the settings of the forecasting services and pipeline: daemon,
+TabPFN client, context sent to the model, batch pipeline and engines.
+Preprocessing settings live in preprocessing_config.
+"""
+
+import os
+import tempfile
+from typing import Optional
+
+
+# ============================================================================
+# FORECASTING DAEMON AND TABPFN CLIENT
+# ============================================================================
+
+# Unix socket of the persistent forecasting daemon (python -m src.forecasting.daemon)
+DAEMON_SOCKET_PATH: str = os.path.join(tempfile.gettempdir(), "tabpfn_forecaster.sock")
+
+# TabPFN client mode: simultaneous API requests, timeout per request (seconds)
+# and attempts per request (see src.forecasting.concurrent_client)
+CLIENT_MAX_IN_FLIGHT: int = 4
+CLIENT_REQUEST_TIMEOUT_SECONDS: float = 600.0
+CLIENT_MAX_ATTEMPTS: int = 3
+
+
+# ============================================================================
+# MODEL CONTEXT
+# ============================================================================
+
+# Maximum number of context rows (accounts x months) sent to TabPFN in one
+# predict_df call; companies above this budget are forecasted in chunks of
+# accounts, which bounds peak memory (None disables chunking)
+TABPFN_MAX_ROWS_PER_CALL: Optional[int] = 20_000
+
+# Context sent to TabPFN: optionally drop the leading NaN months of accounts
+# opened after the start of the history (off by default, as it changes the
+# model input), and keep only the last N months (None keeps the full history;
+# see benchmarks/bench_context_trimming.py)
+TRIM_LEADING_NAN_CONTEXT: bool = False
+MAX_CONTEXT_MONTHS: Optional[int] = None
+
+
+# ============================================================================
+# BATCH PIPELINE
+# ============================================================================
+
+# Batch pipeline (see BatchProcessor): companies loaded ahead of the model and
+# forecasts waiting to be saved. Full queues pause the stage feeding them
+# (0 prefetch processes companies one stage after the other)
+PIPELINE_PREFETCH: int = 2
+PIPELINE_SAVE_QUEUE_SIZE: int = 2
+
+# Processing order of a run: 'alphabetical' (one forecast call per company) or
+# 'size' (largest companies first, small companies packed into shared forecast
+# calls, which puts series of several companies in the same model input)
+COMPANY_SCHEDULE: str = 'alphabetical'
+
+# Forecast of the inactive accounts (no data in the active window):
+# 'tabpfn' sends them to TabPFN with the others, 'zero' forecasts 0 and
+# 'naive' repeats their last observed value, without any TabPFN work
+INACTIVE_ACCOUNTS_FORECAST: str = 'tabpfn'
+
+# Forecast the sparse, constant and step-function accounts with closed-form
+# rules instead of TabPFN (see simple_patterns); off by default, as it changes
+# the forecasts of these accounts
+CLOSED_FORM_SIMPLE_PATTERNS: bool = False
+
+# Forecast versions saved when several engines run on the same input (see
+# MultiEngineForecaster): 'versions' (one per engine), 'ensemble' (their
+# equal-weight combination) or 'both'
+ENGINE_OUTPUT: str = 'versions'
+
@@ -61,6 +61,11 @@ ACTIVE_ACCOUNT_WINDOW_MONTHS: int = 12
 # Replace zero values with NaN (zeros are treated as missing data)
 REPLACE_ZEROS_WITH_NAN: bool = True
 
+# Parse FEC Debit/Credit to int64 cents and sum monthly totals in integers
+# (exact sums; monthly totals are converted to float euros). False keeps
+# float64 amounts
+AMOUNTS_IN_CENTS: bool = False
+
 
 # ============================================================================
 # MODEL SELECTION THRESHOLDS
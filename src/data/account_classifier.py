@@ -5,8 +5,9 @@ Loads and manages account type classifications (fixed, variable, revenue).
 """
 
 import os
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 
@@ -178,3 +179,40 @@ def get_account_type(
             f"Account {account} does not match any known prefixes. "
             f"Known prefixes: {prefixes}"
         )
+
+
+def get_account_types(
+    accounts: pd.Series,
+    prefixes: Dict[str, Tuple[str, ...]]
+) -> pd.Series:
+    """
+    Determine the type of many accounts, once per distinct account.
+
+    Parameters
+    ----------
+    accounts : pd.Series
+        Account numbers (strings or categorical, e.g. the CompteNum column
+        of ledger lines, see fec_loader.encode_accounts)
+    prefixes : Dict[str, Tuple[str, ...]]
+        Dictionary of account type prefixes from get_account_type_prefixes()
+
+    Returns
+    -------
+    pd.Series
+        Account type of each account (see get_account_type), None for
+        accounts matching no known prefix, with the index of accounts
+
+    Examples
+    --------
+    >>> get_account_types(pd.Series(["601000", "707030", "601000"]), prefixes).tolist()
+    ['variable_expenses', 'revenue', 'variable_expenses']
+    """
+    def account_type(account: str) -> Optional[str]:
+        try:
+            return get_account_type(account, prefixes)
+        except ValueError:
+            return None
+
+    codes, uniques = pd.factorize(accounts)
+    types = np.array([account_type(str(account)) for account in uniques] + [None], dtype=object)
+    return pd.Series(types[codes], index=accounts.index, name=accounts.name)
@@ -11,14 +11,106 @@ from typing import Optional, Tuple
 import numpy as np
 import pandas as pd
 
+from ..config import preprocessing_config as config
 
-def formatage(fec: pd.DataFrame) -> pd.DataFrame:
+
+FEC_DATE_COLUMNS = ["EcritureDate", "PieceDate", "DateLet", "ValidDate"]
+
+
+def parse_fec_dates(values: pd.Series) -> pd.Series:
+    """
+    Parse a FEC date column (YYYYMMDD) one distinct value at a time.
+
+    A ledger has a few thousand distinct dates over millions of lines: the
+    column is factorized, its distinct values are parsed with
+    pd.to_datetime(format="%Y%m%d") and the parsed dates are taken back to
+    every line. The result is the same as parsing the full column, empty
+    and missing values (e.g. unlettered DateLet) giving NaT.
+
+    Parameters
+    ----------
+    values : pd.Series
+        Dates as YYYYMMDD strings or integers, as read from a FEC file.
+
+    Returns
+    -------
+    pd.Series
+        datetime64 dates, with the index of values.
+    """
+    codes, uniques = pd.factorize(values)
+    parsed = pd.to_datetime(uniques, format="%Y%m%d").to_numpy()
+    # Missing values have code -1: the NaT appended last
+    parsed = np.append(parsed, np.datetime64("NaT", "ns"))
+    return pd.Series(parsed[codes], index=values.index, name=values.name)
+
+
+def encode_accounts(values: pd.Series, digits: int = 6) -> pd.Series:
+    """
+    Encode account numbers as a categorical of their first digits.
+
+    Each distinct account is truncated once: lines hold a compact integer
+    code into the sorted dictionary of accounts (the categories), so that
+    prefix filters and account-type lookups can be evaluated once per
+    account rather than once per ledger line (see fec_to_monthly_totals).
+
+    Parameters
+    ----------
+    values : pd.Series
+        Account numbers (strings).
+    digits : int, default=6
+        Number of leading digits kept.
+
+    Returns
+    -------
+    pd.Series
+        Categorical account numbers, with the index of values.
+    """
+    codes, uniques = pd.factorize(values)
+    truncated = pd.Index(uniques.astype(str)).str[:digits]
+    account_codes, accounts = pd.factorize(truncated, sort=True)
+    # Missing values keep code -1
+    codes = np.append(account_codes, -1)[codes]
+    return pd.Series(
+        pd.Categorical.from_codes(codes, categories=accounts),
+        index=values.index,
+        name=values.name
+    )
+
+
+def parse_amounts(values: pd.Series, in_cents: bool = False) -> pd.Series:
+    """
+    Parse a FEC amount column (comma as decimal separator).
+
+    Parameters
+    ----------
+    values : pd.Series
+        Amounts as read from a FEC file ("1500,50").
+    in_cents : bool, default=False
+        If True, return int64 cents: each amount is rounded to the cent once,
+        and sums of cents are exact (float sums of euros leave rounding noise
+        in monthly totals). Missing amounts are 0 cents.
+
+    Returns
+    -------
+    pd.Series
+        float64 amounts, or int64 cents if in_cents.
+    """
+    if not pd.api.types.is_numeric_dtype(values):
+        values = values.str.replace(",", ".").astype("float")
+    else:
+        values = values.astype("float")
+    if not in_cents:
+        return values
+    return np.rint(values.fillna(0) * 100).astype("int64")
+
+
+def formatage(fec: pd.DataFrame, amounts_in_cents: Optional[bool] = None) -> pd.DataFrame:
     """
     Format FEC data for easier manipulation.
 
     Converts data types and removes certain journal entries:
-    - Converts Debit/Credit columns to float
-    - Converts date columns to datetime
+    - Converts Debit/Credit columns to float (or int64 cents)
+    - Converts date columns to datetime (see parse_fec_dates)
     - Converts CompteNum to string
     - Removes opening balance (AN) and adjustment (AD) journal entries
 
@@ -26,6 +118,9 @@ def formatage(fec: pd.DataFrame) -> pd.DataFrame:
     ----------
     fec : pd.DataFrame
         Raw FEC DataFrame
+    amounts_in_cents : bool, optional
+        If True, Debit and Credit are int64 cents (see parse_amounts).
+        Defaults to config.AMOUNTS_IN_CENTS
 
     Returns
     -------
@@ -44,18 +139,21 @@ def formatage(fec: pd.DataFrame) -> pd.DataFrame:
         - ValidDate: Validation date
         - CompteNum: Account number
     """
+    if amounts_in_cents is None:
+        amounts_in_cents = config.AMOUNTS_IN_CENTS
+
     # Convert Debit and Credit columns to float (comma → decimal point)
-    fec["Debit"] = fec["Debit"].str.replace(",", ".").astype("float")
-    fec["Credit"] = fec["Credit"].str.replace(",", ".").astype("float")
+    fec["Debit"] = parse_amounts(fec["Debit"], amounts_in_cents)
+    fec["Credit"] = parse_amounts(fec["Credit"], amounts_in_cents)
     
-    # Convert date columns to datetime
-    fec["EcritureDate"] = pd.to_datetime(fec["EcritureDate"], format="%Y%m%d")
-    fec["PieceDate"] = pd.to_datetime(fec["PieceDate"], format="%Y%m%d")
-    fec["DateLet"] = pd.to_datetime(fec["DateLet"], format="%Y%m%d")
-    fec["ValidDate"] = pd.to_datetime(fec["ValidDate"], format="%Y%m%d")
+    # Convert date columns to datetime (parsing each distinct date once)
+    for column in FEC_DATE_COLUMNS:
+        fec[column] = parse_fec_dates(fec[column])
     
-    # Account numbers are easier to manipulate as strings
-    fec["CompteNum"] = fec["CompteNum"].astype(str)
+    # Account numbers are easier to manipulate as strings (converted once
+    # per distinct account)
+    codes, uniques = pd.factorize(fec["CompteNum"], use_na_sentinel=False)
+    fec["CompteNum"] = uniques.astype(str).to_numpy(dtype=object)[codes]
     
     # Remove opening balance (AN) and adjustment (AD) journals
     # These are not accounting entries but management entries
@@ -64,7 +162,7 @@ def formatage(fec: pd.DataFrame) -> pd.DataFrame:
     return fec
 
 
-def import_fecs(fecs_folder_path: str) -> pd.DataFrame:
+def import_fecs(fecs_folder_path: str, amounts_in_cents: Optional[bool] = None) -> pd.DataFrame:
     """
     Import all FEC files from a folder.
 
@@ -75,6 +173,9 @@ def import_fecs(fecs_folder_path: str) -> pd.DataFrame:
     ----------
     fecs_folder_path : str
         Path to the folder containing FEC files
+    amounts_in_cents : bool, optional
+        If True, Debit and Credit are int64 cents (see formatage).
+        Defaults to config.AMOUNTS_IN_CENTS
 
     Returns
     -------
@@ -100,7 +201,7 @@ def import_fecs(fecs_folder_path: str) -> pd.DataFrame:
             # Import the FEC
             fec = pd.read_csv(os.path.join(fecs_folder_path, file), sep="\t")
             # Format the FEC data
-            fec = formatage(fec)
+            fec = formatage(fec, amounts_in_cents)
             # Add to the list of FECs to concatenate
             fecs_to_concat.append(fec)
     
@@ -117,14 +218,16 @@ def load_fecs(
     fecs_folder_path: str,
     accounting_up_to_date: Optional[pd.Timestamp] = None,
     train_test_split: bool = True,
-    forecast_horizon: int = 12
+    forecast_horizon: int = 12,
+    amounts_in_cents: Optional[bool] = None
 ) -> Tuple[pd.DataFrame, Optional[pd.DataFrame]]:
     """
     Load FEC files for a company with optional train/test split.
 
     This function:
     1. Loads all FEC files from the company folder
-    2. Truncates account numbers to 6 digits
+    2. Truncates account numbers to 6 digits, encoded as a categorical
+       (see encode_accounts)
     3. Optionally filters data up to a cutoff date
     4. Optionally splits into train and test sets
 
@@ -140,6 +243,9 @@ def load_fecs(
         If True, split into train/test sets based on forecast_horizon
     forecast_horizon : int, default=12
         Number of months for the test set (when train_test_split=True)
+    amounts_in_cents : bool, optional
+        If True, Debit and Credit are int64 cents (see formatage).
+        Defaults to config.AMOUNTS_IN_CENTS
 
     Returns
     -------
@@ -165,10 +271,10 @@ def load_fecs(
     """
     # Load the FECs from company folder
     company_folder_path = os.path.join(fecs_folder_path, company_id)
-    fecs = import_fecs(company_folder_path)
+    fecs = import_fecs(company_folder_path, amounts_in_cents)
 
     # Ensure account numbers are 6 digits (truncate if longer)
-    fecs.loc[:, 'CompteNum'] = fecs['CompteNum'].str[:6]
+    fecs['CompteNum'] = encode_accounts(fecs['CompteNum'], digits=6)
     
     # Filter by accounting up to date if provided
     if accounting_up_to_date is not None:
@@ -14,7 +14,7 @@ import numpy as np
 import pandas as pd
 
 from ..config import preprocessing_config as config
-from .account_classifier import get_account_type_prefixes
+from .account_classifier import get_account_type_prefixes, get_account_types
 
 
 class PreprocessingResult:
@@ -172,22 +172,9 @@ def preprocess_data(
     # Step 5: Get account type prefixes
     account_type_prefixes = get_account_type_prefixes(classification_charges)
 
-    # Step 6: Filter by account type
-    filtered_data_wide_format = data_wide_format.loc[
-        :,
-        data_wide_format.columns.str.startswith(
-            account_type_prefixes["fixed_expenses_prefixes"]
-        ) |
-        data_wide_format.columns.str.startswith(
-            account_type_prefixes["variable_expenses_prefixes"]
-        ) |
-        data_wide_format.columns.str.startswith(
-            account_type_prefixes["revenue_prefixes"]
-        ) |
-        data_wide_format.columns.str.startswith(
-            account_type_prefixes["untyped_forecastable_prefixes"]
-        )
-    ]
+    # Step 6: Filter by account type (typed once per account)
+    account_types = get_account_types(pd.Series(data_wide_format.columns), account_type_prefixes)
+    filtered_data_wide_format = data_wide_format.loc[:, account_types.notna().to_numpy()]
 
     # Step 7: Keep only active accounts (with data in last N months)
     last_n_months = filtered_data_wide_format.tail(active_window_months)
@@ -213,7 +200,8 @@ def fec_to_monthly_totals(
     Parameters
     ----------
     fecs : pd.DataFrame
-        Formatted FEC data (from fec_loader.formatage())
+        Formatted FEC data (from fec_loader.formatage()), with float Debit
+        and Credit or int64 cents (amounts_in_cents=True)
     account_prefixes : tuple, optional
         Tuple of account prefixes to filter (e.g., ('6', '7') for expenses and revenue).
         If None, includes all accounts starting with '6' or '7'
@@ -224,7 +212,7 @@ def fec_to_monthly_totals(
         Monthly totals with columns:
         - PieceDate: First day of month (datetime)
         - CompteNum: Account number (string)
-        - Solde: Monthly balance (Debit - Credit)
+        - Solde: Monthly balance (Debit - Credit), float in euros
 
     Examples
     --------
@@ -243,10 +231,16 @@ def fec_to_monthly_totals(
     if account_prefixes is None:
         account_prefixes = ('6', '7')
     
+    # Accounts as codes into the sorted dictionary of distinct accounts
+    # (see fec_loader.encode_accounts): prefixes are matched once per account
+    accounts = fecs['CompteNum'].astype('category')
+    categories = accounts.cat.categories.astype(str)
+    codes = accounts.cat.codes.to_numpy()
+
     # Filter to relevant accounts
-    filtered_fecs = fecs[
-        fecs['CompteNum'].str.startswith(account_prefixes)
-    ].copy()
+    relevant = np.asarray(categories.str.startswith(account_prefixes), dtype=bool)[codes] & (codes >= 0)
+    filtered_fecs = fecs[relevant]
+    codes = codes[relevant]
 
     # Handle empty DataFrame case early
     if filtered_fecs.empty:
@@ -256,22 +250,24 @@ def fec_to_monthly_totals(
     # Revenue accounts (7xx): Solde = Credit - Debit (positive values)
     # Expense accounts (6xx): Solde = Debit - Credit (positive values)
     # This ensures both revenue and expenses have positive values for easier interpretation
-    
-    def calculate_solde(row: pd.Series) -> float:
-        """Calculate Solde based on account type."""
-        if row['CompteNum'].startswith('7'):
-            # Revenue: Credit - Debit (positive when credit > debit)
-            return row['Credit'] - row['Debit']
-        else:
-            # Expenses: Debit - Credit (positive when debit > credit)
-            return row['Debit'] - row['Credit']
-    
-    filtered_fecs['Solde'] = filtered_fecs.apply(calculate_solde, axis=1)
-
-    # Aggregate by month and account
-    monthly_totals = filtered_fecs.groupby([
+    is_revenue = np.asarray(categories.str.startswith('7'), dtype=bool)[codes]
+    debit = filtered_fecs['Debit'].to_numpy()
+    credit = filtered_fecs['Credit'].to_numpy()
+
+    # Aggregate by month and account code, then decode the accounts
+    monthly_totals = pd.DataFrame({
+        'PieceDate': filtered_fecs['PieceDate'].to_numpy(),
+        'CompteNum': codes,
+        'Solde': np.where(is_revenue, credit - debit, debit - credit),
+    }).groupby([
         pd.Grouper(key='PieceDate', freq='MS'),  # Month start
         'CompteNum'
     ])['Solde'].sum().reset_index()
+    monthly_totals['CompteNum'] = categories.to_numpy(dtype=object)[monthly_totals['CompteNum'].to_numpy()]
+
+    # Amounts in cents (see fec_loader.parse_amounts) are summed exactly,
+    # then converted to euros
+    if pd.api.types.is_integer_dtype(monthly_totals['Solde']):
+        monthly_totals['Solde'] = monthly_totals['Solde'] / 100
 
     return monthly_totals
@@ -2,12 +2,32 @@
 TabPFN forecasting pipeline module.
 """
 
-from src.forecasting.data_converter import (
-    wide_to_tabpfn_format,
-    tabpfn_output_to_wide_format,
-)
+import importlib
+
+
+# Public names and the submodule defining them. Submodules are imported on
+# first attribute access so that importing src.forecasting.cli stays cheap.
+_LAZY_IMPORTS = {
+    'wide_to_tabpfn_format': 'src.forecasting.data_converter',
+    'tabpfn_output_to_wide_format': 'src.forecasting.data_converter',
+}
 
 __all__ = [
     'wide_to_tabpfn_format',
     'tabpfn_output_to_wide_format',
 ]
+
+
+def __getattr__(name):
+    """Import public names from their submodule on first access."""
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name])
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """List public names, including those not imported yet."""
+    return sorted(set(globals()) | set(__all__))
@@ -2,25 +2,369 @@
 Batch processor for running forecasts across multiple companies.
 
 This module orchestrates the complete forecasting pipeline for one or more companies,
-including preprocessing, forecasting with TabPFN, and saving results.
+including preprocessing, forecasting with TabPFN, and saving results. Every stage
+is timed with a StageTimer and reported in the company result.
+
+Companies flow through three stages running in their own threads: load and
+preprocess, predict, and save (results and metadata). Bounded queues between
+the stages let company N+1 load and company N-1 be written while company N is
+being forecasted, without preparing more companies than the model can absorb.
 """
 
+import queue
+import threading
 import uuid
-from typing import List, Literal
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Literal, Optional, Tuple
 import pandas as pd
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
+from rich.progress import (
+    Progress,
+    SpinnerColumn,
+    TextColumn,
+    BarColumn,
+    TimeElapsedColumn,
+    TimeRemainingColumn,
+)
 
 from src.data.fec_loader import load_fecs
 from src.data.account_classifier import load_classification_charges
-from src.data.preprocessing import fec_to_monthly_totals, preprocess_data
-from src.forecasting.tabpfn_forecaster import TabPFNForecaster
+from src.config.forecasting_config import (
+    CLOSED_FORM_SIMPLE_PATTERNS,
+    ENGINE_OUTPUT,
+    INACTIVE_ACCOUNTS_FORECAST,
+    PIPELINE_PREFETCH,
+    PIPELINE_SAVE_QUEUE_SIZE,
+)
+from src.data.preprocessing import PreprocessingResult, fec_to_monthly_totals, preprocess_data
+from src.forecasting.concurrent_client import ConcurrentForecastClient
+from src.forecasting.data_converter import combine_wide_frames, split_wide_frame
+from src.forecasting.engines import engine_label, version_name
+from src.forecasting.multi_engine import MultiEngineForecaster
+from src.forecasting.profiling import StageTimer
+from src.forecasting.simple_patterns import classify_simple_patterns, forecast_simple_patterns
+from src.forecasting.tabpfn_forecaster import ForecastResult, TabPFNForecaster
 from src.forecasting.result_saver import (
     save_forecast_result,
     save_forecast_result_with_ci,
     update_company_metadata,
 )
 from src.forecasting.company_discovery import get_company_info
+from src.metrics.pipeline import compute_metrics_from_frames
+
+
+@dataclass
+class PreparedCompany:
+    """
+    A company loaded and preprocessed, waiting to be forecasted.
+    
+    Attributes
+    ----------
+    company_id : str
+        Company identifier.
+    preprocessing_result : PreprocessingResult
+        Output of preprocess_data.
+    timer : StageTimer
+        Timer of the company (stages recorded so far).
+    closed_form_types : Dict[str, str]
+        Forecast type of the accounts forecasted without the model (inactive
+        accounts and simple patterns), e.g. {'613200': 'Constant'}.
+    closed_form_forecast : Optional[pd.DataFrame]
+        Forecast of these accounts (None if there are none).
+    forecast_result : Optional[ForecastResult]
+        Saved forecast of every account (set by save_company).
+    monthly_train : Optional[pd.DataFrame]
+        Monthly totals of the training FECs (kept only to compute metrics).
+    monthly_test : Optional[pd.DataFrame]
+        Monthly totals of the test FECs (kept only to compute metrics).
+    """
+    
+    company_id: str
+    preprocessing_result: PreprocessingResult
+    timer: StageTimer
+    closed_form_types: Dict[str, str] = field(default_factory=dict)
+    closed_form_forecast: Optional[pd.DataFrame] = None
+    forecast_result: Optional[ForecastResult] = None
+    monthly_train: Optional[pd.DataFrame] = None
+    monthly_test: Optional[pd.DataFrame] = None
+    
+    @property
+    def data_wide(self) -> pd.DataFrame:
+        """Wide-format input of the forecaster (accounts without a closed-form forecast)."""
+        data_wide = self.preprocessing_result.filtered_data_wide_format
+        if self.closed_form_types:
+            return data_wide[[account for account in data_wide.columns if account not in self.closed_form_types]]
+        return data_wide
+    
+    @property
+    def is_forecastable(self) -> bool:
+        """Whether the company has at least one forecastable account."""
+        return len(self.preprocessing_result.forecastable_accounts) > 0
+    
+    @property
+    def needs_model(self) -> bool:
+        """Whether some accounts are left for the forecaster."""
+        return self.data_wide.shape[1] > 0
+
+
+def _failed_result(company_id: str, status: str, timer: StageTimer) -> dict:
+    """Result of a company that produced no forecast."""
+    return {
+        'company_id': company_id,
+        'process_id': None,
+        'status': status,
+        'accounts_forecasted': 0,
+        'stages': timer.to_dict()
+    }
+
+
+@dataclass
+class CompanyOutcome:
+    """
+    A processed company, as yielded by BatchProcessor.iter_companies.
+    
+    Attributes
+    ----------
+    result : dict
+        Company result (the dictionary returned by process_companies).
+    prepared : Optional[PreparedCompany]
+        In-memory data of the company (None if it failed to load).
+    """
+    
+    result: dict
+    prepared: Optional[PreparedCompany] = None
+    
+    @property
+    def company_id(self) -> str:
+        """Company identifier."""
+        return self.result['company_id']
+    
+    @property
+    def forecast_result(self) -> Optional[ForecastResult]:
+        """Saved forecast of every account (None unless the company succeeded)."""
+        return self.prepared.forecast_result if self.prepared is not None else None
+
+
+class _ProcessingCancelled(Exception):
+    """Raised to stop processing when an iter_companies generator is closed."""
+
+
+# Marks the end of the items of a pipeline queue
+_END_OF_QUEUE = object()
+
+
+def _count_types(forecast_types: Dict[str, str]) -> Dict[str, int]:
+    """Number of accounts per forecast type."""
+    counts: Dict[str, int] = {}
+    for forecast_type in forecast_types.values():
+        counts[forecast_type] = counts.get(forecast_type, 0) + 1
+    return counts
+
+
+def _check_batches(company_ids: List[str], batches: Optional[List[List[str]]]) -> List[List[str]]:
+    """Return the processing batches (one company each if None) after checking they partition company_ids."""
+    if batches is None:
+        return [[company_id] for company_id in company_ids]
+    if sorted(c for batch in batches for c in batch) != sorted(company_ids):
+        raise ValueError("batches must contain every company of company_ids exactly once")
+    return batches
+
+
+def _group_input(group: List[PreparedCompany]) -> pd.DataFrame:
+    """Forecaster input of a group of companies sharing a forecast call."""
+    if len(group) == 1:
+        return group[0].data_wide
+    return combine_wide_frames({prepared.company_id: prepared.data_wide for prepared in group})
+
+
+def _future_index(history_index: pd.Index, prediction_length: int) -> pd.DatetimeIndex:
+    """Monthly forecast dates following the history."""
+    return pd.date_range(history_index[-1], periods=prediction_length + 1, freq='MS', name='ds')[1:]
+
+
+def _inactive_forecast(history: pd.DataFrame, index: pd.Index, method: str) -> pd.DataFrame:
+    """
+    Forecast inactive accounts without the model.
+    
+    'zero' forecasts 0 and 'naive' repeats the last observed value of each
+    account (0 for an account without any value).
+    """
+    if method == 'naive':
+        values = history.ffill().iloc[-1].fillna(0.0) if len(history) else pd.Series(0.0, index=history.columns)
+    else:
+        values = pd.Series(0.0, index=history.columns)
+    return pd.DataFrame([values.to_numpy(dtype=float)] * len(index), index=index, columns=history.columns)
+
+
+def closed_form_forecast(
+    preprocessing_result: PreprocessingResult,
+    forecast_horizon: int = 12,
+    inactive_accounts: str = INACTIVE_ACCOUNTS_FORECAST,
+    use_simple_patterns: bool = CLOSED_FORM_SIMPLE_PATTERNS
+) -> Tuple[Dict[str, str], Optional[pd.DataFrame]]:
+    """
+    Forecast the accounts of a company that do not need the model.
+    
+    Parameters
+    ----------
+    preprocessing_result : PreprocessingResult
+        Output of preprocess_data.
+    forecast_horizon : int, default=12
+        Number of months to forecast.
+    inactive_accounts : str, default=INACTIVE_ACCOUNTS_FORECAST
+        'tabpfn', 'zero' or 'naive' (see BatchProcessor).
+    use_simple_patterns : bool, default=CLOSED_FORM_SIMPLE_PATTERNS
+        Forecast simple patterns in closed form (see simple_patterns).
+    
+    Returns
+    -------
+    Tuple[Dict[str, str], Optional[pd.DataFrame]]
+        Forecast type of each of these accounts and their forecast (None if
+        there are none).
+    """
+    forecastable = set(preprocessing_result.forecastable_accounts)
+    if not forecastable:
+        # The company is not forecasted at all
+        return {}, None
+    data_wide = preprocessing_result.filtered_data_wide_format
+    
+    inactive = []
+    if inactive_accounts != 'tabpfn':
+        inactive = [account for account in data_wide.columns if account not in forecastable]
+    patterns = {}
+    if use_simple_patterns:
+        active = [account for account in data_wide.columns if account in forecastable]
+        patterns = classify_simple_patterns(data_wide[active])
+    
+    if not inactive and not patterns:
+        return {}, None
+    
+    inactive_type = 'Zero' if inactive_accounts == 'zero' else 'Naive'
+    closed_form_types = {account: inactive_type for account in inactive}
+    closed_form_types.update(patterns)
+    
+    index = _future_index(data_wide.index, forecast_horizon)
+    frames = []
+    if inactive:
+        frames.append(_inactive_forecast(data_wide[inactive], index, inactive_accounts))
+    if patterns:
+        frames.append(forecast_simple_patterns(data_wide, patterns, index))
+    return closed_form_types, pd.concat(frames, axis=1)
+
+
+def add_closed_form_forecasts(
+    forecast_result: Optional[ForecastResult],
+    prepared: PreparedCompany,
+    prediction_length: int
+) -> ForecastResult:
+    """
+    Complete a model forecast with the closed-form one, in column order.
+    
+    Closed-form accounts have no prediction interval: their lower and upper
+    bounds equal the forecast.
+    """
+    data_wide = prepared.preprocessing_result.filtered_data_wide_format
+    columns = list(data_wide.columns)
+    closed_form = prepared.closed_form_forecast
+    
+    if forecast_result is None:
+        # Every account has a closed-form forecast
+        forecast_df = closed_form[columns]
+        return ForecastResult(
+            forecast_df=forecast_df,
+            forecast_lower_df=forecast_df.copy(),
+            forecast_upper_df=forecast_df.copy(),
+            accounts=columns,
+            prediction_length=prediction_length,
+            elapsed_time=0.0
+        )
+    
+    def complete(frame: Optional[pd.DataFrame]) -> Optional[pd.DataFrame]:
+        if frame is None:
+            return None
+        return pd.concat([frame, closed_form.set_axis(frame.index)], axis=1)[columns]
+    
+    return ForecastResult(
+        forecast_df=complete(forecast_result.forecast_df),
+        forecast_lower_df=complete(forecast_result.forecast_lower_df),
+        forecast_upper_df=complete(forecast_result.forecast_upper_df),
+        accounts=columns,
+        prediction_length=forecast_result.prediction_length,
+        elapsed_time=forecast_result.elapsed_time,
+        engine=forecast_result.engine
+    )
+
+
+def build_account_metadata(
+    accounts: List[str],
+    closed_form_types: Dict[str, str],
+    engine: str = 'tabpfn'
+) -> Dict[str, Dict[str, str]]:
+    """
+    Account metadata of a forecast version (account_type and forecast_type).
+    
+    Parameters
+    ----------
+    accounts : List[str]
+        Forecasted accounts.
+    closed_form_types : Dict[str, str]
+        Forecast type of the accounts forecasted without the model.
+    engine : str, default='tabpfn'
+        Engine of the other accounts (its label is their forecast_type).
+    
+    Returns
+    -------
+    Dict[str, Dict[str, str]]
+        Metadata of each account, as written to company.json.
+    """
+    model_type = engine_label(engine)
+    account_metadata = {}
+    for account in accounts:
+        # Determine account type
+        account_prefix = account[:3] if len(account) >= 3 else account
+        account_type = 'revenue' if account_prefix.startswith('7') else 'expense'
+        
+        account_metadata[account] = {
+            'account_type': account_type,
+            'forecast_type': closed_form_types.get(account, model_type)
+        }
+    return account_metadata
+
+
+def _split_forecast_result(forecast_result: ForecastResult, company_id: str, share: float) -> ForecastResult:
+    """Extract one company's forecast (and its engines' forecasts) from a shared batch forecast."""
+    def split(frame: Optional[pd.DataFrame]) -> Optional[pd.DataFrame]:
+        return split_wide_frame(frame, company_id) if frame is not None else None
+    
+    engine_results = None
+    if isinstance(forecast_result.engine_results, dict):
+        engine_results = {
+            engine: _split_forecast_result(result, company_id, share)
+            for engine, result in forecast_result.engine_results.items()
+        }
+    
+    forecast_df = split(forecast_result.forecast_df)
+    return ForecastResult(
+        forecast_df=forecast_df,
+        forecast_lower_df=split(forecast_result.forecast_lower_df),
+        forecast_upper_df=split(forecast_result.forecast_upper_df),
+        accounts=list(forecast_df.columns),
+        prediction_length=forecast_result.prediction_length,
+        elapsed_time=forecast_result.elapsed_time * share,
+        engine=forecast_result.engine,
+        engine_results=engine_results
+    )
+
+
+def _engine_names(forecaster) -> List[str]:
+    """Engines run by a forecaster ('tabpfn' for a forecaster without engines, such as a DaemonClient)."""
+    if isinstance(forecaster, ConcurrentForecastClient):
+        forecaster = forecaster.forecaster
+    if isinstance(forecaster, MultiEngineForecaster):
+        return forecaster.engines
+    engine = getattr(forecaster, 'engine', None)
+    return [engine] if isinstance(engine, str) else ['tabpfn']
 
 
 class BatchProcessor:
@@ -41,6 +385,32 @@ class BatchProcessor:
         Root data folder path.
     forecast_horizon : int, default=12
         Number of months to forecast.
+    forecaster : Optional[TabPFNForecaster], default=None
+        Forecaster to use instead of building a new one, e.g. a DaemonClient
+        talking to a warm forecasting daemon, or a MultiEngineForecaster
+        running several engines on each company.
+    inactive_accounts : str, default=INACTIVE_ACCOUNTS_FORECAST
+        Forecast of the accounts without data in the active window: 'tabpfn'
+        (forecasted with the others), 'zero' or 'naive' (last observed value,
+        without TabPFN).
+    use_simple_patterns : bool, default=CLOSED_FORM_SIMPLE_PATTERNS
+        Forecast sparse, constant and step-function accounts with closed-form
+        rules instead of TabPFN (see simple_patterns).
+    prefetch : int, default=PIPELINE_PREFETCH
+        Forecast calls prepared ahead of the model by the loading thread
+        (0 disables the pipeline: companies are loaded, forecasted and saved
+        one after the other).
+    save_queue_size : int, default=PIPELINE_SAVE_QUEUE_SIZE
+        Forecasts waiting for the saving thread before the model pauses.
+    with_metrics : bool, default=False
+        Compute the metrics of each forecast from the in-memory forecast and
+        monthly totals, and write them with the forecast version (one
+        company.json write, no reload as in compute_metrics_for_company).
+    engine_output : str, default=ENGINE_OUTPUT
+        Forecast versions saved with a MultiEngineForecaster: 'versions'
+        (one per engine), 'ensemble' or 'both'. Accounts forecasted by an
+        engine have its label as forecast_type (e.g. 'TabPFN',
+        'Seasonal Naive', 'Ensemble').
     
     Examples
     --------
@@ -54,36 +424,58 @@ class BatchProcessor:
         self,
         mode: Literal['local', 'client'] = 'local',
         data_folder: str = "data",
-        forecast_horizon: int = 12
+        forecast_horizon: int = 12,
+        forecaster: Optional[TabPFNForecaster] = None,
+        inactive_accounts: str = INACTIVE_ACCOUNTS_FORECAST,
+        use_simple_patterns: bool = CLOSED_FORM_SIMPLE_PATTERNS,
+        prefetch: int = PIPELINE_PREFETCH,
+        save_queue_size: int = PIPELINE_SAVE_QUEUE_SIZE,
+        with_metrics: bool = False,
+        engine_output: str = ENGINE_OUTPUT
     ):
         """Initialize batch processor."""
+        if inactive_accounts not in ('tabpfn', 'zero', 'naive'):
+            raise ValueError("inactive_accounts must be 'tabpfn', 'zero' or 'naive'")
+        if engine_output not in ('versions', 'ensemble', 'both'):
+            raise ValueError("engine_output must be 'versions', 'ensemble' or 'both'")
+        
         self.mode = mode
+        self.inactive_accounts = inactive_accounts
+        self.use_simple_patterns = use_simple_patterns
+        self.prefetch = prefetch
+        self.save_queue_size = save_queue_size
+        self.with_metrics = with_metrics
+        self.engine_output = engine_output
         self.data_folder = data_folder
         self.forecast_horizon = forecast_horizon
         self.console = Console()
-        self.forecaster = TabPFNForecaster(mode=mode)
+        self.forecaster = forecaster if forecaster is not None else TabPFNForecaster(mode=mode)
+        self.engines = _engine_names(self.forecaster)
         self.classification = load_classification_charges()
     
-    def process_company(self, company_id: str) -> dict:
+    def prepare_company(self, company_id: str, timer: StageTimer) -> PreparedCompany:
         """
-        Process a single company.
+        Load and preprocess the data of a company.
         
         Parameters
         ----------
         company_id : str
             Company identifier.
+        timer : StageTimer
+            Timer recording the 'load', 'monthly_totals' and 'preprocess' stages.
         
         Returns
         -------
-        dict
-            Results dictionary with process_id, status, and metadata.
+        PreparedCompany
+            Preprocessed company, ready to be forecasted. Accounts that do not
+            need the model (inactive accounts, simple patterns) are already
+            forecasted, in the 'closed_form' stage.
         """
-        try:
-            # Load company info
+        # Load company info and FEC data
+        with timer.span('load'):
             company_info = get_company_info(company_id, self.data_folder)
             accounting_date = pd.Timestamp(company_info.accounting_up_to_date)
             
-            # Load and preprocess data
             fecs_train, fecs_test = load_fecs(
                 company_id=company_id,
                 fecs_folder_path=self.data_folder,
@@ -91,34 +483,148 @@ class BatchProcessor:
                 train_test_split=True,
                 forecast_horizon=self.forecast_horizon
             )
-            
+        
+        with timer.span('monthly_totals'):
             monthly_totals = fec_to_monthly_totals(fecs_train)
-            
+            monthly_test = fec_to_monthly_totals(fecs_test) if self.with_metrics else None
+        
+        with timer.span('preprocess'):
             preprocessing_result = preprocess_data(
                 monthly_totals=monthly_totals,
                 accounting_date_up_to_date=accounting_date,
                 classification_charges=self.classification
             )
-            
-            # Check if we have forecastable accounts
-            if len(preprocessing_result.forecastable_accounts) == 0:
-                return {
-                    'company_id': company_id,
-                    'process_id': None,
-                    'status': 'No forecastable accounts',
-                    'accounts_forecasted': 0
-                }
-            
-            # Run forecast
-            forecast_result = self.forecaster.forecast(
-                data_wide=preprocessing_result.filtered_data_wide_format,
-                prediction_length=self.forecast_horizon
-            )
-            
-            # Generate process ID
-            process_id = str(uuid.uuid4())
-            
-            # Save results (with CI if available)
+        
+        with timer.span('closed_form'):
+            closed_form_types, closed_form_forecast = self._closed_form_forecast(preprocessing_result)
+        
+        return PreparedCompany(
+            company_id=company_id,
+            preprocessing_result=preprocessing_result,
+            timer=timer,
+            closed_form_types=closed_form_types,
+            closed_form_forecast=closed_form_forecast,
+            monthly_train=monthly_totals if self.with_metrics else None,
+            monthly_test=monthly_test
+        )
+    
+    def _closed_form_forecast(
+        self,
+        preprocessing_result: PreprocessingResult
+    ) -> Tuple[Dict[str, str], Optional[pd.DataFrame]]:
+        """Forecast the accounts that do not need the model (see closed_form_forecast)."""
+        return closed_form_forecast(
+            preprocessing_result,
+            forecast_horizon=self.forecast_horizon,
+            inactive_accounts=self.inactive_accounts,
+            use_simple_patterns=self.use_simple_patterns
+        )
+    
+    def save_company(self, prepared: PreparedCompany, forecast_result: ForecastResult) -> dict:
+        """
+        Save the forecast of a company and update its metadata.
+        
+        Parameters
+        ----------
+        prepared : PreparedCompany
+            Company returned by prepare_company.
+        forecast_result : ForecastResult
+            Forecast of the accounts in prepared.data_wide, completed here
+            with the closed-form forecasts. None if every account has a
+            closed-form forecast.
+        
+        Returns
+        -------
+        dict
+            Success result of the company. With several engines, 'versions'
+            maps the name of each saved forecast version to its process ID
+            and 'process_id' is the first one.
+        """
+        company_id = prepared.company_id
+        timer = prepared.timer
+        closed_form_types = prepared.closed_form_types
+        
+        versions = self._forecast_versions(forecast_result)
+        saved = {}
+        metrics_statuses = []
+        for engine, engine_result in versions:
+            if closed_form_types:
+                engine_result = add_closed_form_forecasts(engine_result, prepared, self.forecast_horizon)
+            process_id, metrics_status = self._save_version(prepared, engine, engine_result)
+            saved[version_name(engine)] = process_id
+            if metrics_status is not None:
+                metrics_statuses.append(metrics_status)
+            if prepared.forecast_result is None:
+                prepared.forecast_result = engine_result
+        
+        forecast_result = prepared.forecast_result
+        result = {
+            'company_id': company_id,
+            'process_id': next(iter(saved.values())),
+            'status': 'Success',
+            'accounts_forecasted': len(forecast_result.accounts),
+            'model_accounts': len(forecast_result.accounts) - len(closed_form_types),
+            'closed_form_accounts': _count_types(closed_form_types),
+            'elapsed_time': forecast_result.elapsed_time,
+            'context_months': len(prepared.preprocessing_result.filtered_data_wide_format),
+            'total_time': timer.total_wall_seconds,
+            'stages': timer.to_dict()
+        }
+        if len(saved) > 1 or len(self.engines) > 1:
+            result['versions'] = saved
+        if metrics_statuses:
+            errors = [status for status in metrics_statuses if status != 'Success']
+            result['metrics_status'] = errors[0] if errors else 'Success'
+        return result
+    
+    def _forecast_versions(self, forecast_result: Optional[ForecastResult]) -> List[Tuple[str, Optional[ForecastResult]]]:
+        """
+        Forecast versions to save, as (engine, forecast) pairs.
+        
+        A single engine gives one version. The forecast of several engines
+        (see MultiEngineForecaster) gives one version per engine, the
+        ensemble or both, according to engine_output. Forecasts are None if
+        every account has a closed-form forecast.
+        """
+        if forecast_result is not None and not isinstance(forecast_result.engine_results, dict):
+            engine = forecast_result.engine if isinstance(forecast_result.engine, str) else self.engines[0]
+            return [(engine, forecast_result)]
+        
+        if forecast_result is not None:
+            engine_results = forecast_result.engine_results
+        else:
+            engine_results = {engine: None for engine in self.engines}
+        if len(engine_results) == 1:
+            return list(engine_results.items())
+        
+        versions = []
+        if self.engine_output in ('ensemble', 'both'):
+            versions.append(('ensemble', forecast_result))
+        if self.engine_output in ('versions', 'both'):
+            versions.extend(engine_results.items())
+        return versions
+    
+    def _save_version(
+        self,
+        prepared: PreparedCompany,
+        engine: str,
+        forecast_result: ForecastResult
+    ) -> Tuple[str, Optional[str]]:
+        """
+        Save one forecast version of a company (files, metrics and company.json entry).
+        
+        Returns the process ID of the version and the status of its metrics
+        (None if metrics are not computed).
+        """
+        company_id = prepared.company_id
+        timer = prepared.timer
+        closed_form_types = prepared.closed_form_types
+        
+        # Generate process ID
+        process_id = str(uuid.uuid4())
+        
+        # Save results (with CI if available)
+        with timer.span('save'):
             if (
                 forecast_result.forecast_lower_df is not None
                 and forecast_result.forecast_upper_df is not None
@@ -138,44 +644,474 @@ class BatchProcessor:
                     process_id=process_id,
                     data_folder=self.data_folder
                 )
-            
-            # Prepare account metadata
-            account_metadata = {}
-            for account in forecast_result.accounts:
-                # Determine account type
-                account_prefix = account[:3] if len(account) >= 3 else account
-                account_type = 'revenue' if account_prefix.startswith('7') else 'expense'
-                
-                account_metadata[account] = {
-                    'account_type': account_type,
-                    'forecast_type': 'TabPFN'
-                }
-            
-            # Update company metadata
+        
+        # Prepare account metadata
+        account_metadata = build_account_metadata(forecast_result.accounts, closed_form_types, engine)
+        
+        metrics = None
+        metrics_status = None
+        if self.with_metrics:
+            with timer.span('metrics'):
+                try:
+                    metrics = compute_metrics_from_frames(
+                        forecast_df=forecast_result.forecast_df,
+                        monthly_train=prepared.monthly_train,
+                        monthly_test=prepared.monthly_test,
+                        account_metadata=account_metadata,
+                        forecast_horizon=self.forecast_horizon
+                    )
+                    for account, account_metrics in metrics['account_metrics'].items():
+                        account_metadata.setdefault(account, {})['metrics'] = account_metrics['metrics']
+                    metrics_status = 'Success'
+                except Exception as e:
+                    # The forecast is saved without metrics (metrics --all can compute them later)
+                    metrics_status = f'Error: {str(e)}'
+        
+        with timer.span('metadata'):
+            # Update company metadata (with the metrics, in a single write)
             update_company_metadata(
                 company_id=company_id,
                 process_id=process_id,
                 account_metadata=account_metadata,
-                data_folder=self.data_folder
+                data_folder=self.data_folder,
+                version_name=version_name(engine),
+                metrics=metrics['aggregated_metrics'] if metrics is not None else None
             )
+        
+        return process_id, metrics_status
+    
+    def process_company(self, company_id: str) -> dict:
+        """
+        Process a single company.
+        
+        Parameters
+        ----------
+        company_id : str
+            Company identifier.
+        
+        Returns
+        -------
+        dict
+            Results dictionary with process_id, status, and metadata. The
+            'stages' entry maps each pipeline stage to its wall time, CPU time
+            and peak RSS (see StageTimer.to_dict).
+        """
+        return self._process_company(company_id).result
+    
+    def _process_company(self, company_id: str) -> CompanyOutcome:
+        """Process a single company, keeping its in-memory data."""
+        timer = StageTimer()
+        prepared = None
+        
+        try:
+            prepared = self.prepare_company(company_id, timer)
+            
+            # Check if we have forecastable accounts
+            if not prepared.is_forecastable:
+                return CompanyOutcome(_failed_result(company_id, 'No forecastable accounts', timer), prepared)
+            
+            # Run forecast (records the convert, predict and extract stages)
+            forecast_result = None
+            if prepared.needs_model:
+                forecast_result = self.forecaster.forecast(
+                    data_wide=prepared.data_wide,
+                    prediction_length=self.forecast_horizon,
+                    timer=timer
+                )
             
-            return {
-                'company_id': company_id,
-                'process_id': process_id,
-                'status': 'Success',
-                'accounts_forecasted': len(forecast_result.accounts),
-                'elapsed_time': forecast_result.elapsed_time
-            }
+            return CompanyOutcome(self.save_company(prepared, forecast_result), prepared)
             
         except Exception as e:
-            return {
-                'company_id': company_id,
-                'process_id': None,
-                'status': f'Error: {str(e)}',
-                'accounts_forecasted': 0
-            }
+            return CompanyOutcome(_failed_result(company_id, f'Error: {str(e)}', timer), prepared)
+    
+    def process_batch(self, company_ids: List[str]) -> List[dict]:
+        """
+        Process small companies with a shared forecast call.
+        
+        Companies are loaded and preprocessed one by one, then all companies
+        with the same time index are forecasted together in a single call,
+        which saves the fixed cost of a forecast (model setup, API round trip).
+        The shared convert, predict and extract times are attributed to each
+        company in proportion to its number of accounts.
+        
+        Parameters
+        ----------
+        company_ids : List[str]
+            Company identifiers.
+        
+        Returns
+        -------
+        List[dict]
+            One result per company, in the order of company_ids. Results of
+            companies forecasted together have a 'shared_batch_size' entry.
+        """
+        return [outcome.result for outcome in self._process_batch(company_ids)]
+    
+    def _process_batch(self, company_ids: List[str]) -> List[CompanyOutcome]:
+        """Process small companies with a shared forecast call, keeping their in-memory data."""
+        done, closed_form, groups = self._prepare_groups(company_ids)
+        outcomes = {outcome.company_id: outcome for outcome in done}
+        for prepared in closed_form:
+            outcomes[prepared.company_id] = self._save_closed_form(prepared)
+        
+        for group in groups:
+            shared_timer = StageTimer()
+            try:
+                forecast_result = self.forecaster.forecast(
+                    data_wide=_group_input(group),
+                    prediction_length=self.forecast_horizon,
+                    timer=shared_timer
+                )
+                error = None
+            except Exception as e:
+                forecast_result = None
+                error = f'Error: {str(e)}'
+            
+            for outcome in self._finish_group(group, shared_timer, forecast_result, error):
+                outcomes[outcome.company_id] = outcome
+        
+        return [outcomes[company_id] for company_id in company_ids]
     
-    def process_companies(self, company_ids: List[str]) -> List[dict]:
+    def _prepare_groups(
+        self,
+        company_ids: List[str]
+    ) -> Tuple[List[CompanyOutcome], List[PreparedCompany], List[List[PreparedCompany]]]:
+        """
+        Prepare companies and group the ones needing the model by time index.
+        
+        Returns the outcomes of the companies that failed, the companies
+        fully forecasted in closed form (still to be saved, see
+        _save_closed_form) and the groups of companies that can share a
+        forecast call. Nothing is written here, so that in the pipeline only
+        the saving stage writes output.
+        """
+        done = []
+        closed_form = []
+        groups: Dict[tuple, List[PreparedCompany]] = {}
+        
+        for company_id in company_ids:
+            timer = StageTimer()
+            try:
+                prepared = self.prepare_company(company_id, timer)
+            except Exception as e:
+                done.append(CompanyOutcome(_failed_result(company_id, f'Error: {str(e)}', timer)))
+                continue
+            
+            if not prepared.is_forecastable:
+                done.append(CompanyOutcome(_failed_result(company_id, 'No forecastable accounts', timer), prepared))
+                continue
+            
+            if not prepared.needs_model:
+                closed_form.append(prepared)
+                continue
+            
+            groups.setdefault(tuple(prepared.data_wide.index), []).append(prepared)
+        
+        return done, closed_form, list(groups.values())
+    
+    def _save_closed_form(self, prepared: PreparedCompany) -> CompanyOutcome:
+        """Save a company whose accounts are all forecasted in closed form."""
+        try:
+            result = self.save_company(prepared, None)
+        except Exception as e:
+            result = _failed_result(prepared.company_id, f'Error: {str(e)}', prepared.timer)
+        return CompanyOutcome(result, prepared)
+    
+    def _finish_group(
+        self,
+        group: List[PreparedCompany],
+        shared_timer: StageTimer,
+        forecast_result: Optional[ForecastResult],
+        error: Optional[str]
+    ) -> List[CompanyOutcome]:
+        """
+        Attribute the shared forecast stages and save each company of a group.
+        
+        The shared convert, predict and extract times are split in proportion
+        to the number of accounts of each company.
+        """
+        outcomes = []
+        total_accounts = sum(prepared.data_wide.shape[1] for prepared in group)
+        
+        for prepared in group:
+            share = prepared.data_wide.shape[1] / total_accounts
+            for stage in shared_timer.stages:
+                prepared.timer.add(stage.name, stage.wall_seconds * share, stage.cpu_seconds * share)
+            
+            if error is not None:
+                outcomes.append(CompanyOutcome(_failed_result(prepared.company_id, error, prepared.timer), prepared))
+                continue
+            
+            try:
+                if len(group) > 1:
+                    company_forecast = _split_forecast_result(forecast_result, prepared.company_id, share)
+                else:
+                    company_forecast = forecast_result
+                result = self.save_company(prepared, company_forecast)
+            except Exception as e:
+                result = _failed_result(prepared.company_id, f'Error: {str(e)}', prepared.timer)
+            if len(group) > 1:
+                result['shared_batch_size'] = len(group)
+            outcomes.append(CompanyOutcome(result, prepared))
+        
+        return outcomes
+    
+    def _process_concurrently(self, batches: List[List[str]], handle: Callable[[CompanyOutcome], None]) -> None:
+        """
+        Process batches with several forecast requests in flight.
+        
+        Companies are prepared in the calling thread and their forecasts
+        submitted to the ConcurrentForecastClient; preparation pauses while
+        max_in_flight requests are pending, so memory stays bounded. Results
+        are saved in the calling thread in completion order.
+        """
+        client = self.forecaster
+        in_flight: Dict[Future, Tuple[List[PreparedCompany], StageTimer]] = {}
+        
+        def collect_completed():
+            done, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+            for future in done:
+                group, shared_timer = in_flight.pop(future)
+                try:
+                    forecast_result, error = future.result(), None
+                except Exception as e:
+                    forecast_result, error = None, f'Error: {str(e)}'
+                for outcome in self._finish_group(group, shared_timer, forecast_result, error):
+                    handle(outcome)
+        
+        for batch in batches:
+            done, closed_form, groups = self._prepare_groups(batch)
+            for outcome in done:
+                handle(outcome)
+            for prepared in closed_form:
+                handle(self._save_closed_form(prepared))
+            
+            for group in groups:
+                while len(in_flight) >= client.max_in_flight:
+                    collect_completed()
+                
+                shared_timer = StageTimer()
+                future = client.submit(
+                    data_wide=_group_input(group),
+                    prediction_length=self.forecast_horizon,
+                    timer=shared_timer
+                )
+                in_flight[future] = (group, shared_timer)
+        
+        while in_flight:
+            collect_completed()
+    
+    def _process_pipelined(self, batches: List[List[str]], handle: Callable[[CompanyOutcome], None]) -> None:
+        """
+        Process batches in a load → predict → save pipeline.
+        
+        A loading thread prepares the companies and a saving thread writes
+        the forecasts, while the calling thread runs the model. The queues
+        between them hold at most prefetch forecast calls and
+        save_queue_size forecasts: a full queue blocks the stage feeding it
+        (backpressure). Outcomes are handled in the saving thread, in
+        processing order. Stage CPU times include the other threads.
+        """
+        to_predict: queue.Queue = queue.Queue(maxsize=max(self.prefetch, 1))
+        to_save: queue.Queue = queue.Queue(maxsize=max(self.save_queue_size, 1))
+        stop = threading.Event()
+        errors: List[BaseException] = []
+        
+        def put(target: queue.Queue, item) -> bool:
+            # Wait for room in the queue unless the pipeline is stopping
+            while not stop.is_set():
+                try:
+                    target.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        
+        def get(source: queue.Queue):
+            while not stop.is_set():
+                try:
+                    return source.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+            return _END_OF_QUEUE
+        
+        def load():
+            try:
+                for batch in batches:
+                    done, closed_form, groups = self._prepare_groups(batch)
+                    # Every company goes through the model queue to keep the
+                    # order; only the saver writes output
+                    items = [('done', done)] if done else []
+                    items += [('closed_form', prepared) for prepared in closed_form]
+                    items += [('group', group) for group in groups]
+                    for item in items:
+                        if not put(to_predict, item):
+                            return
+            except BaseException as e:
+                errors.append(e)
+                stop.set()
+            finally:
+                put(to_predict, _END_OF_QUEUE)
+        
+        def save():
+            try:
+                while True:
+                    item = get(to_save)
+                    if item is _END_OF_QUEUE:
+                        return
+                    kind, payload = item
+                    if kind == 'done':
+                        outcomes = payload
+                    elif kind == 'closed_form':
+                        outcomes = [self._save_closed_form(payload)]
+                    else:
+                        outcomes = self._finish_group(*payload)
+                    for outcome in outcomes:
+                        handle(outcome)
+            except BaseException as e:
+                errors.append(e)
+                stop.set()
+        
+        loader = threading.Thread(target=load, name='forecast-loader', daemon=True)
+        saver = threading.Thread(target=save, name='forecast-saver', daemon=True)
+        loader.start()
+        saver.start()
+        
+        try:
+            while True:
+                item = get(to_predict)
+                if item is _END_OF_QUEUE:
+                    break
+                kind, payload = item
+                if kind == 'group':
+                    shared_timer = StageTimer()
+                    try:
+                        forecast_result = self.forecaster.forecast(
+                            data_wide=_group_input(payload),
+                            prediction_length=self.forecast_horizon,
+                            timer=shared_timer
+                        )
+                        error = None
+                    except Exception as e:
+                        forecast_result = None
+                        error = f'Error: {str(e)}'
+                    item = ('group', (payload, shared_timer, forecast_result, error))
+                if not put(to_save, item):
+                    break
+            put(to_save, _END_OF_QUEUE)
+            saver.join()
+        finally:
+            # On error or interruption, stop the other stages; the saver
+            # finishes the company it is writing before returning
+            stop.set()
+            saver.join()
+        
+        if errors:
+            raise errors[0]
+    
+    def _run_batches(self, batches: List[List[str]], handle: Callable[[CompanyOutcome], None]) -> None:
+        """Process batches on the path suited to the forecaster, handling each outcome."""
+        if isinstance(self.forecaster, ConcurrentForecastClient) and self.forecaster.max_in_flight > 1:
+            self._process_concurrently(batches, handle)
+        elif self.prefetch > 0:
+            self._process_pipelined(batches, handle)
+        else:
+            for batch in batches:
+                outcomes = [self._process_company(batch[0])] if len(batch) == 1 else self._process_batch(batch)
+                for outcome in outcomes:
+                    handle(outcome)
+    
+    def iter_companies(
+        self,
+        company_ids: List[str],
+        batches: Optional[List[List[str]]] = None,
+        on_result: Optional[Callable[[dict], None]] = None
+    ) -> Iterator[CompanyOutcome]:
+        """
+        Process companies, yielding each one as soon as it is done.
+        
+        Processing runs in a background thread and stays at most a few
+        companies ahead of the consumer. Each outcome keeps the company's
+        in-memory data (preprocessing result and forecast), so that a
+        consumer such as the metrics can use it without reading the saved
+        files back. Closing the generator (e.g. breaking out of the loop)
+        stops processing after the company being handled.
+        
+        Parameters
+        ----------
+        company_ids : List[str]
+            List of company identifiers to process.
+        batches : Optional[List[List[str]]], default=None
+            Processing order as a partition of company_ids (see
+            process_companies).
+        on_result : Optional[Callable[[dict], None]], default=None
+            Called with each company result in the processing thread, right
+            after the company is saved and before it is yielded, so that a
+            checkpoint (e.g. RunManifest.record) never lags behind the saved
+            forecasts, even if the consumer is interrupted.
+        
+        Yields
+        ------
+        CompanyOutcome
+            Result and in-memory data of each company, in processing order.
+        
+        Raises
+        ------
+        ValueError
+            If batches is not a partition of company_ids.
+        
+        Examples
+        --------
+        >>> for outcome in processor.iter_companies(['RESTO - 1', 'RESTO - 2']):
+        ...     if outcome.forecast_result is not None:
+        ...         print(outcome.company_id, outcome.forecast_result.forecast_df.shape)
+        """
+        batches = _check_batches(company_ids, batches)
+        outcomes: queue.Queue = queue.Queue(maxsize=max(self.save_queue_size, 1))
+        cancelled = threading.Event()
+        
+        def handle(outcome: CompanyOutcome) -> None:
+            if on_result is not None:
+                on_result(outcome.result)
+            # Wait for the consumer, unless it closed the generator
+            while not cancelled.is_set():
+                try:
+                    outcomes.put(outcome, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+            raise _ProcessingCancelled()
+        
+        def run():
+            try:
+                self._run_batches(batches, handle)
+                outcomes.put(_END_OF_QUEUE)
+            except _ProcessingCancelled:
+                pass
+            except BaseException as e:
+                outcomes.put(e)
+        
+        worker = threading.Thread(target=run, name='forecast-batches', daemon=True)
+        worker.start()
+        try:
+            while True:
+                item = outcomes.get()
+                if item is _END_OF_QUEUE:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            cancelled.set()
+            worker.join()
+    
+    def process_companies(
+        self,
+        company_ids: List[str],
+        estimates: Optional[Dict[str, float]] = None,
+        batches: Optional[List[List[str]]] = None,
+        on_result: Optional[Callable[[dict], None]] = None
+    ) -> List[dict]:
         """
         Process multiple companies with progress tracking.
         
@@ -183,44 +1119,83 @@ class BatchProcessor:
         ----------
         company_ids : List[str]
             List of company identifiers to process.
+        estimates : Optional[Dict[str, float]], default=None
+            Estimated seconds per company (see runtime_estimation). When
+            given, progress is weighted by the estimates and a live ETA is
+            shown; it is calibrated by the actual speed of the run.
+        batches : Optional[List[List[str]]], default=None
+            Processing order as a partition of company_ids (see
+            scheduler.schedule_companies). Batches of several companies are
+            processed with process_batch. If None, companies are processed
+            one by one in the order of company_ids.
+            Loading, forecasting and saving overlap (see prefetch), except
+            with a ConcurrentForecastClient, which keeps several forecasts
+            in flight instead.
+        on_result : Optional[Callable[[dict], None]], default=None
+            Called with each company result right after it is saved, in the
+            processing thread, e.g. RunManifest.record to checkpoint the run
+            (see iter_companies).
         
         Returns
         -------
         List[dict]
-            List of result dictionaries, one per company.
+            List of result dictionaries, one per company, in processing order.
+        
+        Raises
+        ------
+        ValueError
+            If batches is not a partition of company_ids.
         """
         results = []
+        batches = _check_batches(company_ids, batches)
+        
+        if estimates:
+            weights = {company_id: max(estimates.get(company_id, 0.0), 1e-3) for company_id in company_ids}
+        else:
+            weights = {company_id: 1.0 for company_id in company_ids}
         
-        with Progress(
+        columns = [
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
             BarColumn(),
             TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
             TimeElapsedColumn(),
-            console=self.console
-        ) as progress:
+        ]
+        if estimates:
+            columns += [TextColumn("ETA"), TimeRemainingColumn()]
+        
+        if isinstance(self.forecaster, ConcurrentForecastClient) and self.forecaster.max_in_flight > 1:
+            description = f"Processing with up to {self.forecaster.max_in_flight} requests in flight"
+        elif self.prefetch > 0:
+            description = f"Processing {len(company_ids)} companies (pipelined)"
+        else:
+            description = f"Processing {len(company_ids)} companies"
+        
+        with Progress(*columns, console=self.console) as progress:
             
-            overall_task = progress.add_task(
-                f"Processing {len(company_ids)} companies", 
-                total=len(company_ids)
-            )
+            overall_task = progress.add_task(description, total=sum(weights.values()))
             
-            for company_id in company_ids:
-                progress.update(overall_task, description =f"Processing {company_id}")
-                
-                result = self.process_company(company_id)
+            for outcome in self.iter_companies(company_ids, batches, on_result=on_result):
+                result = outcome.result
+                company_id = result['company_id']
                 results.append(result)
                 
                 # Log result
                 if result['status'] == 'Success':
+                    shared = (
+                        f" (shared batch of {result['shared_batch_size']})"
+                        if 'shared_batch_size' in result else ""
+                    )
                     self.console.print(
                         f"✓ [green]{company_id}[/green]: "
                         f"{result['accounts_forecasted']} accounts forecasted "
-                        f"in {result['elapsed_time']:.1f}s"
+                        f"in {result['elapsed_time']:.1f}s{shared}"
                     )
+                    if result.get('metrics_status', 'Success') != 'Success':
+                        self.console.print(f"  [yellow]Metrics not computed:[/yellow] {result['metrics_status']}")
                 else:
                     self.console.print(f"✗ [red]{company_id}[/red]: {result['status']}")
                 
-                progress.advance(overall_task)
+                progress.advance(overall_task, weights[company_id])
         
         return results
@@ -2,15 +2,127 @@
 Command-line interface for TabPFN forecasting.
 
 This module provides the CLI for running forecasts on companies using TabPFN.
+The batch processor (and through it TabPFN, torch and gluonts) is only imported
+once forecasts are actually run, so --help and --dry-run start instantly.
 """
 
 import argparse
 import sys
+from datetime import datetime
 from rich.console import Console
 from rich.table import Table
 
+from src.config.forecasting_config import (
+    CLIENT_MAX_ATTEMPTS,
+    CLIENT_MAX_IN_FLIGHT,
+    CLIENT_REQUEST_TIMEOUT_SECONDS,
+    CLOSED_FORM_SIMPLE_PATTERNS,
+    COMPANY_SCHEDULE,
+    DAEMON_SOCKET_PATH,
+    ENGINE_OUTPUT,
+    INACTIVE_ACCOUNTS_FORECAST,
+    MAX_CONTEXT_MONTHS,
+    PIPELINE_PREFETCH,
+    PIPELINE_SAVE_QUEUE_SIZE,
+    TABPFN_MAX_ROWS_PER_CALL,
+    TRIM_LEADING_NAN_CONTEXT,
+)
 from src.forecasting.company_discovery import discover_companies, filter_companies
-from src.forecasting.batch_processor import BatchProcessor
+from src.forecasting.profiling import new_run_id, summarize_stages, write_run_report
+from src.forecasting.run_manifest import RunManifest
+from src.forecasting.runtime_estimation import (
+    append_timing_history,
+    estimate_runtime,
+    format_duration,
+    processing_mode,
+)
+from src.forecasting.scheduler import DEFAULT_MAX_BATCH_COMPANIES, WorkBatch, estimate_company_costs, schedule_companies
+
+
+# Run settings saved in the manifest, with the argument they come from and
+# whether the argument is the negation of the setting (--no-... flags)
+RUN_SETTINGS = (
+    ('mode', 'tabpfn_mode', False),
+    ('engine', 'engine', False),
+    ('engine_output', 'engine_output', False),
+    ('forecast_horizon', 'forecast_horizon', False),
+    ('schedule', 'schedule', False),
+    ('max_batch_companies', 'max_batch_companies', False),
+    ('max_rows_per_call', 'max_rows_per_call', False),
+    ('chunk_workers', 'chunk_workers', False),
+    ('inactive_accounts', 'inactive_accounts', False),
+    ('simple_patterns', 'simple_patterns', False),
+    ('prefetch', 'prefetch', False),
+    ('save_queue', 'save_queue', False),
+    ('max_context_months', 'max_context_months', False),
+    ('context_trimming', 'context_trimming', False),
+    ('with_metrics', 'with_metrics', False),
+)
+
+# Settings that only apply in client mode
+CLIENT_RUN_SETTINGS = (
+    ('max_in_flight', 'max_in_flight', False),
+    ('requests_per_second', 'requests_per_second', False),
+    ('request_timeout', 'request_timeout', False),
+    ('max_attempts', 'max_attempts', False),
+)
+
+
+def get_run_settings(args: argparse.Namespace) -> dict:
+    """
+    Return the settings of a run from the parsed arguments.
+    
+    Parameters
+    ----------
+    args : argparse.Namespace
+        Parsed command-line arguments.
+    
+    Returns
+    -------
+    dict
+        Every setting that affects the forecasts or the processing, saved in
+        the run manifest and restored on resume (see restore_run_settings).
+    """
+    specs = RUN_SETTINGS + (CLIENT_RUN_SETTINGS if args.tabpfn_mode == 'client' else ())
+    return {
+        name: (not getattr(args, attribute)) if negated else getattr(args, attribute)
+        for name, attribute, negated in specs
+    }
+
+
+def restore_run_settings(args: argparse.Namespace, settings: dict) -> dict:
+    """
+    Apply the settings of a previous run to the parsed arguments.
+    
+    A resumed run keeps the settings it was started with, so that all its
+    companies are forecasted the same way. Settings missing from the
+    manifest (runs started by an older version) keep their argument value.
+    
+    Parameters
+    ----------
+    args : argparse.Namespace
+        Parsed command-line arguments, modified in place.
+    settings : dict
+        Settings saved in the run manifest.
+    
+    Returns
+    -------
+    dict
+        Settings whose value differs from the arguments of this invocation,
+        as {name: (run value, invocation value)}.
+    """
+    overridden = {}
+    for name, attribute, negated in RUN_SETTINGS + CLIENT_RUN_SETTINGS:
+        if name not in settings:
+            continue
+        value = settings[name]
+        if name == 'engine' and isinstance(value, str):
+            value = [value]
+        current = (not getattr(args, attribute)) if negated else getattr(args, attribute)
+        if value != current:
+            overridden[name] = (value, current)
+        setattr(args, attribute, (not value) if negated else value)
+    return overridden
 
 
 def main():
@@ -34,6 +146,25 @@ Examples:
   
   # Use TabPFN CLIENT mode (cloud API)
   %(prog)s --companies "RESTO - 1" --tabpfn-mode client
+  
+  # Client mode with 8 concurrent requests, at most 2 new requests per second
+  %(prog)s --companies all --tabpfn-mode client --max-in-flight 8 --requests-per-second 2
+  
+  # Process the largest companies first, small companies forecasted together
+  %(prog)s --companies all --schedule size
+  
+  # Resume an interrupted run (only unfinished companies are processed)
+  %(prog)s --resume 20250114_093000_1a2b3c
+  
+  # Load test the whole pipeline without the model (deterministic stub forecasts)
+  %(prog)s --companies all --engine stub
+  
+  # TabPFN and a seasonal naive baseline on the same preprocessed data, saved
+  # as one forecast version each and as their ensemble
+  %(prog)s --companies all --engine tabpfn seasonal_naive --engine-output both
+  
+  # Reuse a warm model (start it once with: python -m src.forecasting.daemon)
+  %(prog)s --companies all --daemon-socket /tmp/tabpfn_forecaster.sock
         """
     )
     
@@ -59,6 +190,26 @@ Examples:
         help='TabPFN mode: local (runs locally) or client (cloud API) (default: local)'
     )
     
+    parser.add_argument(
+        '--engine',
+        nargs='+',
+        choices=['tabpfn', 'seasonal_naive', 'stub'],
+        default=['tabpfn'],
+        metavar='ENGINE',
+        help='Forecast engines: tabpfn (the TabPFN model), seasonal_naive (baseline, '
+             'without prediction interval) or stub (deterministic forecasts, to load '
+             'test the pipeline). Several engines run in parallel on the same '
+             'preprocessed data (default: tabpfn)'
+    )
+    
+    parser.add_argument(
+        '--engine-output',
+        choices=['versions', 'ensemble', 'both'],
+        default=ENGINE_OUTPUT,
+        help='Forecast versions saved with several engines: one per engine, their '
+             f'equal-weight ensemble, or both (default: {ENGINE_OUTPUT})'
+    )
+    
     parser.add_argument(
         '--forecast-horizon',
         type=int,
@@ -73,38 +224,275 @@ Examples:
         help='List companies that would be processed without running forecasts'
     )
     
+    parser.add_argument(
+        '--schedule',
+        choices=['size', 'alphabetical'],
+        default=COMPANY_SCHEDULE,
+        help='Processing order: alphabetical (one forecast call per company) or size '
+             '(largest companies first, small companies forecasted together in shared '
+             f'calls) (default: {COMPANY_SCHEDULE})'
+    )
+    
+    parser.add_argument(
+        '--max-batch-companies',
+        type=int,
+        default=DEFAULT_MAX_BATCH_COMPANIES,
+        metavar='N',
+        help=f'With --schedule size, maximum number of small companies forecasted in one '
+             f'shared call, 1 to disable (default: {DEFAULT_MAX_BATCH_COMPANIES})'
+    )
+    
+    parser.add_argument(
+        '--max-rows-per-call',
+        type=int,
+        default=TABPFN_MAX_ROWS_PER_CALL,
+        metavar='N',
+        help=f'Context rows (accounts x months) per TabPFN call; larger companies are forecasted '
+             f'in chunks of accounts, 0 disables chunking (default: {TABPFN_MAX_ROWS_PER_CALL})'
+    )
+    
+    parser.add_argument(
+        '--inactive-accounts',
+        choices=['tabpfn', 'zero', 'naive'],
+        default=INACTIVE_ACCOUNTS_FORECAST,
+        help='Forecast of accounts without data in the last 12 months: tabpfn, zero or naive '
+             f'(last observed value); zero and naive skip TabPFN (default: {INACTIVE_ACCOUNTS_FORECAST})'
+    )
+    
+    parser.add_argument(
+        '--simple-patterns',
+        action='store_true',
+        default=CLOSED_FORM_SIMPLE_PATTERNS,
+        help='Forecast sparse, constant and step-function accounts with closed-form rules '
+             'instead of TabPFN'
+    )
+    
+    parser.add_argument(
+        '--with-metrics',
+        action='store_true',
+        help='Compute the metrics of each forecast from the data already in memory and '
+             'save them with the forecast (no separate metrics run needed)'
+    )
+    
+    parser.add_argument(
+        '--max-context-months',
+        type=int,
+        default=MAX_CONTEXT_MONTHS,
+        metavar='N',
+        help='Only send the last N months of history to TabPFN (default: full history)'
+    )
+    
+    parser.add_argument(
+        '--context-trimming',
+        action='store_true',
+        default=TRIM_LEADING_NAN_CONTEXT,
+        help='Drop the leading NaN months of accounts opened after the start of the history '
+             'from the TabPFN context'
+    )
+    
+    parser.add_argument(
+        '--chunk-workers',
+        type=int,
+        default=1,
+        metavar='N',
+        help='Client mode: number of account chunks of a company forecasted in parallel (default: 1)'
+    )
+    
+    parser.add_argument(
+        '--prefetch',
+        type=int,
+        default=PIPELINE_PREFETCH,
+        metavar='N',
+        help=f'Forecast calls loaded and preprocessed ahead of the model while it runs, '
+             f'0 to load, forecast and save one company at a time (default: {PIPELINE_PREFETCH})'
+    )
+    
+    parser.add_argument(
+        '--save-queue',
+        type=int,
+        default=PIPELINE_SAVE_QUEUE_SIZE,
+        metavar='N',
+        help=f'Forecasts waiting to be written before the model pauses (default: {PIPELINE_SAVE_QUEUE_SIZE})'
+    )
+    
+    parser.add_argument(
+        '--max-in-flight',
+        type=int,
+        default=CLIENT_MAX_IN_FLIGHT,
+        metavar='N',
+        help=f'Client mode: number of simultaneous API requests (default: {CLIENT_MAX_IN_FLIGHT})'
+    )
+    
+    parser.add_argument(
+        '--requests-per-second',
+        type=float,
+        default=None,
+        metavar='RATE',
+        help='Client mode: maximum rate of new API requests (default: no limit)'
+    )
+    
+    parser.add_argument(
+        '--request-timeout',
+        type=float,
+        default=CLIENT_REQUEST_TIMEOUT_SECONDS,
+        metavar='SECONDS',
+        help=f'Client mode: timeout of one API request (default: {CLIENT_REQUEST_TIMEOUT_SECONDS:.0f})'
+    )
+    
+    parser.add_argument(
+        '--max-attempts',
+        type=int,
+        default=CLIENT_MAX_ATTEMPTS,
+        metavar='N',
+        help=f'Client mode: attempts per request on timeouts and connection errors (default: {CLIENT_MAX_ATTEMPTS})'
+    )
+    
+    parser.add_argument(
+        '--resume',
+        default=None,
+        metavar='RUN_ID',
+        help='Resume an interrupted run, skipping the companies it already finished '
+             '(companies and all forecasting settings are taken from the run)'
+    )
+    
+    parser.add_argument(
+        '--daemon-socket',
+        default=DAEMON_SOCKET_PATH,
+        metavar='PATH',
+        help=f'Socket of a running forecasting daemon to submit jobs to (default: {DAEMON_SOCKET_PATH})'
+    )
+    
+    parser.add_argument(
+        '--no-daemon',
+        action='store_true',
+        help='Always load a new TabPFN model, even if a forecasting daemon is running'
+    )
+    
     args = parser.parse_args()
     
     console = Console()
     
-    # Discover companies
-    all_companies = discover_companies(args.data_folder)
+    manifest = None
+    if args.resume:
+        # Resume a previous run: only its unfinished companies are processed
+        try:
+            manifest = RunManifest.load(args.resume, args.data_folder)
+        except FileNotFoundError as e:
+            console.print(f"[red]Error:[/red] {e}")
+            sys.exit(1)
+        
+        overridden = restore_run_settings(args, manifest.settings)
+        selected_companies = manifest.pending_companies
+        finished = len(manifest.companies) - len(selected_companies)
+        console.print(
+            f"[yellow]Resuming run {manifest.run_id}:[/yellow] "
+            f"{finished}/{len(manifest.companies)} companies already finished"
+        )
+        for name, (value, given) in overridden.items():
+            console.print(f"  [dim]{name} = {value} (from the run, not {given})[/dim]")
+        
+        if not selected_companies:
+            console.print("[green]Nothing left to process[/green]")
+            sys.exit(0)
+    else:
+        # Discover companies
+        all_companies = discover_companies(args.data_folder)
+        
+        if not all_companies:
+            console.print(f"[red]No companies found in {args.data_folder}[/red]")
+            sys.exit(1)
+        
+        # Filter companies based on selection
+        try:
+            if args.companies == ['all']:
+                selected_companies = all_companies
+            else:
+                selected_companies = filter_companies(all_companies, args.companies)
+        except ValueError as e:
+            console.print(f"[red]Error:[/red] {e}")
+            sys.exit(1)
     
-    if not all_companies:
-        console.print(f"[red]No companies found in {args.data_folder}[/red]")
+    if args.chunk_workers > 1 and args.tabpfn_mode == 'local':
+        console.print("[red]Error:[/red] --chunk-workers requires --tabpfn-mode client (a local model predicts one chunk at a time)")
         sys.exit(1)
     
-    # Filter companies based on selection
-    try:
-        if args.companies == ['all']:
-            selected_companies = all_companies
+    # Forecaster settings, also sent with each job when the daemon is used
+    forecaster_settings = {
+        'max_rows_per_call': args.max_rows_per_call or None,
+        'chunk_workers': args.chunk_workers,
+        'trim_leading_nan': args.context_trimming,
+        'max_context_months': args.max_context_months,
+    }
+    
+    from src.forecasting.daemon import DaemonClient, is_daemon_running
+    
+    # The daemon serves the TabPFN model only
+    daemon_client = None
+    if 'tabpfn' in args.engine and not args.no_daemon and is_daemon_running(args.daemon_socket):
+        client = DaemonClient(args.daemon_socket, settings=forecaster_settings)
+        daemon_mode = client.ping().get('mode')
+        if daemon_mode == args.tabpfn_mode:
+            console.print(f"[green]Using warm forecasting daemon at {args.daemon_socket}[/green]\n")
+            daemon_client = client
         else:
-            selected_companies = filter_companies(all_companies, args.companies)
-    except ValueError as e:
-        console.print(f"[red]Error:[/red] {e}")
-        sys.exit(1)
+            console.print(
+                f"[yellow]Forecasting daemon runs in {daemon_mode} mode, "
+                f"loading a new {args.tabpfn_mode} model instead[/yellow]\n"
+            )
+    
+    daemon_used = daemon_client is not None
+    processing = processing_mode(args.tabpfn_mode, args.prefetch, args.max_in_flight)
     
-    # Display company list
+    # Schedule companies: largest first, small companies packed into shared batches
+    if args.schedule == 'size':
+        company_costs = estimate_company_costs(
+            selected_companies, mode=args.tabpfn_mode, data_folder=args.data_folder,
+            engines=args.engine, daemon=daemon_used, processing=processing
+        )
+        schedule = schedule_companies(company_costs, max_batch_companies=args.max_batch_companies)
+    else:
+        company_costs = None
+        schedule = [WorkBatch([company_id]) for company_id in selected_companies]
+    
+    # Display company list (in processing order)
     table = Table(title="Companies to Process")
     table.add_column("#", justify="right", style="cyan")
     table.add_column("Company ID", style="green")
+    if company_costs is not None:
+        table.add_column("Est. time", justify="right")
+        table.add_column("Batch", justify="right")
     
-    for idx, company_id in enumerate(selected_companies, 1):
-        table.add_row(str(idx), company_id)
+    idx = 0
+    for batch_number, batch in enumerate(schedule, 1):
+        for company_id in batch.company_ids:
+            idx += 1
+            row = [str(idx), company_id]
+            if company_costs is not None:
+                row += [
+                    format_duration(company_costs[company_id].seconds),
+                    f"{batch_number} (shared)" if batch.is_shared else str(batch_number)
+                ]
+            table.add_row(*row)
     
     console.print(table)
     console.print(f"\nTotal: {len(selected_companies)} companies")
     
+    # Estimate runtime from the timing history of previous runs
+    runtime_estimate = estimate_runtime(
+        selected_companies, mode=args.tabpfn_mode, data_folder=args.data_folder,
+        engines=args.engine, daemon=daemon_used, processing=processing
+    )
+    if runtime_estimate.model.n_samples:
+        basis = (
+            f"cost model from {runtime_estimate.model.n_samples} previous companies, "
+            f"{runtime_estimate.known_sizes}/{len(selected_companies)} sizes known"
+        )
+    else:
+        basis = "default, no timing history yet"
+    console.print(
+        f"[yellow]Estimated time:[/yellow] ~{format_duration(runtime_estimate.total_seconds)} ({basis})"
+    )
+    
     # Dry run mode
     if args.dry_run:
         console.print("\n[yellow]Dry run mode - no forecasts will be executed[/yellow]")
@@ -113,12 +501,10 @@ Examples:
     # Confirm before processing
     if len(selected_companies) > 1:
         console.print(f"\n[yellow]Mode:[/yellow] {args.tabpfn_mode.upper()}")
+        if args.engine != ['tabpfn']:
+            console.print(f"[yellow]Engines:[/yellow] {', '.join(args.engine)}")
         console.print(f"[yellow]Forecast horizon:[/yellow] {args.forecast_horizon} months")
         
-        if args.tabpfn_mode == 'local':
-            estimated_time = len(selected_companies) * 7.7  # minutes
-            console.print(f"[yellow]Estimated time:[/yellow] ~{estimated_time:.0f} minutes")
-        
         response = console.input("\n[bold]Proceed? [y/N]:[/bold] ")
         if response.lower() != 'y':
             console.print("[yellow]Cancelled[/yellow]")
@@ -127,13 +513,105 @@ Examples:
     # Run forecasts
     console.print("\n[bold green]Starting forecast processing...[/bold green]\n")
     
+    from src.forecasting.batch_processor import BatchProcessor
+    
+    from src.forecasting.tabpfn_forecaster import TabPFNForecaster
+    
+    forecasters = {}
+    for engine in dict.fromkeys(args.engine):
+        if engine == 'tabpfn' and daemon_client is not None:
+            forecasters[engine] = daemon_client
+            continue
+        forecasters[engine] = TabPFNForecaster(
+            mode=args.tabpfn_mode,
+            engine=engine,
+            **forecaster_settings
+        )
+    
+    if len(forecasters) == 1:
+        forecaster = next(iter(forecasters.values()))
+    else:
+        # Engines run in parallel on each company's preprocessed data
+        from src.forecasting.multi_engine import MultiEngineForecaster
+        
+        forecaster = MultiEngineForecaster(forecasters)
+    
+    if args.tabpfn_mode == 'client':
+        # Several rate-limited API requests in flight, with retries and timeouts
+        from src.forecasting.concurrent_client import ConcurrentForecastClient, RetryPolicy
+        
+        forecaster = ConcurrentForecastClient(
+            forecaster,
+            max_in_flight=args.max_in_flight,
+            requests_per_second=args.requests_per_second,
+            request_timeout=args.request_timeout,
+            retry_policy=RetryPolicy(max_attempts=args.max_attempts)
+        )
+    
     processor = BatchProcessor(
         mode=args.tabpfn_mode,
         data_folder=args.data_folder,
-        forecast_horizon=args.forecast_horizon
+        forecast_horizon=args.forecast_horizon,
+        forecaster=forecaster,
+        inactive_accounts=args.inactive_accounts,
+        use_simple_patterns=args.simple_patterns,
+        prefetch=args.prefetch,
+        save_queue_size=args.save_queue,
+        with_metrics=args.with_metrics,
+        engine_output=args.engine_output
     )
     
-    results = processor.process_companies(selected_companies)
+    settings = get_run_settings(args)
+    settings['daemon'] = daemon_used
+    
+    # Checkpoint every company in the run manifest
+    if manifest is None:
+        manifest = RunManifest(new_run_id(), selected_companies, data_folder=args.data_folder, settings=settings)
+        manifest.save()
+    else:
+        manifest.status = 'running'
+    started_at = datetime.fromisoformat(manifest.created_at)
+    
+    if company_costs is not None:
+        estimates = {company_id: cost.seconds for company_id, cost in company_costs.items()}
+    else:
+        estimates = runtime_estimate.per_company
+    
+    try:
+        new_results = processor.process_companies(
+            selected_companies,
+            estimates=estimates,
+            batches=[batch.company_ids for batch in schedule],
+            on_result=manifest.record
+        )
+    except KeyboardInterrupt:
+        manifest.finish('interrupted')
+        console.print(
+            f"\n[yellow]Interrupted.[/yellow] Resume with: --resume {manifest.run_id}"
+        )
+        sys.exit(130)
+    
+    manifest.finish()
+    append_timing_history(
+        new_results,
+        mode=args.tabpfn_mode,
+        data_folder=args.data_folder,
+        engines=args.engine,
+        daemon=daemon_used,
+        max_context_months=args.max_context_months,
+        processing=processing,
+        concurrency=args.max_in_flight if processing == 'concurrent' else 1
+    )
+    
+    # The report covers the whole run, including companies finished before a resume
+    results = manifest.results
+    report_path = write_run_report(
+        results,
+        run_id=manifest.run_id,
+        data_folder=args.data_folder,
+        started_at=started_at,
+        settings=settings
+    )
     
     # Display summary
     console.print("\n[bold]Summary:[/bold]")
@@ -142,6 +620,10 @@ Examples:
     summary_table.add_column("Company ID", style="cyan")
     summary_table.add_column("Status")
     summary_table.add_column("Accounts", justify="right")
+    summary_table.add_column("Load (s)", justify="right")
+    summary_table.add_column("Prep (s)", justify="right")
+    summary_table.add_column("Predict (s)", justify="right")
+    summary_table.add_column("Save (s)", justify="right")
     summary_table.add_column("Time (s)", justify="right")
     
     successful = 0
@@ -152,12 +634,22 @@ Examples:
         status_style = "green" if result['status'] == 'Success' else "red"
         status_text = f"[{status_style}]{result['status']}[/{status_style}]"
         
-        time_str = f"{result.get('elapsed_time', 0):.1f}" if 'elapsed_time' in result else "-"
+        stages = result.get('stages', {})
+        
+        def stage_time(*names):
+            recorded = [stages[name]['wall_seconds'] for name in names if name in stages]
+            return f"{sum(recorded):.1f}" if recorded else "-"
+        
+        time_str = f"{result.get('total_time', 0):.1f}" if 'total_time' in result else "-"
         
         summary_table.add_row(
             result['company_id'],
             status_text,
             str(result['accounts_forecasted']),
+            stage_time('load'),
+            stage_time('monthly_totals', 'preprocess'),
+            stage_time('convert', 'predict', 'extract'),
+            stage_time('save', 'metadata'),
             time_str
         )
         
@@ -168,10 +660,35 @@ Examples:
             failed += 1
     
     console.print(summary_table)
+    
+    # Stage totals over all companies
+    stage_table = Table(title="Time per Stage")
+    stage_table.add_column("Stage", style="cyan")
+    stage_table.add_column("Wall (s)", justify="right")
+    stage_table.add_column("CPU (s)", justify="right")
+    stage_table.add_column("Peak RSS (MB)", justify="right")
+    
+    for stage, totals in summarize_stages(results).items():
+        stage_table.add_row(
+            stage,
+            f"{totals['wall_seconds']:.1f}",
+            f"{totals['cpu_seconds']:.1f}",
+            f"{totals['peak_rss_mb']:.0f}" if totals['peak_rss_mb'] else "-"
+        )
+    
+    console.print(stage_table)
     console.print(
         f"\n[bold]Results:[/bold] {successful} successful, {failed} failed, "
         f"{total_accounts} accounts forecasted"
     )
+    if args.tabpfn_mode == 'client':
+        stats = forecaster.stats
+        console.print(
+            f"[bold]API requests:[/bold] {stats.requests} ({stats.retries} retries, "
+            f"{stats.timeouts} timeouts, {stats.throttled_seconds:.0f}s throttled)"
+        )
+    console.print(f"[bold]Run report:[/bold] {report_path}")
+    console.print(f"[bold]Run ID:[/bold] {manifest.run_id}")
 
 
 if __name__ == '__main__':
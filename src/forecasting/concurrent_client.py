@@ -0,0 +1,433 @@
+"""
+Concurrent forecasting for TabPFN client mode.
+
+In client mode, a forecast is a remote API call that mostly waits on the
+network and the server. ConcurrentForecastClient keeps several of these calls
+in flight from a thread pool, while protecting the API with:
+
+- a token bucket limiting the request rate (with bursts),
+- retries with exponential backoff on transient errors,
+- a timeout per request.
+
+A request that times out cannot be cancelled: it keeps its in-flight slot
+until the server answers, so abandoned requests still count towards the
+concurrency limit.
+
+It wraps any forecaster (TabPFNForecaster, DaemonClient, ...) and exposes the
+same forecast() method, plus submit() returning a Future, which
+BatchProcessor uses to forecast several companies at once.
+"""
+
+import random
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple, Type
+
+import pandas as pd
+
+from src.forecasting.profiling import StageTimer
+from src.forecasting.tabpfn_forecaster import ForecastResult
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter.
+
+    Tokens are added continuously at ``rate`` per second, up to ``capacity``.
+    Each request consumes one token and waits when the bucket is empty.
+
+    Parameters
+    ----------
+    rate : float
+        Sustained number of requests per second.
+    capacity : Optional[float], default=None
+        Maximum burst size (defaults to max(1, rate)).
+    clock : Callable[[], float], default=time.monotonic
+        Time source (injectable for tests).
+    sleep : Callable[[float], None], default=time.sleep
+        Sleep function (injectable for tests).
+
+    Examples
+    --------
+    >>> bucket = TokenBucket(rate=2.0, capacity=2)
+    >>> bucket.acquire()  # the first requests of a burst do not wait
+    0.0
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        """Initialize a full bucket."""
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.capacity
+        self._updated_at = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        Take one token, waiting until one is available.
+
+        Returns
+        -------
+        float
+            Time spent waiting (seconds).
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                wait = (1 - self._tokens) / self.rate
+            self._sleep(wait)
+            waited += wait
+
+
+def transport_errors() -> Tuple[Type[BaseException], ...]:
+    """
+    Return the exceptions of transient network failures.
+
+    The API client reports network failures with the exceptions of its HTTP
+    library, which do not derive from the built-in TimeoutError and
+    ConnectionError. The httpx and requests exceptions are included when
+    these libraries are installed.
+
+    Returns
+    -------
+    Tuple[Type[BaseException], ...]
+        Timeout, connection and transport exception types.
+    """
+    errors: List[Type[BaseException]] = [TimeoutError, ConnectionError]
+    try:
+        import httpx
+    except ImportError:
+        pass
+    else:
+        errors.append(httpx.TransportError)
+    try:
+        import requests
+    except ImportError:
+        pass
+    else:
+        errors += [requests.exceptions.ConnectionError, requests.exceptions.Timeout]
+    return tuple(errors)
+
+
+@dataclass
+class RetryPolicy:
+    """
+    Retry schedule for failed forecast requests.
+
+    Attributes
+    ----------
+    max_attempts : int
+        Total number of attempts per request (1 disables retries).
+    initial_backoff : float
+        Wait before the first retry (seconds).
+    backoff_factor : float
+        Multiplier applied to the wait after each retry.
+    max_backoff : float
+        Upper bound of the wait (seconds).
+    jitter : float
+        Random fraction added to each wait to spread retries of parallel
+        requests (0.1 means up to +10%).
+    retryable_errors : Tuple[Type[BaseException], ...]
+        Exceptions considered transient. Anything else fails immediately.
+        Defaults to timeouts and connection errors, including those of the
+        HTTP clients that are installed (see transport_errors).
+    """
+
+    max_attempts: int = 3
+    initial_backoff: float = 1.0
+    backoff_factor: float = 2.0
+    max_backoff: float = 30.0
+    jitter: float = 0.1
+    retryable_errors: Tuple[Type[BaseException], ...] = field(default_factory=transport_errors)
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Return the wait before retrying after a failed attempt.
+
+        Parameters
+        ----------
+        attempt : int
+            Number of the failed attempt (1 for the first one).
+
+        Returns
+        -------
+        float
+            Wait in seconds.
+
+        Examples
+        --------
+        >>> RetryPolicy(jitter=0.0).backoff(3)
+        4.0
+        """
+        wait = min(self.initial_backoff * self.backoff_factor ** (attempt - 1), self.max_backoff)
+        return wait * (1 + random.uniform(0, self.jitter))
+
+
+@dataclass
+class ClientStats:
+    """
+    Counters of a ConcurrentForecastClient.
+
+    Attributes
+    ----------
+    requests : int
+        Attempts sent (including retries).
+    retries : int
+        Attempts that were retries.
+    timeouts : int
+        Attempts that exceeded the request timeout.
+    failures : int
+        Forecasts that failed after all attempts.
+    throttled_seconds : float
+        Total time spent waiting for the rate limiter.
+    peak_in_flight : int
+        Highest number of simultaneous requests observed.
+    """
+
+    requests: int = 0
+    retries: int = 0
+    timeouts: int = 0
+    failures: int = 0
+    throttled_seconds: float = 0.0
+    peak_in_flight: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def to_dict(self) -> Dict[str, float]:
+        """Return the counters as a dictionary."""
+        return {
+            'requests': self.requests,
+            'retries': self.retries,
+            'timeouts': self.timeouts,
+            'failures': self.failures,
+            'throttled_seconds': self.throttled_seconds,
+            'peak_in_flight': self.peak_in_flight,
+        }
+
+
+def _call_with_timeout(function: Callable[[], ForecastResult], timeout: Optional[float]) -> ForecastResult:
+    """
+    Run a call in a helper thread and stop waiting for it after ``timeout``.
+
+    A thread cannot be cancelled: a request that times out keeps running in
+    the background until the server answers, but its result is discarded.
+    Cleanup that must wait for the end of the request (e.g. releasing its
+    slot) belongs in ``function`` itself.
+    """
+    if timeout is None:
+        return function()
+
+    outcome: Dict[str, object] = {}
+
+    def target():
+        try:
+            outcome['result'] = function()
+        except BaseException as e:  # re-raised in the calling thread
+            outcome['error'] = e
+
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    if thread.is_alive():
+        raise TimeoutError(f"Forecast request timed out after {timeout:.0f}s")
+    if 'error' in outcome:
+        raise outcome['error']
+    return outcome['result']
+
+
+class ConcurrentForecastClient:
+    """
+    Rate-limited, retrying forecaster keeping several requests in flight.
+
+    Parameters
+    ----------
+    forecaster : TabPFNForecaster
+        Forecaster performing each request (typically in client mode). Its
+        forecast method must be safe to call from several threads.
+    max_in_flight : int, default=4
+        Maximum number of simultaneous requests.
+    requests_per_second : Optional[float], default=None
+        Sustained request rate (no limit if None).
+    burst : Optional[float], default=None
+        Token bucket capacity (see TokenBucket).
+    request_timeout : Optional[float], default=None
+        Maximum duration of one attempt in seconds (no limit if None).
+    retry_policy : Optional[RetryPolicy], default=None
+        Retry schedule (RetryPolicy() if None).
+
+    Examples
+    --------
+    >>> client = ConcurrentForecastClient(TabPFNForecaster(mode='client'), max_in_flight=8,
+    ...                                   requests_per_second=4, request_timeout=300)
+    >>> futures = [client.submit(df, prediction_length=12) for df in frames]
+    >>> results = [future.result() for future in futures]
+    """
+
+    def __init__(
+        self,
+        forecaster,
+        max_in_flight: int = 4,
+        requests_per_second: Optional[float] = None,
+        burst: Optional[float] = None,
+        request_timeout: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None
+    ):
+        """Initialize the client and its thread pool."""
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+
+        self.forecaster = forecaster
+        self.max_in_flight = max_in_flight
+        self.request_timeout = request_timeout
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.rate_limiter = TokenBucket(requests_per_second, burst) if requests_per_second else None
+        self.stats = ClientStats()
+        self._in_flight = 0
+        self._slots = threading.BoundedSemaphore(max_in_flight)
+        self._executor = ThreadPoolExecutor(max_workers=max_in_flight, thread_name_prefix='forecast-client')
+
+    @property
+    def mode(self) -> str:
+        """Mode of the wrapped forecaster."""
+        return self.forecaster.mode
+
+    def _attempt(self, data_wide, prediction_length, quantiles, timer) -> ForecastResult:
+        # Wait for a free slot: a timed-out request holds its slot until it really ends
+        self._slots.acquire()
+        if self.rate_limiter is not None:
+            waited = self.rate_limiter.acquire()
+            with self.stats._lock:
+                self.stats.throttled_seconds += waited
+
+        with self.stats._lock:
+            self.stats.requests += 1
+            self._in_flight += 1
+            self.stats.peak_in_flight = max(self.stats.peak_in_flight, self._in_flight)
+
+        # Each attempt records its stages on its own timer, so that an
+        # abandoned request never writes to the caller's timer
+        attempt_timer = StageTimer() if timer is not None else None
+
+        def call() -> ForecastResult:
+            try:
+                return self.forecaster.forecast(
+                    data_wide=data_wide,
+                    prediction_length=prediction_length,
+                    quantiles=quantiles,
+                    timer=attempt_timer
+                )
+            finally:
+                with self.stats._lock:
+                    self._in_flight -= 1
+                self._slots.release()
+
+        try:
+            result = _call_with_timeout(call, self.request_timeout)
+        except TimeoutError:
+            with self.stats._lock:
+                self.stats.timeouts += 1
+            raise
+
+        if timer is not None:
+            for stage in attempt_timer.stages:
+                timer.add(stage.name, stage.wall_seconds, stage.cpu_seconds)
+        return result
+
+    def forecast(
+        self,
+        data_wide: pd.DataFrame,
+        prediction_length: int = 12,
+        quantiles: List[float] = [0.1, 0.5, 0.9],
+        timer: Optional[StageTimer] = None
+    ) -> ForecastResult:
+        """
+        Forecast one wide-format DataFrame, retrying transient errors.
+
+        Parameters
+        ----------
+        data_wide : pd.DataFrame
+            Wide-format DataFrame (ds index × account columns).
+        prediction_length : int, default=12
+            Number of future periods to forecast.
+        quantiles : List[float], default=[0.1, 0.5, 0.9]
+            Quantiles for prediction intervals.
+        timer : Optional[StageTimer], default=None
+            Timer receiving the stages of the successful attempt.
+
+        Returns
+        -------
+        ForecastResult
+            Result of the first successful attempt.
+
+        Raises
+        ------
+        Exception
+            The last error if every attempt failed, or the first
+            non-retryable error.
+        """
+        policy = self.retry_policy
+        attempt = 1
+        while True:
+            try:
+                return self._attempt(data_wide, prediction_length, quantiles, timer)
+            except policy.retryable_errors:
+                if attempt >= policy.max_attempts:
+                    with self.stats._lock:
+                        self.stats.failures += 1
+                    raise
+            except Exception:
+                with self.stats._lock:
+                    self.stats.failures += 1
+                raise
+
+            time.sleep(policy.backoff(attempt))
+            attempt += 1
+            with self.stats._lock:
+                self.stats.retries += 1
+
+    def submit(
+        self,
+        data_wide: pd.DataFrame,
+        prediction_length: int = 12,
+        quantiles: List[float] = [0.1, 0.5, 0.9],
+        timer: Optional[StageTimer] = None
+    ) -> 'Future[ForecastResult]':
+        """
+        Schedule a forecast on the thread pool.
+
+        Parameters are the same as forecast().
+
+        Returns
+        -------
+        Future[ForecastResult]
+            Future resolving to the forecast (or raising its error).
+        """
+        return self._executor.submit(self.forecast, data_wide, prediction_length, quantiles, timer)
+
+    def close(self) -> None:
+        """Wait for submitted forecasts and stop the thread pool."""
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> 'ConcurrentForecastClient':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,536 @@
+"""
+Persistent forecasting daemon keeping one TabPFN model warm.
+
+Building a TabPFNTSPipeline loads the model weights, which dominates the
+runtime of small batches. The daemon wraps a single TabPFNForecaster and
+serves forecast requests over a Unix socket, so consecutive CLI runs reuse
+the already-loaded model.
+
+Start the daemon with:
+    uv run python -m src.forecasting.daemon --tabpfn-mode local
+
+The forecasting CLI submits its jobs to the daemon whenever one is listening
+on the configured socket (see --daemon-socket / --no-daemon).
+
+Each job carries the forecaster settings of the run that submitted it
+(chunking and context, see TabPFNForecaster.with_settings), which the daemon applies to
+its warm model, so a run gives the same forecasts with or without the daemon.
+
+Messages are JSON documents prefixed with their length (8 bytes, big endian).
+The forecast input is passed in shared memory (see shared_frames), so only
+its descriptor goes through the socket; forecasts, which are small, are sent
+as JSON.
+"""
+
+import argparse
+import json
+import os
+import socket
+import socketserver
+import struct
+import threading
+import time
+from typing import Any, Dict, List, Literal, Optional
+
+import pandas as pd
+
+from src.config.forecasting_config import (
+    DAEMON_SOCKET_PATH,
+    MAX_CONTEXT_MONTHS,
+    TABPFN_MAX_ROWS_PER_CALL,
+    TRIM_LEADING_NAN_CONTEXT,
+)
+from src.forecasting.profiling import StageTimer
+from src.forecasting.shared_frames import SharedFrame, attach_frame, is_shared_descriptor, share_frame
+from src.forecasting.tabpfn_forecaster import ForecastResult, TabPFNForecaster
+
+
+# Default location of the daemon socket
+DEFAULT_SOCKET_PATH = DAEMON_SOCKET_PATH
+
+# Size of the length prefix sent before each message
+_HEADER = struct.Struct('>Q')
+
+
+def _frame_to_payload(df: Optional[pd.DataFrame]) -> Optional[Dict[str, Any]]:
+    """
+    Convert a wide-format DataFrame to a JSON-serializable dictionary.
+
+    Parameters
+    ----------
+    df : Optional[pd.DataFrame]
+        DataFrame with a DatetimeIndex and account columns, or None.
+
+    Returns
+    -------
+    Optional[Dict[str, Any]]
+        Dictionary with 'index', 'index_name', 'columns' and 'data', or None.
+    """
+    if df is None:
+        return None
+
+    return {
+        'index': [ts.isoformat() for ts in pd.DatetimeIndex(df.index)],
+        'index_name': df.index.name,
+        'columns': [str(col) for col in df.columns],
+        'data': df.to_numpy(dtype=float).tolist(),
+    }
+
+
+def _frame_from_payload(payload: Optional[Dict[str, Any]]) -> Optional[pd.DataFrame]:
+    """
+    Rebuild a wide-format DataFrame from _frame_to_payload output.
+
+    Parameters
+    ----------
+    payload : Optional[Dict[str, Any]]
+        Serialized DataFrame, or None.
+
+    Returns
+    -------
+    Optional[pd.DataFrame]
+        Reconstructed DataFrame, or None.
+    """
+    if payload is None:
+        return None
+
+    index = pd.DatetimeIndex(payload['index'], name=payload['index_name'])
+    return pd.DataFrame(payload['data'], index=index, columns=payload['columns'], dtype=float)
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes:
+    """Read exactly size bytes from a socket."""
+    chunks = []
+    remaining = size
+    while remaining > 0:
+        chunk = sock.recv(min(remaining, 1 << 20))
+        if not chunk:
+            raise ConnectionError("Connection closed before the message was complete")
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b''.join(chunks)
+
+
+def send_message(sock: socket.socket, message: Dict[str, Any]) -> None:
+    """
+    Send a length-prefixed JSON message.
+
+    Parameters
+    ----------
+    sock : socket.socket
+        Connected socket.
+    message : Dict[str, Any]
+        JSON-serializable message.
+    """
+    data = json.dumps(message).encode('utf-8')
+    sock.sendall(_HEADER.pack(len(data)) + data)
+
+
+def recv_message(sock: socket.socket) -> Dict[str, Any]:
+    """
+    Receive a length-prefixed JSON message.
+
+    Parameters
+    ----------
+    sock : socket.socket
+        Connected socket.
+
+    Returns
+    -------
+    Dict[str, Any]
+        Decoded message.
+    """
+    (size,) = _HEADER.unpack(_recv_exact(sock, _HEADER.size))
+    return json.loads(_recv_exact(sock, size).decode('utf-8'))
+
+
+class ForecastDaemon:
+    """
+    Unix socket server wrapping a single warm forecaster.
+
+    Requests are handled in threads, but forecasts are serialized with a
+    lock because the underlying model is not shared safely between threads.
+
+    Parameters
+    ----------
+    forecaster : TabPFNForecaster
+        Forecaster kept in memory (any object with the same forecast method).
+    socket_path : str, default=DEFAULT_SOCKET_PATH
+        Path of the Unix socket to listen on.
+
+    Examples
+    --------
+    >>> daemon = ForecastDaemon(TabPFNForecaster(mode='local'))
+    >>> daemon.serve_forever()  # blocks until a 'shutdown' request
+    """
+
+    def __init__(self, forecaster: TabPFNForecaster, socket_path: str = DEFAULT_SOCKET_PATH):
+        """Initialize the daemon without binding the socket."""
+        self.forecaster = forecaster
+        self.socket_path = socket_path
+        self.jobs_served = 0
+        self.started_at = time.time()
+        self._forecast_lock = threading.Lock()
+        self._server: Optional[socketserver.ThreadingUnixStreamServer] = None
+
+    def _handle(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Execute a single request.
+
+        Parameters
+        ----------
+        request : Dict[str, Any]
+            Request with an 'action' key: 'ping', 'forecast' or 'shutdown'.
+
+        Returns
+        -------
+        Dict[str, Any]
+            Response with a 'status' key ('ok' or 'error').
+        """
+        action = request.get('action')
+
+        if action == 'ping':
+            return {
+                'status': 'ok',
+                'mode': getattr(self.forecaster, 'mode', None),
+                'jobs_served': self.jobs_served,
+                'uptime': time.time() - self.started_at,
+            }
+
+        if action == 'shutdown':
+            # shutdown() blocks until serve_forever returns, so it cannot run
+            # on the request thread
+            threading.Thread(target=self.shutdown, daemon=True).start()
+            return {'status': 'ok'}
+
+        if action == 'forecast':
+            if is_shared_descriptor(request['data']):
+                with attach_frame(request['data']) as data_wide:
+                    result = self._forecast(data_wide, request)
+                    # Drop the view so that the block is unmapped on exit
+                    del data_wide
+            else:
+                result = self._forecast(_frame_from_payload(request['data']), request)
+
+            return {
+                'status': 'ok',
+                'forecast': _frame_to_payload(result.forecast_df),
+                'lower': _frame_to_payload(result.forecast_lower_df),
+                'upper': _frame_to_payload(result.forecast_upper_df),
+                'accounts': [str(acc) for acc in result.accounts],
+                'prediction_length': result.prediction_length,
+                'elapsed_time': result.elapsed_time,
+            }
+
+        return {'status': 'error', 'error': f"Unknown action: {action}"}
+
+    def _forecast(self, data_wide: pd.DataFrame, request: Dict[str, Any]) -> ForecastResult:
+        """Run one forecast request on the warm forecaster, with the settings of the job."""
+        forecaster = self.forecaster
+        if request.get('settings'):
+            forecaster = forecaster.with_settings(**request['settings'])
+
+        with self._forecast_lock:
+            result = forecaster.forecast(
+                data_wide=data_wide,
+                prediction_length=request.get('prediction_length', 12),
+                quantiles=request.get('quantiles', [0.1, 0.5, 0.9])
+            )
+            self.jobs_served += 1
+        return result
+
+    def bind(self) -> None:
+        """
+        Bind the Unix socket, removing a stale socket file if needed.
+
+        Raises
+        ------
+        RuntimeError
+            If another daemon is already listening on the socket.
+        """
+        if os.path.exists(self.socket_path):
+            if is_daemon_running(self.socket_path):
+                raise RuntimeError(f"A forecasting daemon is already running on {self.socket_path}")
+            os.unlink(self.socket_path)
+
+        daemon = self
+
+        class _RequestHandler(socketserver.BaseRequestHandler):
+            def handle(self):
+                try:
+                    request = recv_message(self.request)
+                except (ConnectionError, ValueError):
+                    return
+
+                try:
+                    response = daemon._handle(request)
+                except Exception as e:
+                    response = {'status': 'error', 'error': str(e)}
+
+                send_message(self.request, response)
+
+        self._server = socketserver.ThreadingUnixStreamServer(self.socket_path, _RequestHandler)
+        self._server.daemon_threads = True
+        os.chmod(self.socket_path, 0o600)
+
+    def serve_forever(self) -> None:
+        """Bind the socket (if needed) and serve requests until shutdown."""
+        if self._server is None:
+            self.bind()
+
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+
+    def shutdown(self) -> None:
+        """Stop serve_forever (must be called from another thread)."""
+        if self._server is not None:
+            self._server.shutdown()
+
+
+class DaemonClient:
+    """
+    Client submitting forecast jobs to a running ForecastDaemon.
+
+    Exposes the same forecast method as TabPFNForecaster so it can be used
+    as a drop-in forecaster by BatchProcessor.
+
+    Parameters
+    ----------
+    socket_path : str, default=DEFAULT_SOCKET_PATH
+        Path of the daemon socket.
+    timeout : Optional[float], default=None
+        Socket timeout in seconds (None waits indefinitely).
+    shared_memory : bool, default=True
+        Pass the forecast input in shared memory instead of serializing it
+        in the request (falls back to serializing if shared memory is not
+        available).
+    settings : Optional[Dict[str, Any]], default=None
+        Forecaster settings sent with each job and applied by the daemon
+        (see tabpfn_forecaster.FORECAST_SETTINGS). None uses the settings
+        the daemon was started with.
+
+    Examples
+    --------
+    >>> client = DaemonClient()
+    >>> client.ping()['mode']
+    'local'
+    >>> result = client.forecast(df, prediction_length=12)
+    """
+
+    def __init__(
+        self,
+        socket_path: str = DEFAULT_SOCKET_PATH,
+        timeout: Optional[float] = None,
+        shared_memory: bool = True,
+        settings: Optional[Dict[str, Any]] = None
+    ):
+        """Initialize the client."""
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self.shared_memory = shared_memory
+        self.settings = settings
+        self.mode = 'daemon'
+
+    def _request(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Send one request and return the daemon response.
+
+        Raises
+        ------
+        RuntimeError
+            If the daemon reports an error.
+        """
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(self.timeout)
+            sock.connect(self.socket_path)
+            send_message(sock, message)
+            response = recv_message(sock)
+
+        if response.get('status') != 'ok':
+            raise RuntimeError(f"Forecasting daemon error: {response.get('error')}")
+
+        return response
+
+    def ping(self) -> Dict[str, Any]:
+        """
+        Query the daemon status.
+
+        Returns
+        -------
+        Dict[str, Any]
+            Status with 'mode', 'jobs_served' and 'uptime' (seconds).
+        """
+        return self._request({'action': 'ping'})
+
+    def shutdown(self) -> None:
+        """Ask the daemon to stop."""
+        self._request({'action': 'shutdown'})
+
+    def forecast(
+        self,
+        data_wide: pd.DataFrame,
+        prediction_length: int = 12,
+        quantiles: List[float] = [0.1, 0.5, 0.9],
+        timer: Optional[StageTimer] = None
+    ) -> ForecastResult:
+        """
+        Forecast all accounts using the daemon's warm model.
+
+        Parameters
+        ----------
+        data_wide : pd.DataFrame
+            Wide-format DataFrame (DatetimeIndex × account columns).
+        prediction_length : int, default=12
+            Number of future periods to forecast.
+        quantiles : List[float], default=[0.1, 0.5, 0.9]
+            Quantiles for prediction intervals.
+        timer : Optional[StageTimer], default=None
+            If given, serialization (or the copy to shared memory) is
+            recorded as 'convert', the daemon round trip as 'predict' and
+            deserialization as 'extract'.
+
+        Returns
+        -------
+        ForecastResult
+            Forecast results as returned by the daemon's forecaster.
+        """
+        timer = timer if timer is not None else StageTimer()
+
+        with timer.span('convert'):
+            shared = self._share(data_wide)
+            request = {
+                'action': 'forecast',
+                'data': shared.descriptor if shared is not None else _frame_to_payload(data_wide),
+                'prediction_length': prediction_length,
+                'quantiles': list(quantiles),
+            }
+            if self.settings:
+                request['settings'] = self.settings
+
+        try:
+            with timer.span('predict'):
+                response = self._request(request)
+        finally:
+            if shared is not None:
+                shared.close()
+
+        with timer.span('extract'):
+            return ForecastResult(
+                forecast_df=_frame_from_payload(response['forecast']),
+                forecast_lower_df=_frame_from_payload(response['lower']),
+                forecast_upper_df=_frame_from_payload(response['upper']),
+                accounts=response['accounts'],
+                prediction_length=response['prediction_length'],
+                elapsed_time=response['elapsed_time']
+            )
+
+    def _share(self, data_wide: pd.DataFrame) -> Optional[SharedFrame]:
+        """Copy the input to shared memory (None if disabled or unavailable)."""
+        if not self.shared_memory:
+            return None
+        try:
+            return share_frame(data_wide)
+        except OSError:
+            return None
+
+
+def is_daemon_running(socket_path: str = DEFAULT_SOCKET_PATH, timeout: float = 1.0) -> bool:
+    """
+    Check whether a forecasting daemon answers on the socket.
+
+    Parameters
+    ----------
+    socket_path : str, default=DEFAULT_SOCKET_PATH
+        Path of the daemon socket.
+    timeout : float, default=1.0
+        Maximum time to wait for the ping response (seconds).
+
+    Returns
+    -------
+    bool
+        True if the daemon responded to a ping.
+    """
+    if not hasattr(socket, 'AF_UNIX') or not os.path.exists(socket_path):
+        return False
+
+    try:
+        DaemonClient(socket_path, timeout=timeout).ping()
+        return True
+    except (OSError, RuntimeError, ValueError):
+        return False
+
+
+def main():
+    """Run the forecasting daemon from the command line."""
+    parser = argparse.ArgumentParser(description="Run a persistent TabPFN forecasting daemon")
+    parser.add_argument(
+        '--tabpfn-mode',
+        choices=['local', 'client'],
+        default='local',
+        help='TabPFN mode: local (runs locally) or client (cloud API) (default: local)'
+    )
+    parser.add_argument(
+        '--socket',
+        default=DEFAULT_SOCKET_PATH,
+        metavar='PATH',
+        help=f'Unix socket path (default: {DEFAULT_SOCKET_PATH})'
+    )
+    parser.add_argument(
+        '--max-rows-per-call',
+        type=int,
+        default=TABPFN_MAX_ROWS_PER_CALL,
+        metavar='N',
+        help=f'Context rows per TabPFN call, larger jobs are chunked; 0 disables (default: {TABPFN_MAX_ROWS_PER_CALL})'
+    )
+    parser.add_argument(
+        '--max-context-months',
+        type=int,
+        default=MAX_CONTEXT_MONTHS,
+        metavar='N',
+        help='Only send the last N months of history to TabPFN (default: full history)'
+    )
+    parser.add_argument(
+        '--context-trimming',
+        action='store_true',
+        default=TRIM_LEADING_NAN_CONTEXT,
+        help='Drop the leading NaN months of accounts from the context'
+    )
+    parser.add_argument(
+        '--stop',
+        action='store_true',
+        help='Stop the daemon listening on the socket'
+    )
+    args = parser.parse_args()
+
+    if args.stop:
+        if is_daemon_running(args.socket):
+            DaemonClient(args.socket).shutdown()
+            print(f"Stopped forecasting daemon on {args.socket}")
+        else:
+            print(f"No forecasting daemon running on {args.socket}")
+        return
+
+    mode: Literal['local', 'client'] = args.tabpfn_mode
+    print(f"Loading TabPFN model ({mode} mode)...")
+    forecaster = TabPFNForecaster(
+        mode=mode,
+        max_rows_per_call=args.max_rows_per_call or None,
+        trim_leading_nan=args.context_trimming,
+        max_context_months=args.max_context_months
+    )
+    daemon = ForecastDaemon(forecaster, socket_path=args.socket)
+    daemon.bind()
+    print(f"Forecasting daemon listening on {args.socket} (Ctrl+C to stop)")
+
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        print("\nShutting down forecasting daemon...")
+
+
+if __name__ == '__main__':
+    main()
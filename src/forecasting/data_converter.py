@@ -6,17 +6,29 @@ This module provides functions to convert between the wide-format DataFrames
 (timestamp, target, item_id columns) required by TabPFN.
 """
 
-from typing import List
+from typing import Dict, List, Optional
+import numpy as np
 import pandas as pd
 
 
-def wide_to_tabpfn_format(wide_df: pd.DataFrame) -> pd.DataFrame:
+def wide_to_tabpfn_format(
+    wide_df: pd.DataFrame,
+    trim_leading_nan: bool = False,
+    max_history_months: Optional[int] = None
+) -> pd.DataFrame:
     """
     Convert wide-format DataFrame to TabPFN input format.
     
     Transforms a DataFrame with datetime index and account columns into
     the long-format required by TabPFN with timestamp, target, and item_id columns.
     
+    Accounts opened after the start of the history have a run of leading NaN
+    months that carries no information but still costs TabPFN context rows.
+    With trim_leading_nan, each account starts at its first observed value
+    (interior and trailing NaNs are kept, and an account without any value is
+    left untouched). max_history_months keeps only the most recent months.
+    Both keep the last timestamp, so forecast dates are unchanged.
+    
     Parameters
     ----------
     wide_df : pd.DataFrame
@@ -24,6 +36,10 @@ def wide_to_tabpfn_format(wide_df: pd.DataFrame) -> pd.DataFrame:
         - Index: DatetimeIndex (typically named 'ds')
         - Columns: Account numbers as strings
         - Values: Monthly balances (float)
+    trim_leading_nan : bool, default=False
+        If True, drop the leading NaN rows of each account.
+    max_history_months : Optional[int], default=None
+        If given, keep only the last max_history_months periods.
     
     Returns
     -------
@@ -47,6 +63,9 @@ def wide_to_tabpfn_format(wide_df: pd.DataFrame) -> pd.DataFrame:
     if wide_df.empty:
         return pd.DataFrame(columns=['timestamp', 'target', 'item_id'])
     
+    if max_history_months is not None:
+        wide_df = wide_df.iloc[-max_history_months:]
+    
     # Reset index to make the datetime index a column
     long_df = wide_df.reset_index()
     
@@ -64,6 +83,14 @@ def wide_to_tabpfn_format(wide_df: pd.DataFrame) -> pd.DataFrame:
     # Ensure correct column order
     long_df = long_df[['timestamp', 'target', 'item_id']]
     
+    if trim_leading_nan:
+        # melt stacks the columns one after the other: keep the rows of each
+        # account from its first observed value (argmax of an all-NaN column is 0)
+        observed = wide_df.notna().to_numpy()
+        first_observed = observed.argmax(axis=0)
+        keep = np.arange(len(wide_df))[None, :] >= first_observed[:, None]
+        long_df = long_df[keep.ravel()].reset_index(drop=True)
+    
     return long_df
 
 
@@ -149,7 +176,9 @@ def tabpfn_output_to_wide_format(
 
 def extract_quantiles_from_tabpfn_output(
     tabpfn_output: pd.DataFrame,
-    accounts: List[str]
+    accounts: List[str],
+    lower_quantile: float = 0.1,
+    upper_quantile: float = 0.9
 ) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
     """
     Extract quantile columns from TabPFN output into separate DataFrames.
@@ -169,6 +198,10 @@ def extract_quantiles_from_tabpfn_output(
     accounts : List[str]
         List of account numbers to include as columns in the output.
         This ensures consistent column ordering.
+    lower_quantile : float, default=0.1
+        Quantile of the lower bound.
+    upper_quantile : float, default=0.9
+        Quantile of the upper bound.
     
     Returns
     -------
@@ -251,10 +284,10 @@ def extract_quantiles_from_tabpfn_output(
     median_pivot.index.name = 'ds'
     median_pivot.columns.name = None
     
-    lower_col = resolve_quantile_column(df.columns, 0.1)
-    upper_col = resolve_quantile_column(df.columns, 0.9)
+    lower_col = resolve_quantile_column(df.columns, lower_quantile)
+    upper_col = resolve_quantile_column(df.columns, upper_quantile)
 
-    # Extract lower bound (0.1 quantile)
+    # Extract lower bound (0.1 quantile by default)
     lower_pivot = df.pivot(
         index='timestamp',
         columns='item_id',
@@ -264,7 +297,7 @@ def extract_quantiles_from_tabpfn_output(
     lower_pivot.index.name = 'ds'
     lower_pivot.columns.name = None
     
-    # Extract upper bound (0.9 quantile)
+    # Extract upper bound (0.9 quantile by default)
     upper_pivot = df.pivot(
         index='timestamp',
         columns='item_id',
@@ -276,3 +309,125 @@ def extract_quantiles_from_tabpfn_output(
     
     return median_pivot, lower_pivot, upper_pivot
 
+
+
+# Separator between company and account in the item ids of a shared batch
+BATCH_ITEM_SEPARATOR = '::'
+
+
+def combine_wide_frames(frames: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """
+    Combine the wide-format DataFrames of several companies into one.
+    
+    Used to forecast small companies in a single TabPFN call. All frames must
+    share the same index; columns are renamed to '<company_id>::<account>'.
+    
+    Parameters
+    ----------
+    frames : Dict[str, pd.DataFrame]
+        Wide-format DataFrame per company ID.
+    
+    Returns
+    -------
+    pd.DataFrame
+        Wide-format DataFrame with the columns of all companies.
+    
+    Raises
+    ------
+    ValueError
+        If the frames do not share the same index.
+    
+    Examples
+    --------
+    >>> dates = pd.date_range('2023-01-01', periods=3, freq='MS')
+    >>> a = pd.DataFrame({'707000': [1.0, 2.0, 3.0]}, index=dates)
+    >>> b = pd.DataFrame({'707000': [4.0, 5.0, 6.0]}, index=dates)
+    >>> list(combine_wide_frames({'A': a, 'B': b}).columns)
+    ['A::707000', 'B::707000']
+    """
+    frames_list = list(frames.values())
+    index = frames_list[0].index
+    if any(not frame.index.equals(index) for frame in frames_list[1:]):
+        raise ValueError("Frames of a shared batch must have the same index")
+    
+    combined = pd.concat(
+        [
+            frame.rename(columns=lambda account, company_id=company_id: f"{company_id}{BATCH_ITEM_SEPARATOR}{account}")
+            for company_id, frame in frames.items()
+        ],
+        axis=1
+    )
+    combined.index.name = index.name
+    return combined
+
+
+def split_wide_frame(combined: pd.DataFrame, company_id: str) -> pd.DataFrame:
+    """
+    Extract the columns of one company from a combined wide-format DataFrame.
+    
+    Inverse of combine_wide_frames.
+    
+    Parameters
+    ----------
+    combined : pd.DataFrame
+        DataFrame with '<company_id>::<account>' columns.
+    company_id : str
+        Company to extract.
+    
+    Returns
+    -------
+    pd.DataFrame
+        Wide-format DataFrame with the original account columns.
+    """
+    prefix = f"{company_id}{BATCH_ITEM_SEPARATOR}"
+    columns = [column for column in combined.columns if column.startswith(prefix)]
+    return combined[columns].rename(columns=lambda column: column[len(prefix):])
+
+
+def chunk_accounts(
+    accounts: List[str],
+    n_periods: int,
+    max_rows: Optional[int]
+) -> List[List[str]]:
+    """
+    Split accounts into chunks whose context stays within a row budget.
+    
+    TabPFN receives one context row per account and period, so a chunk of
+    k accounts over n_periods months produces k × n_periods rows.
+    
+    Parameters
+    ----------
+    accounts : List[str]
+        Accounts to forecast, in column order.
+    n_periods : int
+        Number of context periods (rows of the wide-format DataFrame).
+    max_rows : Optional[int]
+        Maximum number of context rows per chunk (a single chunk if None).
+        A chunk always contains at least one account.
+    
+    Returns
+    -------
+    List[List[str]]
+        Consecutive, equally sized (up to one account) chunks of accounts.
+    
+    Examples
+    --------
+    >>> chunk_accounts(['a', 'b', 'c', 'd', 'e'], n_periods=10, max_rows=20)
+    [['a', 'b'], ['c', 'd'], ['e']]
+    """
+    if not accounts:
+        return []
+    if max_rows is None or len(accounts) * n_periods <= max_rows:
+        return [list(accounts)]
+    
+    per_chunk = max(1, max_rows // max(n_periods, 1))
+    n_chunks = -(-len(accounts) // per_chunk)
+    # Balance chunk sizes instead of leaving a small remainder
+    base, extra = divmod(len(accounts), n_chunks)
+    chunks = []
+    start = 0
+    for i in range(n_chunks):
+        end = start + base + (1 if i < extra else 0)
+        chunks.append(list(accounts[start:end]))
+        start = end
+    return chunks
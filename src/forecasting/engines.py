@@ -0,0 +1,295 @@
+"""
+Forecast engines behind TabPFNForecaster.
+
+TabPFNForecaster converts wide-format data to the long format of
+tabpfn-time-series, calls the predict_df method of its engine and converts
+the quantile output back (chunking accounts and trimming the context on the
+way). The engine is any object implementing ForecastEngine; by default it is
+a TabPFNTSPipeline.
+
+Engines are registered by name, so that the CLI can select one or several
+(see multi_engine), with the label written as the forecast_type of the
+accounts they forecast and in the name of their forecast version:
+
+- 'tabpfn': the TabPFN time series model, local or client (built by
+  TabPFNForecaster according to its mode),
+- 'seasonal_naive': SeasonalNaiveEngine, the baseline of the RMSSE (the
+  same month one year earlier), without prediction interval,
+- 'stub': StubEngine as a stand-in for the model, for load tests of the
+  whole pipeline (preprocessing, forecasting, saving, metrics) at portfolio
+  scale on a CPU box.
+
+    >>> forecaster = TabPFNForecaster(mode='local', engine='stub')
+"""
+
+import time
+import warnings
+from typing import Callable, Dict, List, Optional, Protocol
+
+import numpy as np
+import pandas as pd
+
+from src.metrics.seasonal_naive import generate_seasonal_naive
+
+
+class ForecastEngine(Protocol):
+    """Interface of a forecast engine (the predict_df method of TabPFNTSPipeline)."""
+
+    def predict_df(
+        self,
+        context_df: pd.DataFrame,
+        prediction_length: int,
+        quantiles: List[float] = [0.1, 0.5, 0.9]
+    ) -> pd.DataFrame:
+        """
+        Forecast every series of a long-format context.
+
+        Parameters
+        ----------
+        context_df : pd.DataFrame
+            Long-format context with timestamp, target and item_id columns.
+        prediction_length : int
+            Number of future periods.
+        quantiles : List[float], default=[0.1, 0.5, 0.9]
+            Quantiles to return.
+
+        Returns
+        -------
+        pd.DataFrame
+            Output indexed by (item_id, timestamp) with a 'target' column
+            (median) and one column per quantile.
+        """
+        ...
+
+
+# Half-width of a quantile band in standard deviations per unit of (q - 0.5):
+# q=0.1 and q=0.9 fall at -/+1.28 standard deviations, as for a normal law
+_QUANTILE_SCALE = 2 * 1.2816
+
+
+class StubEngine:
+    """
+    Deterministic stand-in for the TabPFN model.
+
+    Forecasts each series with its value of the same month one year earlier
+    (the last observed value if there is none), with quantiles spread by the
+    standard deviation of the series. The output has the shape of
+    TabPFNTSPipeline.predict_df, so everything around the model runs as in a
+    real forecast, in milliseconds.
+
+    Parameters
+    ----------
+    latency : float, default=0.0
+        Simulated duration of a call (seconds).
+    latency_per_row : float, default=0.0
+        Additional simulated duration per context row (seconds), to mimic
+        the cost of the model.
+
+    Attributes
+    ----------
+    calls : int
+        Number of predict_df calls.
+    rows : int
+        Total number of context rows received.
+
+    Examples
+    --------
+    >>> engine = StubEngine()
+    >>> forecaster = TabPFNForecaster(mode='local', pipeline=engine)
+    >>> result = forecaster.forecast(df, prediction_length=12)
+    """
+
+    def __init__(self, latency: float = 0.0, latency_per_row: float = 0.0):
+        """Initialize the engine and its counters."""
+        self.latency = latency
+        self.latency_per_row = latency_per_row
+        self.calls = 0
+        self.rows = 0
+
+    def predict_df(
+        self,
+        context_df: pd.DataFrame,
+        prediction_length: int,
+        quantiles: List[float] = [0.1, 0.5, 0.9]
+    ) -> pd.DataFrame:
+        """Return deterministic quantile forecasts (see ForecastEngine.predict_df)."""
+        self.calls += 1
+        self.rows += len(context_df)
+        delay = self.latency + self.latency_per_row * len(context_df)
+        if delay > 0:
+            time.sleep(delay)
+
+        items = pd.unique(context_df['item_id'])
+        history = context_df.pivot(index='timestamp', columns='item_id', values='target')
+        history = history.sort_index().reindex(columns=items)
+        values = history.to_numpy(dtype=float)
+        n_periods = len(values)
+
+        # Last observed value of each series (0 without any)
+        last_values = history.ffill().iloc[-1].fillna(0.0).to_numpy(dtype=float) if n_periods else np.zeros(len(items))
+
+        # Seasonal naive: the same month one year earlier, when observed
+        median = np.tile(last_values, (prediction_length, 1))
+        if n_periods >= 12:
+            steps = np.arange(prediction_length)
+            seasonal = values[n_periods - 12 + steps % 12]
+            median = np.where(np.isnan(seasonal), median, seasonal)
+
+        with warnings.catch_warnings():
+            # Series without any value have no spread
+            warnings.simplefilter('ignore', RuntimeWarning)
+            spread = np.nan_to_num(np.nanstd(values, axis=0)) if n_periods else np.zeros(len(items))
+
+        last_date = pd.Timestamp(history.index[-1]) if n_periods else pd.Timestamp.today().normalize()
+        future = pd.date_range(last_date, periods=prediction_length + 1, freq='MS')[1:]
+        index = pd.MultiIndex.from_product([items, future], names=['item_id', 'timestamp'])
+
+        # Series-major order, like the MultiIndex
+        median = median.T.reshape(-1)
+        spread = np.repeat(spread, prediction_length)
+        output = pd.DataFrame({'target': median}, index=index)
+        for quantile in quantiles:
+            output[quantile] = median + (quantile - 0.5) * _QUANTILE_SCALE * spread
+        return output
+
+
+class SeasonalNaiveEngine:
+    """
+    Seasonal naive baseline: each month is forecast with its value one year earlier.
+
+    The first year comes from metrics.seasonal_naive.generate_seasonal_naive,
+    the baseline of the RMSSE, and is repeated for longer horizons. Months
+    whose value one year earlier is missing (e.g. in series with less than a
+    year of history) get the last observed value of the series (0 without
+    any).
+
+    A seasonal naive forecast has no prediction interval: the output only
+    has the 'target' column, so its forecast versions are saved without
+    bounds (and an ensemble including it has none either).
+
+    Examples
+    --------
+    >>> forecaster = TabPFNForecaster(mode='local', engine='seasonal_naive')
+    >>> result = forecaster.forecast(df, prediction_length=12)
+    >>> result.forecast_lower_df is None
+    True
+    """
+
+    def predict_df(
+        self,
+        context_df: pd.DataFrame,
+        prediction_length: int,
+        quantiles: List[float] = [0.1, 0.5, 0.9]
+    ) -> pd.DataFrame:
+        """Return seasonal naive forecasts, without quantiles (see ForecastEngine.predict_df)."""
+        items = pd.unique(context_df['item_id'])
+        history = context_df.pivot(index='timestamp', columns='item_id', values='target')
+        history = history.sort_index().reindex(columns=items)
+
+        # Monthly calendar covering at least the last year, so that trimmed
+        # or short series line up with their months one year earlier
+        last_date = pd.Timestamp(history.index[-1])
+        calendar = pd.date_range(min(pd.Timestamp(history.index[0]), last_date - pd.DateOffset(months=11)),
+                                 last_date, freq='MS')
+        history = history.reindex(calendar)
+
+        last_values = history.ffill().iloc[-1].fillna(0.0)
+        future = pd.date_range(last_date, periods=prediction_length + 1, freq='MS')[1:]
+
+        one_year = generate_seasonal_naive(history, forecast_horizon=12).to_numpy(dtype=float)
+        values = one_year[np.arange(prediction_length) % 12]
+        forecast = pd.DataFrame(values, index=future, columns=items).fillna(last_values)
+
+        # Series-major order, like the MultiIndex
+        index = pd.MultiIndex.from_product([items, future], names=['item_id', 'timestamp'])
+        return pd.DataFrame({'target': forecast.to_numpy().T.reshape(-1)}, index=index)
+
+
+# Engines available by name (besides 'tabpfn', which TabPFNForecaster builds)
+ENGINES: Dict[str, Callable[[], ForecastEngine]] = {
+    'seasonal_naive': SeasonalNaiveEngine,
+    'stub': StubEngine,
+}
+
+# Label of each engine in company.json (forecast_type and version name)
+ENGINE_LABELS: Dict[str, str] = {
+    'tabpfn': 'TabPFN',
+    'seasonal_naive': 'Seasonal Naive',
+    'stub': 'Stub',
+    'ensemble': 'Ensemble',
+}
+
+
+def register_engine(name: str, factory: Callable[[], ForecastEngine], label: Optional[str] = None) -> None:
+    """
+    Make an engine available by name.
+
+    Parameters
+    ----------
+    name : str
+        Engine name (e.g. for TabPFNForecaster(engine=name)).
+    factory : Callable[[], ForecastEngine]
+        Builds a new engine.
+    label : Optional[str], default=None
+        Label of its forecasts in company.json (the name if None).
+    """
+    ENGINES[name] = factory
+    ENGINE_LABELS[name] = label or name
+
+
+def engine_label(name: str) -> str:
+    """
+    Label of an engine's forecasts (forecast_type of the accounts it forecasts).
+
+    Parameters
+    ----------
+    name : str
+        Engine name, or 'ensemble' for a combination of engines.
+
+    Returns
+    -------
+    str
+        Registered label, e.g. 'TabPFN' (the name itself if unknown).
+    """
+    return ENGINE_LABELS.get(name, name)
+
+
+def version_name(engine: str) -> str:
+    """
+    Name of the forecast version of an engine in company.json.
+
+    Parameters
+    ----------
+    engine : str
+        Engine name, or 'ensemble'.
+
+    Returns
+    -------
+    str
+        Version name, e.g. 'TabPFN-v1.0'.
+    """
+    return f"{engine_label(engine)}-v1.0"
+
+
+def create_engine(name: str) -> ForecastEngine:
+    """
+    Build a registered engine.
+
+    Parameters
+    ----------
+    name : str
+        Engine name.
+
+    Returns
+    -------
+    ForecastEngine
+        New engine.
+
+    Raises
+    ------
+    ValueError
+        If no engine is registered under this name.
+    """
+    if name not in ENGINES:
+        raise ValueError(f"Unknown engine: {name} (available: tabpfn, {', '.join(sorted(ENGINES))})")
+    return ENGINES[name]()
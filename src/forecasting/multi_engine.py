@@ -0,0 +1,160 @@
+"""
+Several forecast engines on the same input.
+
+MultiEngineForecaster runs the forecasters of several engines (see engines)
+in parallel threads on the wide-format DataFrame of a company, so that its
+ledger is loaded and preprocessed once whatever the number of engines. Its
+result is the equal-weight ensemble of the engines, with the forecast of each
+engine in ForecastResult.engine_results; BatchProcessor saves them as one
+forecast version per engine, as the ensemble, or both.
+
+    >>> forecaster = MultiEngineForecaster({
+    ...     'tabpfn': TabPFNForecaster(mode='local'),
+    ...     'seasonal_naive': TabPFNForecaster(mode='local', engine='seasonal_naive'),
+    ... })
+    >>> processor = BatchProcessor(forecaster=forecaster, engine_output='both')
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from src.forecasting.profiling import StageTimer
+from src.forecasting.tabpfn_forecaster import ForecastResult
+
+
+def ensemble_forecast(engine_results: Dict[str, ForecastResult], elapsed_time: float = 0.0) -> ForecastResult:
+    """
+    Combine the forecasts of several engines with equal weights.
+
+    The forecast and each bound are the mean of the engines' forecasts and
+    bounds (bounds are None unless every engine has them).
+
+    Parameters
+    ----------
+    engine_results : Dict[str, ForecastResult]
+        Forecast of each engine, over the same accounts and dates.
+    elapsed_time : float, default=0.0
+        Elapsed time of the ensemble (seconds).
+
+    Returns
+    -------
+    ForecastResult
+        Ensemble forecast (engine 'ensemble'), with engine_results attached.
+    """
+    results = list(engine_results.values())
+    accounts = results[0].accounts
+
+    def mean(frames: List[Optional[pd.DataFrame]]) -> Optional[pd.DataFrame]:
+        if any(frame is None for frame in frames):
+            return None
+        return sum(frame[accounts] for frame in frames) / len(frames)
+
+    return ForecastResult(
+        forecast_df=mean([result.forecast_df for result in results]),
+        forecast_lower_df=mean([result.forecast_lower_df for result in results]),
+        forecast_upper_df=mean([result.forecast_upper_df for result in results]),
+        accounts=accounts,
+        prediction_length=results[0].prediction_length,
+        elapsed_time=elapsed_time,
+        engine='ensemble',
+        engine_results=dict(engine_results)
+    )
+
+
+class MultiEngineForecaster:
+    """
+    Forecast with several engines at once.
+
+    Parameters
+    ----------
+    forecasters : Dict[str, TabPFNForecaster]
+        Forecaster of each engine, by engine name (a TabPFNForecaster, or
+        any object with the same forecast method such as a DaemonClient).
+    parallel : bool, default=True
+        Run the engines in parallel threads (one after the other if False).
+
+    Examples
+    --------
+    >>> forecaster = MultiEngineForecaster({
+    ...     'tabpfn': TabPFNForecaster(mode='client'),
+    ...     'seasonal_naive': TabPFNForecaster(mode='client', engine='seasonal_naive'),
+    ... })
+    >>> result = forecaster.forecast(df, prediction_length=12)
+    >>> sorted(result.engine_results)
+    ['seasonal_naive', 'tabpfn']
+    """
+
+    def __init__(self, forecasters: Dict[str, object], parallel: bool = True):
+        """Initialize the forecaster."""
+        if not forecasters:
+            raise ValueError("At least one engine is required")
+        self.forecasters = dict(forecasters)
+        self.parallel = parallel
+
+    @property
+    def mode(self) -> str:
+        """Mode of the first forecaster."""
+        return next(iter(self.forecasters.values())).mode
+
+    @property
+    def engines(self) -> List[str]:
+        """Names of the engines."""
+        return list(self.forecasters)
+
+    def forecast(
+        self,
+        data_wide: pd.DataFrame,
+        prediction_length: int = 12,
+        quantiles: List[float] = [0.1, 0.5, 0.9],
+        timer: Optional[StageTimer] = None
+    ) -> ForecastResult:
+        """
+        Forecast all accounts with every engine.
+
+        Parameters
+        ----------
+        data_wide : pd.DataFrame
+            Wide-format DataFrame (ds index × account columns), shared by
+            the engines.
+        prediction_length : int, default=12
+            Number of future periods to forecast.
+        quantiles : List[float], default=[0.1, 0.5, 0.9]
+            Quantiles for prediction intervals.
+        timer : Optional[StageTimer], default=None
+            If given, the wall time of all engines (conversions included) is
+            recorded on it as the 'predict' stage.
+
+        Returns
+        -------
+        ForecastResult
+            Ensemble forecast, with the forecast of each engine in
+            engine_results (see ensemble_forecast).
+
+        Raises
+        ------
+        Exception
+            The first error of an engine (the company has no forecast).
+        """
+        start_time = time.time()
+        timer = timer if timer is not None else StageTimer()
+
+        def run(name: str) -> ForecastResult:
+            # Engine timers stay separate: in parallel, their stages overlap
+            return self.forecasters[name].forecast(
+                data_wide=data_wide,
+                prediction_length=prediction_length,
+                quantiles=quantiles,
+                timer=StageTimer()
+            )
+
+        with timer.span('predict'):
+            if self.parallel and len(self.forecasters) > 1:
+                with ThreadPoolExecutor(max_workers=len(self.forecasters), thread_name_prefix='engine') as executor:
+                    outputs = list(executor.map(run, self.engines))
+            else:
+                outputs = [run(name) for name in self.engines]
+
+        return ensemble_forecast(dict(zip(self.engines, outputs)), elapsed_time=time.time() - start_time)
@@ -0,0 +1,265 @@
+"""
+Stage-level timing and memory instrumentation for the forecasting pipeline.
+
+A StageTimer records, for each named stage, the wall time, the CPU time of the
+process and the peak resident set size (RSS) reached so far. Stages are opened
+with a context manager:
+
+    >>> timer = StageTimer()
+    >>> with timer.span('load'):
+    ...     fecs = load_fecs(...)
+    >>> timer.to_dict()['load']['wall_seconds']
+    0.42
+
+Per-company timings are collected into a run report written as JSON under
+<data_folder>/_runs/<run_id>/report.json.
+"""
+
+import json
+import sys
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
+
+
+# Pipeline stages, in execution order
+PIPELINE_STAGES = (
+    'load',
+    'monthly_totals',
+    'preprocess',
+    'convert',
+    'predict',
+    'extract',
+    'save',
+    'metadata',
+)
+
+# Folder (inside the data folder) holding run reports
+RUNS_FOLDER_NAME = '_runs'
+
+
+def new_run_id() -> str:
+    """
+    Generate a sortable run identifier.
+
+    Returns
+    -------
+    str
+        Identifier such as '20250114_093000_1a2b3c'.
+    """
+    return f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
+
+
+def get_peak_rss_mb() -> Optional[float]:
+    """
+    Return the peak resident set size of the current process.
+
+    Returns
+    -------
+    Optional[float]
+        Peak RSS in megabytes, or None if the platform does not report it.
+    """
+    if resource is None:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes on Linux
+    divisor = 1024 * 1024 if sys.platform == 'darwin' else 1024
+    return peak / divisor
+
+
+@dataclass
+class StageTiming:
+    """
+    Measurements for one pipeline stage.
+
+    Attributes
+    ----------
+    name : str
+        Stage name (see PIPELINE_STAGES).
+    wall_seconds : float
+        Elapsed wall-clock time.
+    cpu_seconds : float
+        CPU time consumed by the process (all threads) during the stage.
+    peak_rss_mb : Optional[float]
+        Peak RSS of the process at the end of the stage (None if unavailable).
+    """
+
+    name: str
+    wall_seconds: float
+    cpu_seconds: float
+    peak_rss_mb: Optional[float]
+
+
+class StageTimer:
+    """
+    Collect StageTiming measurements for a sequence of stages.
+
+    Entering the same stage several times accumulates its wall and CPU time.
+
+    Examples
+    --------
+    >>> timer = StageTimer()
+    >>> with timer.span('convert'):
+    ...     pass
+    >>> list(timer.to_dict())
+    ['convert']
+    """
+
+    def __init__(self):
+        """Initialize an empty timer."""
+        self._stages: Dict[str, StageTiming] = {}
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        """
+        Measure the enclosed block as stage ``name``.
+
+        The timing is recorded even if the block raises.
+
+        Parameters
+        ----------
+        name : str
+            Stage name.
+        """
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - wall_start, time.process_time() - cpu_start)
+
+    def add(self, name: str, wall_seconds: float, cpu_seconds: float = 0.0) -> None:
+        """
+        Add a measurement taken elsewhere to stage ``name``.
+
+        Used to attribute a share of a stage that several companies ran
+        together (e.g. a shared forecast call).
+
+        Parameters
+        ----------
+        name : str
+            Stage name.
+        wall_seconds : float
+            Wall time to add.
+        cpu_seconds : float, default=0.0
+            CPU time to add.
+        """
+        previous = self._stages.get(name)
+        if previous is not None:
+            wall_seconds += previous.wall_seconds
+            cpu_seconds += previous.cpu_seconds
+        self._stages[name] = StageTiming(
+            name=name,
+            wall_seconds=wall_seconds,
+            cpu_seconds=cpu_seconds,
+            peak_rss_mb=get_peak_rss_mb()
+        )
+
+    @property
+    def stages(self) -> List[StageTiming]:
+        """Recorded stages in the order they were first entered."""
+        return list(self._stages.values())
+
+    @property
+    def total_wall_seconds(self) -> float:
+        """Sum of the wall time of all stages."""
+        return sum(stage.wall_seconds for stage in self._stages.values())
+
+    def to_dict(self) -> Dict[str, Dict[str, Optional[float]]]:
+        """
+        Return the measurements as a JSON-serializable dictionary.
+
+        Returns
+        -------
+        Dict[str, Dict[str, Optional[float]]]
+            Mapping of stage name to wall_seconds, cpu_seconds and peak_rss_mb.
+        """
+        return {
+            name: {key: value for key, value in asdict(stage).items() if key != 'name'}
+            for name, stage in self._stages.items()
+        }
+
+
+def summarize_stages(results: List[dict]) -> Dict[str, Dict[str, float]]:
+    """
+    Sum stage timings over all company results.
+
+    Parameters
+    ----------
+    results : List[dict]
+        Company results from BatchProcessor (with a 'stages' entry).
+
+    Returns
+    -------
+    Dict[str, Dict[str, float]]
+        Mapping of stage name to total wall_seconds, cpu_seconds and the
+        highest peak_rss_mb, in PIPELINE_STAGES order.
+    """
+    totals: Dict[str, Dict[str, float]] = {}
+    for result in results:
+        for name, stage in result.get('stages', {}).items():
+            total = totals.setdefault(name, {'wall_seconds': 0.0, 'cpu_seconds': 0.0, 'peak_rss_mb': 0.0})
+            total['wall_seconds'] += stage['wall_seconds']
+            total['cpu_seconds'] += stage['cpu_seconds']
+            total['peak_rss_mb'] = max(total['peak_rss_mb'], stage['peak_rss_mb'] or 0.0)
+
+    order = {name: i for i, name in enumerate(PIPELINE_STAGES)}
+    return dict(sorted(totals.items(), key=lambda item: order.get(item[0], len(order))))
+
+
+def write_run_report(
+    results: List[dict],
+    run_id: str,
+    data_folder: str = "data",
+    started_at: Optional[datetime] = None,
+    settings: Optional[dict] = None
+) -> Path:
+    """
+    Write the per-company stage breakdown of a batch run.
+
+    Parameters
+    ----------
+    results : List[dict]
+        Company results from BatchProcessor.
+    run_id : str
+        Run identifier.
+    data_folder : str, default="data"
+        Root data folder path; the report goes to <data_folder>/_runs/<run_id>/.
+    started_at : Optional[datetime], default=None
+        Start time of the run.
+    settings : Optional[dict], default=None
+        Run settings (mode, forecast horizon, ...).
+
+    Returns
+    -------
+    Path
+        Path to the written report.json.
+    """
+    run_path = Path(data_folder) / RUNS_FOLDER_NAME / run_id
+    run_path.mkdir(parents=True, exist_ok=True)
+
+    report = {
+        'run_id': run_id,
+        'started_at': started_at.isoformat(timespec='seconds') if started_at else None,
+        'finished_at': datetime.now().isoformat(timespec='seconds'),
+        'settings': settings or {},
+        'peak_rss_mb': get_peak_rss_mb(),
+        'stage_totals': summarize_stages(results),
+        'companies': results,
+    }
+
+    report_path = run_path / 'report.json'
+    with open(report_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, default=str)
+
+    return report_path
@@ -7,7 +7,7 @@ and update company metadata with forecast information.
 
 import json
 from pathlib import Path
-from typing import Dict
+from typing import Any, Dict, Optional
 import pandas as pd
 
 
@@ -142,7 +142,8 @@ def update_company_metadata(
     account_metadata: Dict[str, Dict],
     data_folder: str = "data",
     version_name: str = "TabPFN-v1.0",
-    status: str = "Success"
+    status: str = "Success",
+    metrics: Optional[Dict[str, Any]] = None
 ) -> None:
     """
     Update company.json with new forecast version information.
@@ -168,6 +169,9 @@ def update_company_metadata(
         Name for this forecast version.
     status : str, default="Success"
         Status of the forecast run.
+    metrics : Optional[Dict[str, Any]], default=None
+        Aggregated metrics of the version (see compute_aggregated_metrics),
+        written with the version so that company.json is written once.
     
     Examples
     --------
@@ -191,6 +195,8 @@ def update_company_metadata(
         "status": status,
         "meta_data": account_metadata
     }
+    if metrics is not None:
+        forecast_version["metrics"] = metrics
     
     # Append to forecast_versions list
     if 'forecast_versions' not in company_data:
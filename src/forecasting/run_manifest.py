@@ -0,0 +1,185 @@
+"""
+Checkpoint manifest of a batch forecasting run.
+
+The manifest lives next to the run report, in
+<data_folder>/_runs/<run_id>/manifest.json. It lists every company of the run
+with its status and is rewritten (atomically) each time a company completes,
+so an interrupted or crashed run can be resumed with
+
+    python -m src.forecasting --resume <run_id>
+
+which only processes the companies that did not finish.
+"""
+
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from src.forecasting.profiling import RUNS_FOLDER_NAME
+
+
+MANIFEST_FILE = 'manifest.json'
+
+# Status of a company that has not been processed yet
+PENDING_STATUS = 'pending'
+
+# Company statuses that are not retried when a run is resumed
+FINISHED_STATUSES = ('Success', 'No forecastable accounts')
+
+
+def get_manifest_path(run_id: str, data_folder: str = "data") -> Path:
+    """
+    Return the path of the manifest of a run.
+
+    Parameters
+    ----------
+    run_id : str
+        Run identifier.
+    data_folder : str, default="data"
+        Root data folder path.
+
+    Returns
+    -------
+    Path
+        <data_folder>/_runs/<run_id>/manifest.json
+    """
+    return Path(data_folder) / RUNS_FOLDER_NAME / run_id / MANIFEST_FILE
+
+
+class RunManifest:
+    """
+    Per-company progress of a batch run, persisted after every company.
+
+    Parameters
+    ----------
+    run_id : str
+        Run identifier.
+    company_ids : List[str]
+        Companies of the run.
+    data_folder : str, default="data"
+        Root data folder path.
+    settings : Optional[dict], default=None
+        Run settings (mode, forecast horizon, ...), reused on resume.
+
+    Examples
+    --------
+    >>> manifest = RunManifest('20250114_093000_1a2b3c', ['A', 'B'], data_folder='data')
+    >>> manifest.save()
+    >>> manifest.record({'company_id': 'A', 'status': 'Success', 'process_id': 'p1'})
+    >>> RunManifest.load('20250114_093000_1a2b3c', 'data').pending_companies
+    ['B']
+    """
+
+    def __init__(
+        self,
+        run_id: str,
+        company_ids: List[str],
+        data_folder: str = "data",
+        settings: Optional[dict] = None
+    ):
+        """Initialize a manifest with every company pending."""
+        self.run_id = run_id
+        self.data_folder = data_folder
+        self.settings = settings or {}
+        self.status = 'running'
+        self.created_at = datetime.now().isoformat(timespec='seconds')
+        self.companies: Dict[str, dict] = {
+            company_id: {'company_id': company_id, 'status': PENDING_STATUS}
+            for company_id in company_ids
+        }
+
+    @property
+    def path(self) -> Path:
+        """Path of the manifest file."""
+        return get_manifest_path(self.run_id, self.data_folder)
+
+    @property
+    def pending_companies(self) -> List[str]:
+        """Companies still to process (never processed or failed), in run order."""
+        return [
+            company_id for company_id, entry in self.companies.items()
+            if entry['status'] not in FINISHED_STATUSES
+        ]
+
+    @property
+    def results(self) -> List[dict]:
+        """Results of the processed companies, in run order."""
+        return [entry for entry in self.companies.values() if entry['status'] != PENDING_STATUS]
+
+    def record(self, result: dict) -> None:
+        """
+        Record the result of a company and save the manifest.
+
+        Parameters
+        ----------
+        result : dict
+            Company result from BatchProcessor.
+        """
+        self.companies[result['company_id']] = result
+        self.save()
+
+    def finish(self, status: str = 'completed') -> None:
+        """
+        Mark the run as finished and save the manifest.
+
+        Parameters
+        ----------
+        status : str, default='completed'
+            Final run status ('completed' or 'interrupted').
+        """
+        self.status = status
+        self.save()
+
+    def save(self) -> None:
+        """Write the manifest atomically (a crash never leaves a truncated file)."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        manifest = {
+            'run_id': self.run_id,
+            'status': self.status,
+            'created_at': self.created_at,
+            'updated_at': datetime.now().isoformat(timespec='seconds'),
+            'settings': self.settings,
+            'companies': list(self.companies.values()),
+        }
+
+        tmp_path = self.path.with_suffix('.json.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, default=str)
+        os.replace(tmp_path, self.path)
+
+    @classmethod
+    def load(cls, run_id: str, data_folder: str = "data") -> 'RunManifest':
+        """
+        Load the manifest of a previous run.
+
+        Parameters
+        ----------
+        run_id : str
+            Run identifier.
+        data_folder : str, default="data"
+            Root data folder path.
+
+        Returns
+        -------
+        RunManifest
+            The manifest, with the companies in their original order.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the run has no manifest.
+        """
+        path = get_manifest_path(run_id, data_folder)
+        if not path.exists():
+            raise FileNotFoundError(f"No manifest found for run '{run_id}' at path: {path}")
+
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        manifest = cls(run_id, [], data_folder=data_folder, settings=data.get('settings'))
+        manifest.status = data.get('status', 'running')
+        manifest.created_at = data.get('created_at', manifest.created_at)
+        manifest.companies = {entry['company_id']: entry for entry in data.get('companies', [])}
+        return manifest
@@ -0,0 +1,529 @@
+"""
+Data-driven runtime estimation for batch forecasting runs.
+
+Every completed company is appended to a timing history
+(<data_folder>/_runs/timing_history.jsonl) with the number of accounts sent
+to the model, the number of months of context, the TabPFN mode, the engines,
+whether the model was served by the forecasting daemon, how companies were
+processed (see processing_mode) and the time the company added to the run.
+
+Companies processed one after the other add their total processing time.
+When loading and saving overlap with the model (pipelined), or several
+forecasts are in flight (concurrent), the per-company totals overlap and
+would add up to much more than the run: those runs record the forecast
+stages instead, divided by the number of forecasts in flight.
+
+A simple linear cost model is fitted on the records of the same mode,
+engines, daemon use and processing as the run to estimate (a stub engine or
+a warm daemon model would otherwise pass for a much faster TabPFN):
+
+    seconds ≈ intercept + per_cell × (accounts × months)
+
+TabPFN builds one context row per account and month, so the number of
+account-months is the main driver of inference time; the intercept absorbs
+loading, preprocessing and saving. The model drives both the pre-run estimate
+of the CLI and the live ETA of BatchProcessor.process_companies.
+"""
+
+import json
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from statistics import median
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from src.forecasting.profiling import RUNS_FOLDER_NAME
+
+
+# Timing history file (inside <data_folder>/_runs/)
+TIMING_HISTORY_FILE = 'timing_history.jsonl'
+
+# Fallback when no history is available (historical local-mode average)
+DEFAULT_SECONDS_PER_COMPANY = {
+    'local': 7.7 * 60,
+    'client': 60.0,
+}
+
+# Months assumed when a company's context length is unknown
+DEFAULT_CONTEXT_MONTHS = 48
+
+# Stages of the forecast call, which bound the run when the others overlap with it
+FORECAST_STAGES = ('convert', 'predict', 'extract')
+
+
+@dataclass
+class TimingRecord:
+    """
+    Processing time of one company.
+
+    Attributes
+    ----------
+    company_id : str
+        Company identifier.
+    mode : str
+        TabPFN mode ('local' or 'client').
+    accounts : int
+        Number of accounts sent to the model (closed-form forecasts excluded).
+    months : int
+        Number of months of context sent to the model.
+    seconds : float
+        Time the company added to the run: total processing time, or
+        forecast time when stages overlapped (see processing).
+    recorded_at : str
+        ISO timestamp of the record.
+    engine : str
+        Engines of the run (see engine_key).
+    daemon : bool
+        True if the TabPFN model was served by the forecasting daemon.
+    processing : str
+        'sequential', 'pipelined' or 'concurrent' (see processing_mode;
+        empty for records written before it was recorded).
+    """
+
+    company_id: str
+    mode: str
+    accounts: int
+    months: int
+    seconds: float
+    recorded_at: str = ''
+    engine: str = 'tabpfn'
+    daemon: bool = False
+    processing: str = ''
+
+
+def processing_mode(mode: str, prefetch: int, max_in_flight: int = 1) -> str:
+    """
+    How BatchProcessor runs the companies of a batch.
+
+    Parameters
+    ----------
+    mode : str
+        TabPFN mode of the run.
+    prefetch : int
+        Forecast calls loaded ahead of the model (0 disables the pipeline).
+    max_in_flight : int, default=1
+        Simultaneous requests in client mode.
+
+    Returns
+    -------
+    str
+        'concurrent' (several client requests in flight), 'pipelined'
+        (loading and saving overlap with the model) or 'sequential'.
+
+    Examples
+    --------
+    >>> processing_mode('local', prefetch=2)
+    'pipelined'
+    """
+    if mode == 'client' and max_in_flight > 1:
+        return 'concurrent'
+    if prefetch > 0:
+        return 'pipelined'
+    return 'sequential'
+
+
+def _record_seconds(result: dict, processing: str, concurrency: int) -> float:
+    """Time a company added to a run (see the module docstring)."""
+    stages = result.get('stages') or {}
+    if processing == 'sequential' or not any(name in stages for name in FORECAST_STAGES):
+        return float(result['total_time'])
+    forecast_seconds = sum(stages[name]['wall_seconds'] for name in FORECAST_STAGES if name in stages)
+    return forecast_seconds / max(concurrency, 1)
+
+
+def engine_key(engines: Sequence[str]) -> str:
+    """
+    Key of a set of engines in the timing history.
+
+    Parameters
+    ----------
+    engines : Sequence[str]
+        Engines of a run.
+
+    Returns
+    -------
+    str
+        Sorted distinct engine names joined by '+'.
+
+    Examples
+    --------
+    >>> engine_key(['tabpfn', 'seasonal_naive', 'tabpfn'])
+    'seasonal_naive+tabpfn'
+    """
+    return '+'.join(sorted(set(engines)))
+
+
+def _history_path(data_folder: str) -> Path:
+    return Path(data_folder) / RUNS_FOLDER_NAME / TIMING_HISTORY_FILE
+
+
+def append_timing_history(
+    results: List[dict],
+    mode: str,
+    data_folder: str = "data",
+    engines: Sequence[str] = ('tabpfn',),
+    daemon: bool = False,
+    max_context_months: Optional[int] = None,
+    processing: str = 'sequential',
+    concurrency: int = 1
+) -> int:
+    """
+    Append successful company results to the timing history.
+
+    Parameters
+    ----------
+    results : List[dict]
+        Company results from BatchProcessor (with 'model_accounts' or
+        'accounts_forecasted', 'context_months', 'total_time' and
+        'stages').
+    mode : str
+        TabPFN mode used for the run.
+    data_folder : str, default="data"
+        Root data folder path.
+    engines : Sequence[str], default=('tabpfn',)
+        Engines of the run.
+    daemon : bool, default=False
+        True if the TabPFN model was served by the forecasting daemon.
+    max_context_months : Optional[int], default=None
+        History cap of the run: longer contexts are recorded with the
+        number of months actually sent to the model.
+    processing : str, default='sequential'
+        How the companies were processed (see processing_mode).
+    concurrency : int, default=1
+        Number of forecasts in flight with concurrent processing.
+
+    Returns
+    -------
+    int
+        Number of records appended.
+    """
+    recorded_at = datetime.now().isoformat(timespec='seconds')
+    records = []
+    for result in results:
+        if result.get('status') != 'Success' or 'total_time' not in result or 'context_months' not in result:
+            continue
+        months = int(result['context_months'])
+        if max_context_months:
+            months = min(months, max_context_months)
+        records.append(TimingRecord(
+            company_id=result['company_id'],
+            mode=mode,
+            # Closed-form forecasts (inactive and simple-pattern accounts) cost no model time
+            accounts=int(result.get('model_accounts', result['accounts_forecasted'])),
+            months=months,
+            seconds=_record_seconds(result, processing, concurrency),
+            recorded_at=recorded_at,
+            engine=engine_key(engines),
+            daemon=daemon,
+            processing=processing
+        ))
+
+    if records:
+        path = _history_path(data_folder)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'a', encoding='utf-8') as f:
+            for record in records:
+                f.write(json.dumps(asdict(record)) + '\n')
+
+    return len(records)
+
+
+def load_timing_history(
+    data_folder: str = "data",
+    mode: Optional[str] = None,
+    engines: Optional[Sequence[str]] = None,
+    daemon: Optional[bool] = None,
+    processing: Optional[str] = None
+) -> List[TimingRecord]:
+    """
+    Load the timing history.
+
+    Parameters
+    ----------
+    data_folder : str, default="data"
+        Root data folder path.
+    mode : Optional[str], default=None
+        Only return records of this TabPFN mode.
+    engines : Optional[Sequence[str]], default=None
+        Only return records of runs with these engines.
+    daemon : Optional[bool], default=None
+        Only return records of runs served (True) or not (False) by the
+        forecasting daemon.
+    processing : Optional[str], default=None
+        Only return records of runs processed this way (see
+        processing_mode).
+
+    Returns
+    -------
+    List[TimingRecord]
+        Records in the order they were written (malformed lines are skipped).
+    """
+    path = _history_path(data_folder)
+    if not path.exists():
+        return []
+
+    records = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = TimingRecord(**json.loads(line))
+            except (ValueError, TypeError):
+                continue
+            if mode is not None and record.mode != mode:
+                continue
+            if engines is not None and record.engine != engine_key(engines):
+                continue
+            if daemon is not None and record.daemon != daemon:
+                continue
+            if processing is not None and record.processing != processing:
+                continue
+            records.append(record)
+    return records
+
+
+@dataclass
+class CostModel:
+    """
+    Linear runtime model: seconds = intercept + per_cell × accounts × months.
+
+    Attributes
+    ----------
+    intercept : float
+        Fixed cost per company (seconds).
+    per_cell : float
+        Cost per account-month of context (seconds).
+    n_samples : int
+        Number of history records used for the fit (0 for the default model).
+    """
+
+    intercept: float
+    per_cell: float
+    n_samples: int = 0
+
+    @classmethod
+    def default(cls, mode: str = 'local') -> 'CostModel':
+        """Size-independent model used when no history is available."""
+        return cls(intercept=DEFAULT_SECONDS_PER_COMPANY.get(mode, DEFAULT_SECONDS_PER_COMPANY['local']), per_cell=0.0)
+
+    @classmethod
+    def fit(cls, records: List[TimingRecord], mode: str = 'local') -> 'CostModel':
+        """
+        Fit the model by ordinary least squares.
+
+        With a single record, or when all records have the same size, the
+        model is a constant equal to the median time. Negative coefficients
+        are clipped to zero so that larger companies never get shorter
+        estimates.
+
+        Parameters
+        ----------
+        records : List[TimingRecord]
+            Timing history (one mode).
+        mode : str, default='local'
+            Mode used for the default model when records is empty.
+
+        Returns
+        -------
+        CostModel
+            Fitted model.
+
+        Examples
+        --------
+        >>> records = [TimingRecord('A', 'local', 10, 24, 30.0), TimingRecord('B', 'local', 20, 24, 50.0)]
+        >>> model = CostModel.fit(records)
+        >>> round(model.predict(30, 24), 1)
+        70.0
+        """
+        if not records:
+            return cls.default(mode)
+
+        x = [r.accounts * r.months for r in records]
+        y = [r.seconds for r in records]
+        n = len(records)
+        mean_x = sum(x) / n
+        mean_y = sum(y) / n
+        var_x = sum((xi - mean_x) ** 2 for xi in x)
+
+        if var_x == 0:
+            return cls(intercept=median(y), per_cell=0.0, n_samples=n)
+
+        per_cell = sum((xi - mean_x) * (yi - mean_y) for xi, yi in zip(x, y)) / var_x
+        per_cell = max(per_cell, 0.0)
+        intercept = max(mean_y - per_cell * mean_x, 0.0)
+        return cls(intercept=intercept, per_cell=per_cell, n_samples=n)
+
+    def predict(self, accounts: int, months: int) -> float:
+        """
+        Predict the processing time of a company.
+
+        Parameters
+        ----------
+        accounts : int
+            Number of accounts.
+        months : int
+            Number of months of context.
+
+        Returns
+        -------
+        float
+            Estimated seconds.
+        """
+        return self.intercept + self.per_cell * accounts * months
+
+
+def get_company_size(
+    company_id: str,
+    data_folder: str = "data",
+    history: Optional[List[TimingRecord]] = None
+) -> Optional[Tuple[int, int]]:
+    """
+    Return the last known (accounts, months) size of a company.
+
+    The timing history is used first; otherwise the account count of the
+    latest forecast version in company.json is combined with
+    DEFAULT_CONTEXT_MONTHS.
+
+    Parameters
+    ----------
+    company_id : str
+        Company identifier.
+    data_folder : str, default="data"
+        Root data folder path.
+    history : Optional[List[TimingRecord]], default=None
+        Timing history (loaded if None).
+
+    Returns
+    -------
+    Optional[Tuple[int, int]]
+        (accounts, months), or None if nothing is known about the company.
+    """
+    if history is None:
+        history = load_timing_history(data_folder)
+
+    for record in reversed(history):
+        if record.company_id == company_id:
+            return record.accounts, record.months
+
+    company_json = Path(data_folder) / company_id / 'company.json'
+    try:
+        with open(company_json, 'r', encoding='utf-8') as f:
+            versions = json.load(f).get('forecast_versions', [])
+    except (OSError, ValueError):
+        return None
+
+    for version in reversed(versions):
+        meta_data = version.get('meta_data') or {}
+        if meta_data:
+            return len(meta_data), DEFAULT_CONTEXT_MONTHS
+
+    return None
+
+
+@dataclass
+class RuntimeEstimate:
+    """
+    Pre-run estimate of a batch.
+
+    Attributes
+    ----------
+    per_company : Dict[str, float]
+        Estimated seconds per company.
+    model : CostModel
+        Model used for the estimate.
+    known_sizes : int
+        Number of companies whose size was known from previous runs.
+    """
+
+    per_company: Dict[str, float]
+    model: CostModel
+    known_sizes: int
+
+    @property
+    def total_seconds(self) -> float:
+        """Estimated total time of the batch."""
+        return sum(self.per_company.values())
+
+
+def estimate_runtime(
+    company_ids: List[str],
+    mode: str = 'local',
+    data_folder: str = "data",
+    engines: Sequence[str] = ('tabpfn',),
+    daemon: bool = False,
+    processing: Optional[str] = None
+) -> RuntimeEstimate:
+    """
+    Estimate the processing time of each company from the timing history.
+
+    Companies of unknown size are assumed to have the median size of the
+    history (or get the default per-company time without history).
+
+    Parameters
+    ----------
+    company_ids : List[str]
+        Companies to process.
+    mode : str, default='local'
+        TabPFN mode of the run.
+    data_folder : str, default="data"
+        Root data folder path.
+    engines : Sequence[str], default=('tabpfn',)
+        Engines of the run.
+    daemon : bool, default=False
+        True if the TabPFN model is served by the forecasting daemon.
+    processing : Optional[str], default=None
+        How the companies will be processed (see processing_mode). None
+        uses the records of every kind of processing.
+
+    Returns
+    -------
+    RuntimeEstimate
+        Per-company estimates and the fitted model.
+    """
+    history = load_timing_history(data_folder, mode=mode, engines=engines, daemon=daemon, processing=processing)
+    model = CostModel.fit(history, mode=mode)
+
+    if history:
+        fallback_size = (
+            int(median(r.accounts for r in history)),
+            int(median(r.months for r in history)),
+        )
+    else:
+        fallback_size = None
+
+    per_company = {}
+    known_sizes = 0
+    for company_id in company_ids:
+        size = get_company_size(company_id, data_folder, history)
+        if size is not None:
+            known_sizes += 1
+        else:
+            size = fallback_size
+        per_company[company_id] = model.predict(*size) if size else model.intercept
+
+    return RuntimeEstimate(per_company=per_company, model=model, known_sizes=known_sizes)
+
+
+def format_duration(seconds: float) -> str:
+    """
+    Format a duration for display.
+
+    Parameters
+    ----------
+    seconds : float
+        Duration in seconds.
+
+    Returns
+    -------
+    str
+        e.g. '45 s', '12 min' or '3.2 h'.
+
+    Examples
+    --------
+    >>> format_duration(11520)
+    '3.2 h'
+    """
+    if seconds < 120:
+        return f"{seconds:.0f} s"
+    if seconds < 2 * 3600:
+        return f"{seconds / 60:.0f} min"
+    return f"{seconds / 3600:.1f} h"
@@ -0,0 +1,295 @@
+"""
+Size-aware scheduling of companies for batch forecasting.
+
+Companies differ by orders of magnitude in number of accounts and history
+length. Instead of processing them in alphabetical order, the scheduler:
+
+1. Estimates the cost of every company from cached metadata: the timing
+   history of previous runs, the account count of the latest forecast version
+   and, for companies never forecasted, the size of their FEC files.
+2. Packs small companies sharing the same accounting date into shared batches,
+   which BatchProcessor forecasts with a single TabPFN call.
+3. Orders the batches longest-first, so that the largest jobs start early and
+   a pool of workers never waits on one big company at the end of a run.
+"""
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from statistics import mean, median
+from typing import Dict, List, Optional, Sequence
+
+from src.forecasting.runtime_estimation import (
+    CostModel,
+    get_company_size,
+    load_timing_history,
+)
+
+
+# File extensions identifying FEC files (same rule as fec_loader.import_fecs)
+FEC_FILE_EXTENSIONS = ('txt', 'csv', 'tsv')
+
+# A company is "small" if its cost is at most this fraction of the largest one
+DEFAULT_SMALL_COMPANY_FRACTION = 0.25
+
+# Maximum number of companies forecasted together in one shared batch
+DEFAULT_MAX_BATCH_COMPANIES = 8
+
+
+@dataclass
+class CompanyCost:
+    """
+    Estimated cost of one company.
+
+    Attributes
+    ----------
+    company_id : str
+        Company identifier.
+    seconds : float
+        Estimated processing time.
+    cells : Optional[float]
+        Estimated number of account-months of context (None if unknown).
+    fec_bytes : int
+        Total size of the company's FEC files.
+    accounting_up_to_date : str
+        Accounting date from company.json (used to group shared batches).
+    source : str
+        Where the size comes from: 'history', 'metadata', 'fec_size' or 'default'.
+    """
+
+    company_id: str
+    seconds: float
+    cells: Optional[float]
+    fec_bytes: int
+    accounting_up_to_date: str
+    source: str
+
+
+@dataclass
+class WorkBatch:
+    """
+    Companies processed together.
+
+    Attributes
+    ----------
+    company_ids : List[str]
+        Companies of the batch (one for large companies).
+    estimated_seconds : float
+        Sum of the estimated costs of the companies.
+    """
+
+    company_ids: List[str] = field(default_factory=list)
+    estimated_seconds: float = 0.0
+
+    @property
+    def is_shared(self) -> bool:
+        """Whether several companies share the batch."""
+        return len(self.company_ids) > 1
+
+
+def get_fec_size(company_id: str, data_folder: str = "data") -> int:
+    """
+    Return the total size of the FEC files of a company.
+
+    Parameters
+    ----------
+    company_id : str
+        Company identifier.
+    data_folder : str, default="data"
+        Root data folder path.
+
+    Returns
+    -------
+    int
+        Size in bytes (0 if the folder has no FEC file).
+    """
+    company_path = Path(data_folder) / company_id
+    if not company_path.is_dir():
+        return 0
+
+    return sum(
+        path.stat().st_size
+        for path in company_path.iterdir()
+        if path.is_file() and path.name.endswith(FEC_FILE_EXTENSIONS)
+    )
+
+
+def _get_accounting_date(company_id: str, data_folder: str) -> str:
+    try:
+        with open(Path(data_folder) / company_id / 'company.json', 'r', encoding='utf-8') as f:
+            return json.load(f).get('accounting_up_to_date', '')
+    except (OSError, ValueError):
+        return ''
+
+
+def estimate_company_costs(
+    company_ids: List[str],
+    mode: str = 'local',
+    data_folder: str = "data",
+    engines: Sequence[str] = ('tabpfn',),
+    daemon: bool = False,
+    processing: Optional[str] = None
+) -> Dict[str, CompanyCost]:
+    """
+    Estimate the processing cost of each company from cached metadata.
+
+    The size of a company (account-months of context) comes from the timing
+    history, then from the account count of its latest forecast version. For
+    companies without either, it is extrapolated from the FEC file size using
+    the median cells-per-byte ratio of the companies whose size is known.
+
+    Sizes are turned into seconds with the cost model fitted on the timing
+    history. Without a size-dependent model (no or constant history), the
+    default per-company time is spread proportionally to size, so that the
+    ordering still follows company size.
+
+    Parameters
+    ----------
+    company_ids : List[str]
+        Companies to schedule.
+    mode : str, default='local'
+        TabPFN mode of the run.
+    data_folder : str, default="data"
+        Root data folder path.
+    engines : Sequence[str], default=('tabpfn',)
+        Engines of the run (the cost model only uses runs with the same
+        engines, see runtime_estimation).
+    daemon : bool, default=False
+        True if the TabPFN model is served by the forecasting daemon.
+    processing : Optional[str], default=None
+        How the companies will be processed (see
+        runtime_estimation.processing_mode).
+
+    Returns
+    -------
+    Dict[str, CompanyCost]
+        Cost per company, in the order of company_ids.
+    """
+    history = load_timing_history(data_folder, mode=mode, engines=engines, daemon=daemon, processing=processing)
+    model = CostModel.fit(history, mode=mode)
+    history_ids = {record.company_id for record in history}
+
+    costs = {}
+    for company_id in company_ids:
+        size = get_company_size(company_id, data_folder, history)
+        if size is not None:
+            source = 'history' if company_id in history_ids else 'metadata'
+        else:
+            source = 'default'
+        costs[company_id] = CompanyCost(
+            company_id=company_id,
+            seconds=0.0,
+            cells=float(size[0] * size[1]) if size else None,
+            fec_bytes=get_fec_size(company_id, data_folder),
+            accounting_up_to_date=_get_accounting_date(company_id, data_folder),
+            source=source,
+        )
+
+    # Extrapolate unknown sizes from the FEC file size
+    ratios = [cost.cells / cost.fec_bytes for cost in costs.values() if cost.cells and cost.fec_bytes]
+    if ratios:
+        cells_per_byte = median(ratios)
+    elif history:
+        # No company with both sizes: assume the median company has median FEC size
+        known_bytes = [cost.fec_bytes for cost in costs.values() if cost.fec_bytes]
+        median_cells = median(record.accounts * record.months for record in history)
+        cells_per_byte = median_cells / median(known_bytes) if known_bytes else None
+    else:
+        cells_per_byte = None
+
+    for cost in costs.values():
+        if cost.cells is None and cost.fec_bytes:
+            if cells_per_byte is not None:
+                cost.cells = cost.fec_bytes * cells_per_byte
+            else:
+                # Only relative sizes matter below
+                cost.cells = float(cost.fec_bytes)
+            cost.source = 'fec_size'
+
+    known_cells = [cost.cells for cost in costs.values() if cost.cells]
+    if model.per_cell > 0:
+        # A size-dependent model implies a history to take the median size from
+        fallback_cells = median(known_cells or [record.accounts * record.months for record in history])
+        for cost in costs.values():
+            cells = cost.cells if cost.cells is not None else fallback_cells
+            cost.seconds = model.intercept + model.per_cell * cells
+    else:
+        mean_cells = mean(known_cells) if known_cells else None
+        for cost in costs.values():
+            if mean_cells and cost.cells:
+                cost.seconds = model.intercept * cost.cells / mean_cells
+            else:
+                cost.seconds = model.intercept
+
+    return costs
+
+
+def schedule_companies(
+    costs: Dict[str, CompanyCost],
+    max_batch_companies: int = DEFAULT_MAX_BATCH_COMPANIES,
+    small_company_fraction: float = DEFAULT_SMALL_COMPANY_FRACTION
+) -> List[WorkBatch]:
+    """
+    Group companies into batches and order them longest-first.
+
+    Companies whose cost is at most small_company_fraction of the largest cost
+    are packed first-fit decreasing into shared batches of at most
+    max_batch_companies companies and at most the cost of the largest company,
+    so that no shared batch becomes the new tail. Only companies with the same
+    accounting date are packed together, since a shared TabPFN call needs a
+    common time index.
+
+    Parameters
+    ----------
+    costs : Dict[str, CompanyCost]
+        Costs from estimate_company_costs.
+    max_batch_companies : int, default=DEFAULT_MAX_BATCH_COMPANIES
+        Maximum number of companies per shared batch (1 disables packing).
+    small_company_fraction : float, default=DEFAULT_SMALL_COMPANY_FRACTION
+        Cost threshold for packing, relative to the largest company.
+
+    Returns
+    -------
+    List[WorkBatch]
+        Batches sorted by decreasing estimated time (ties keep the
+        alphabetical order of the companies).
+
+    Examples
+    --------
+    >>> costs = {
+    ...     name: CompanyCost(name, seconds, None, 0, '2024-12-31', 'default')
+    ...     for name, seconds in [('A', 10.0), ('B', 100.0), ('C', 5.0)]
+    ... }
+    >>> [batch.company_ids for batch in schedule_companies(costs)]
+    [['B'], ['A', 'C']]
+    """
+    if not costs:
+        return []
+
+    ordered = sorted(costs.values(), key=lambda cost: (-cost.seconds, cost.company_id))
+    capacity = ordered[0].seconds
+    threshold = capacity * small_company_fraction
+
+    batches: List[WorkBatch] = []
+    open_batches: Dict[str, List[WorkBatch]] = {}
+
+    for cost in ordered:
+        if max_batch_companies <= 1 or cost.seconds > threshold:
+            batches.append(WorkBatch([cost.company_id], cost.seconds))
+            continue
+
+        candidates = open_batches.setdefault(cost.accounting_up_to_date, [])
+        for batch in candidates:
+            if (
+                len(batch.company_ids) < max_batch_companies
+                and batch.estimated_seconds + cost.seconds <= capacity
+            ):
+                batch.company_ids.append(cost.company_id)
+                batch.estimated_seconds += cost.seconds
+                break
+        else:
+            batch = WorkBatch([cost.company_id], cost.seconds)
+            candidates.append(batch)
+            batches.append(batch)
+
+    return sorted(batches, key=lambda batch: -batch.estimated_seconds)
@@ -0,0 +1,184 @@
+"""
+Wide-format DataFrames in shared memory.
+
+Sending a wide DataFrame to another process (the forecasting daemon, a worker
+process) normally serializes every value, copies the bytes through a socket
+or pipe and rebuilds the DataFrame on the other side. share_frame instead
+copies the values once into a multiprocessing.shared_memory block and
+returns a small descriptor (block name, shape, index and columns) to send in
+their place; attach_frame rebuilds a DataFrame over the same memory in the
+receiving process, without copying.
+
+The process calling share_frame owns the block and releases it when done:
+
+    >>> with share_frame(data_wide) as shared:
+    ...     client.send({'data': shared.descriptor})   # a few hundred bytes
+    ...     response = client.receive()
+
+and the receiving process only maps it while it uses the DataFrame:
+
+    >>> with attach_frame(descriptor) as data_wide:
+    ...     result = forecaster.forecast(data_wide)
+"""
+
+import threading
+from contextlib import contextmanager
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Dict, Iterator, List
+
+import numpy as np
+import pandas as pd
+
+
+# Values are shared as C-ordered float64 (the dtype of wide-format data)
+_DTYPE = np.dtype(np.float64)
+
+# Blocks created by this process (registered with its resource tracker)
+_OWNED_BLOCKS = set()
+
+# Attached blocks still in use by a DataFrame when their context exited
+_DETACH_LATER: List[shared_memory.SharedMemory] = []
+_DETACH_LOCK = threading.Lock()
+
+
+class SharedFrame:
+    """
+    Values of a wide-format DataFrame copied into a shared memory block.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        DataFrame with a DatetimeIndex and account columns.
+
+    Attributes
+    ----------
+    descriptor : Dict[str, Any]
+        JSON-serializable description of the block (name, shape, index and
+        columns), to send to the process calling attach_frame.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        """Create the shared memory block and copy the values into it."""
+        values = df.to_numpy(dtype=_DTYPE)
+        # A zero-size block is not allowed
+        self._shm = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+        _OWNED_BLOCKS.add(self._shm.name)
+        np.ndarray(values.shape, dtype=_DTYPE, buffer=self._shm.buf)[...] = values
+
+        self.descriptor = {
+            'shared_memory': self._shm.name,
+            'shape': list(values.shape),
+            'index': [ts.isoformat() for ts in pd.DatetimeIndex(df.index)],
+            'index_name': df.index.name,
+            'columns': [str(col) for col in df.columns],
+        }
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the shared values in bytes."""
+        rows, columns = self.descriptor['shape']
+        return rows * columns * _DTYPE.itemsize
+
+    def close(self) -> None:
+        """Release the shared memory block (attached processes keep their mapping until they detach)."""
+        if self._shm is not None:
+            _OWNED_BLOCKS.discard(self._shm.name)
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+    def __enter__(self) -> 'SharedFrame':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def share_frame(df: pd.DataFrame) -> SharedFrame:
+    """
+    Copy the values of a wide-format DataFrame into shared memory.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        DataFrame with a DatetimeIndex and account columns. Values are
+        stored as float64.
+
+    Returns
+    -------
+    SharedFrame
+        Owner of the block; close it (or use it as a context manager) once
+        the receiving process is done with the DataFrame.
+    """
+    return SharedFrame(df)
+
+
+def _attach_block(name: str) -> shared_memory.SharedMemory:
+    """Map an existing block without taking ownership of it."""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Before Python 3.13, attaching registers the block with this
+        # process's resource tracker, which would unlink it on exit
+        shm = shared_memory.SharedMemory(name=name)
+        if shm.name not in _OWNED_BLOCKS:
+            resource_tracker.unregister(shm._name, 'shared_memory')
+        return shm
+
+
+def _detach(shm: shared_memory.SharedMemory) -> bool:
+    """Unmap an attached block, unless an array still uses it."""
+    try:
+        shm.close()
+        return True
+    except BufferError:
+        return False
+
+
+def is_shared_descriptor(payload: Any) -> bool:
+    """Whether a payload is a SharedFrame descriptor."""
+    return isinstance(payload, dict) and 'shared_memory' in payload
+
+
+@contextmanager
+def attach_frame(descriptor: Dict[str, Any]) -> Iterator[pd.DataFrame]:
+    """
+    Rebuild a DataFrame over a shared memory block, without copying.
+
+    Parameters
+    ----------
+    descriptor : Dict[str, Any]
+        SharedFrame.descriptor, received from the owning process.
+
+    Yields
+    ------
+    pd.DataFrame
+        Read-only view of the shared values. The block is unmapped when the
+        context exits, or later if the view (or a view of it) is still alive.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the block does not exist (e.g. it was already released).
+    """
+    # Unmap the blocks whose views have been released since
+    with _DETACH_LOCK:
+        _DETACH_LATER[:] = [block for block in _DETACH_LATER if not _detach(block)]
+
+    shm = _attach_block(descriptor['shared_memory'])
+    rows, columns = descriptor['shape']
+    frame = None
+    try:
+        # frombuffer holds the buffer while the array lives, so the block
+        # cannot be unmapped under a view
+        values = np.frombuffer(shm.buf, dtype=_DTYPE, count=rows * columns).reshape(rows, columns)
+        values.flags.writeable = False
+        index = pd.DatetimeIndex(descriptor['index'], name=descriptor['index_name'])
+        frame = pd.DataFrame(values, index=index, columns=descriptor['columns'], copy=False)
+        del values
+        yield frame
+    finally:
+        frame = None
+        if not _detach(shm):
+            with _DETACH_LOCK:
+                _DETACH_LATER.append(shm)
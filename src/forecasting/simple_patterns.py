@@ -0,0 +1,185 @@
+"""
+Closed-form forecasts for simple account patterns.
+
+Many accounts do not need TabPFN: a monthly rent is constant, an insurance
+premium changes level once a year, a yearly fee shows up in one or two months.
+This module classifies all the accounts of a wide-format DataFrame at once
+(vectorized over the account columns) and forecasts the simple ones with the
+rules of the ProphetApproach (see preprocessing_baseline_reference.md):
+
+- Sparse: every year (12-month windows counted back from the last period) has
+  at most SPARSE_MAX_POINTS_PER_YEAR values. The expected number of values per
+  year is placed on the calendar months that most often have one, each with
+  the last value seen in that month.
+- Constant: every month of the recent window is observed and no value differs
+  from the previous one by more than STEP_CHANGE_THRESHOLD. The last value is
+  repeated.
+- Step Function: same, but with a few level changes, each level lasting at
+  least MIN_STEP_LENGTH months. The last level is repeated (the conservative
+  forecast of the ProphetApproach, without its step classifier).
+
+Everything else is left to TabPFN.
+"""
+
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+
+SPARSE_MAX_POINTS_PER_YEAR = 3
+
+# Relative change between consecutive months counted as a level change
+STEP_CHANGE_THRESHOLD = 0.1
+
+# Minimum number of months of every level of a step function
+MIN_STEP_LENGTH = 3
+
+# Recent months that must all be observed for the constant and step rules
+PATTERN_WINDOW_MONTHS = 24
+
+# Denominator floor of relative changes
+EPSILON = 1e-8
+
+
+def classify_simple_patterns(
+    data_wide: pd.DataFrame,
+    sparse_max_points_per_year: int = SPARSE_MAX_POINTS_PER_YEAR,
+    step_threshold: float = STEP_CHANGE_THRESHOLD,
+    min_step_length: int = MIN_STEP_LENGTH,
+    window_months: int = PATTERN_WINDOW_MONTHS
+) -> Dict[str, str]:
+    """
+    Find the accounts following a simple pattern.
+
+    Parameters
+    ----------
+    data_wide : pd.DataFrame
+        Wide-format DataFrame (ds index × account columns) with NaN for
+        missing months.
+    sparse_max_points_per_year : int, default=SPARSE_MAX_POINTS_PER_YEAR
+        Maximum number of values per year of a sparse account.
+    step_threshold : float, default=STEP_CHANGE_THRESHOLD
+        Relative change between two months counted as a level change.
+    min_step_length : int, default=MIN_STEP_LENGTH
+        Minimum duration of every level of a step function (months).
+    window_months : int, default=PATTERN_WINDOW_MONTHS
+        Recent window used by the constant and step rules.
+
+    Returns
+    -------
+    Dict[str, str]
+        Forecast type ('Sparse', 'Constant' or 'Step Function') of each simple
+        account, in column order. Other accounts are not included.
+
+    Examples
+    --------
+    >>> dates = pd.date_range('2022-01-01', periods=36, freq='MS')
+    >>> df = pd.DataFrame({
+    ...     '613200': [800.0] * 36,
+    ...     '616000': [1200.0] * 18 + [1500.0] * 18,
+    ...     '623000': [np.nan] * 11 + [450.0] + [np.nan] * 11 + [470.0] + [np.nan] * 12,
+    ...     '707000': np.linspace(1000, 2000, 36) * (1 + 0.3 * np.sin(np.arange(36))),
+    ... }, index=dates)
+    >>> classify_simple_patterns(df)
+    {'613200': 'Constant', '616000': 'Step Function', '623000': 'Sparse'}
+    """
+    values = data_wide.to_numpy(dtype=float)
+    n_periods, n_accounts = values.shape
+    if n_periods == 0 or n_accounts == 0:
+        return {}
+    observed = ~np.isnan(values)
+
+    # Sparse: count values per 12-month year, counted back from the last period
+    year = (n_periods - 1 - np.arange(n_periods)) // 12
+    year_membership = year[None, :] == np.arange(year[0] + 1)[:, None]
+    yearly_counts = year_membership.astype(int) @ observed.astype(int)
+    sparse = observed.any(axis=0) & (yearly_counts <= sparse_max_points_per_year).all(axis=0)
+
+    # Constant and step function: level changes over a fully observed recent window
+    window = values[-window_months:]
+    n_window = len(window)
+    dense = observed[-window_months:].all(axis=0) & (n_window >= 2 * min_step_length)
+    with np.errstate(invalid='ignore'):
+        change = np.abs(window[1:] - window[:-1]) / np.maximum(np.abs(window[:-1]), EPSILON) > step_threshold
+    n_changes = change.sum(axis=0)
+
+    # Levels start at the window start and after every change; a level is too
+    # short if two boundaries are closer than min_step_length
+    boundaries = np.zeros((n_window + 1, n_accounts), dtype=bool)
+    boundaries[0] = boundaries[n_window] = True
+    boundaries[1:n_window] = change
+    short_level = np.zeros(n_accounts, dtype=bool)
+    for gap in range(1, min_step_length):
+        short_level |= (boundaries[:-gap] & boundaries[gap:]).any(axis=0)
+
+    constant = ~sparse & dense & (n_changes == 0)
+    step = ~sparse & dense & (n_changes > 0) & ~short_level
+
+    patterns = np.select([sparse, constant, step], ['Sparse', 'Constant', 'Step Function'], default='')
+    return {
+        account: str(pattern)
+        for account, pattern in zip(data_wide.columns, patterns)
+        if pattern
+    }
+
+
+def forecast_simple_patterns(
+    data_wide: pd.DataFrame,
+    patterns: Dict[str, str],
+    index: pd.DatetimeIndex
+) -> pd.DataFrame:
+    """
+    Forecast simple accounts with their closed-form rule.
+
+    Parameters
+    ----------
+    data_wide : pd.DataFrame
+        Wide-format history (ds index × account columns).
+    patterns : Dict[str, str]
+        Output of classify_simple_patterns.
+    index : pd.DatetimeIndex
+        Forecast dates.
+
+    Returns
+    -------
+    pd.DataFrame
+        Forecast (index × accounts of patterns). Months without an expected
+        value of a sparse account are 0.
+    """
+    accounts = list(patterns)
+    history = data_wide[accounts]
+    last_values = history.ffill().iloc[-1].fillna(0.0).to_numpy(dtype=float)
+    forecast = np.tile(last_values, (len(index), 1))
+
+    is_sparse = np.array([patterns[account] == 'Sparse' for account in accounts], dtype=bool)
+    if is_sparse.any():
+        forecast[:, is_sparse] = _forecast_sparse(history.loc[:, is_sparse], index, last_values[is_sparse])
+
+    return pd.DataFrame(forecast, index=index, columns=accounts)
+
+
+def _forecast_sparse(history: pd.DataFrame, index: pd.DatetimeIndex, last_values: np.ndarray) -> np.ndarray:
+    """Place the expected number of values per year on the most frequent calendar months."""
+    observed = history.notna().to_numpy()
+    months = np.arange(1, 13)
+    month_membership = history.index.month.to_numpy()[None, :] == months[:, None]
+
+    # Share of the years in which each calendar month has a value
+    occurrences = np.maximum(month_membership.sum(axis=1), 1)
+    probability = (month_membership.astype(int) @ observed.astype(int)) / occurrences[:, None]
+
+    # Expected number of values per year, on the most probable months
+    n_years = max(len(history), 12) / 12
+    expected = np.rint(observed.sum(axis=0) / n_years).astype(int)
+    rank = np.empty_like(probability, dtype=int)
+    order = np.argsort(-probability, axis=0, kind='stable')
+    np.put_along_axis(rank, order, np.arange(12)[:, None].repeat(history.shape[1], axis=1), axis=0)
+    selected = (rank < expected[None, :]) & (probability > 0)
+
+    # Last value seen in each calendar month (last overall value if none)
+    month_values = history.groupby(history.index.month).last().reindex(months).to_numpy(dtype=float)
+    month_values = np.where(np.isnan(month_values), last_values[None, :], month_values)
+
+    forecast_months = index.month.to_numpy() - 1
+    return np.where(selected[forecast_months], month_values[forecast_months], 0.0)
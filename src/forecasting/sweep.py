@@ -0,0 +1,740 @@
+"""
+Configuration sweeps sharing the loaded and preprocessed data.
+
+Comparing settings such as the TabPFN context length, the COVID handling
+(USE_COVID_DUMMIES), the active account window (ACTIVE_ACCOUNT_WINDOW_MONTHS)
+or the quantile set used to mean one full forecasting run per setting, each
+loading every ledger again. A sweep loads each company once and fans out:
+
+- the FECs and their monthly totals are computed once per company,
+- preprocessing (and the closed-form forecasts) once per distinct
+  preprocessing setting (COVID handling, active window),
+- the model once per context length for the whole sweep,
+- a forecast per configuration.
+
+Forecasts are not saved: each configuration is scored in memory against the
+held-out actuals (see compute_metrics_from_frames), with the coverage of its
+prediction interval, and the comparison table is written to
+<data_folder>/_runs/<run_id>/sweep.json and sweep.csv.
+
+Usage:
+    uv run python -m src.forecasting.sweep --companies all --active-window-months 12 24
+    uv run python -m src.forecasting.sweep --covid-dummies off on --max-context-length 1024 4096
+    uv run python -m src.forecasting.sweep --quantiles 0.1,0.5,0.9 0.05,0.5,0.95 --engine stub
+"""
+
+import argparse
+import csv
+import itertools
+import json
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from rich.console import Console
+from rich.table import Table
+
+from src.config.forecasting_config import (
+    CLOSED_FORM_SIMPLE_PATTERNS,
+    INACTIVE_ACCOUNTS_FORECAST,
+)
+from src.config.preprocessing_config import (
+    ACTIVE_ACCOUNT_WINDOW_MONTHS,
+    USE_COVID_DUMMIES,
+)
+from src.data.account_classifier import load_classification_charges
+from src.data.fec_loader import load_fecs
+from src.data.preprocessing import fec_to_monthly_totals, preprocess_data
+from src.forecasting.batch_processor import (
+    PreparedCompany,
+    add_closed_form_forecasts,
+    build_account_metadata,
+    closed_form_forecast,
+)
+from src.forecasting.company_discovery import discover_companies, filter_companies, get_company_info
+from src.forecasting.profiling import RUNS_FOLDER_NAME, StageTimer, new_run_id
+from src.forecasting.tabpfn_forecaster import ForecastResult, TabPFNForecaster
+from src.metrics.pipeline import compute_metrics_from_frames
+
+
+DEFAULT_MAX_CONTEXT_LENGTH = 4096
+DEFAULT_QUANTILES = (0.1, 0.5, 0.9)
+
+# Columns of the comparison table (see summarize_sweep)
+SUMMARY_COLUMNS = [
+    'config', 'companies', 'accounts', 'net_income_wape', 'net_income_rmsse', 'net_income_pbias',
+    'account_wape', 'coverage', 'interval_width', 'preprocess_seconds', 'forecast_seconds', 'metrics_seconds',
+]
+
+
+@dataclass(frozen=True)
+class SweepConfig:
+    """
+    One configuration of a sweep.
+
+    Attributes
+    ----------
+    use_covid_dummies : bool
+        Keep the COVID period (see preprocess_data).
+    active_window_months : int
+        Active account window of preprocessing (months).
+    max_context_length : int
+        Context length of the TabPFN model.
+    quantiles : Tuple[float, ...]
+        Forecast quantiles; the lowest and highest bound the interval.
+    """
+
+    use_covid_dummies: bool = USE_COVID_DUMMIES
+    active_window_months: int = ACTIVE_ACCOUNT_WINDOW_MONTHS
+    max_context_length: int = DEFAULT_MAX_CONTEXT_LENGTH
+    quantiles: Tuple[float, ...] = DEFAULT_QUANTILES
+
+    @property
+    def name(self) -> str:
+        """Short label, e.g. 'covid=off window=12 context=4096 q=0.1/0.5/0.9'."""
+        quantiles = '/'.join(f"{q:g}" for q in self.quantiles)
+        return (
+            f"covid={'on' if self.use_covid_dummies else 'off'} window={self.active_window_months} "
+            f"context={self.max_context_length} q={quantiles}"
+        )
+
+    @property
+    def preprocessing_key(self) -> Tuple[bool, int]:
+        """Settings that change the preprocessed data."""
+        return self.use_covid_dummies, self.active_window_months
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable settings."""
+        return {
+            'use_covid_dummies': self.use_covid_dummies,
+            'active_window_months': self.active_window_months,
+            'max_context_length': self.max_context_length,
+            'quantiles': list(self.quantiles),
+        }
+
+
+def sweep_grid(
+    use_covid_dummies: Sequence[bool] = (USE_COVID_DUMMIES,),
+    active_window_months: Sequence[int] = (ACTIVE_ACCOUNT_WINDOW_MONTHS,),
+    max_context_lengths: Sequence[int] = (DEFAULT_MAX_CONTEXT_LENGTH,),
+    quantile_sets: Sequence[Tuple[float, ...]] = (DEFAULT_QUANTILES,)
+) -> List[SweepConfig]:
+    """
+    Every combination of the given settings.
+
+    Returns
+    -------
+    List[SweepConfig]
+        Configurations, ordered so that those sharing preprocessing follow
+        each other.
+
+    Examples
+    --------
+    >>> [config.name for config in sweep_grid(active_window_months=[12, 24])]
+    ['covid=off window=12 context=4096 q=0.1/0.5/0.9', 'covid=off window=24 context=4096 q=0.1/0.5/0.9']
+    """
+    return [
+        SweepConfig(covid, window, context, tuple(quantiles))
+        for covid, window, context, quantiles in itertools.product(
+            use_covid_dummies, active_window_months, max_context_lengths, quantile_sets
+        )
+    ]
+
+
+def interval_metrics(
+    actual_df: pd.DataFrame,
+    lower_df: Optional[pd.DataFrame],
+    upper_df: Optional[pd.DataFrame]
+) -> Dict[str, Optional[float]]:
+    """
+    Coverage and width of a prediction interval.
+
+    Parameters
+    ----------
+    actual_df : pd.DataFrame
+        Actual values (forecast dates × accounts).
+    lower_df, upper_df : Optional[pd.DataFrame]
+        Interval bounds, aligned with actual_df (None if unavailable).
+
+    Returns
+    -------
+    Dict[str, Optional[float]]
+        'coverage': share of the actual values inside the interval;
+        'interval_width': total interval width relative to the total
+        absolute actual value. None without an interval.
+    """
+    if lower_df is None or upper_df is None or actual_df.size == 0:
+        return {'coverage': None, 'interval_width': None}
+    actual = actual_df.to_numpy(dtype=float)
+    lower = np.minimum(lower_df.to_numpy(dtype=float), upper_df.to_numpy(dtype=float))
+    upper = np.maximum(lower_df.to_numpy(dtype=float), upper_df.to_numpy(dtype=float))
+    total = np.abs(actual).sum()
+    return {
+        'coverage': float(((actual >= lower) & (actual <= upper)).mean()),
+        'interval_width': float((upper - lower).sum() / total) if total > 0 else None,
+    }
+
+
+def _actuals(monthly_test: pd.DataFrame, forecast_df: pd.DataFrame) -> pd.DataFrame:
+    """Actual values of the forecast dates and accounts (0 when missing)."""
+    actual_df = monthly_test.pivot(index='PieceDate', columns='CompteNum', values='Solde')
+    return actual_df.reindex(index=forecast_df.index, columns=forecast_df.columns).fillna(0.0)
+
+
+class ConfigSweep:
+    """
+    Run several configurations on each company, sharing loading and preprocessing.
+
+    Parameters
+    ----------
+    configs : List[SweepConfig]
+        Configurations to compare.
+    data_folder : str, default="data"
+        Root data folder path.
+    forecast_horizon : int, default=12
+        Number of months to forecast (and held out as actuals).
+    mode : str, default='local'
+        TabPFN mode.
+    engine : str, default='tabpfn'
+        Forecast engine (see engines).
+    inactive_accounts : str, default=INACTIVE_ACCOUNTS_FORECAST
+        Forecast of the inactive accounts (see BatchProcessor).
+    use_simple_patterns : bool, default=CLOSED_FORM_SIMPLE_PATTERNS
+        Forecast simple patterns in closed form (see BatchProcessor).
+    forecaster_factory : Optional[Callable[[int], TabPFNForecaster]], default=None
+        Builds the forecaster of a context length (a TabPFNForecaster of the
+        mode and engine if None). Called once per context length.
+
+    Examples
+    --------
+    >>> sweep = ConfigSweep(sweep_grid(active_window_months=[12, 24]), engine='stub')
+    >>> report = sweep.run(['RESTO - 1', 'RESTO - 2'])
+    >>> [row['config'] for row in report['summary']]
+    ['covid=off window=12 context=4096 q=0.1/0.5/0.9', 'covid=off window=24 context=4096 q=0.1/0.5/0.9']
+    """
+
+    def __init__(
+        self,
+        configs: List[SweepConfig],
+        data_folder: str = "data",
+        forecast_horizon: int = 12,
+        mode: str = 'local',
+        engine: str = 'tabpfn',
+        inactive_accounts: str = INACTIVE_ACCOUNTS_FORECAST,
+        use_simple_patterns: bool = CLOSED_FORM_SIMPLE_PATTERNS,
+        forecaster_factory: Optional[Callable[[int], TabPFNForecaster]] = None
+    ):
+        """Initialize the sweep."""
+        if not configs:
+            raise ValueError("At least one configuration is required")
+        self.configs = list(configs)
+        self.data_folder = data_folder
+        self.forecast_horizon = forecast_horizon
+        self.mode = mode
+        self.engine = engine
+        self.inactive_accounts = inactive_accounts
+        self.use_simple_patterns = use_simple_patterns
+        self.forecaster_factory = forecaster_factory or (
+            lambda max_context_length: TabPFNForecaster(
+                mode=mode, engine=engine, max_context_length=max_context_length
+            )
+        )
+        self._forecasters: Dict[int, TabPFNForecaster] = {}
+        self.classification = load_classification_charges()
+
+    def _forecaster(self, config: SweepConfig) -> TabPFNForecaster:
+        """Forecaster of a configuration (built once per context length)."""
+        if config.max_context_length not in self._forecasters:
+            self._forecasters[config.max_context_length] = self.forecaster_factory(config.max_context_length)
+        return self._forecasters[config.max_context_length]
+
+    def run_company(self, company_id: str) -> List[Dict[str, Any]]:
+        """
+        Run every configuration on a company.
+
+        Parameters
+        ----------
+        company_id : str
+            Company identifier.
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            One row per configuration, in the order of configs, with its
+            status, number of accounts, aggregated metrics, interval metrics
+            and the time of its preprocessing, forecast and metrics. The
+            preprocessing time is shared by the configurations with the same
+            preprocessing settings; 'load_seconds' is shared by all.
+        """
+        timer = StageTimer()
+        try:
+            with timer.span('load'):
+                company_info = get_company_info(company_id, self.data_folder)
+                accounting_date = pd.Timestamp(company_info.accounting_up_to_date)
+                fecs_train, fecs_test = load_fecs(
+                    company_id=company_id,
+                    fecs_folder_path=self.data_folder,
+                    accounting_up_to_date=accounting_date,
+                    train_test_split=True,
+                    forecast_horizon=self.forecast_horizon
+                )
+                monthly_train = fec_to_monthly_totals(fecs_train)
+                monthly_test = fec_to_monthly_totals(fecs_test)
+        except Exception as e:
+            return [self._row(company_id, config, f'Error: {str(e)}', timer) for config in self.configs]
+
+        rows = {}
+        prepared_by_key: Dict[Tuple[bool, int], Union[PreparedCompany, str]] = {}
+        for config in self.configs:
+            key = config.preprocessing_key
+            if key not in prepared_by_key:
+                prepared_by_key[key] = self._prepare(company_id, config, monthly_train, accounting_date)
+            prepared = prepared_by_key[key]
+
+            if isinstance(prepared, str):
+                rows[config] = self._row(company_id, config, prepared, timer)
+            elif not prepared.is_forecastable:
+                rows[config] = self._row(company_id, config, 'No forecastable accounts', timer, prepared.timer)
+            else:
+                rows[config] = self._run_config(company_id, config, prepared, monthly_train, monthly_test, timer)
+
+        return [rows[config] for config in self.configs]
+
+    def _prepare(
+        self,
+        company_id: str,
+        config: SweepConfig,
+        monthly_train: pd.DataFrame,
+        accounting_date: pd.Timestamp
+    ) -> Union[PreparedCompany, str]:
+        """Preprocess a company with the settings of a configuration (an error status on failure)."""
+        timer = StageTimer()
+        try:
+            with timer.span('preprocess'):
+                preprocessing_result = preprocess_data(
+                    monthly_totals=monthly_train,
+                    accounting_date_up_to_date=accounting_date,
+                    classification_charges=self.classification,
+                    use_covid_dummies=config.use_covid_dummies,
+                    active_window_months=config.active_window_months
+                )
+            with timer.span('closed_form'):
+                closed_form_types, closed_form = closed_form_forecast(
+                    preprocessing_result,
+                    forecast_horizon=self.forecast_horizon,
+                    inactive_accounts=self.inactive_accounts,
+                    use_simple_patterns=self.use_simple_patterns
+                )
+        except Exception as e:
+            return f'Error: {str(e)}'
+        return PreparedCompany(
+            company_id=company_id,
+            preprocessing_result=preprocessing_result,
+            timer=timer,
+            closed_form_types=closed_form_types,
+            closed_form_forecast=closed_form
+        )
+
+    def _run_config(
+        self,
+        company_id: str,
+        config: SweepConfig,
+        prepared: PreparedCompany,
+        monthly_train: pd.DataFrame,
+        monthly_test: pd.DataFrame,
+        load_timer: StageTimer
+    ) -> Dict[str, Any]:
+        """Forecast a prepared company with a configuration and score the forecast."""
+        forecast_timer = StageTimer()
+        try:
+            forecast_result: Optional[ForecastResult] = None
+            if prepared.needs_model:
+                forecast_result = self._forecaster(config).forecast(
+                    data_wide=prepared.data_wide,
+                    prediction_length=self.forecast_horizon,
+                    quantiles=list(config.quantiles),
+                    timer=forecast_timer
+                )
+            if prepared.closed_form_types:
+                forecast_result = add_closed_form_forecasts(forecast_result, prepared, self.forecast_horizon)
+
+            metrics_timer = StageTimer()
+            with metrics_timer.span('metrics'):
+                account_metadata = build_account_metadata(
+                    forecast_result.accounts, prepared.closed_form_types, self.engine
+                )
+                metrics = compute_metrics_from_frames(
+                    forecast_df=forecast_result.forecast_df,
+                    monthly_train=monthly_train,
+                    monthly_test=monthly_test,
+                    account_metadata=account_metadata,
+                    forecast_horizon=self.forecast_horizon
+                )
+                intervals = interval_metrics(
+                    _actuals(monthly_test, forecast_result.forecast_df),
+                    forecast_result.forecast_lower_df,
+                    forecast_result.forecast_upper_df
+                )
+        except Exception as e:
+            return self._row(company_id, config, f'Error: {str(e)}', load_timer, prepared.timer, forecast_timer)
+
+        account_wapes = [
+            values['metrics'].get('WAPE') for values in metrics['account_metrics'].values()
+        ]
+        account_wapes = [value for value in account_wapes if value is not None and np.isfinite(value)]
+        row = self._row(company_id, config, 'Success', load_timer, prepared.timer, forecast_timer, metrics_timer)
+        row.update({
+            'accounts': len(forecast_result.accounts),
+            'model_accounts': len(forecast_result.accounts) - len(prepared.closed_form_types),
+            'net_income': metrics['aggregated_metrics']['net_income'],
+            'account_wape': float(np.median(account_wapes)) if account_wapes else None,
+            **intervals,
+        })
+        return row
+
+    def _row(
+        self,
+        company_id: str,
+        config: SweepConfig,
+        status: str,
+        load_timer: StageTimer,
+        preprocess_timer: Optional[StageTimer] = None,
+        forecast_timer: Optional[StageTimer] = None,
+        metrics_timer: Optional[StageTimer] = None
+    ) -> Dict[str, Any]:
+        """Result row of a company and configuration."""
+        def seconds(timer: Optional[StageTimer]) -> float:
+            return timer.total_wall_seconds if timer is not None else 0.0
+
+        return {
+            'company_id': company_id,
+            'config': config.name,
+            'status': status,
+            'accounts': 0,
+            'load_seconds': seconds(load_timer),
+            'preprocess_seconds': seconds(preprocess_timer),
+            'forecast_seconds': seconds(forecast_timer),
+            'metrics_seconds': seconds(metrics_timer),
+        }
+
+    def run(
+        self,
+        company_ids: List[str],
+        on_company: Optional[Callable[[str, List[Dict[str, Any]]], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Run the sweep on companies.
+
+        Parameters
+        ----------
+        company_ids : List[str]
+            Company identifiers.
+        on_company : Optional[Callable[[str, List[Dict[str, Any]]], None]], default=None
+            Called with the rows of each company once it is done.
+
+        Returns
+        -------
+        Dict[str, Any]
+            Report with 'configs' (settings of each configuration),
+            'summary' (see summarize_sweep), 'rows' (one per company and
+            configuration), 'load_seconds' (loading shared by all
+            configurations) and 'wall_seconds'.
+        """
+        start = time.perf_counter()
+        rows = []
+        for company_id in company_ids:
+            company_rows = self.run_company(company_id)
+            rows.extend(company_rows)
+            if on_company is not None:
+                on_company(company_id, company_rows)
+
+        load_seconds = sum({row['company_id']: row['load_seconds'] for row in rows}.values())
+        return {
+            'configs': {config.name: config.to_dict() for config in self.configs},
+            'summary': summarize_sweep(rows, self.configs),
+            'rows': rows,
+            'load_seconds': load_seconds,
+            'wall_seconds': time.perf_counter() - start,
+        }
+
+
+def summarize_sweep(rows: List[Dict[str, Any]], configs: List[SweepConfig]) -> List[Dict[str, Any]]:
+    """
+    Comparison table of a sweep, one row per configuration.
+
+    Metrics are averaged over the successful companies (the account WAPE is
+    the median over their accounts' medians); times are summed.
+
+    Parameters
+    ----------
+    rows : List[Dict[str, Any]]
+        Rows of ConfigSweep.run_company.
+    configs : List[SweepConfig]
+        Configurations, in table order.
+
+    Returns
+    -------
+    List[Dict[str, Any]]
+        One entry per configuration with the SUMMARY_COLUMNS keys.
+    """
+    def mean(values: List[Optional[float]]) -> Optional[float]:
+        values = [value for value in values if value is not None and np.isfinite(value)]
+        return float(np.mean(values)) if values else None
+
+    summary = []
+    for config in configs:
+        config_rows = [row for row in rows if row['config'] == config.name]
+        done = [row for row in config_rows if row['status'] == 'Success']
+        summary.append({
+            'config': config.name,
+            'companies': len(done),
+            'accounts': sum(row['accounts'] for row in done),
+            'net_income_wape': mean([row['net_income'].get('WAPE') for row in done]),
+            'net_income_rmsse': mean([row['net_income'].get('RMSSE') for row in done]),
+            'net_income_pbias': mean([row['net_income'].get('PBIAS') for row in done]),
+            'account_wape': float(np.median([row['account_wape'] for row in done if row['account_wape'] is not None]))
+            if any(row['account_wape'] is not None for row in done) else None,
+            'coverage': mean([row['coverage'] for row in done]),
+            'interval_width': mean([row['interval_width'] for row in done]),
+            'preprocess_seconds': sum(row['preprocess_seconds'] for row in config_rows),
+            'forecast_seconds': sum(row['forecast_seconds'] for row in config_rows),
+            'metrics_seconds': sum(row['metrics_seconds'] for row in config_rows),
+        })
+    return summary
+
+
+def write_sweep_report(report: Dict[str, Any], run_id: str, data_folder: str = "data", settings: Optional[dict] = None) -> Path:
+    """
+    Write a sweep report as JSON and its comparison table as CSV.
+
+    Parameters
+    ----------
+    report : Dict[str, Any]
+        Output of ConfigSweep.run.
+    run_id : str
+        Run identifier.
+    data_folder : str, default="data"
+        Root data folder path; files go to <data_folder>/_runs/<run_id>/.
+    settings : Optional[dict], default=None
+        Sweep settings shared by all configurations (mode, engine, ...).
+
+    Returns
+    -------
+    Path
+        Path of sweep.json (sweep.csv is next to it).
+    """
+    run_folder = Path(data_folder) / RUNS_FOLDER_NAME / run_id
+    run_folder.mkdir(parents=True, exist_ok=True)
+
+    report_path = run_folder / 'sweep.json'
+    report_path.write_text(json.dumps({'run_id': run_id, 'settings': settings or {}, **report}, indent=2))
+
+    with open(run_folder / 'sweep.csv', 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=SUMMARY_COLUMNS)
+        writer.writeheader()
+        writer.writerows(report['summary'])
+    return report_path
+
+
+def _quantile_set(value: str) -> Tuple[float, ...]:
+    """Parse a comma-separated quantile set such as '0.1,0.5,0.9'."""
+    try:
+        quantiles = tuple(sorted(float(q) for q in value.split(',')))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid quantile set: {value}")
+    if not quantiles or not all(0 < q < 1 for q in quantiles):
+        raise argparse.ArgumentTypeError(f"quantiles must be between 0 and 1: {value}")
+    return quantiles
+
+
+def _format(value: Optional[float], pattern: str = "{:.1f}") -> str:
+    return pattern.format(value) if value is not None else 'n/a'
+
+
+def main():
+    """Run a configuration sweep from the command line."""
+    parser = argparse.ArgumentParser(
+        description="Compare forecasting configurations, loading and preprocessing each company once"
+    )
+    parser.add_argument(
+        '--companies',
+        nargs='+',
+        default=['all'],
+        metavar='COMPANY_ID',
+        help='Company IDs to process, or "all" for all companies (default: all)'
+    )
+
+    parser.add_argument(
+        '--data-folder',
+        default='data',
+        metavar='PATH',
+        help='Path to data folder (default: data)'
+    )
+
+    parser.add_argument(
+        '--tabpfn-mode',
+        choices=['local', 'client'],
+        default='local',
+        help='TabPFN mode: local (runs locally) or client (cloud API) (default: local)'
+    )
+
+    parser.add_argument(
+        '--engine',
+        choices=['tabpfn', 'seasonal_naive', 'stub'],
+        default='tabpfn',
+        help='Forecast engine (default: tabpfn)'
+    )
+
+    parser.add_argument(
+        '--forecast-horizon',
+        type=int,
+        default=12,
+        metavar='N',
+        help='Number of months to forecast and score (default: 12)'
+    )
+
+    parser.add_argument(
+        '--covid-dummies',
+        nargs='+',
+        choices=['off', 'on'],
+        default=['on' if USE_COVID_DUMMIES else 'off'],
+        help='COVID handling: off removes the COVID period, on keeps it '
+             f"(default: {'on' if USE_COVID_DUMMIES else 'off'})"
+    )
+
+    parser.add_argument(
+        '--active-window-months',
+        nargs='+',
+        type=int,
+        default=[ACTIVE_ACCOUNT_WINDOW_MONTHS],
+        metavar='N',
+        help=f'Active account windows (default: {ACTIVE_ACCOUNT_WINDOW_MONTHS})'
+    )
+
+    parser.add_argument(
+        '--max-context-length',
+        nargs='+',
+        type=int,
+        default=[DEFAULT_MAX_CONTEXT_LENGTH],
+        metavar='N',
+        help=f'TabPFN context lengths (default: {DEFAULT_MAX_CONTEXT_LENGTH})'
+    )
+
+    parser.add_argument(
+        '--quantiles',
+        nargs='+',
+        type=_quantile_set,
+        default=[DEFAULT_QUANTILES],
+        metavar='Q1,Q2,...',
+        help='Quantile sets, comma-separated (default: 0.1,0.5,0.9)'
+    )
+
+    parser.add_argument(
+        '--inactive-accounts',
+        choices=['tabpfn', 'zero', 'naive'],
+        default=INACTIVE_ACCOUNTS_FORECAST,
+        help=f'Forecast of accounts without recent data (default: {INACTIVE_ACCOUNTS_FORECAST})'
+    )
+
+    parser.add_argument(
+        '--simple-patterns',
+        action='store_true',
+        default=CLOSED_FORM_SIMPLE_PATTERNS,
+        help='Forecast sparse, constant and step-function accounts without the model'
+    )
+
+    args = parser.parse_args()
+
+    console = Console()
+
+    all_companies = discover_companies(args.data_folder)
+    if not all_companies:
+        console.print(f"[red]No companies found in {args.data_folder}[/red]")
+        sys.exit(1)
+    try:
+        company_ids = all_companies if args.companies == ['all'] else filter_companies(all_companies, args.companies)
+    except ValueError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        sys.exit(1)
+
+    configs = sweep_grid(
+        use_covid_dummies=[value == 'on' for value in dict.fromkeys(args.covid_dummies)],
+        active_window_months=list(dict.fromkeys(args.active_window_months)),
+        max_context_lengths=list(dict.fromkeys(args.max_context_length)),
+        quantile_sets=list(dict.fromkeys(args.quantiles))
+    )
+    n_preprocessing = len({config.preprocessing_key for config in configs})
+    console.print(
+        f"[bold]Sweep:[/bold] {len(configs)} configurations on {len(company_ids)} companies "
+        f"({n_preprocessing} preprocessing variants per company)\n"
+    )
+
+    sweep = ConfigSweep(
+        configs,
+        data_folder=args.data_folder,
+        forecast_horizon=args.forecast_horizon,
+        mode=args.tabpfn_mode,
+        engine=args.engine,
+        inactive_accounts=args.inactive_accounts,
+        use_simple_patterns=args.simple_patterns
+    )
+
+    def on_company(company_id: str, rows: List[Dict[str, Any]]) -> None:
+        failed = [row for row in rows if row['status'] != 'Success']
+        if not failed:
+            console.print(f"✓ [green]{company_id}[/green]")
+        else:
+            console.print(f"✗ [red]{company_id}[/red]: {len(failed)}/{len(rows)} configurations failed ({failed[0]['status']})")
+
+    report = sweep.run(company_ids, on_company=on_company)
+
+    table = Table(title="Configuration Comparison")
+    table.add_column("COVID")
+    table.add_column("Window", justify="right")
+    table.add_column("Context", justify="right")
+    table.add_column("Quantiles")
+    table.add_column("Companies", justify="right")
+    table.add_column("NI WAPE %", justify="right")
+    table.add_column("Acct WAPE %", justify="right")
+    table.add_column("Cover %", justify="right")
+    table.add_column("Prep (s)", justify="right")
+    table.add_column("Fcst (s)", justify="right")
+    for row in report['summary']:
+        config = report['configs'][row['config']]
+        coverage = row['coverage'] * 100 if row['coverage'] is not None else None
+        table.add_row(
+            'on' if config['use_covid_dummies'] else 'off',
+            str(config['active_window_months']),
+            str(config['max_context_length']),
+            '/'.join(f"{q:g}" for q in config['quantiles']),
+            str(row['companies']),
+            _format(row['net_income_wape']),
+            _format(row['account_wape']),
+            _format(coverage),
+            _format(row['preprocess_seconds']),
+            _format(row['forecast_seconds'])
+        )
+    console.print()
+    console.print(table)
+    console.print(
+        f"Loading (shared by all configurations): {report['load_seconds']:.1f}s, "
+        f"total: {report['wall_seconds']:.1f}s"
+    )
+
+    settings = {
+        'mode': args.tabpfn_mode,
+        'engine': args.engine,
+        'forecast_horizon': args.forecast_horizon,
+        'inactive_accounts': args.inactive_accounts,
+        'simple_patterns': args.simple_patterns,
+    }
+    report_path = write_sweep_report(report, new_run_id(), data_folder=args.data_folder, settings=settings)
+    console.print(f"Sweep report: {report_path}")
+
+
+if __name__ == '__main__':
+    main()
@@ -3,22 +3,60 @@ TabPFN forecaster wrapper for time series forecasting.
 
 This module provides a high-level interface to the TabPFN time series model,
 handling data format conversions and providing a simple API for forecasting.
+The model itself is a pluggable engine (see engines).
 """
 
+import copy
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import List, Literal, Optional
+from typing import Dict, List, Literal, Optional, Tuple
 
 import pandas as pd
-from tabpfn_time_series import TabPFNTSPipeline, TabPFNMode
 
+from src.config.forecasting_config import (
+    MAX_CONTEXT_MONTHS,
+    TABPFN_MAX_ROWS_PER_CALL,
+    TRIM_LEADING_NAN_CONTEXT,
+)
+from src.forecasting.engines import create_engine
+from src.forecasting.profiling import StageTimer
 from src.forecasting.data_converter import (
+    chunk_accounts,
     wide_to_tabpfn_format,
     tabpfn_output_to_wide_format,
     extract_quantiles_from_tabpfn_output,
 )
 
 
+# tabpfn_time_series pulls in torch and gluonts, which take several seconds to
+# import. They are loaded by _load_tabpfn() when the first forecaster is built.
+TabPFNTSPipeline = None
+TabPFNMode = None
+
+# Settings that can differ between the jobs of one forecaster (see with_settings)
+FORECAST_SETTINGS = ('max_rows_per_call', 'chunk_workers', 'trim_leading_nan', 'max_context_months')
+
+
+def _load_tabpfn() -> None:
+    """Import the TabPFN time series classes on first use."""
+    global TabPFNTSPipeline, TabPFNMode
+    
+    if TabPFNTSPipeline is None or TabPFNMode is None:
+        import tabpfn_time_series
+        
+        if TabPFNTSPipeline is None:
+            TabPFNTSPipeline = tabpfn_time_series.TabPFNTSPipeline
+        if TabPFNMode is None:
+            TabPFNMode = tabpfn_time_series.TabPFNMode
+
+
+def _check_chunk_workers(mode: str, chunk_workers: int) -> None:
+    """Reject parallel chunks on a local model, which predicts one chunk at a time."""
+    if chunk_workers > 1 and mode == 'local':
+        raise ValueError("chunk_workers > 1 requires client mode")
+
+
 @dataclass
 class ForecastResult:
     """
@@ -29,15 +67,20 @@ class ForecastResult:
     forecast_df : pd.DataFrame
         Wide-format DataFrame with forecast results (ds index × account columns).
     forecast_lower_df : Optional[pd.DataFrame]
-        Wide-format lower bound DataFrame (10th percentile) or None if unavailable.
+        Wide-format lower bound DataFrame (lowest requested quantile, 10th percentile by default) or None if unavailable.
     forecast_upper_df : Optional[pd.DataFrame]
-        Wide-format upper bound DataFrame (90th percentile) or None if unavailable.
+        Wide-format upper bound DataFrame (highest requested quantile, 90th percentile by default) or None if unavailable.
     accounts : List[str]
         List of account numbers that were forecasted.
     prediction_length : int
         Number of periods forecasted.
     elapsed_time : float
         Total time taken for forecasting (in seconds).
+    engine : str
+        Engine that produced the forecast ('tabpfn', 'stub', ..., or
+        'ensemble' for a combination of engines, see multi_engine).
+    engine_results : Optional[Dict[str, ForecastResult]]
+        Forecast of each engine of an ensemble (None for a single engine).
     """
     
     forecast_df: pd.DataFrame
@@ -46,6 +89,8 @@ class ForecastResult:
     accounts: List[str]
     prediction_length: int
     elapsed_time: float
+    engine: str = 'tabpfn'
+    engine_results: Optional[Dict[str, 'ForecastResult']] = None
 
 
 class TabPFNForecaster:
@@ -63,6 +108,25 @@ class TabPFNForecaster:
         - 'client': Use TabPFN cloud API (faster, requires API key)
     max_context_length : int, default=4096
         Maximum context length for TabPFN model.
+    pipeline : optional
+        Engine to use instead of building one (any object implementing
+        engines.ForecastEngine, e.g. a local stand-in server).
+    max_rows_per_call : Optional[int], default=TABPFN_MAX_ROWS_PER_CALL
+        Maximum number of context rows (accounts × months) per predict_df
+        call. Larger inputs are split into chunks of accounts whose forecasts
+        are merged back, which bounds peak memory. None disables chunking.
+    chunk_workers : int, default=1
+        Number of chunks predicted in parallel (threads), in client mode
+        only, where a chunk is a remote request: a local model predicts one
+        chunk at a time.
+    trim_leading_nan : bool, default=TRIM_LEADING_NAN_CONTEXT
+        Drop the leading NaN months of each account from the context.
+    max_context_months : Optional[int], default=MAX_CONTEXT_MONTHS
+        Only send the last max_context_months months of history (None sends
+        the full history).
+    engine : str, default='tabpfn'
+        Name of the engine built when no pipeline is given: 'tabpfn' or a
+        registered engine such as 'stub' (see engines.ENGINES).
     
     Examples
     --------
@@ -79,7 +143,13 @@ class TabPFNForecaster:
     def __init__(
         self,
         mode: Literal['local', 'client'] = 'local',
-        max_context_length: int = 4096
+        max_context_length: int = 4096,
+        pipeline=None,
+        max_rows_per_call: Optional[int] = TABPFN_MAX_ROWS_PER_CALL,
+        chunk_workers: int = 1,
+        trim_leading_nan: bool = TRIM_LEADING_NAN_CONTEXT,
+        max_context_months: Optional[int] = MAX_CONTEXT_MONTHS,
+        engine: str = 'tabpfn'
     ):
         """
         Initialize TabPFN forecaster.
@@ -90,30 +160,91 @@ class TabPFNForecaster:
             Forecasting mode.
         max_context_length : int, default=4096
             Maximum context length for TabPFN model.
+        pipeline : optional
+            Prediction pipeline to use instead of TabPFNTSPipeline.
+        max_rows_per_call : Optional[int], default=TABPFN_MAX_ROWS_PER_CALL
+            Context row budget of one predict_df call.
+        chunk_workers : int, default=1
+            Number of chunks predicted in parallel.
+        trim_leading_nan : bool, default=TRIM_LEADING_NAN_CONTEXT
+            Drop the leading NaN months of each account.
+        max_context_months : Optional[int], default=MAX_CONTEXT_MONTHS
+            Number of most recent months sent as context.
+        engine : str, default='tabpfn'
+            Engine built when no pipeline is given.
         
         Raises
         ------
         ValueError
-            If mode is not 'local' or 'client'.
+            If mode is not 'local' or 'client', the engine is unknown, or
+            chunk_workers > 1 in local mode.
         """
         if mode not in ['local', 'client']:
             raise ValueError("mode must be 'local' or 'client'")
+        _check_chunk_workers(mode, chunk_workers)
         
         self.mode = mode
         self.max_context_length = max_context_length
+        self.max_rows_per_call = max_rows_per_call
+        self.chunk_workers = chunk_workers
+        self.trim_leading_nan = trim_leading_nan
+        self.max_context_months = max_context_months
+        self.engine = engine
+        
+        if pipeline is not None:
+            self.pipeline = pipeline
+            return
+        
+        if engine != 'tabpfn':
+            self.pipeline = create_engine(engine)
+            return
         
         # Initialize TabPFN pipeline
+        _load_tabpfn()
         tabpfn_mode = TabPFNMode.LOCAL if mode == 'local' else TabPFNMode.CLIENT
         self.pipeline = TabPFNTSPipeline(
             tabpfn_mode=tabpfn_mode,
             max_context_length=max_context_length,
         )
     
+    def with_settings(self, **settings) -> 'TabPFNForecaster':
+        """
+        Return a copy of the forecaster with other chunking and context settings.
+        
+        The copy shares the pipeline, and so the loaded model: this is how
+        the forecasting daemon applies the settings of each job.
+        
+        Parameters
+        ----------
+        **settings
+            New values of the FORECAST_SETTINGS attributes.
+        
+        Returns
+        -------
+        TabPFNForecaster
+            Forecaster with the given settings.
+        
+        Raises
+        ------
+        ValueError
+            If a setting is unknown, or chunk_workers > 1 in local mode.
+        """
+        unknown = sorted(set(settings) - set(FORECAST_SETTINGS))
+        if unknown:
+            raise ValueError(f"Unknown forecaster settings: {', '.join(unknown)}")
+        
+        forecaster = copy.copy(self)
+        for name, value in settings.items():
+            setattr(forecaster, name, value)
+        _check_chunk_workers(forecaster.mode, forecaster.chunk_workers)
+        return forecaster
+    
     def forecast(
         self,
         data_wide: pd.DataFrame,
         prediction_length: int = 12,
-        quantiles: List[float] = [0.1, 0.5, 0.9]
+        quantiles: List[float] = [0.1, 0.5, 0.9],
+        timer: Optional[StageTimer] = None
     ) -> ForecastResult:
         """
         Generate forecasts for all accounts in the wide-format DataFrame.
@@ -129,6 +260,9 @@ class TabPFNForecaster:
             Number of future periods to forecast.
         quantiles : List[float], default=[0.1, 0.5, 0.9]
             Quantiles for prediction intervals.
+        timer : Optional[StageTimer], default=None
+            If given, the 'convert', 'predict' and 'extract' stages are
+            recorded on it.
         
         Returns
         -------
@@ -147,30 +281,44 @@ class TabPFNForecaster:
         (12, 2)
         """
         start_time = time.time()
+        timer = timer if timer is not None else StageTimer()
         
         # Extract account list
         accounts = list(data_wide.columns)
         
-        # Convert to TabPFN format
-        tabpfn_input = wide_to_tabpfn_format(data_wide)
+        # Split the accounts so that each predict_df call fits the row budget
+        n_periods = len(data_wide)
+        if self.max_context_months is not None:
+            n_periods = min(n_periods, self.max_context_months)
+        chunks = chunk_accounts(accounts, n_periods, self.max_rows_per_call)
         
-        # Run TabPFN forecast
-        tabpfn_output = self.pipeline.predict_df(
-            context_df=tabpfn_input,
-            prediction_length=prediction_length,
-            quantiles=quantiles
-        )
-        
-        # Convert back to wide format (with quantiles if available)
-        try:
-            forecast_df, lower_df, upper_df = extract_quantiles_from_tabpfn_output(
-                tabpfn_output,
-                accounts
+        if len(chunks) <= 1:
+            forecast_df, lower_df, upper_df = self._forecast_chunk(
+                data_wide, accounts, prediction_length, quantiles, timer
             )
-        except KeyError:
-            forecast_df = tabpfn_output_to_wide_format(tabpfn_output, accounts)
-            lower_df = None
-            upper_df = None
+        else:
+            # Each chunk records its stages on its own timer (chunks may run in threads)
+            chunk_timers = [StageTimer() for _ in chunks]
+            
+            def run_chunk(i: int):
+                chunk = chunks[i]
+                return self._forecast_chunk(data_wide[chunk], chunk, prediction_length, quantiles, chunk_timers[i])
+            
+            if self.chunk_workers > 1:
+                with ThreadPoolExecutor(max_workers=self.chunk_workers) as executor:
+                    outputs = list(executor.map(run_chunk, range(len(chunks))))
+            else:
+                outputs = [run_chunk(i) for i in range(len(chunks))]
+            
+            for chunk_timer in chunk_timers:
+                for stage in chunk_timer.stages:
+                    timer.add(stage.name, stage.wall_seconds, stage.cpu_seconds)
+            
+            forecast_df = pd.concat([output[0] for output in outputs], axis=1)
+            lower_df, upper_df = None, None
+            if all(output[1] is not None and output[2] is not None for output in outputs):
+                lower_df = pd.concat([output[1] for output in outputs], axis=1)
+                upper_df = pd.concat([output[2] for output in outputs], axis=1)
         
         # Calculate elapsed time
         elapsed_time = time.time() - start_time
@@ -181,5 +329,41 @@ class TabPFNForecaster:
             forecast_upper_df=upper_df,
             accounts=accounts,
             prediction_length=prediction_length,
-            elapsed_time=elapsed_time
+            elapsed_time=elapsed_time,
+            engine=self.engine
         )
+    
+    def _forecast_chunk(
+        self,
+        data_wide: pd.DataFrame,
+        accounts: List[str],
+        prediction_length: int,
+        quantiles: List[float],
+        timer: StageTimer
+    ) -> Tuple[pd.DataFrame, Optional[pd.DataFrame], Optional[pd.DataFrame]]:
+        """Run one predict_df call and return the median, lower and upper forecasts."""
+        # Convert to TabPFN format
+        with timer.span('convert'):
+            tabpfn_input = wide_to_tabpfn_format(
+                data_wide,
+                trim_leading_nan=self.trim_leading_nan,
+                max_history_months=self.max_context_months
+            )
+        
+        # Run TabPFN forecast
+        with timer.span('predict'):
+            tabpfn_output = self.pipeline.predict_df(
+                context_df=tabpfn_input,
+                prediction_length=prediction_length,
+                quantiles=quantiles
+            )
+        
+        # Convert back to wide format (with quantiles if available)
+        with timer.span('extract'):
+            try:
+                # The outer quantiles bound the prediction interval
+                return extract_quantiles_from_tabpfn_output(
+                    tabpfn_output, accounts, lower_quantile=min(quantiles), upper_quantile=max(quantiles)
+                )
+            except KeyError:
+                return tabpfn_output_to_wide_format(tabpfn_output, accounts), None, None
@@ -5,19 +5,27 @@ This module provides functions to compute forecast accuracy metrics
 and compare different forecasting approaches.
 """
 
-from .compute_metrics import (
-    compute_mape_df,
-    compute_smape_df,
-    compute_rmsse_df,
-    compute_nrmse_df,
-    compute_wape_df,
-    compute_swape_df,
-    compute_pbias_df,
-    compute_all_metrics,
-)
-from .seasonal_naive import generate_seasonal_naive
-from .aggregation import compute_aggregated_metrics
-from .pipeline import compute_metrics_for_company
+import importlib
+
+
+# Public names and the submodule defining them. Submodules are imported on
+# first attribute access so that importing src.metrics.cli stays cheap.
+_LAZY_IMPORTS = {
+    "compute_mape_df": ".compute_metrics",
+    "compute_smape_df": ".compute_metrics",
+    "compute_rmsse_df": ".compute_metrics",
+    "compute_nrmse_df": ".compute_metrics",
+    "compute_wape_df": ".compute_metrics",
+    "compute_swape_df": ".compute_metrics",
+    "compute_pbias_df": ".compute_metrics",
+    "compute_all_metrics": ".compute_metrics",
+    "compute_metrics_array": ".compute_metrics",
+    "METRIC_NAMES": ".compute_metrics",
+    "generate_seasonal_naive": ".seasonal_naive",
+    "compute_aggregated_metrics": ".aggregation",
+    "compute_metrics_for_company": ".pipeline",
+    "compute_metrics_from_frames": ".pipeline",
+}
 
 __all__ = [
     "compute_mape_df",
@@ -28,7 +36,25 @@ __all__ = [
     "compute_swape_df",
     "compute_pbias_df",
     "compute_all_metrics",
+    "compute_metrics_array",
+    "METRIC_NAMES",
     "generate_seasonal_naive",
     "compute_aggregated_metrics",
     "compute_metrics_for_company",
+    "compute_metrics_from_frames",
 ]
+
+
+def __getattr__(name):
+    """Import public names from their submodule on first access."""
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """List public names, including those not imported yet."""
+    return sorted(set(globals()) | set(__all__))
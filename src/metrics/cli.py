@@ -4,6 +4,9 @@ Command-line interface for metrics computation.
 Usage:
     uv run python -m src.metrics.cli --company_id "RESTO - 1" --process_id "abc-123"
     uv run python -m src.metrics.cli --all  # Compute for all companies
+
+The metrics pipeline (pandas, FEC loading) is imported only when metrics are
+computed, so --help returns immediately.
 """
 
 import argparse
@@ -11,8 +14,6 @@ import json
 import sys
 from pathlib import Path
 
-from .pipeline import compute_metrics_for_company
-
 
 def main():
     """Main CLI entry point."""
@@ -57,6 +58,8 @@ def main():
         )
     elif args.company_id and args.process_id:
         # Single company mode
+        from .pipeline import compute_metrics_for_company
+        
         try:
             print(f"Computing metrics for {args.company_id} / {args.process_id}...")
             metrics = compute_metrics_for_company(
@@ -97,6 +100,8 @@ def compute_all_missing_metrics(
     forecast_horizon : int
         Forecast horizon in months.
     """
+    from .pipeline import compute_metrics_for_company
+    
     data_path = Path(data_folder)
     
     if not data_path.exists():
@@ -11,12 +11,18 @@ Implements the 7 metrics used in ProphetApproach for forecast evaluation:
 - PBIAS: Percent Bias
 """
 
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 
 
+# Metric order used by the array kernel (columns of compute_metrics_array output)
+METRIC_NAMES: Tuple[str, ...] = (
+    'MAPE', 'SMAPE', 'RMSSE', 'NRMSE', 'WAPE', 'SWAPE', 'PBIAS'
+)
+
+
 def compute_mape_df(
     actual_df: pd.DataFrame,
     forecast_df: pd.DataFrame,
@@ -383,3 +389,119 @@ def compute_all_metrics(
         metrics['RMSSE'] = pd.Series([None] * len(forecast_df.columns), index=forecast_df.columns)
     
     return metrics
+
+
+def compute_metrics_array(
+    actual: np.ndarray,
+    forecasts: np.ndarray,
+    seasonal_naive: Optional[np.ndarray] = None,
+    epsilon: float = 1e-8
+) -> np.ndarray:
+    """
+    Compute all metrics for several forecasts of one series in a single pass.
+    
+    Vectorized counterpart of the ``compute_*_df`` functions for callers that
+    hold every approach in one aligned array (e.g. the dashboard). Each row of
+    ``forecasts`` is scored against ``actual`` over the time steps where both
+    are finite, which matches aligning each forecast on the common index.
+    
+    Parameters
+    ----------
+    actual : np.ndarray
+        Actual values, shape (T,).
+    forecasts : np.ndarray
+        Forecast values, shape (n_forecasts, T). NaN marks missing steps.
+    seasonal_naive : np.ndarray, optional
+        Seasonal naive baseline, shape (T,). If None, RMSSE is NaN.
+    epsilon : float, default=1e-8
+        Threshold for filtering near-zero actual values in MAPE.
+    
+    Returns
+    -------
+    np.ndarray
+        Array of shape (n_forecasts, len(METRIC_NAMES)). NaN where a metric
+        is undefined (no overlapping steps, zero denominators, ...).
+    
+    Examples
+    --------
+    >>> actual = np.array([100.0, 200.0, 150.0])
+    >>> forecasts = np.array([[110.0, 190.0, 160.0]])
+    >>> result = compute_metrics_array(actual, forecasts)
+    >>> round(result[0, METRIC_NAMES.index('WAPE')], 6)
+    6.666667
+    """
+    actual = np.asarray(actual, dtype=float)
+    forecasts = np.atleast_2d(np.asarray(forecasts, dtype=float))
+    n_forecasts = forecasts.shape[0]
+    result = np.full((n_forecasts, len(METRIC_NAMES)), np.nan)
+    
+    if actual.size == 0 or n_forecasts == 0:
+        return result
+    
+    # Steps where both actual and forecast are available
+    valid = np.isfinite(forecasts) & np.isfinite(actual)
+    n_valid = valid.sum(axis=1)
+    
+    a = np.where(valid, actual, 0.0)
+    f = np.where(valid, forecasts, 0.0)
+    abs_a = np.abs(a)
+    abs_f = np.abs(f)
+    error = f - a
+    abs_error = np.abs(error)
+    squared_error = error ** 2
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # MAPE: only steps with non-negligible actuals
+        mape_mask = valid & (abs_a > epsilon)
+        mape_terms = np.where(mape_mask, abs_error / np.where(mape_mask, abs_a, 1.0), 0.0)
+        mape = mape_terms.sum(axis=1) / mape_mask.sum(axis=1) * 100
+        
+        # SMAPE: skip steps where actual and forecast are both zero
+        half_sum = (abs_a + abs_f) / 2
+        smape_mask = valid & (half_sum != 0)
+        smape_terms = np.where(smape_mask, abs_error / np.where(smape_mask, half_sum, 1.0), 0.0)
+        smape = smape_terms.sum(axis=1) / smape_mask.sum(axis=1) * 100
+        
+        mse = squared_error.sum(axis=1) / n_valid
+        
+        # RMSSE: forecast error scaled by the seasonal naive error
+        if seasonal_naive is not None:
+            naive = np.asarray(seasonal_naive, dtype=float)
+            naive_valid = valid & np.isfinite(naive)
+            naive_error = np.where(naive_valid, naive - actual, 0.0) ** 2
+            naive_mse = naive_error.sum(axis=1) / naive_valid.sum(axis=1)
+            rmsse = np.sqrt(mse) / np.sqrt(np.where(naive_mse == 0, np.nan, naive_mse))
+            rmsse = np.where(mse == 0, 0.0, rmsse)
+        else:
+            rmsse = np.full(n_forecasts, np.nan)
+        
+        # NRMSE: RMSE normalized by the range of the actuals
+        actual_max = np.where(valid, actual, -np.inf).max(axis=1)
+        actual_min = np.where(valid, actual, np.inf).min(axis=1)
+        value_range = np.where(n_valid > 0, actual_max - actual_min, np.nan)
+        nrmse = np.sqrt(mse) / np.where(value_range == 0, np.nan, value_range)
+        nrmse = np.where(mse == 0, 0.0, nrmse)
+        
+        sum_abs_error = abs_error.sum(axis=1)
+        sum_abs_actual = abs_a.sum(axis=1)
+        sum_abs_actual = np.where(sum_abs_actual == 0, np.nan, sum_abs_actual)
+        
+        wape = sum_abs_error / sum_abs_actual * 100
+        
+        swape_den = half_sum.sum(axis=1)
+        swape = sum_abs_error / np.where(swape_den == 0, np.nan, swape_den) * 100
+        
+        pbias = np.abs(error.sum(axis=1)) / sum_abs_actual * 100
+    
+    result[:, METRIC_NAMES.index('MAPE')] = mape
+    result[:, METRIC_NAMES.index('SMAPE')] = smape
+    result[:, METRIC_NAMES.index('RMSSE')] = rmsse
+    result[:, METRIC_NAMES.index('NRMSE')] = nrmse
+    result[:, METRIC_NAMES.index('WAPE')] = wape
+    result[:, METRIC_NAMES.index('SWAPE')] = swape
+    result[:, METRIC_NAMES.index('PBIAS')] = pbias
+    
+    # Forecasts without any overlapping step have no defined metric
+    result[n_valid == 0, :] = np.nan
+    
+    return result
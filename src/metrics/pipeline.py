@@ -117,9 +117,60 @@ def compute_metrics_for_company(
         forecast_horizon=forecast_horizon
     )
     
-    # Convert test FECs to monthly totals
-    monthly_test = fec_to_monthly_totals(fecs_test)
+    # 4-6. Compare the forecast with the actuals and the seasonal naive baseline
+    metrics = compute_metrics_from_frames(
+        forecast_df=forecast_df,
+        monthly_train=fec_to_monthly_totals(fecs_train),
+        monthly_test=fec_to_monthly_totals(fecs_test),
+        account_metadata=account_metadata,
+        forecast_horizon=forecast_horizon
+    )
+    
+    # 7. Update company.json
+    _update_company_json_with_metrics(
+        company_json_path=company_json_path,
+        process_id=process_id,
+        account_metrics=metrics['account_metrics'],
+        aggregated_metrics=metrics['aggregated_metrics']
+    )
+    
+    return metrics
+
+
+def compute_metrics_from_frames(
+    forecast_df: pd.DataFrame,
+    monthly_train: pd.DataFrame,
+    monthly_test: pd.DataFrame,
+    account_metadata: Dict[str, Dict],
+    forecast_horizon: int = 12
+) -> Dict[str, Any]:
+    """
+    Compute all metrics of a forecast from in-memory data.
+    
+    This is the computation of compute_metrics_for_company without any file
+    access, so that a forecasting run can compute metrics right after a
+    forecast, from the data it already has in memory.
+    
+    Parameters
+    ----------
+    forecast_df : pd.DataFrame
+        Forecast (ds index × account columns), e.g. ForecastResult.forecast_df.
+    monthly_train : pd.DataFrame
+        Monthly totals of the training FECs (see fec_to_monthly_totals).
+    monthly_test : pd.DataFrame
+        Monthly totals of the test FECs (the actuals of the forecast period).
+    account_metadata : Dict[str, Dict]
+        Account metadata of the forecast version (account_type, forecast_type).
+    forecast_horizon : int, default=12
+        Number of months in forecast horizon.
     
+    Returns
+    -------
+    Dict[str, Any]
+        Dictionary with:
+        - 'account_metrics': Dict mapping account to metric dict
+        - 'aggregated_metrics': Aggregated metrics structure
+    """
     # Pivot to wide format matching forecast structure
     actual_df = monthly_test.pivot(
         index='PieceDate',
@@ -138,8 +189,7 @@ def compute_metrics_for_company(
     # Use forecast dates as reference
     actual_df = actual_df.reindex(forecast_df.index, fill_value=0)
     
-    # 4. Generate seasonal naive baseline from training data
-    monthly_train = fec_to_monthly_totals(fecs_train)
+    # Generate seasonal naive baseline from training data
     historical_df = monthly_train.pivot(
         index='PieceDate',
         columns='CompteNum',
@@ -158,7 +208,7 @@ def compute_metrics_for_company(
     # Align naive with forecast dates
     seasonal_naive_df = seasonal_naive_df.reindex(forecast_df.index, fill_value=0)
     
-    # 5. Compute account-level metrics
+    # Compute account-level metrics
     account_level_metrics = compute_all_metrics(
         actual_df=actual_df,
         forecast_df=forecast_df,
@@ -180,7 +230,7 @@ def compute_metrics_for_company(
             'metrics': metrics_dict
         }
     
-    # 6. Compute aggregated metrics
+    # Compute aggregated metrics
     aggregated_metrics = compute_aggregated_metrics(
         actual_df=actual_df,
         forecast_df=forecast_df,
@@ -188,14 +238,6 @@ def compute_metrics_for_company(
         account_metadata=account_metadata
     )
     
-    # 7. Update company.json
-    _update_company_json_with_metrics(
-        company_json_path=company_json_path,
-        process_id=process_id,
-        account_metrics=account_metrics,
-        aggregated_metrics=aggregated_metrics
-    )
-    
     return {
         'account_metrics': account_metrics,
         'aggregated_metrics': aggregated_metrics
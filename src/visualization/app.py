@@ -17,7 +17,13 @@ from .callbacks import register_callbacks
 from .translations import APP_TITLE_PREFIX
 
 
-def create_app(company_id: str, data_folder: str = "data", debug: bool = False) -> dash.Dash:
+def create_app(
+    company_id: str,
+    data_folder: str = "data",
+    debug: bool = False,
+    use_webgl: bool = False,
+    compact_payload: bool = False
+) -> dash.Dash:
     """
     Create and configure Dash application.
     
@@ -29,6 +35,10 @@ def create_app(company_id: str, data_folder: str = "data", debug: bool = False)
         Root data folder path.
     debug : bool, default=False
         Enable debug mode for Dash.
+    use_webgl : bool, default=False
+        Render chart traces with WebGL (Scattergl).
+    compact_payload : bool, default=False
+        Minimize the chart JSON sent to the browser.
     
     Returns
     -------
@@ -83,7 +93,12 @@ def create_app(company_id: str, data_folder: str = "data", debug: bool = False)
     )
     
     # Register callbacks
-    register_callbacks(app, dashboard_data)
+    register_callbacks(
+        app,
+        dashboard_data,
+        use_webgl=use_webgl,
+        compact_payload=compact_payload
+    )
     
     print(f"\nDashboard ready! Access at: http://localhost:8050")
     
@@ -95,7 +110,9 @@ def run_dashboard(
     data_folder: str = "data",
     host: str = "127.0.0.1",
     port: int = 8050,
-    debug: bool = True
+    debug: bool = True,
+    use_webgl: bool = False,
+    compact_payload: bool = False
 ):
     """
     Run the dashboard application.
@@ -112,13 +129,23 @@ def run_dashboard(
         Port to run server on.
     debug : bool, default=True
         Enable debug mode.
+    use_webgl : bool, default=False
+        Render chart traces with WebGL (Scattergl).
+    compact_payload : bool, default=False
+        Minimize the chart JSON sent to the browser.
     
     Examples
     --------
     >>> run_dashboard("RESTO - 1", debug=False)
     """
     try:
-        app = create_app(company_id=company_id, data_folder=data_folder, debug=debug)
+        app = create_app(
+            company_id=company_id,
+            data_folder=data_folder,
+            debug=debug,
+            use_webgl=use_webgl,
+            compact_payload=compact_payload
+        )
         app.run(host=host, port=port, debug=debug)
     except KeyboardInterrupt:
         print("\nShutting down dashboard...")
@@ -129,6 +156,8 @@ def run_dashboard(
 
 if __name__ == "__main__":
     import argparse
+
+    from .cli import add_chart_arguments
     
     parser = argparse.ArgumentParser(
         description="Run forecast comparison dashboard"
@@ -162,6 +191,7 @@ if __name__ == "__main__":
         action="store_true",
         help="Disable debug mode"
     )
+    add_chart_arguments(parser)
     
     args = parser.parse_args()
     
@@ -170,5 +200,7 @@ if __name__ == "__main__":
         data_folder=args.data_folder,
         host=args.host,
         port=args.port,
-        debug=not args.no_debug
+        debug=not args.no_debug,
+        use_webgl=args.webgl,
+        compact_payload=args.compact_payload
     )
@@ -13,6 +13,29 @@ from rich.console import Console
 console = Console()
 
 
+def add_chart_arguments(parser: argparse.ArgumentParser) -> None:
+    """
+    Add the chart rendering options (--webgl, --compact-payload).
+    
+    Shared by the dashboard command and ``python -m src.visualization.app``.
+    
+    Parameters
+    ----------
+    parser : argparse.ArgumentParser
+        Parser to add the options to.
+    """
+    parser.add_argument(
+        '--webgl',
+        action='store_true',
+        help='Render charts with WebGL (faster for many versions)'
+    )
+    parser.add_argument(
+        '--compact-payload',
+        action='store_true',
+        help='Minimize chart JSON (float32 values, short dates, no template)'
+    )
+
+
 def main():
     """
     Main entry point for visualization CLI.
@@ -72,6 +95,7 @@ Examples:
         action='store_true',
         help='Disable debug mode'
     )
+    add_chart_arguments(dashboard_parser)
     
     args = parser.parse_args()
     
@@ -109,7 +133,9 @@ def run_dashboard_command(args):
             data_folder=args.data_folder,
             host=args.host,
             port=args.port,
-            debug=not args.no_debug
+            debug=not args.no_debug,
+            use_webgl=args.webgl,
+            compact_payload=args.compact_payload
         )
     except KeyboardInterrupt:
         console.print("\n[yellow]Dashboard stopped by user[/yellow]")
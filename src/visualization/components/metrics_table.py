@@ -7,10 +7,12 @@ forecast approaches.
 
 from typing import Dict, List, Optional, Any
 
+import numpy as np
 import pandas as pd
 import dash_bootstrap_components as dbc
 from dash import html, dash_table
 
+from ...metrics.compute_metrics import compute_metrics_array, METRIC_NAMES
 from ..translations import (
     METRICS_INFO_FR,
     METRICS_TABLE_HEADER_METRIC,
@@ -246,6 +248,8 @@ def compute_aggregated_metrics_on_the_fly(
     Compute metrics on-the-fly for aggregated views.
     
     This is used when pre-computed aggregated metrics are not available.
+    All approaches are aligned on the actual series' index and stacked into a
+    single array, then scored in one pass by ``compute_metrics_array``.
     
     Parameters
     ----------
@@ -254,7 +258,8 @@ def compute_aggregated_metrics_on_the_fly(
     forecast_series_dict : Dict[str, pd.Series]
         Dictionary mapping approach name to forecast series.
     seasonal_naive_series : pd.Series, optional
-        Seasonal naive baseline for RMSSE computation.
+        Seasonal naive baseline for RMSSE computation. Dates missing from the
+        baseline count as zero, as in the metrics pipeline.
     
     Returns
     -------
@@ -269,81 +274,33 @@ def compute_aggregated_metrics_on_the_fly(
     >>> 'MAPE' in metrics['TabPFN']
     True
     """
-    from ...metrics.compute_metrics import (
-        compute_mape_df, compute_smape_df, compute_rmsse_df,
-        compute_nrmse_df, compute_wape_df, compute_swape_df,
-        compute_pbias_df
-    )
+    approaches = list(forecast_series_dict.keys())
+    if not approaches:
+        return {}
     
-    metrics_by_approach = {}
+    index = actual_series.index
+    actual = actual_series.to_numpy(dtype=float)
     
-    for approach_name, forecast_series in forecast_series_dict.items():
-        # Align series
-        common_index = actual_series.index.intersection(forecast_series.index)
-        
-        if len(common_index) == 0:
-            metrics_by_approach[approach_name] = {
-                metric_name: None for metric_name, _, _ in METRICS_INFO
-            }
-            continue
-        
-        actual_aligned = actual_series.loc[common_index]
-        forecast_aligned = forecast_series.loc[common_index]
-        
-        # Convert to DataFrame format expected by metric functions
-        actual_df = pd.DataFrame({'agg': actual_aligned})
-        forecast_df = pd.DataFrame({'agg': forecast_aligned})
-        
-        # Compute metrics
-        metrics = {}
-        
-        try:
-            mape = compute_mape_df(actual_df, forecast_df)
-            metrics['MAPE'] = mape['agg'] if 'agg' in mape.index else None
-        except:
-            metrics['MAPE'] = None
-        
-        try:
-            smape = compute_smape_df(actual_df, forecast_df)
-            metrics['SMAPE'] = smape['agg'] if 'agg' in smape.index else None
-        except:
-            metrics['SMAPE'] = None
-        
-        try:
-            if seasonal_naive_series is not None:
-                naive_aligned = seasonal_naive_series.loc[common_index]
-                naive_df = pd.DataFrame({'agg': naive_aligned})
-                rmsse = compute_rmsse_df(actual_df, forecast_df, naive_df)
-                metrics['RMSSE'] = rmsse['agg'] if 'agg' in rmsse.index else None
-            else:
-                metrics['RMSSE'] = None
-        except:
-            metrics['RMSSE'] = None
-        
-        try:
-            nrmse = compute_nrmse_df(actual_df, forecast_df)
-            metrics['NRMSE'] = nrmse['agg'] if 'agg' in nrmse.index else None
-        except:
-            metrics['NRMSE'] = None
-        
-        try:
-            wape = compute_wape_df(actual_df, forecast_df)
-            metrics['WAPE'] = wape['agg'] if 'agg' in wape.index else None
-        except:
-            metrics['WAPE'] = None
-        
-        try:
-            swape = compute_swape_df(actual_df, forecast_df)
-            metrics['SWAPE'] = swape['agg'] if 'agg' in swape.index else None
-        except:
-            metrics['SWAPE'] = None
-        
-        try:
-            pbias = compute_pbias_df(actual_df, forecast_df)
-            metrics['PBIAS'] = pbias['agg'] if 'agg' in pbias.index else None
-        except:
-            metrics['PBIAS'] = None
-        
-        metrics_by_approach[approach_name] = metrics
+    # One row per approach, aligned on the actual dates (NaN where missing)
+    forecasts = np.vstack([
+        forecast_series_dict[approach].reindex(index).to_numpy(dtype=float)
+        for approach in approaches
+    ])
+    
+    seasonal_naive = None
+    if seasonal_naive_series is not None:
+        seasonal_naive = seasonal_naive_series.reindex(index, fill_value=0).to_numpy(dtype=float)
+    
+    values = compute_metrics_array(actual, forecasts, seasonal_naive)
+    
+    metrics_by_approach = {}
+    for row, approach_name in enumerate(approaches):
+        metrics_by_approach[approach_name] = {
+            metric_name: (
+                None if np.isnan(values[row, METRIC_NAMES.index(metric_name)])
+                else float(values[row, METRIC_NAMES.index(metric_name)])
+            )
+            for metric_name, _, _ in METRICS_INFO
+        }
     
     return metrics_by_approach
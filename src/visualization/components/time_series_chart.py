@@ -5,8 +5,9 @@ Provides functions to create Plotly figures showing train data,
 test data, and forecasts from multiple approaches.
 """
 
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 from plotly.graph_objs import Figure
@@ -45,11 +46,17 @@ def create_forecast_comparison_chart(
     title: str,
     y_label: str = "Value",
     forecast_lower_dict: Optional[Dict[str, pd.Series]] = None,
-    forecast_upper_dict: Optional[Dict[str, pd.Series]] = None
+    forecast_upper_dict: Optional[Dict[str, pd.Series]] = None,
+    use_webgl: bool = False,
+    compact_payload: bool = False
 ) -> Figure:
     """
     Create a Plotly figure comparing train, test, and forecast data.
     
+    With many forecast versions and long histories the figure JSON sent to the
+    browser grows quickly. ``use_webgl`` renders traces with ``Scattergl`` and
+    ``compact_payload`` shrinks the serialized figure (see Notes).
+    
     Parameters
     ----------
     train_series : pd.Series
@@ -66,6 +73,11 @@ def create_forecast_comparison_chart(
         Dictionary mapping forecast approach name to lower bound (10th percentile).
     forecast_upper_dict : Optional[Dict[str, pd.Series]], optional
         Dictionary mapping forecast approach name to upper bound (90th percentile).
+    use_webgl : bool, default=False
+        If True, use ``go.Scattergl`` (WebGL) instead of ``go.Scatter`` (SVG).
+    compact_payload : bool, default=False
+        If True, encode values as float32, dates as short 'YYYY-MM-DD'
+        strings, and drop the default plotly template.
     
     Returns
     -------
@@ -82,14 +94,30 @@ def create_forecast_comparison_chart(
     >>> fig = create_forecast_comparison_chart(train, test, forecasts, "Account 707000")
     >>> fig.layout.title.text
     'Account 707000'
+    
+    Notes
+    -----
+    Compact payloads serialize values as base64 float32 arrays (plotly >= 6)
+    and dates as 'YYYY-MM-DD' strings instead of full ISO timestamps. Forecast
+    versions usually share the test period index, so their dates are
+    converted once per figure; the serialized figure still holds the x-array
+    of every trace (plotly has no shared data arrays).
     """
     fig = go.Figure()
+    scatter = go.Scattergl if use_webgl else go.Scatter
+    shared_x: Dict[Tuple, np.ndarray] = {}
+    
+    def encode_x(series: pd.Series):
+        return _encode_dates(series.index, shared_x) if compact_payload else series.index
+    
+    def encode_y(series: pd.Series):
+        return _encode_values(series) if compact_payload else series.values
     
     # Add train data
     if not train_series.empty:
-        fig.add_trace(go.Scatter(
-            x=train_series.index,
-            y=train_series.values,
+        fig.add_trace(scatter(
+            x=encode_x(train_series),
+            y=encode_y(train_series),
             mode='lines+markers',
             name=CHART_TRAIN_DATA,
             line=dict(color='#1f77b4', width=2),
@@ -99,9 +127,9 @@ def create_forecast_comparison_chart(
     
     # Add test/actual data
     if not test_series.empty:
-        fig.add_trace(go.Scatter(
-            x=test_series.index,
-            y=test_series.values,
+        fig.add_trace(scatter(
+            x=encode_x(test_series),
+            y=encode_y(test_series),
             mode='lines+markers',
             name=CHART_ACTUAL_TEST,
             line=dict(color='#2ca02c', width=2),
@@ -120,10 +148,17 @@ def create_forecast_comparison_chart(
             if lower_series is not None and upper_series is not None and not lower_series.empty and not upper_series.empty:
                 color = colors[idx % len(colors)]
                 
+                if compact_payload:
+                    band_x = np.concatenate([encode_x(lower_series), encode_x(upper_series)[::-1]])
+                    band_y = np.concatenate([encode_y(lower_series), encode_y(upper_series)[::-1]])
+                else:
+                    band_x = list(lower_series.index) + list(upper_series.index[::-1])
+                    band_y = list(lower_series.values) + list(upper_series.values[::-1])
+                
                 # Add shaded band for 80% confidence interval (10th to 90th percentile)
-                fig.add_trace(go.Scatter(
-                    x=list(lower_series.index) + list(upper_series.index[::-1]),
-                    y=list(lower_series.values) + list(upper_series.values[::-1]),
+                fig.add_trace(scatter(
+                    x=band_x,
+                    y=band_y,
                     fill='toself',
                     fillcolor=f'rgba({int(color[1:3], 16)}, {int(color[3:5], 16)}, {int(color[5:7], 16)}, 0.2)',
                     line=dict(width=0),
@@ -137,9 +172,9 @@ def create_forecast_comparison_chart(
     for idx, (approach_name, forecast_series) in enumerate(forecast_series_dict.items()):
         if not forecast_series.empty:
             color = colors[idx % len(colors)]
-            fig.add_trace(go.Scatter(
-                x=forecast_series.index,
-                y=forecast_series.values,
+            fig.add_trace(scatter(
+                x=encode_x(forecast_series),
+                y=encode_y(forecast_series),
                 mode='lines+markers',
                 name=f'{approach_name}',
                 line=dict(color=color, width=2, dash='dash'),
@@ -187,9 +222,61 @@ def create_forecast_comparison_chart(
         height=500
     )
     
+    if compact_payload:
+        # Styling is fully specified above; the default template only adds bytes
+        fig.update_layout(template='none')
+    
     return fig
 
 
+def _encode_dates(index: pd.Index, shared_x: Dict[Tuple, np.ndarray]) -> np.ndarray:
+    """
+    Convert an index to a compact x-array, reusing conversions already done.
+    
+    Parameters
+    ----------
+    index : pd.Index
+        Series index (usually a DatetimeIndex of month starts).
+    shared_x : Dict[Tuple, np.ndarray]
+        Arrays already converted for this figure, keyed by index content
+        (saves the conversion, not bytes: each trace serializes its x-array).
+    
+    Returns
+    -------
+    np.ndarray
+        'YYYY-MM-DD' strings for datetime indexes, raw values otherwise.
+    """
+    if isinstance(index, pd.DatetimeIndex):
+        key = ('datetime', index.asi8.tobytes())
+    else:
+        key = ('values', tuple(index))
+    
+    if key not in shared_x:
+        if isinstance(index, pd.DatetimeIndex):
+            shared_x[key] = np.asarray(index.strftime('%Y-%m-%d'), dtype=object)
+        else:
+            shared_x[key] = index.to_numpy()
+    
+    return shared_x[key]
+
+
+def _encode_values(series: pd.Series) -> np.ndarray:
+    """
+    Convert series values to a float32 array.
+    
+    Parameters
+    ----------
+    series : pd.Series
+        Series to encode.
+    
+    Returns
+    -------
+    np.ndarray
+        float32 values (4 bytes per point once base64-encoded by plotly).
+    """
+    return series.to_numpy(dtype=np.float32, na_value=np.nan)
+
+
 def create_empty_chart(message: str = "No data available") -> Figure:
     """
     Create an empty chart with a message.
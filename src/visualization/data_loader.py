@@ -16,6 +16,7 @@ import pandas as pd
 from ..data.fec_loader import load_fecs
 from ..data.preprocessing import fec_to_monthly_totals
 from ..metrics.result_loader import load_gather_result, load_confidence_intervals
+from ..metrics.seasonal_naive import generate_seasonal_naive
 
 
 class DashboardData:
@@ -50,6 +51,9 @@ class DashboardData:
         All accounts with any forecast
     forecast_versions : List[Dict[str, Any]]
         Forecast version metadata
+    seasonal_naive_data : Optional[pd.DataFrame]
+        Seasonal naive baseline over the test period (ds × accounts), used for
+        RMSSE when metrics are computed on the fly. None if train data is too short.
     """
     
     def __init__(
@@ -63,7 +67,8 @@ class DashboardData:
         forecast_upper: Dict[str, Optional[pd.DataFrame]],
         account_metrics: Dict[str, Dict[str, Dict[str, float]]],
         aggregated_metrics: Dict[str, Dict[str, Any]],
-        forecast_versions: List[Dict[str, Any]]
+        forecast_versions: List[Dict[str, Any]],
+        seasonal_naive_data: Optional[pd.DataFrame] = None
     ):
         self.company_id = company_id
         self.accounting_up_to_date = accounting_up_to_date
@@ -75,6 +80,7 @@ class DashboardData:
         self.account_metrics = account_metrics
         self.aggregated_metrics = aggregated_metrics
         self.forecast_versions = forecast_versions
+        self.seasonal_naive_data = seasonal_naive_data
         
         # Compute common and all accounts
         if forecasts:
@@ -100,7 +106,7 @@ def load_company_dashboard_data(
     
     Loads:
     1. Company metadata from company.json
-    2. Train and test data from FEC files
+    2. Train and test data from FEC files (plus the seasonal naive baseline)
     3. Forecast results for all versions
     4. Metrics for each forecast version
     
@@ -180,6 +186,14 @@ def load_company_dashboard_data(
     ).fillna(0)
     test_data.index.name = 'ds'
     
+    # Seasonal naive baseline (same construction as the metrics pipeline)
+    seasonal_naive_data = None
+    if len(train_data) >= forecast_horizon:
+        seasonal_naive_data = generate_seasonal_naive(
+            train_data,
+            forecast_horizon=forecast_horizon
+        )
+    
     # 3. Load forecasts for all versions
     forecasts: Dict[str, pd.DataFrame] = {}
     forecast_lower: Dict[str, Optional[pd.DataFrame]] = {}
@@ -235,7 +249,8 @@ def load_company_dashboard_data(
         forecast_upper=forecast_upper,
         account_metrics=account_metrics,
         aggregated_metrics=aggregated_metrics,
-        forecast_versions=forecast_versions
+        forecast_versions=forecast_versions,
+        seasonal_naive_data=seasonal_naive_data
     )
 
 
@@ -0,0 +1,139 @@
+"""
+Bounded memoization for dashboard callback payloads.
+
+The dashboard data is loaded once at startup and never changes while the
+server runs, so the figure and metrics table produced for a given selection
+can be reused as long as the set of forecast versions is the same.
+"""
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+
+CacheKey = Tuple[str, str, Tuple[Tuple[str, str], ...]]
+
+
+def make_cache_key(
+    company_id: str,
+    selected_value: Optional[str],
+    version_set: Iterable[Tuple[str, str]]
+) -> CacheKey:
+    """
+    Build a cache key for a dashboard selection.
+
+    Parameters
+    ----------
+    company_id : str
+        Company identifier.
+    selected_value : Optional[str]
+        Selected dropdown value (account number or "AGG:<type>").
+    version_set : Iterable[Tuple[str, str]]
+        (version_name, process_id) pairs of the loaded forecast versions.
+
+    Returns
+    -------
+    CacheKey
+        Hashable key. The version set is sorted so that its order does not matter.
+
+    Examples
+    --------
+    >>> make_cache_key("RESTO - 1", "707000", [("TabPFN-v1.0", "abc")])
+    ('RESTO - 1', '707000', (('TabPFN-v1.0', 'abc'),))
+    """
+    return (company_id, selected_value or "", tuple(sorted(version_set)))
+
+
+class CallbackCache:
+    """
+    Thread-safe LRU cache with hit/miss counters.
+
+    Parameters
+    ----------
+    max_entries : int, default=256
+        Maximum number of payloads kept. The least recently used entry is
+        evicted when the cache is full.
+
+    Examples
+    --------
+    >>> cache = CallbackCache(max_entries=2)
+    >>> cache.get_or_compute(("a",), lambda: 1)
+    1
+    >>> cache.get_or_compute(("a",), lambda: 2)
+    1
+    >>> cache.stats()
+    {'hits': 1, 'misses': 1, 'size': 1, 'max_entries': 2}
+    """
+
+    def __init__(self, max_entries: int = 256):
+        """Initialize an empty cache."""
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = Lock()
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        Return the cached payload for key, computing and storing it on a miss.
+
+        Parameters
+        ----------
+        key : Hashable
+            Cache key (see make_cache_key).
+        compute : Callable[[], Any]
+            Function producing the payload when it is not cached.
+
+        Returns
+        -------
+        Any
+            Cached or freshly computed payload.
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+
+        # Compute outside the lock so a slow payload does not block other keys
+        value = compute()
+
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+        return value
+
+    def clear(self) -> None:
+        """Remove all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return cache statistics.
+
+        Returns
+        -------
+        Dict[str, int]
+            Dictionary with 'hits', 'misses', 'size' and 'max_entries'.
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self._entries),
+                'max_entries': self.max_entries,
+            }
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return len(self._entries)
@@ -13,7 +13,7 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from src.data.fec_loader import formatage, import_fecs, load_fecs
+from src.data.fec_loader import encode_accounts, formatage, import_fecs, load_fecs, parse_amounts, parse_fec_dates
 
 
 # ============================================================================
@@ -120,6 +120,55 @@ def test_formatage_converts_dates_to_datetime(sample_raw_fec_data):
     assert pd.api.types.is_datetime64_any_dtype(result['ValidDate'])
 
 
+def test_formatage_amounts_in_cents(sample_raw_fec_data):
+    """Test that amounts can be parsed to int64 cents."""
+    result = formatage(sample_raw_fec_data, amounts_in_cents=True)
+
+    assert result['Debit'].dtype == np.int64
+    assert result['Debit'].tolist() == [0, 150050, 120000]
+    assert result['Credit'].tolist() == [500000, 0, 0]
+
+
+def test_parse_amounts_in_cents_rounds_each_amount():
+    """Test cents parsing of unusual decimals, signs and missing amounts."""
+    values = pd.Series(['0,1', '-12,50', '1234567,89', '3', np.nan, '0,07'])
+
+    assert parse_amounts(values, in_cents=True).tolist() == [10, -1250, 123456789, 300, 0, 7]
+    assert parse_amounts(values).iloc[1] == -12.5
+
+
+def test_encode_accounts_truncates_distinct_accounts():
+    """Test that accounts are encoded as codes into sorted, truncated accounts."""
+    values = pd.Series(['70700000', '601000', np.nan, '707000', '6011'], index=[3, 4, 5, 6, 7])
+
+    result = encode_accounts(values)
+
+    assert list(result.cat.categories) == ['601000', '6011', '707000']
+    assert result.cat.codes.tolist() == [2, 0, -1, 2, 1]
+    assert result.index.tolist() == [3, 4, 5, 6, 7]
+    assert result.tolist()[:2] == ['707000', '601000']
+
+
+def test_parse_fec_dates_matches_full_column_parse():
+    """Test that parsing distinct dates gives the same column as pd.to_datetime."""
+    columns = [
+        pd.Series(['20230105', '', '20230101', '20230105', ''], index=[3, 4, 7, 8, 9], name='DateLet'),
+        pd.Series([20230101, 20231231, 20230101]),
+        pd.Series([np.nan, np.nan]),
+        pd.Series([20230101.0, np.nan]),
+        pd.Series([], dtype=object),
+    ]
+
+    for values in columns:
+        pd.testing.assert_series_equal(parse_fec_dates(values), pd.to_datetime(values, format="%Y%m%d"))
+
+
+def test_parse_fec_dates_rejects_invalid_dates():
+    """Test that an invalid date still raises."""
+    with pytest.raises(ValueError):
+        parse_fec_dates(pd.Series(['20230101', '2023-01-02']))
+
+
 def test_formatage_converts_compte_num_to_string(sample_raw_fec_data):
     """Test that CompteNum is converted to string."""
     result = formatage(sample_raw_fec_data)
@@ -296,6 +345,7 @@ def test_load_fecs_truncates_account_numbers(temp_fec_directory):
         
         fecs, _ = load_fecs(company_id, tmpdir, train_test_split=False)
         assert fecs['CompteNum'].iloc[0] == '707000'  # Truncated to 6
+        assert isinstance(fecs['CompteNum'].dtype, pd.CategoricalDtype)
 
 
 def test_load_fecs_filters_by_accounting_date(temp_fec_directory):
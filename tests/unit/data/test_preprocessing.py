@@ -14,7 +14,7 @@ from src.data.preprocessing import (
     fec_to_monthly_totals,
     PreprocessingResult
 )
-from src.data.account_classifier import load_classification_charges
+from src.data.account_classifier import get_account_type_prefixes, get_account_types, load_classification_charges
 from src.config import preprocessing_config as config
 
 
@@ -498,6 +498,48 @@ def test_fec_to_monthly_totals_uses_month_start(sample_formatted_fecs):
     assert (result['PieceDate'].dt.day == 1).all()
 
 
+def test_fec_to_monthly_totals_sums_cents_exactly():
+    """Test that amounts in cents give exact monthly totals in euros."""
+    fecs = pd.DataFrame({
+        'PieceDate': pd.to_datetime(['2023-01-05'] * 3 + ['2023-01-06'] * 2),
+        'CompteNum': ['601000'] * 3 + ['707000'] * 2,
+        'Debit': [10, 20, 0, 0, 5],
+        'Credit': [0, 0, 0, 1000, 0],
+    })
+
+    result = fec_to_monthly_totals(fecs).set_index('CompteNum')['Solde']
+
+    assert result.dtype == float
+    assert result['601000'] == 0.3
+    assert result['707000'] == 9.95
+
+    # The same amounts in euros accumulate float rounding noise
+    floats = fecs.assign(Debit=fecs['Debit'] / 100, Credit=fecs['Credit'] / 100)
+    assert fec_to_monthly_totals(floats).set_index('CompteNum')['Solde']['601000'] != 0.3
+
+
+def test_fec_to_monthly_totals_with_categorical_accounts(sample_formatted_fecs):
+    """Test that categorical accounts (see load_fecs) give the same totals as strings."""
+    categorical = sample_formatted_fecs.assign(
+        CompteNum=sample_formatted_fecs['CompteNum'].astype('category')
+    )
+
+    result = fec_to_monthly_totals(categorical)
+
+    pd.testing.assert_frame_equal(result, fec_to_monthly_totals(sample_formatted_fecs))
+    assert result['CompteNum'].dtype == object
+
+
+def test_get_account_types_per_distinct_account(classification_charges):
+    """Test vectorized account types, None for accounts of no known type."""
+    prefixes = get_account_type_prefixes(classification_charges)
+    accounts = pd.Series(['601000', '707030', '601000', '411000'], dtype='category')
+
+    result = get_account_types(accounts, prefixes)
+
+    assert result.tolist() == ['variable_expenses', 'revenue', 'variable_expenses', None]
+
+
 def test_fec_to_monthly_totals_empty_fec():
     """Test fec_to_monthly_totals with empty FEC."""
     empty_fec = pd.DataFrame(columns=['PieceDate', 'CompteNum', 'Debit', 'Credit'])
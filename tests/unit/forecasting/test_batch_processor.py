@@ -2,6 +2,7 @@
 Tests for batch processor.
 """
 
+import threading
 from unittest.mock import Mock, patch, MagicMock
 import pandas as pd
 import pytest
@@ -37,8 +38,8 @@ def mock_dependencies():
         preprocessing_result.forecastable_accounts = ['707000', '601000']
         dates = pd.date_range('2023-01-01', periods=24, freq='MS')
         preprocessing_result.filtered_data_wide_format = pd.DataFrame({
-            '707000': [1000.0] * 24,
-            '601000': [500.0] * 24
+            '707000': [1000.0 + (i % 5) * 150 for i in range(24)],
+            '601000': [500.0 + (i % 4) * 90 for i in range(24)]
         }, index=dates)
         preprocessing_result.filtered_data_wide_format.index.name = 'ds'
         mock_preprocess.return_value = preprocessing_result
@@ -171,3 +172,417 @@ def test_process_companies_processes_all_companies(mock_dependencies):
     company_ids = [r['company_id'] for r in results]
     assert 'TEST-COMPANY-1' in company_ids
     assert 'TEST-COMPANY-2' in company_ids
+
+
+def test_process_company_reports_stage_timings(mock_dependencies):
+    """Test that each pipeline stage is timed in the result."""
+    processor = BatchProcessor(mode='local')
+    result = processor.process_company('TEST-COMPANY')
+    
+    stages = result['stages']
+    for stage in ['load', 'monthly_totals', 'preprocess', 'save', 'metadata']:
+        assert stage in stages
+        assert stages[stage]['wall_seconds'] >= 0
+    assert result['total_time'] >= 0
+    
+    # The forecaster receives the timer to record convert/predict/extract
+    forecaster = mock_dependencies['forecaster'].return_value
+    assert 'timer' in forecaster.forecast.call_args.kwargs
+
+
+def test_process_company_error_keeps_stage_timings(mock_dependencies):
+    """Test that stages completed before an error are reported."""
+    mock_dependencies['preprocess'].side_effect = Exception("Test error")
+    
+    processor = BatchProcessor(mode='local')
+    result = processor.process_company('TEST-COMPANY')
+    
+    assert set(result['stages']) == {'load', 'monthly_totals', 'preprocess'}
+
+
+def _echo_forecast(data_wide, prediction_length, quantiles=None, timer=None):
+    """Forecast returning the last value of every column (keeps column names)."""
+    dates = pd.date_range('2025-01-01', periods=prediction_length, freq='MS')
+    forecast_df = pd.DataFrame(
+        {column: [data_wide[column].iloc[-1]] * prediction_length for column in data_wide.columns},
+        index=dates
+    )
+    result = Mock()
+    result.accounts = list(data_wide.columns)
+    result.elapsed_time = 4.0
+    result.prediction_length = prediction_length
+    result.forecast_df = forecast_df
+    result.forecast_lower_df = forecast_df - 1
+    result.forecast_upper_df = forecast_df + 1
+    return result
+
+
+def test_process_batch_uses_one_shared_forecast_call(mock_dependencies):
+    """Test that a shared batch runs one forecast and saves each company separately."""
+    forecaster = mock_dependencies['forecaster'].return_value
+    forecaster.forecast.side_effect = _echo_forecast
+    
+    processor = BatchProcessor(mode='local')
+    results = processor.process_batch(['A', 'B'])
+    
+    assert forecaster.forecast.call_count == 1
+    assert list(forecaster.forecast.call_args.kwargs['data_wide'].columns) == [
+        'A::707000', 'A::601000', 'B::707000', 'B::601000'
+    ]
+    
+    assert [r['company_id'] for r in results] == ['A', 'B']
+    assert all(r['status'] == 'Success' and r['shared_batch_size'] == 2 for r in results)
+    assert results[0]['elapsed_time'] == pytest.approx(2.0)
+    
+    saved = mock_dependencies['save_ci'].call_args_list
+    assert [call.kwargs['company_id'] for call in saved] == ['A', 'B']
+    assert list(saved[0].kwargs['median_df'].columns) == ['707000', '601000']
+
+
+def test_process_batch_reports_failures_per_company(mock_dependencies):
+    """Test that a company failing to load does not stop the rest of the batch."""
+    mock_dependencies['forecaster'].return_value.forecast.side_effect = _echo_forecast
+    info = mock_dependencies['info'].return_value
+    
+    def get_info(company_id, data_folder):
+        if company_id == 'B':
+            raise FileNotFoundError('missing')
+        return info
+    
+    mock_dependencies['info'].side_effect = get_info
+    
+    processor = BatchProcessor(mode='local')
+    results = processor.process_batch(['A', 'B', 'C'])
+    
+    assert [r['status'] for r in results] == ['Success', 'Error: missing', 'Success']
+
+
+def test_process_companies_follows_batches(mock_dependencies):
+    """Test that process_companies processes companies in batch order."""
+    mock_dependencies['forecaster'].return_value.forecast.side_effect = _echo_forecast
+    
+    processor = BatchProcessor(mode='local')
+    results = processor.process_companies(['A', 'B', 'C'], batches=[['C'], ['A', 'B']])
+    
+    assert [r['company_id'] for r in results] == ['C', 'A', 'B']
+    assert 'shared_batch_size' not in results[0]
+    
+    with pytest.raises(ValueError):
+        processor.process_companies(['A', 'B'], batches=[['A']])
+
+
+def test_process_companies_reports_each_result(mock_dependencies):
+    """Test that on_result is called as each company completes."""
+    recorded = []
+    
+    processor = BatchProcessor(mode='local')
+    results = processor.process_companies(['A', 'B'], on_result=recorded.append)
+    
+    assert recorded == results
+
+
+def test_process_companies_with_concurrent_client(mock_dependencies):
+    """Test that a ConcurrentForecastClient forecasts companies in parallel."""
+    from src.forecasting.concurrent_client import ConcurrentForecastClient
+    
+    inner = Mock()
+    inner.forecast.side_effect = _echo_forecast
+    client = ConcurrentForecastClient(inner, max_in_flight=2)
+    
+    processor = BatchProcessor(mode='client', forecaster=client)
+    results = processor.process_companies(['A', 'B', 'C'], batches=[['A'], ['B', 'C']])
+    client.close()
+    
+    assert sorted(r['company_id'] for r in results) == ['A', 'B', 'C']
+    assert all(r['status'] == 'Success' for r in results)
+    assert inner.forecast.call_count == 2
+
+
+@pytest.mark.parametrize('method, expected', [('zero', 0.0), ('naive', 300.0)])
+def test_process_company_skips_inactive_accounts(mock_dependencies, method, expected):
+    """Test that inactive accounts are not sent to the forecaster but still saved."""
+    forecaster = mock_dependencies['forecaster'].return_value
+    forecaster.forecast.side_effect = _echo_forecast
+    preprocessing_result = mock_dependencies['preprocess'].return_value
+    data_wide = preprocessing_result.filtered_data_wide_format
+    data_wide.insert(1, '606000', [300.0] * 6 + [None] * 18)
+    
+    processor = BatchProcessor(mode='local', inactive_accounts=method)
+    result = processor.process_company('TEST-COMPANY')
+    
+    assert list(forecaster.forecast.call_args.kwargs['data_wide'].columns) == ['707000', '601000']
+    assert result['accounts_forecasted'] == 3
+    assert result['model_accounts'] == 2
+    assert result['closed_form_accounts'] == {'Zero' if method == 'zero' else 'Naive': 1}
+    
+    saved = mock_dependencies['save_ci'].call_args.kwargs
+    assert list(saved['median_df'].columns) == ['707000', '606000', '601000']
+    assert (saved['median_df']['606000'] == expected).all()
+    assert (saved['lower_df']['606000'] == expected).all()
+    
+    metadata = mock_dependencies['update'].call_args.kwargs['account_metadata']
+    assert metadata['606000']['forecast_type'] == ('Zero' if method == 'zero' else 'Naive')
+    assert metadata['707000']['forecast_type'] == 'TabPFN'
+
+
+@pytest.mark.parametrize('options', [{}, {'inactive_accounts': 'tabpfn'}])
+def test_process_company_can_forecast_inactive_accounts_with_tabpfn(mock_dependencies, options):
+    """Test that inactive_accounts='tabpfn', the default, keeps every account in the forecaster input."""
+    forecaster = mock_dependencies['forecaster'].return_value
+    forecaster.forecast.side_effect = _echo_forecast
+    data_wide = mock_dependencies['preprocess'].return_value.filtered_data_wide_format
+    data_wide['606000'] = [300.0] * 6 + [None] * 18
+    
+    processor = BatchProcessor(mode='local', **options)
+    result = processor.process_company('TEST-COMPANY')
+    
+    assert '606000' in forecaster.forecast.call_args.kwargs['data_wide'].columns
+    assert result['closed_form_accounts'] == {}
+
+
+def test_process_company_forecasts_simple_patterns_without_model(mock_dependencies):
+    """Test that simple-pattern accounts get closed-form forecasts and metadata."""
+    forecaster = mock_dependencies['forecaster'].return_value
+    forecaster.forecast.side_effect = _echo_forecast
+    data_wide = mock_dependencies['preprocess'].return_value.filtered_data_wide_format
+    data_wide['613200'] = 800.0
+    mock_dependencies['preprocess'].return_value.forecastable_accounts = ['707000', '601000', '613200']
+    
+    processor = BatchProcessor(mode='local', use_simple_patterns=True)
+    result = processor.process_company('TEST-COMPANY')
+    
+    assert list(forecaster.forecast.call_args.kwargs['data_wide'].columns) == ['707000', '601000']
+    assert result['closed_form_accounts'] == {'Constant': 1}
+    saved = mock_dependencies['save_ci'].call_args.kwargs
+    assert (saved['median_df']['613200'] == 800.0).all()
+    metadata = mock_dependencies['update'].call_args.kwargs['account_metadata']
+    assert metadata['613200']['forecast_type'] == 'Constant'
+    
+    # Without simple patterns (the default), the account goes to the model
+    BatchProcessor(mode='local').process_company('TEST-COMPANY')
+    assert '613200' in forecaster.forecast.call_args.kwargs['data_wide'].columns
+
+
+def test_process_company_without_model_accounts(mock_dependencies):
+    """Test that a company with only simple accounts is saved without a forecast call."""
+    forecaster = mock_dependencies['forecaster'].return_value
+    dates = pd.date_range('2023-01-01', periods=24, freq='MS')
+    preprocessing_result = mock_dependencies['preprocess'].return_value
+    preprocessing_result.filtered_data_wide_format = pd.DataFrame({'613200': [800.0] * 24}, index=dates)
+    preprocessing_result.forecastable_accounts = ['613200']
+    
+    processor = BatchProcessor(mode='local', use_simple_patterns=True)
+    results = processor.process_batch(['A', 'B'])
+    
+    forecaster.forecast.assert_not_called()
+    assert [r['status'] for r in results] == ['Success', 'Success']
+    saved = mock_dependencies['save_ci'].call_args.kwargs
+    assert saved['median_df'].index[0] == pd.Timestamp('2025-01-01')
+    assert (saved['median_df']['613200'] == 800.0).all()
+
+
+def test_pipeline_saves_closed_form_companies_in_saver_thread(mock_dependencies):
+    """Test that companies without model accounts are written by the saving stage only."""
+    dates = pd.date_range('2023-01-01', periods=24, freq='MS')
+    preprocessing_result = mock_dependencies['preprocess'].return_value
+    preprocessing_result.filtered_data_wide_format = pd.DataFrame({'613200': [800.0] * 24}, index=dates)
+    preprocessing_result.forecastable_accounts = ['613200']
+    writers = []
+    mock_dependencies['save_ci'].side_effect = lambda **kwargs: writers.append(threading.current_thread().name)
+    
+    processor = BatchProcessor(mode='local', use_simple_patterns=True, prefetch=1)
+    results = processor.process_companies(['A', 'B'])
+    
+    assert [r['status'] for r in results] == ['Success', 'Success']
+    assert writers == ['forecast-saver', 'forecast-saver']
+    assert all('save' in r['stages'] for r in results)
+
+
+def test_process_companies_overlaps_loading_with_forecasting(mock_dependencies):
+    """Test that the next company loads while the current one is forecasted."""
+    import threading
+    
+    next_loading = threading.Event()
+    info = mock_dependencies['info'].return_value
+    
+    def get_info(company_id, data_folder):
+        if company_id == 'B':
+            next_loading.set()
+        return info
+    
+    overlapped = []
+    
+    def forecast(data_wide, prediction_length, quantiles=None, timer=None):
+        if not overlapped:
+            overlapped.append(next_loading.wait(timeout=5))
+        return _echo_forecast(data_wide, prediction_length)
+    
+    mock_dependencies['info'].side_effect = get_info
+    mock_dependencies['forecaster'].return_value.forecast.side_effect = forecast
+    
+    processor = BatchProcessor(mode='local', prefetch=1, save_queue_size=1)
+    results = processor.process_companies(['A', 'B', 'C'])
+    
+    assert overlapped == [True]
+    assert [r['company_id'] for r in results] == ['A', 'B', 'C']
+    assert all(r['status'] == 'Success' for r in results)
+
+
+def test_process_companies_without_pipeline(mock_dependencies):
+    """Test that prefetch=0 processes companies one after the other."""
+    processor = BatchProcessor(mode='local', prefetch=0)
+    results = processor.process_companies(['A', 'B'])
+    
+    assert [r['company_id'] for r in results] == ['A', 'B']
+    assert all(r['status'] == 'Success' for r in results)
+
+
+def test_process_companies_pipeline_propagates_result_handler_errors(mock_dependencies):
+    """Test that an error while handling a result stops the pipeline."""
+    def on_result(result):
+        raise OSError('disk full')
+    
+    processor = BatchProcessor(mode='local')
+    
+    with pytest.raises(OSError, match='disk full'):
+        processor.process_companies(['A', 'B', 'C'], on_result=on_result)
+
+
+@pytest.mark.parametrize('prefetch', [0, 2])
+def test_iter_companies_yields_in_memory_forecasts(mock_dependencies, prefetch):
+    """Test that iter_companies yields each result with its forecast."""
+    mock_dependencies['forecaster'].return_value.forecast.side_effect = _echo_forecast
+    
+    processor = BatchProcessor(mode='local', prefetch=prefetch)
+    outcomes = list(processor.iter_companies(['A', 'B', 'C'], batches=[['A'], ['B', 'C']]))
+    
+    assert [outcome.company_id for outcome in outcomes] == ['A', 'B', 'C']
+    for outcome in outcomes:
+        assert outcome.result['status'] == 'Success'
+        assert list(outcome.forecast_result.forecast_df.columns) == ['707000', '601000']
+        assert outcome.prepared.preprocessing_result is mock_dependencies['preprocess'].return_value
+
+
+def test_iter_companies_stops_when_closed(mock_dependencies):
+    """Test that breaking out of iter_companies stops processing."""
+    processor = BatchProcessor(mode='local', prefetch=1, save_queue_size=1)
+    
+    for outcome in processor.iter_companies([f'C{i}' for i in range(20)]):
+        break
+    
+    assert outcome.company_id == 'C0'
+    assert mock_dependencies['save_ci'].call_count < 20
+
+
+@pytest.mark.parametrize('prefetch', [0, 1])
+def test_iter_companies_records_each_saved_company(mock_dependencies, prefetch):
+    """Test that on_result runs in the processing thread for every saved company."""
+    recorded = []
+    threads = set()
+    
+    def on_result(result):
+        recorded.append(result['company_id'])
+        threads.add(threading.current_thread().name)
+    
+    processor = BatchProcessor(mode='local', prefetch=prefetch, save_queue_size=1)
+    for outcome in processor.iter_companies([f'C{i}' for i in range(20)], on_result=on_result):
+        break
+    
+    # Companies saved after the consumer stopped are recorded too
+    assert recorded[0] == 'C0'
+    assert len(recorded) == mock_dependencies['save_ci'].call_count
+    assert threading.current_thread().name not in threads
+
+
+def test_iter_companies_failed_company_has_no_forecast(mock_dependencies):
+    """Test that a failed company is yielded without a forecast."""
+    mock_dependencies['load_fecs'].side_effect = FileNotFoundError('missing')
+    
+    processor = BatchProcessor(mode='local')
+    outcome, = processor.iter_companies(['A'])
+    
+    assert outcome.result['status'].startswith('Error')
+    assert outcome.prepared is None
+    assert outcome.forecast_result is None
+
+
+def test_process_company_with_metrics_writes_company_json_once(mock_dependencies):
+    """Test that metrics are computed in memory and saved with the forecast version."""
+    metrics = {
+        'account_metrics': {'707000': {'metrics': {'MAPE': 4.0}}},
+        'aggregated_metrics': {'net_income': {'MAPE': 2.0}},
+    }
+    with patch('src.forecasting.batch_processor.compute_metrics_from_frames', return_value=metrics) as mock_metrics:
+        processor = BatchProcessor(mode='local', with_metrics=True)
+        result = processor.process_company('RESTO - 1')
+    
+    assert result['metrics_status'] == 'Success'
+    assert mock_metrics.call_args.kwargs['monthly_test'] is mock_dependencies['monthly'].return_value
+    assert list(mock_metrics.call_args.kwargs['forecast_df'].columns) == ['707000', '601000']
+    
+    mock_dependencies['update'].assert_called_once()
+    kwargs = mock_dependencies['update'].call_args.kwargs
+    assert kwargs['metrics'] == {'net_income': {'MAPE': 2.0}}
+    assert kwargs['account_metadata']['707000']['metrics'] == {'MAPE': 4.0}
+    assert 'metrics' not in kwargs['account_metadata']['601000']
+
+
+def test_process_company_saves_forecast_when_metrics_fail(mock_dependencies):
+    """Test that a metrics error does not fail the company."""
+    with patch('src.forecasting.batch_processor.compute_metrics_from_frames', side_effect=KeyError('PieceDate')):
+        processor = BatchProcessor(mode='local', with_metrics=True)
+        result = processor.process_company('RESTO - 1')
+    
+    assert result['status'] == 'Success'
+    assert result['metrics_status'].startswith('Error')
+    assert mock_dependencies['update'].call_args.kwargs['metrics'] is None
+
+
+def _engine_forecaster(offset):
+    """Forecaster returning real ForecastResults shifted by offset."""
+    from src.forecasting.tabpfn_forecaster import ForecastResult
+    
+    def forecast(data_wide, prediction_length, quantiles=None, timer=None):
+        echo = _echo_forecast(data_wide, prediction_length)
+        return ForecastResult(
+            forecast_df=echo.forecast_df + offset,
+            forecast_lower_df=echo.forecast_lower_df + offset,
+            forecast_upper_df=echo.forecast_upper_df + offset,
+            accounts=echo.accounts,
+            prediction_length=prediction_length,
+            elapsed_time=1.0
+        )
+    
+    forecaster = Mock()
+    forecaster.forecast.side_effect = forecast
+    return forecaster
+
+
+@pytest.mark.parametrize('engine_output,expected_versions', [
+    ('versions', ['TabPFN-v1.0', 'Seasonal Naive-v1.0']),
+    ('ensemble', ['Ensemble-v1.0']),
+    ('both', ['Ensemble-v1.0', 'TabPFN-v1.0', 'Seasonal Naive-v1.0']),
+])
+def test_process_batch_saves_a_version_per_engine(mock_dependencies, engine_output, expected_versions):
+    """Test that several engines are preprocessed once and saved as labelled versions."""
+    from src.forecasting.multi_engine import MultiEngineForecaster
+    
+    forecaster = MultiEngineForecaster({'tabpfn': _engine_forecaster(0.0), 'seasonal_naive': _engine_forecaster(100.0)})
+    processor = BatchProcessor(mode='local', forecaster=forecaster, engine_output=engine_output)
+    results = processor.process_batch(['A', 'B'])
+    
+    assert mock_dependencies['preprocess'].call_count == 2
+    assert all(r['status'] == 'Success' for r in results)
+    assert list(results[0]['versions']) == expected_versions
+    
+    updates = [call.kwargs for call in mock_dependencies['update'].call_args_list if call.kwargs['company_id'] == 'A']
+    assert [update['version_name'] for update in updates] == expected_versions
+    for update in updates:
+        label = update['version_name'].rsplit('-v', 1)[0]
+        assert {meta['forecast_type'] for meta in update['account_metadata'].values()} == {label}
+    
+    saved = [call.kwargs for call in mock_dependencies['save_ci'].call_args_list if call.kwargs['company_id'] == 'A']
+    medians = {update['version_name']: save['median_df'] for update, save in zip(updates, saved)}
+    if engine_output == 'both':
+        expected = (medians['TabPFN-v1.0'] + medians['Seasonal Naive-v1.0']) / 2
+        pd.testing.assert_frame_equal(medians['Ensemble-v1.0'], expected)
@@ -0,0 +1,76 @@
+"""
+Tests for the forecasting CLI helpers.
+"""
+
+import argparse
+
+from src.forecasting.cli import get_run_settings, restore_run_settings
+
+
+def _args(**overrides) -> argparse.Namespace:
+    """Parsed arguments with the CLI defaults."""
+    values = {
+        'tabpfn_mode': 'local',
+        'engine': ['tabpfn'],
+        'engine_output': 'versions',
+        'forecast_horizon': 12,
+        'schedule': 'size',
+        'max_batch_companies': 8,
+        'max_rows_per_call': 10000,
+        'chunk_workers': 1,
+        'inactive_accounts': 'tabpfn',
+        'simple_patterns': False,
+        'prefetch': 2,
+        'save_queue': 4,
+        'max_context_months': None,
+        'context_trimming': False,
+        'with_metrics': False,
+        'max_in_flight': 4,
+        'requests_per_second': None,
+        'request_timeout': 120.0,
+        'max_attempts': 3,
+    }
+    values.update(overrides)
+    return argparse.Namespace(**values)
+
+
+def test_get_run_settings_keeps_client_settings_to_client_mode():
+    """Test that client settings are only saved in client mode."""
+    assert 'max_in_flight' not in get_run_settings(_args())
+    assert get_run_settings(_args(tabpfn_mode='client'))['max_in_flight'] == 4
+
+
+def test_restore_run_settings_round_trips_every_setting():
+    """Test that a resumed run gets back all the settings it was started with."""
+    started = _args(
+        tabpfn_mode='client',
+        engine=['stub'],
+        inactive_accounts='zero',
+        simple_patterns=True,
+        max_context_months=36,
+        context_trimming=True,
+        with_metrics=True,
+        max_rows_per_call=0,
+        schedule='alphabetical',
+        prefetch=0,
+        max_in_flight=8,
+    )
+    resumed = _args()
+    
+    overridden = restore_run_settings(resumed, get_run_settings(started))
+    
+    assert resumed == started
+    assert overridden['inactive_accounts'] == ('zero', 'tabpfn')
+    assert overridden['context_trimming'] == (True, False)
+    assert 'forecast_horizon' not in overridden
+
+
+def test_restore_run_settings_keeps_arguments_missing_from_the_manifest():
+    """Test that older manifests only restore the settings they saved."""
+    args = _args(inactive_accounts='naive')
+    
+    overridden = restore_run_settings(args, {'mode': 'local', 'engine': 'stub'})
+    
+    assert args.engine == ['stub']
+    assert args.inactive_accounts == 'naive'
+    assert overridden == {'engine': (['stub'], ['tabpfn'])}
@@ -0,0 +1,181 @@
+"""
+Tests for concurrent client-mode forecasting.
+"""
+
+import time
+from unittest.mock import Mock
+
+import pandas as pd
+import pytest
+
+from benchmarks.stand_in_server import StandInPredictServer
+from src.forecasting.concurrent_client import ConcurrentForecastClient, RetryPolicy, TokenBucket
+from src.forecasting.profiling import StageTimer
+from src.forecasting.tabpfn_forecaster import TabPFNForecaster
+
+
+NO_BACKOFF = RetryPolicy(max_attempts=3, initial_backoff=0.0, jitter=0.0)
+
+
+@pytest.fixture
+def wide_df():
+    """Create a wide-format DataFrame with two accounts."""
+    dates = pd.date_range('2023-01-01', periods=24, freq='MS', name='ds')
+    return pd.DataFrame({'707000': [1000.0] * 24, '601000': [500.0] * 24}, index=dates)
+
+
+class FakeClock:
+    """Manually advanced clock whose sleep advances time."""
+    
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+    
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def test_token_bucket_limits_rate_after_burst():
+    """Test that requests beyond the burst wait for new tokens."""
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2.0, capacity=2, clock=clock, sleep=clock.sleep)
+    
+    waits = [bucket.acquire() for _ in range(4)]
+    
+    assert waits[:2] == [0.0, 0.0]
+    assert waits[2] == pytest.approx(0.5)
+    assert clock.now == pytest.approx(1.0)
+
+
+def test_retry_policy_backoff_is_capped():
+    """Test exponential backoff with an upper bound."""
+    policy = RetryPolicy(initial_backoff=1.0, backoff_factor=3.0, max_backoff=5.0, jitter=0.0)
+    
+    assert [policy.backoff(attempt) for attempt in (1, 2, 3)] == [1.0, 3.0, 5.0]
+
+
+def test_stand_in_forecast_round_trip(wide_df):
+    """Test that the stand-in server output goes through the forecaster unchanged."""
+    forecaster = TabPFNForecaster(mode='client', pipeline=StandInPredictServer(latency=0.0))
+    
+    result = forecaster.forecast(wide_df, prediction_length=6)
+    
+    assert result.forecast_df.shape == (6, 2)
+    assert result.forecast_df['707000'].iloc[0] == pytest.approx(1000.0)
+    assert (result.forecast_lower_df < result.forecast_upper_df).all().all()
+
+
+def test_client_keeps_requests_in_flight(wide_df):
+    """Test that submitted forecasts overlap up to max_in_flight."""
+    server = StandInPredictServer(latency=0.2)
+    client = ConcurrentForecastClient(TabPFNForecaster(mode='client', pipeline=server), max_in_flight=4)
+    
+    start = time.perf_counter()
+    with client:
+        futures = [client.submit(data_wide=wide_df, prediction_length=3) for _ in range(8)]
+        results = [future.result() for future in futures]
+    elapsed = time.perf_counter() - start
+    
+    assert len(results) == 8
+    assert server.peak_concurrency == 4
+    assert elapsed < 8 * 0.2
+    assert client.stats.requests == 8
+
+
+def test_client_retries_server_rejections(wide_df):
+    """Test that rejected requests are retried until they succeed."""
+    server = StandInPredictServer(latency=0.05, max_concurrency=1)
+    client = ConcurrentForecastClient(
+        TabPFNForecaster(mode='client', pipeline=server),
+        max_in_flight=3,
+        retry_policy=RetryPolicy(max_attempts=20, initial_backoff=0.02, jitter=0.5)
+    )
+    
+    with client:
+        futures = [client.submit(data_wide=wide_df, prediction_length=3) for _ in range(3)]
+        assert all(future.exception() is None for future in futures)
+    
+    assert server.rejected > 0
+    assert client.stats.retries == server.rejected
+
+
+def test_client_times_out_and_gives_up(wide_df):
+    """Test that slow requests time out and fail after max_attempts."""
+    client = ConcurrentForecastClient(
+        TabPFNForecaster(mode='client', pipeline=StandInPredictServer(latency=1.0)),
+        max_in_flight=1,
+        request_timeout=0.05,
+        retry_policy=RetryPolicy(max_attempts=2, initial_backoff=0.0, jitter=0.0)
+    )
+    
+    with pytest.raises(TimeoutError):
+        client.forecast(wide_df, prediction_length=3)
+    
+    assert client.stats.timeouts == 2
+    assert client.stats.failures == 1
+
+
+def test_timed_out_requests_keep_their_slot(wide_df):
+    """Test that abandoned requests still count towards max_in_flight."""
+    server = StandInPredictServer(latency=0.2)
+    client = ConcurrentForecastClient(
+        TabPFNForecaster(mode='client', pipeline=server),
+        max_in_flight=2,
+        request_timeout=0.05,
+        retry_policy=RetryPolicy(max_attempts=3, initial_backoff=0.0, jitter=0.0)
+    )
+    
+    with client:
+        futures = [client.submit(data_wide=wide_df, prediction_length=3) for _ in range(2)]
+        assert all(isinstance(future.exception(), TimeoutError) for future in futures)
+    
+    assert client.stats.requests == 6
+    assert server.peak_concurrency == 2
+
+
+def test_timed_out_request_does_not_write_to_timer(wide_df):
+    """Test that only the successful attempt records its stages."""
+    def slow_forecast(data_wide, prediction_length, quantiles, timer):
+        time.sleep(0.1)
+        timer.add('predict', 0.1)
+        return Mock()
+    
+    forecaster = Mock()
+    forecaster.forecast.side_effect = slow_forecast
+    client = ConcurrentForecastClient(
+        forecaster,
+        request_timeout=0.01,
+        retry_policy=RetryPolicy(max_attempts=1)
+    )
+    timer = StageTimer()
+    
+    with pytest.raises(TimeoutError):
+        client.forecast(wide_df, timer=timer)
+    time.sleep(0.2)
+    
+    assert timer.stages == []
+
+
+def test_client_retries_http_client_transport_errors(wide_df):
+    """Test that the network errors of the HTTP libraries are retried."""
+    requests = pytest.importorskip('requests')
+    forecaster = Mock()
+    forecaster.forecast.side_effect = [requests.exceptions.ConnectionError('reset'), 'result']
+    client = ConcurrentForecastClient(forecaster, retry_policy=NO_BACKOFF)
+    
+    assert client.forecast(wide_df) == 'result'
+    assert client.stats.retries == 1
+
+
+def test_client_does_not_retry_other_errors(wide_df):
+    """Test that non-transient errors fail immediately."""
+    forecaster = Mock()
+    forecaster.forecast.side_effect = ValueError("bad input")
+    client = ConcurrentForecastClient(forecaster, retry_policy=NO_BACKOFF)
+    
+    with pytest.raises(ValueError):
+        client.forecast(wide_df)
+    
+    assert forecaster.forecast.call_count == 1
@@ -0,0 +1,179 @@
+"""
+Tests for the persistent forecasting daemon.
+"""
+
+import os
+import sys
+import tempfile
+import threading
+from unittest.mock import MagicMock
+import pandas as pd
+import pytest
+
+# Mock the tabpfn_time_series module before importing our code
+sys.modules.setdefault('tabpfn_time_series', MagicMock())
+
+from src.forecasting.tabpfn_forecaster import ForecastResult
+from src.forecasting.daemon import (
+    DaemonClient,
+    ForecastDaemon,
+    is_daemon_running,
+)
+
+
+class FakeForecaster:
+    """Forecaster returning the last observed value for every account."""
+
+    mode = 'local'
+
+    def __init__(self):
+        self.calls = 0
+        self.job_settings = []
+
+    def with_settings(self, **settings):
+        self.job_settings.append(settings)
+        return self
+
+    def forecast(self, data_wide, prediction_length=12, quantiles=[0.1, 0.5, 0.9]):
+        self.calls += 1
+        if data_wide.empty:
+            raise ValueError("empty input")
+        dates = pd.date_range(
+            data_wide.index[-1] + pd.offsets.MonthBegin(1),
+            periods=prediction_length,
+            freq='MS'
+        )
+        forecast_df = pd.DataFrame(
+            {col: [data_wide[col].iloc[-1]] * prediction_length for col in data_wide.columns},
+            index=dates
+        )
+        forecast_df.index.name = 'ds'
+        return ForecastResult(
+            forecast_df=forecast_df,
+            forecast_lower_df=forecast_df - 1.5,
+            forecast_upper_df=None,
+            accounts=list(data_wide.columns),
+            prediction_length=prediction_length,
+            elapsed_time=0.25
+        )
+
+
+@pytest.fixture
+def running_daemon():
+    """Start a daemon with a fake forecaster on a temporary socket."""
+    socket_dir = tempfile.mkdtemp()
+    socket_path = os.path.join(socket_dir, 'daemon.sock')
+    forecaster = FakeForecaster()
+    daemon = ForecastDaemon(forecaster, socket_path=socket_path)
+    daemon.bind()
+    thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+    thread.start()
+
+    yield daemon, forecaster, socket_path
+
+    daemon.shutdown()
+    thread.join(timeout=5)
+    os.rmdir(socket_dir)
+
+
+@pytest.fixture
+def sample_wide_format_df():
+    """Create a sample wide-format DataFrame."""
+    dates = pd.date_range('2023-01-01', periods=24, freq='MS')
+    df = pd.DataFrame({
+        '707000': [1000.0 + i * 100.125 for i in range(24)],
+        '601000': [500.0] * 23 + [float('nan')],
+    }, index=dates)
+    df.index.name = 'ds'
+    return df
+
+
+def test_is_daemon_running(running_daemon):
+    """Test daemon detection on an active and a missing socket."""
+    _, _, socket_path = running_daemon
+
+    assert is_daemon_running(socket_path)
+    assert not is_daemon_running(socket_path + '.missing')
+
+
+def test_ping_reports_mode_and_jobs(running_daemon):
+    """Test that ping returns the forecaster mode and job count."""
+    _, _, socket_path = running_daemon
+
+    status = DaemonClient(socket_path).ping()
+
+    assert status['mode'] == 'local'
+    assert status['jobs_served'] == 0
+
+
+def test_forecast_round_trip(running_daemon, sample_wide_format_df):
+    """Test that forecasts are computed by the warm forecaster and returned intact."""
+    _, forecaster, socket_path = running_daemon
+    client = DaemonClient(socket_path)
+
+    first = client.forecast(sample_wide_format_df, prediction_length=6)
+    client.forecast(sample_wide_format_df, prediction_length=6)
+
+    assert isinstance(first, ForecastResult)
+    assert forecaster.calls == 2
+    assert first.accounts == ['707000', '601000']
+    assert first.forecast_df.shape == (6, 2)
+    assert first.forecast_df.index.name == 'ds'
+    assert first.forecast_df.index[0] == pd.Timestamp('2025-01-01')
+    assert first.forecast_df['707000'].iloc[0] == sample_wide_format_df['707000'].iloc[-1]
+    assert first.forecast_df['601000'].isna().all()
+    assert first.forecast_upper_df is None
+    assert first.elapsed_time == 0.25
+    assert client.ping()['jobs_served'] == 2
+
+
+def test_forecast_error_is_raised(running_daemon):
+    """Test that forecaster errors are reported to the client."""
+    _, _, socket_path = running_daemon
+    empty = pd.DataFrame(index=pd.DatetimeIndex([], name='ds'))
+
+    with pytest.raises(RuntimeError, match="empty input"):
+        DaemonClient(socket_path).forecast(empty)
+
+
+def test_shutdown_removes_socket(running_daemon):
+    """Test that a shutdown request stops the daemon."""
+    daemon, _, socket_path = running_daemon
+
+    DaemonClient(socket_path).shutdown()
+
+    for _ in range(50):
+        if not os.path.exists(socket_path):
+            break
+        threading.Event().wait(0.05)
+    assert not os.path.exists(socket_path)
+
+
+def test_second_daemon_refuses_active_socket(running_daemon):
+    """Test that binding an active socket raises an error."""
+    _, _, socket_path = running_daemon
+
+    with pytest.raises(RuntimeError, match="already running"):
+        ForecastDaemon(FakeForecaster(), socket_path=socket_path).bind()
+
+
+def test_forecast_without_shared_memory(running_daemon, sample_wide_format_df):
+    """Test that the input can still be serialized in the request."""
+    _, _, socket_path = running_daemon
+
+    shared = DaemonClient(socket_path).forecast(sample_wide_format_df, prediction_length=3)
+    serialized = DaemonClient(socket_path, shared_memory=False).forecast(sample_wide_format_df, prediction_length=3)
+
+    pd.testing.assert_frame_equal(shared.forecast_df, serialized.forecast_df)
+
+
+def test_forecast_applies_job_settings(running_daemon, sample_wide_format_df):
+    """Test that the settings of the client are applied to each of its jobs."""
+    _, forecaster, socket_path = running_daemon
+    settings = {'max_rows_per_call': None, 'chunk_workers': 2}
+
+    DaemonClient(socket_path).forecast(sample_wide_format_df, prediction_length=3)
+    DaemonClient(socket_path, settings=settings).forecast(sample_wide_format_df, prediction_length=3)
+
+    assert forecaster.job_settings == [settings]
+    assert forecaster.calls == 2
@@ -8,6 +8,9 @@ from src.forecasting.data_converter import (
     wide_to_tabpfn_format,
     tabpfn_output_to_wide_format,
     extract_quantiles_from_tabpfn_output,
+    combine_wide_frames,
+    split_wide_frame,
+    chunk_accounts,
 )
 
 
@@ -117,6 +120,35 @@ def test_wide_to_tabpfn_format_handles_nan_values():
     assert result['target'].isna().sum() == 2
 
 
+def test_wide_to_tabpfn_format_trims_leading_nan():
+    """Test that only the leading NaN run of each account is dropped."""
+    dates = pd.date_range('2023-01-01', periods=5, freq='MS')
+    df = pd.DataFrame({
+        '707000': [1000.0, None, 1200.0, None, 1400.0],
+        '601000': [None, None, 500.0, None, 700.0],
+        '602000': [None] * 5,
+    }, index=dates)
+    df.index.name = 'ds'
+    
+    result = wide_to_tabpfn_format(df, trim_leading_nan=True)
+    
+    counts = result.groupby('item_id', sort=False).size()
+    assert counts.to_dict() == {'707000': 5, '601000': 3, '602000': 5}
+    trimmed = result[result['item_id'] == '601000']
+    assert trimmed['timestamp'].iloc[0] == pd.Timestamp('2023-03-01')
+    assert trimmed['target'].tolist()[:1] == [500.0]
+    assert trimmed['target'].isna().sum() == 1
+
+
+def test_wide_to_tabpfn_format_caps_history(sample_wide_format_df):
+    """Test that max_history_months keeps the most recent months."""
+    result = wide_to_tabpfn_format(sample_wide_format_df, max_history_months=6)
+    
+    assert len(result) == 6 * len(sample_wide_format_df.columns)
+    assert result['timestamp'].min() == sample_wide_format_df.index[-6]
+    assert result['timestamp'].max() == sample_wide_format_df.index[-1]
+
+
 def test_tabpfn_output_to_wide_format_returns_correct_shape(sample_tabpfn_format_df):
     """Test that conversion back to wide format produces correct shape."""
     # Simulate TabPFN output format with predictions
@@ -374,3 +406,52 @@ def test_extract_quantiles_handles_single_account():
     assert upper_df.shape == (3, 1)
     assert list(median_df.columns) == accounts
 
+
+def test_extract_quantiles_with_other_bounds():
+    """Test extracting the interval of another quantile set."""
+    forecast_dates = pd.date_range('2024-01-01', periods=3, freq='MS')
+    
+    data = pd.DataFrame({
+        'target': [2200.0, 2300.0, 2400.0],
+        0.05: [2000.0, 2100.0, 2200.0],
+        0.5: [2200.0, 2300.0, 2400.0],
+        0.95: [2400.0, 2500.0, 2600.0],
+    }, index=pd.MultiIndex.from_product([['707000'], forecast_dates], 
+                                        names=['item_id', 'timestamp']))
+    
+    _, lower_df, upper_df = extract_quantiles_from_tabpfn_output(
+        data, ['707000'], lower_quantile=0.05, upper_quantile=0.95
+    )
+    
+    assert lower_df['707000'].tolist() == [2000.0, 2100.0, 2200.0]
+    assert upper_df['707000'].tolist() == [2400.0, 2500.0, 2600.0]
+
+
+
+def test_combine_and_split_wide_frames(sample_wide_format_df):
+    """Test that companies combined in a shared batch can be split back."""
+    other = sample_wide_format_df * 2
+    
+    combined = combine_wide_frames({'A': sample_wide_format_df, 'B': other})
+    
+    assert combined.shape[1] == 2 * sample_wide_format_df.shape[1]
+    assert combined.index.name == sample_wide_format_df.index.name
+    pd.testing.assert_frame_equal(split_wide_frame(combined, 'B'), other)
+
+
+def test_combine_wide_frames_requires_same_index(sample_wide_format_df):
+    """Test that frames with different indexes cannot be combined."""
+    with pytest.raises(ValueError):
+        combine_wide_frames({'A': sample_wide_format_df, 'B': sample_wide_format_df.iloc[1:]})
+
+
+def test_chunk_accounts_respects_row_budget():
+    """Test that chunks stay within the row budget and keep account order."""
+    accounts = [f'{600000 + i}' for i in range(10)]
+    
+    chunks = chunk_accounts(accounts, n_periods=12, max_rows=36)
+    
+    assert [len(chunk) for chunk in chunks] == [3, 3, 2, 2]
+    assert [account for chunk in chunks for account in chunk] == accounts
+    assert chunk_accounts(accounts, n_periods=12, max_rows=None) == [accounts]
+    assert chunk_accounts(accounts[:2], n_periods=500, max_rows=100) == [[accounts[0]], [accounts[1]]]
@@ -0,0 +1,119 @@
+"""
+Tests for forecast engines.
+"""
+
+import sys
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Mock the tabpfn_time_series module before importing our code
+sys.modules['tabpfn_time_series'] = MagicMock()
+
+from src.forecasting.engines import (
+    ENGINE_LABELS, ENGINES, SeasonalNaiveEngine, StubEngine, create_engine, engine_label, register_engine
+)
+from src.forecasting.tabpfn_forecaster import TabPFNForecaster
+
+
+@pytest.fixture
+def sample_wide_format_df():
+    """Wide-format DataFrame with a seasonal account and a short account."""
+    dates = pd.date_range('2022-01-01', periods=24, freq='MS')
+    df = pd.DataFrame({
+        '707000': [1000.0 + 100 * (i % 12) for i in range(24)],
+        '601000': [np.nan] * 20 + [500.0, 510.0, 520.0, 530.0],
+    }, index=dates)
+    df.index.name = 'ds'
+    return df
+
+
+def _long_format(df):
+    """Long-format context as built by DataConverter."""
+    long_df = df.reset_index().melt(id_vars='ds', var_name='item_id', value_name='target')
+    return long_df.rename(columns={'ds': 'timestamp'}).dropna(subset=['target'])
+
+
+def test_stub_engine_output_shape(sample_wide_format_df):
+    """Test that the stub engine returns the MultiIndex output of predict_df."""
+    engine = StubEngine()
+    output = engine.predict_df(_long_format(sample_wide_format_df), prediction_length=6, quantiles=[0.1, 0.5, 0.9])
+
+    assert list(output.index.names) == ['item_id', 'timestamp']
+    assert list(output.columns) == ['target', 0.1, 0.5, 0.9]
+    assert len(output) == 2 * 6
+    assert output.loc['707000'].index[0] == pd.Timestamp('2024-01-01')
+    assert engine.calls == 1
+
+
+def test_stub_engine_is_deterministic(sample_wide_format_df):
+    """Test that the stub engine forecasts the seasonal value with ordered quantiles."""
+    context = _long_format(sample_wide_format_df)
+    first = StubEngine().predict_df(context, prediction_length=12)
+    second = StubEngine().predict_df(context, prediction_length=12)
+
+    pd.testing.assert_frame_equal(first, second)
+    # Seasonal account: same month one year earlier
+    np.testing.assert_allclose(first.loc['707000', 'target'], [1000.0 + 100 * i for i in range(12)])
+    # Short account: last observed value where the previous year is missing
+    assert first.loc['601000', 'target'].iloc[0] == 530.0
+    assert (first[0.1] <= first[0.5]).all() and (first[0.5] <= first[0.9]).all()
+
+
+def test_seasonal_naive_engine_forecast(sample_wide_format_df):
+    """Test that the seasonal naive engine repeats last year without prediction interval."""
+    output = SeasonalNaiveEngine().predict_df(_long_format(sample_wide_format_df), prediction_length=15,
+                                              quantiles=[0.1, 0.5, 0.9])
+
+    assert list(output.index.names) == ['item_id', 'timestamp']
+    assert list(output.columns) == ['target']
+    # Seasonal account: same month one year earlier, repeated after a year
+    np.testing.assert_allclose(output.loc['707000', 'target'], [1000.0 + 100 * (i % 12) for i in range(15)])
+    # Short account: last observed value where the previous year is missing
+    np.testing.assert_allclose(output.loc['601000', 'target'],
+                               [530.0] * 8 + [500.0, 510.0, 520.0, 530.0] + [530.0] * 3)
+
+
+def test_seasonal_naive_forecast_has_no_bounds(sample_wide_format_df):
+    """Test that seasonal naive forecasts are independent of chunking and have no bounds."""
+    chunked = TabPFNForecaster(mode='local', engine='seasonal_naive', max_rows_per_call=20,
+                               trim_leading_nan=True).forecast(sample_wide_format_df, prediction_length=12)
+    single = TabPFNForecaster(mode='local', engine='seasonal_naive').forecast(sample_wide_format_df,
+                                                                              prediction_length=12)
+
+    pd.testing.assert_frame_equal(chunked.forecast_df, single.forecast_df)
+    assert single.forecast_lower_df is None
+    assert single.forecast_upper_df is None
+
+
+def test_create_engine():
+    """Test building engines by name."""
+    assert isinstance(create_engine('stub'), StubEngine)
+    assert isinstance(create_engine('seasonal_naive'), SeasonalNaiveEngine)
+    with pytest.raises(ValueError, match="Unknown engine"):
+        create_engine('unknown')
+
+
+def test_register_engine():
+    """Test that a registered engine can be built by name."""
+    register_engine('slow_stub', lambda: StubEngine(latency=0.001), label='Slow Stub')
+    try:
+        assert create_engine('slow_stub').latency == 0.001
+        assert engine_label('slow_stub') == 'Slow Stub'
+    finally:
+        del ENGINES['slow_stub']
+        del ENGINE_LABELS['slow_stub']
+
+
+def test_forecaster_with_stub_engine(sample_wide_format_df):
+    """Test a forecast through TabPFNForecaster with the stub engine."""
+    forecaster = TabPFNForecaster(mode='local', engine='stub', max_rows_per_call=20)
+    result = forecaster.forecast(sample_wide_format_df, prediction_length=12)
+
+    assert isinstance(forecaster.pipeline, StubEngine)
+    assert forecaster.pipeline.calls > 1
+    assert result.forecast_df.shape == (12, 2)
+    assert list(result.forecast_df.columns) == ['707000', '601000']
+    assert not result.forecast_df.isna().any().any()
@@ -0,0 +1,94 @@
+"""
+Tests for the multi-engine forecaster.
+"""
+
+import sys
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+
+# Mock the tabpfn_time_series module before importing our code
+sys.modules['tabpfn_time_series'] = MagicMock()
+
+from src.forecasting.engines import engine_label, version_name
+from src.forecasting.multi_engine import MultiEngineForecaster, ensemble_forecast
+from src.forecasting.profiling import StageTimer
+from src.forecasting.tabpfn_forecaster import ForecastResult, TabPFNForecaster
+
+
+@pytest.fixture
+def sample_wide_format_df():
+    """Wide-format DataFrame with two accounts over two years."""
+    dates = pd.date_range('2023-01-01', periods=24, freq='MS')
+    df = pd.DataFrame({
+        '707000': [1000.0 + 100 * (i % 12) for i in range(24)],
+        '601000': [500.0 + 10 * i for i in range(24)],
+    }, index=dates)
+    df.index.name = 'ds'
+    return df
+
+
+def _result(value, with_bounds=True):
+    """ForecastResult with a constant forecast."""
+    dates = pd.date_range('2025-01-01', periods=3, freq='MS')
+    forecast_df = pd.DataFrame({'707000': [value] * 3, '601000': [value / 2] * 3}, index=dates)
+    return ForecastResult(
+        forecast_df=forecast_df,
+        forecast_lower_df=forecast_df - 10 if with_bounds else None,
+        forecast_upper_df=forecast_df + 10 if with_bounds else None,
+        accounts=['707000', '601000'],
+        prediction_length=3,
+        elapsed_time=1.0
+    )
+
+
+def test_ensemble_forecast_averages_engines():
+    """Test that the ensemble is the mean of the engines' forecasts and bounds."""
+    ensemble = ensemble_forecast({'tabpfn': _result(100.0), 'seasonal_naive': _result(200.0)})
+
+    assert ensemble.engine == 'ensemble'
+    assert sorted(ensemble.engine_results) == ['seasonal_naive', 'tabpfn']
+    assert (ensemble.forecast_df['707000'] == 150.0).all()
+    assert (ensemble.forecast_lower_df['601000'] == 65.0).all()
+
+
+def test_ensemble_forecast_without_bounds():
+    """Test that the ensemble has no bounds unless every engine has them."""
+    ensemble = ensemble_forecast({'tabpfn': _result(100.0), 'other': _result(200.0, with_bounds=False)})
+
+    assert ensemble.forecast_lower_df is None
+    assert ensemble.forecast_upper_df is None
+
+
+def test_multi_engine_forecaster_runs_every_engine(sample_wide_format_df):
+    """Test that every engine forecasts the same input."""
+    forecaster = MultiEngineForecaster({
+        'seasonal_naive': TabPFNForecaster(mode='local', engine='seasonal_naive'),
+        'stub': TabPFNForecaster(mode='local', engine='stub'),
+    })
+    timer = StageTimer()
+    result = forecaster.forecast(sample_wide_format_df, prediction_length=12, timer=timer)
+
+    assert forecaster.engines == ['seasonal_naive', 'stub']
+    assert forecaster.mode == 'local'
+    assert {name: r.engine for name, r in result.engine_results.items()} == {
+        'seasonal_naive': 'seasonal_naive', 'stub': 'stub'
+    }
+    # Identical engines: the ensemble equals each of them
+    pd.testing.assert_frame_equal(result.forecast_df, result.engine_results['stub'].forecast_df)
+    assert list(timer.to_dict()) == ['predict']
+
+
+def test_multi_engine_forecaster_requires_an_engine():
+    """Test that an empty engine list is rejected."""
+    with pytest.raises(ValueError, match="At least one engine"):
+        MultiEngineForecaster({})
+
+
+def test_engine_labels():
+    """Test the labels written to company.json."""
+    assert engine_label('tabpfn') == 'TabPFN'
+    assert engine_label('seasonal_naive') == 'Seasonal Naive'
+    assert version_name('tabpfn') == 'TabPFN-v1.0'
+    assert version_name('ensemble') == 'Ensemble-v1.0'
@@ -0,0 +1,93 @@
+"""
+Tests for stage-level profiling.
+"""
+
+import json
+
+import pytest
+
+from src.forecasting.profiling import (
+    StageTimer,
+    new_run_id,
+    summarize_stages,
+    write_run_report,
+)
+
+
+def test_span_records_wall_cpu_and_rss():
+    """Test that a span records its measurements."""
+    timer = StageTimer()
+    
+    with timer.span('load'):
+        sum(range(10000))
+    
+    stages = timer.to_dict()
+    assert list(stages) == ['load']
+    assert stages['load']['wall_seconds'] >= 0
+    assert stages['load']['cpu_seconds'] >= 0
+    assert stages['load']['peak_rss_mb'] is None or stages['load']['peak_rss_mb'] > 0
+
+
+def test_span_accumulates_repeated_stages():
+    """Test that entering a stage twice sums its time."""
+    timer = StageTimer()
+    
+    with timer.span('predict'):
+        pass
+    first = timer.to_dict()['predict']['wall_seconds']
+    with timer.span('predict'):
+        pass
+    
+    assert len(timer.stages) == 1
+    assert timer.to_dict()['predict']['wall_seconds'] >= first
+
+
+def test_span_records_on_exception():
+    """Test that a failing stage is still recorded."""
+    timer = StageTimer()
+    
+    with pytest.raises(ValueError):
+        with timer.span('preprocess'):
+            raise ValueError("boom")
+    
+    assert 'preprocess' in timer.to_dict()
+
+
+def test_summarize_stages_orders_and_sums():
+    """Test stage totals across companies."""
+    results = [
+        {'stages': {
+            'save': {'wall_seconds': 1.0, 'cpu_seconds': 0.5, 'peak_rss_mb': 100.0},
+            'load': {'wall_seconds': 2.0, 'cpu_seconds': 1.0, 'peak_rss_mb': 90.0},
+        }},
+        {'stages': {
+            'load': {'wall_seconds': 3.0, 'cpu_seconds': 2.0, 'peak_rss_mb': 120.0},
+        }},
+        {'status': 'Error: no stages'},
+    ]
+    
+    totals = summarize_stages(results)
+    
+    assert list(totals) == ['load', 'save']
+    assert totals['load']['wall_seconds'] == 5.0
+    assert totals['load']['cpu_seconds'] == 3.0
+    assert totals['load']['peak_rss_mb'] == 120.0
+
+
+def test_write_run_report(tmp_path):
+    """Test that the run report is written under _runs/<run_id>."""
+    run_id = new_run_id()
+    results = [{
+        'company_id': 'RESTO - 1',
+        'status': 'Success',
+        'stages': {'load': {'wall_seconds': 1.5, 'cpu_seconds': 1.0, 'peak_rss_mb': 50.0}},
+    }]
+    
+    report_path = write_run_report(results, run_id, data_folder=str(tmp_path), settings={'mode': 'local'})
+    
+    assert report_path == tmp_path / '_runs' / run_id / 'report.json'
+    report = json.loads(report_path.read_text())
+    assert report['run_id'] == run_id
+    assert report['settings'] == {'mode': 'local'}
+    assert report['stage_totals']['load']['wall_seconds'] == 1.5
+    assert report['companies'][0]['company_id'] == 'RESTO - 1'
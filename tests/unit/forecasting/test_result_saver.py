@@ -251,6 +251,24 @@ def test_update_company_metadata_appends_to_existing_versions(temp_data_folder):
     assert company_data['forecast_versions'][1]['process_id'] == "process-2"
 
 
+
+def test_update_company_metadata_writes_metrics(temp_data_folder):
+    """Test that aggregated metrics are written with the version."""
+    metrics = {'net_income': {'MAPE': 5.0}, 'account_type': {}, 'forecast_type': {}}
+    
+    update_company_metadata(
+        company_id="TEST-COMPANY",
+        process_id="process-1",
+        account_metadata={},
+        data_folder=temp_data_folder,
+        metrics=metrics
+    )
+    
+    company_json_file = Path(temp_data_folder) / "TEST-COMPANY" / "company.json"
+    company_data = json.loads(company_json_file.read_text())
+    
+    assert company_data['forecast_versions'][0]['metrics'] == metrics
+
 # =============================================================================
 # Tests for saving confidence intervals (Step 3)
 # =============================================================================
@@ -0,0 +1,55 @@
+"""
+Tests for the checkpoint manifest of batch runs.
+"""
+
+import json
+
+import pytest
+
+from src.forecasting.run_manifest import PENDING_STATUS, RunManifest, get_manifest_path
+
+
+def test_new_manifest_has_all_companies_pending(tmp_path):
+    """Test that a new manifest lists every company as pending."""
+    manifest = RunManifest('run1', ['A', 'B'], data_folder=str(tmp_path), settings={'mode': 'local'})
+    manifest.save()
+    
+    data = json.loads(get_manifest_path('run1', str(tmp_path)).read_text())
+    assert data['status'] == 'running'
+    assert data['settings'] == {'mode': 'local'}
+    assert [c['status'] for c in data['companies']] == [PENDING_STATUS, PENDING_STATUS]
+    assert manifest.pending_companies == ['A', 'B']
+    assert manifest.results == []
+
+
+def test_record_checkpoints_each_company(tmp_path):
+    """Test that each recorded result is persisted immediately."""
+    manifest = RunManifest('run1', ['A', 'B', 'C'], data_folder=str(tmp_path))
+    manifest.save()
+    
+    manifest.record({'company_id': 'B', 'status': 'Success', 'process_id': 'p-b', 'total_time': 3.0})
+    
+    loaded = RunManifest.load('run1', str(tmp_path))
+    assert loaded.pending_companies == ['A', 'C']
+    assert loaded.companies['B']['process_id'] == 'p-b'
+    assert not get_manifest_path('run1', str(tmp_path)).with_suffix('.json.tmp').exists()
+
+
+def test_failed_companies_are_retried_on_resume(tmp_path):
+    """Test that only errors and unprocessed companies are pending."""
+    manifest = RunManifest('run1', ['A', 'B', 'C', 'D'], data_folder=str(tmp_path))
+    manifest.record({'company_id': 'A', 'status': 'Success', 'process_id': 'p-a'})
+    manifest.record({'company_id': 'B', 'status': 'No forecastable accounts', 'process_id': None})
+    manifest.record({'company_id': 'C', 'status': 'Error: boom', 'process_id': None})
+    manifest.finish('interrupted')
+    
+    loaded = RunManifest.load('run1', str(tmp_path))
+    assert loaded.status == 'interrupted'
+    assert loaded.pending_companies == ['C', 'D']
+    assert [r['company_id'] for r in loaded.results] == ['A', 'B', 'C']
+
+
+def test_load_missing_manifest(tmp_path):
+    """Test that resuming an unknown run raises FileNotFoundError."""
+    with pytest.raises(FileNotFoundError):
+        RunManifest.load('unknown', str(tmp_path))
@@ -0,0 +1,172 @@
+"""
+Tests for data-driven runtime estimation.
+"""
+
+import json
+
+import pytest
+
+from src.forecasting.runtime_estimation import (
+    CostModel,
+    TimingRecord,
+    append_timing_history,
+    engine_key,
+    estimate_runtime,
+    format_duration,
+    get_company_size,
+    load_timing_history,
+    processing_mode,
+)
+
+
+@pytest.fixture
+def data_folder(tmp_path):
+    """Create a data folder with two companies."""
+    for company_id, n_accounts in [('SMALL', 5), ('NEW', 0)]:
+        company_path = tmp_path / company_id
+        company_path.mkdir()
+        versions = []
+        if n_accounts:
+            versions.append({
+                'version_name': 'TabPFN-v1.0',
+                'process_id': 'p1',
+                'meta_data': {f'70{i}000': {'account_type': 'revenue'} for i in range(n_accounts)}
+            })
+        (company_path / 'company.json').write_text(json.dumps({'forecast_versions': versions}))
+    return tmp_path
+
+
+def test_append_and_load_history(tmp_path):
+    """Test that only successful results are appended to the history."""
+    results = [
+        {'company_id': 'A', 'status': 'Success', 'accounts_forecasted': 10,
+         'context_months': 36, 'total_time': 12.5},
+        {'company_id': 'B', 'status': 'Error: boom', 'accounts_forecasted': 0},
+    ]
+    
+    assert append_timing_history(results, mode='local', data_folder=str(tmp_path)) == 1
+    append_timing_history(results, mode='client', data_folder=str(tmp_path))
+    
+    assert len(load_timing_history(str(tmp_path))) == 2
+    local = load_timing_history(str(tmp_path), mode='local')
+    assert [(r.company_id, r.accounts, r.months, r.seconds) for r in local] == [('A', 10, 36, 12.5)]
+
+
+def test_history_records_model_work(tmp_path):
+    """Test that records count the model accounts and the months actually sent."""
+    results = [
+        {'company_id': 'A', 'status': 'Success', 'accounts_forecasted': 30, 'model_accounts': 12,
+         'context_months': 96, 'total_time': 40.0},
+    ]
+    
+    append_timing_history(results, mode='local', data_folder=str(tmp_path), max_context_months=36)
+    
+    [record] = load_timing_history(str(tmp_path))
+    assert (record.accounts, record.months) == (12, 36)
+
+
+def test_history_is_separated_by_engine_and_daemon(tmp_path):
+    """Test that stub, multi-engine and daemon runs do not feed the TabPFN cost model."""
+    results = [
+        {'company_id': 'A', 'status': 'Success', 'accounts_forecasted': 10,
+         'context_months': 36, 'total_time': 100.0},
+    ]
+    folder = str(tmp_path)
+    
+    append_timing_history(results, mode='local', data_folder=folder)
+    append_timing_history(results, mode='local', data_folder=folder, engines=['stub'])
+    append_timing_history(results, mode='local', data_folder=folder, engines=['tabpfn', 'seasonal_naive'])
+    append_timing_history(results, mode='local', data_folder=folder, daemon=True)
+    
+    assert len(load_timing_history(folder)) == 4
+    tabpfn = load_timing_history(folder, mode='local', engines=['tabpfn'], daemon=False)
+    assert len(tabpfn) == 1
+    assert [r.engine for r in load_timing_history(folder, engines=['seasonal_naive', 'tabpfn'])] == [
+        'seasonal_naive+tabpfn'
+    ]
+    assert len(load_timing_history(folder, daemon=True)) == 1
+    assert estimate_runtime(['A'], mode='local', data_folder=folder, engines=['stub']).model.n_samples == 1
+    assert engine_key(['tabpfn', 'stub', 'tabpfn']) == 'stub+tabpfn'
+
+
+def test_overlapping_runs_record_forecast_time(tmp_path):
+    """Test that pipelined and concurrent runs record the forecast stages, not overlapping totals."""
+    stages = {name: {'wall_seconds': seconds, 'cpu_seconds': 0.0, 'peak_rss_mb': None}
+              for name, seconds in [('load', 5.0), ('convert', 1.0), ('predict', 10.0),
+                                    ('extract', 1.0), ('save', 3.0)]}
+    results = [
+        {'company_id': 'A', 'status': 'Success', 'accounts_forecasted': 10,
+         'context_months': 36, 'total_time': 20.0, 'stages': stages},
+    ]
+    folder = str(tmp_path)
+    
+    append_timing_history(results, mode='local', data_folder=folder)
+    append_timing_history(results, mode='local', data_folder=folder, processing='pipelined')
+    append_timing_history(results, mode='client', data_folder=folder, processing='concurrent', concurrency=4)
+    
+    assert [r.seconds for r in load_timing_history(folder)] == [20.0, 12.0, 3.0]
+    pipelined = estimate_runtime(['A'], mode='local', data_folder=folder, processing='pipelined')
+    assert pipelined.model.n_samples == 1
+    assert pipelined.total_seconds == pytest.approx(12.0)
+    assert processing_mode('local', prefetch=0) == 'sequential'
+    assert processing_mode('client', prefetch=2, max_in_flight=4) == 'concurrent'
+
+
+def test_cost_model_fit():
+    """Test the least-squares fit on account-months."""
+    records = [
+        TimingRecord('A', 'local', 10, 24, 30.0),
+        TimingRecord('B', 'local', 20, 24, 50.0),
+        TimingRecord('C', 'local', 40, 24, 90.0),
+    ]
+    
+    model = CostModel.fit(records)
+    
+    assert model.n_samples == 3
+    assert model.intercept == pytest.approx(10.0)
+    assert model.predict(30, 24) == pytest.approx(70.0)
+
+
+def test_cost_model_degenerate_cases():
+    """Test the default model and same-size history."""
+    assert CostModel.fit([], mode='local').predict(100, 100) == pytest.approx(7.7 * 60)
+    
+    same_size = [TimingRecord('A', 'local', 10, 24, s) for s in (10.0, 20.0, 30.0)]
+    model = CostModel.fit(same_size)
+    assert model.per_cell == 0.0
+    assert model.predict(50, 50) == 20.0
+
+
+def test_get_company_size(data_folder):
+    """Test size lookup from history, then company.json."""
+    history = [TimingRecord('SMALL', 'local', 7, 30, 5.0)]
+    
+    assert get_company_size('SMALL', str(data_folder), history) == (7, 30)
+    assert get_company_size('SMALL', str(data_folder), [])[0] == 5
+    assert get_company_size('NEW', str(data_folder), []) is None
+
+
+def test_estimate_runtime_scales_with_size(data_folder):
+    """Test that estimates come from the fitted model and company sizes."""
+    append_timing_history([
+        {'company_id': 'SMALL', 'status': 'Success', 'accounts_forecasted': 5,
+         'context_months': 24, 'total_time': 20.0},
+        {'company_id': 'OTHER', 'status': 'Success', 'accounts_forecasted': 50,
+         'context_months': 24, 'total_time': 200.0},
+    ], mode='local', data_folder=str(data_folder))
+    
+    estimate = estimate_runtime(['SMALL', 'NEW'], mode='local', data_folder=str(data_folder))
+    
+    assert estimate.model.n_samples == 2
+    assert estimate.known_sizes == 1
+    assert estimate.per_company['SMALL'] == pytest.approx(20.0)
+    # Unknown size falls back to the median history size
+    assert estimate.per_company['NEW'] == pytest.approx(108.0)
+    assert estimate.total_seconds == pytest.approx(128.0)
+
+
+def test_format_duration():
+    """Test duration formatting."""
+    assert format_duration(45) == '45 s'
+    assert format_duration(720) == '12 min'
+    assert format_duration(11520) == '3.2 h'
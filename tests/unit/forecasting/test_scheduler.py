@@ -0,0 +1,105 @@
+"""
+Tests for size-aware scheduling of companies.
+"""
+
+import json
+
+import pytest
+
+from src.forecasting.runtime_estimation import append_timing_history
+from src.forecasting.scheduler import (
+    CompanyCost,
+    estimate_company_costs,
+    get_fec_size,
+    schedule_companies,
+)
+
+
+def _cost(company_id, seconds, accounting_up_to_date='2024-12-31'):
+    return CompanyCost(company_id, seconds, None, 0, accounting_up_to_date, 'default')
+
+
+@pytest.fixture
+def data_folder(tmp_path):
+    """Create companies with FEC files of different sizes and no history."""
+    for company_id, fec_size, n_accounts in [('BIG', 8000, 0), ('MID', 2000, 0), ('KNOWN', 1000, 20)]:
+        company_path = tmp_path / company_id
+        company_path.mkdir()
+        (company_path / '2024_12_31.tsv').write_text('x' * fec_size)
+        (company_path / 'notes.md').write_text('y' * 10_000)
+        versions = []
+        if n_accounts:
+            versions.append({'meta_data': {f'6{i:05d}': {} for i in range(n_accounts)}})
+        (company_path / 'company.json').write_text(json.dumps({
+            'accounting_up_to_date': '2024-12-31',
+            'forecast_versions': versions,
+        }))
+    return tmp_path
+
+
+def test_get_fec_size_counts_only_fec_files(data_folder):
+    """Test that only .txt/.csv/.tsv files are counted."""
+    assert get_fec_size('BIG', str(data_folder)) == 8000
+    assert get_fec_size('MISSING', str(data_folder)) == 0
+
+
+def test_estimate_costs_without_history_follows_size(data_folder):
+    """Test that companies are ranked by size even without timing history."""
+    costs = estimate_company_costs(['BIG', 'MID', 'KNOWN'], data_folder=str(data_folder))
+    
+    assert costs['KNOWN'].source == 'metadata'
+    assert costs['BIG'].source == 'fec_size'
+    # FEC size extrapolated with the cells-per-byte ratio of KNOWN
+    assert costs['BIG'].cells == pytest.approx(8 * costs['KNOWN'].cells)
+    assert costs['BIG'].seconds > costs['MID'].seconds > costs['KNOWN'].seconds
+
+
+def test_estimate_costs_uses_fitted_model(data_folder):
+    """Test that the timing history drives the estimates."""
+    results = [
+        {'company_id': 'KNOWN', 'status': 'Success', 'accounts_forecasted': 10,
+         'context_months': 10, 'total_time': 10.0},
+        {'company_id': 'OTHER', 'status': 'Success', 'accounts_forecasted': 20,
+         'context_months': 10, 'total_time': 20.0},
+    ]
+    append_timing_history(results, mode='local', data_folder=str(data_folder))
+    
+    costs = estimate_company_costs(['BIG', 'KNOWN'], data_folder=str(data_folder))
+    
+    assert costs['KNOWN'].source == 'history'
+    assert costs['KNOWN'].seconds == pytest.approx(10.0)
+    # 8x the FEC size of KNOWN -> 800 account-months -> 80 s
+    assert costs['BIG'].seconds == pytest.approx(80.0)
+
+
+def test_schedule_orders_longest_first():
+    """Test that large companies come first, each in its own batch."""
+    costs = {c.company_id: c for c in [_cost('A', 50.0), _cost('B', 100.0), _cost('C', 80.0)]}
+    
+    batches = schedule_companies(costs)
+    
+    assert [batch.company_ids for batch in batches] == [['B'], ['C'], ['A']]
+    assert not any(batch.is_shared for batch in batches)
+
+
+def test_schedule_packs_small_companies_by_accounting_date():
+    """Test that small companies with the same accounting date share batches."""
+    costs = {c.company_id: c for c in [
+        _cost('BIG', 100.0),
+        _cost('S1', 20.0),
+        _cost('S2', 10.0),
+        _cost('S3', 10.0, accounting_up_to_date='2024-06-30'),
+    ]}
+    
+    batches = schedule_companies(costs)
+    
+    assert [batch.company_ids for batch in batches] == [['BIG'], ['S1', 'S2'], ['S3']]
+    assert batches[1].estimated_seconds == pytest.approx(30.0)
+
+
+def test_schedule_respects_batch_limits():
+    """Test the maximum batch size and disabling packing."""
+    costs = {c.company_id: c for c in [_cost('BIG', 100.0)] + [_cost(f'S{i}', 1.0) for i in range(5)]}
+    
+    assert [len(b.company_ids) for b in schedule_companies(costs, max_batch_companies=2)] == [1, 2, 2, 1]
+    assert len(schedule_companies(costs, max_batch_companies=1)) == 6
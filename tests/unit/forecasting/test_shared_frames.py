@@ -0,0 +1,82 @@
+"""
+Tests for wide-format DataFrames in shared memory.
+"""
+
+import gc
+import multiprocessing
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.forecasting.shared_frames import attach_frame, is_shared_descriptor, share_frame
+
+
+@pytest.fixture
+def wide_df():
+    """Create a sample wide-format DataFrame."""
+    dates = pd.date_range('2023-01-01', periods=24, freq='MS', name='ds')
+    return pd.DataFrame({
+        '707000': [1000.0 + i * 100.125 for i in range(24)],
+        '601000': [500.0] * 23 + [float('nan')],
+    }, index=dates)
+
+
+def _sum_in_child(descriptor, queue):
+    with attach_frame(descriptor) as frame:
+        queue.put((list(frame.columns), float(np.nansum(frame.to_numpy()))))
+
+
+def test_attach_frame_round_trip(wide_df):
+    """Test that the attached frame equals the shared one."""
+    with share_frame(wide_df) as shared:
+        assert is_shared_descriptor(shared.descriptor)
+        assert shared.nbytes == 24 * 2 * 8
+        with attach_frame(shared.descriptor) as frame:
+            pd.testing.assert_frame_equal(frame, wide_df, check_freq=False)
+
+
+def test_attach_frame_is_a_read_only_view(wide_df):
+    """Test that the attached frame reads the shared block without copying."""
+    with share_frame(wide_df) as shared:
+        with attach_frame(shared.descriptor) as frame:
+            np.ndarray((24, 2), buffer=shared._shm.buf)[0, 0] = -1.0
+            assert frame.iloc[0, 0] == -1.0
+            with pytest.raises(ValueError):
+                frame.iloc[0, 0] = 0.0
+
+
+def test_attach_frame_view_outliving_context(wide_df):
+    """Test that a view kept after the context stays valid."""
+    with share_frame(wide_df) as shared:
+        with attach_frame(shared.descriptor) as frame:
+            kept = frame
+    
+    assert kept['707000'].iloc[1] == 1100.125
+    del kept, frame
+    gc.collect()
+
+
+def test_attach_frame_in_another_process(wide_df):
+    """Test that a worker process reads the shared values."""
+    context = multiprocessing.get_context('spawn')
+    queue = context.Queue()
+    with share_frame(wide_df) as shared:
+        process = context.Process(target=_sum_in_child, args=(shared.descriptor, queue))
+        process.start()
+        columns, total = queue.get(timeout=60)
+        process.join(timeout=60)
+    
+    assert columns == ['707000', '601000']
+    assert total == pytest.approx(np.nansum(wide_df.to_numpy()))
+
+
+def test_attach_released_frame_fails(wide_df):
+    """Test that a released block cannot be attached."""
+    shared = share_frame(wide_df)
+    descriptor = shared.descriptor
+    shared.close()
+    
+    with pytest.raises(FileNotFoundError):
+        with attach_frame(descriptor):
+            pass
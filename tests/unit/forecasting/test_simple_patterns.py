@@ -0,0 +1,57 @@
+"""
+Tests for the closed-form simple-pattern forecasts.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.forecasting.simple_patterns import classify_simple_patterns, forecast_simple_patterns
+
+
+@pytest.fixture
+def pattern_df():
+    """Three years of accounts with known patterns."""
+    dates = pd.date_range('2022-01-01', periods=36, freq='MS', name='ds')
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        '613200': [800.0] * 36,
+        '616000': [1200.0] * 18 + [1500.0] * 18,
+        '623000': [np.nan] * 11 + [450.0] + [np.nan] * 11 + [470.0] + [np.nan] * 12,
+        '707000': 1000 + rng.normal(0, 300, 36),
+        '606100': [800.0] * 20 + [2000.0] + [800.0] * 15,
+        '625100': [np.nan, np.nan, 300.0] * 12,
+    }, index=dates)
+
+
+def test_classify_simple_patterns(pattern_df):
+    """Test that each rule picks its account and noisy, spiky or quarterly accounts are left out."""
+    patterns = classify_simple_patterns(pattern_df)
+    
+    assert patterns == {'613200': 'Constant', '616000': 'Step Function', '623000': 'Sparse'}
+
+
+def test_classify_simple_patterns_requires_observed_window(pattern_df):
+    """Test that a gap in the recent window prevents the constant rule."""
+    pattern_df.iloc[-3, 0] = np.nan
+    
+    assert '613200' not in classify_simple_patterns(pattern_df)
+
+
+def test_classify_simple_patterns_empty():
+    """Test that an empty frame has no pattern."""
+    assert classify_simple_patterns(pd.DataFrame()) == {}
+
+
+def test_forecast_simple_patterns(pattern_df):
+    """Test the closed-form forecast of each pattern."""
+    index = pd.date_range('2025-01-01', periods=12, freq='MS', name='ds')
+    patterns = classify_simple_patterns(pattern_df)
+    
+    forecast = forecast_simple_patterns(pattern_df, patterns, index)
+    
+    assert list(forecast.columns) == ['613200', '616000', '623000']
+    assert (forecast['613200'] == 800.0).all()
+    assert (forecast['616000'] == 1500.0).all()
+    # One value per year, in December, at its last December amount
+    assert forecast['623000'].tolist() == [0.0] * 11 + [470.0]
@@ -0,0 +1,110 @@
+"""
+Tests for configuration sweeps.
+"""
+
+import csv
+import json
+import sys
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+
+# Mock the tabpfn_time_series module before importing our code
+sys.modules['tabpfn_time_series'] = MagicMock()
+
+from benchmarks.synthetic_fec import SyntheticFECConfig, generate_dataset
+from src.forecasting import sweep as sweep_module
+from src.forecasting.sweep import ConfigSweep, interval_metrics, sweep_grid, write_sweep_report
+from src.forecasting.tabpfn_forecaster import TabPFNForecaster
+
+
+@pytest.fixture
+def data_folder(tmp_path):
+    """Synthetic data folder with two companies."""
+    config = SyntheticFECConfig(n_companies=2, n_years=4, n_accounts=10, lines_per_month=60, seed=3)
+    company_ids = generate_dataset(str(tmp_path), config, with_forecast=False)
+    return str(tmp_path), company_ids
+
+
+def test_sweep_grid_groups_preprocessing():
+    """Test that the grid covers every combination, preprocessing settings varying slowest."""
+    configs = sweep_grid(
+        active_window_months=[12, 24],
+        quantile_sets=[(0.1, 0.5, 0.9), (0.05, 0.5, 0.95)]
+    )
+
+    assert len(configs) == 4
+    assert [config.active_window_months for config in configs] == [12, 12, 24, 24]
+    assert configs[1].name == 'covid=off window=12 context=4096 q=0.05/0.5/0.95'
+
+
+def test_interval_metrics():
+    """Test the coverage and relative width of an interval."""
+    actual = pd.DataFrame({'a': [100.0, 200.0], 'b': [50.0, 50.0]})
+    lower = pd.DataFrame({'a': [90.0, 210.0], 'b': [40.0, 40.0]})
+    upper = pd.DataFrame({'a': [110.0, 230.0], 'b': [60.0, 60.0]})
+
+    metrics = interval_metrics(actual, lower, upper)
+
+    assert metrics['coverage'] == pytest.approx(0.75)
+    assert metrics['interval_width'] == pytest.approx(80.0 / 400.0)
+    assert interval_metrics(actual, None, upper) == {'coverage': None, 'interval_width': None}
+
+
+def test_sweep_loads_and_preprocesses_once(data_folder):
+    """Test that configurations share loading, preprocessing and the model."""
+    folder, company_ids = data_folder
+    configs = sweep_grid(
+        active_window_months=[12, 24],
+        quantile_sets=[(0.1, 0.5, 0.9), (0.05, 0.5, 0.95)]
+    )
+    factory = MagicMock(side_effect=lambda max_context_length: TabPFNForecaster(mode='local', engine='stub'))
+    sweep = ConfigSweep(configs, data_folder=folder, engine='stub', forecaster_factory=factory)
+
+    with patch.object(sweep_module, 'load_fecs', wraps=sweep_module.load_fecs) as load_fecs, \
+         patch.object(sweep_module, 'preprocess_data', wraps=sweep_module.preprocess_data) as preprocess:
+        report = sweep.run(company_ids)
+
+    assert load_fecs.call_count == len(company_ids)
+    assert preprocess.call_count == 2 * len(company_ids)
+    assert factory.call_count == 1
+
+    assert len(report['rows']) == len(configs) * len(company_ids)
+    assert all(row['status'] == 'Success' for row in report['rows'])
+
+    summary = {row['config']: row for row in report['summary']}
+    narrow, wide = summary[configs[0].name], summary[configs[1].name]
+    # Same forecast, wider interval
+    assert narrow['net_income_wape'] == pytest.approx(wide['net_income_wape'])
+    assert wide['coverage'] >= narrow['coverage']
+    assert wide['interval_width'] > narrow['interval_width']
+
+
+def test_sweep_reports_failed_companies(data_folder):
+    """Test that a company failing to load gets an error row per configuration."""
+    folder, company_ids = data_folder
+    configs = sweep_grid(active_window_months=[12, 24])
+    sweep = ConfigSweep(configs, data_folder=folder, engine='stub')
+
+    report = sweep.run([company_ids[0], 'MISSING'])
+
+    statuses = [row['status'] for row in report['rows'] if row['company_id'] == 'MISSING']
+    assert len(statuses) == 2 and all(status.startswith('Error') for status in statuses)
+    assert [row['companies'] for row in report['summary']] == [1, 1]
+
+
+def test_write_sweep_report(data_folder):
+    """Test that the report is written as JSON with its comparison table as CSV."""
+    folder, company_ids = data_folder
+    sweep = ConfigSweep(sweep_grid(), data_folder=folder, engine='stub')
+    report = sweep.run(company_ids[:1])
+
+    report_path = write_sweep_report(report, 'test-run', data_folder=folder, settings={'engine': 'stub'})
+
+    saved = json.loads(report_path.read_text())
+    assert saved['settings'] == {'engine': 'stub'}
+    assert len(saved['summary']) == 1
+    with open(report_path.parent / 'sweep.csv', newline='') as f:
+        rows = list(csv.DictReader(f))
+    assert rows[0]['config'] == 'covid=off window=12 context=4096 q=0.1/0.5/0.9'
@@ -11,6 +11,7 @@ import pytest
 sys.modules['tabpfn_time_series'] = MagicMock()
 
 from src.forecasting.tabpfn_forecaster import TabPFNForecaster, ForecastResult
+from src.forecasting.profiling import StageTimer
 
 
 @pytest.fixture
@@ -172,6 +173,26 @@ def test_forecast_timing_metrics(mock_pipeline_class, sample_wide_format_df):
     assert result.elapsed_time >= 0
 
 
+@patch('src.forecasting.tabpfn_forecaster.TabPFNTSPipeline')
+def test_forecast_records_stage_timings(mock_pipeline_class, sample_wide_format_df):
+    """Test that convert, predict and extract stages are recorded on the timer."""
+    mock_pipeline = Mock()
+    mock_pipeline_class.return_value = mock_pipeline
+    
+    forecast_dates = pd.date_range('2025-01-01', periods=12, freq='MS')
+    mock_pipeline.predict_df.return_value = pd.DataFrame({
+        'timestamp': forecast_dates.tolist() * 2,
+        'target': [1.0] * 24,
+        'item_id': ['707000'] * 12 + ['601000'] * 12
+    })
+    
+    timer = StageTimer()
+    forecaster = TabPFNForecaster(mode='local')
+    forecaster.forecast(sample_wide_format_df, prediction_length=12, timer=timer)
+    
+    assert list(timer.to_dict()) == ['convert', 'predict', 'extract']
+
+
 @patch('src.forecasting.tabpfn_forecaster.TabPFNTSPipeline')
 def test_forecast_with_custom_quantiles(mock_pipeline_class, sample_wide_format_df):
     """Test forecasting with custom quantiles."""
@@ -270,3 +291,93 @@ def test_forecast_result_attributes():
     assert result.elapsed_time == 10.5
     assert result.forecast_lower_df is not None
     assert result.forecast_upper_df is not None
+
+
+@pytest.mark.parametrize('chunk_workers', [1, 3])
+def test_forecast_chunks_accounts_over_row_budget(sample_wide_format_df, chunk_workers):
+    """Test that large inputs are split into predict_df calls and merged back."""
+    from benchmarks.stand_in_server import StandInPredictServer
+    
+    wide = pd.concat(
+        [sample_wide_format_df.add_suffix(f'_{i}') for i in range(3)], axis=1
+    )
+    server = StandInPredictServer(latency=0.0)
+    forecaster = TabPFNForecaster(
+        mode='client', pipeline=server, max_rows_per_call=2 * 24, chunk_workers=chunk_workers
+    )
+    timer = StageTimer()
+    
+    result = forecaster.forecast(wide, prediction_length=6, timer=timer)
+    
+    assert server.calls == 3
+    assert list(result.forecast_df.columns) == list(wide.columns)
+    assert list(result.forecast_lower_df.columns) == list(wide.columns)
+    assert result.forecast_df.shape == (6, 6)
+    assert {'convert', 'predict', 'extract'} <= set(timer.to_dict())
+
+
+def test_forecast_without_chunking(sample_wide_format_df):
+    """Test that max_rows_per_call=None sends everything in one call."""
+    from benchmarks.stand_in_server import StandInPredictServer
+    
+    server = StandInPredictServer(latency=0.0)
+    forecaster = TabPFNForecaster(mode='client', pipeline=server, max_rows_per_call=None)
+    
+    forecaster.forecast(sample_wide_format_df, prediction_length=6)
+    
+    assert server.calls == 1
+
+
+def test_local_forecaster_rejects_parallel_chunks():
+    """Test that a local model cannot predict several chunks at once."""
+    with pytest.raises(ValueError, match='client mode'):
+        TabPFNForecaster(mode='local', pipeline=Mock(), chunk_workers=2)
+
+
+def test_with_settings_shares_the_pipeline():
+    """Test that with_settings returns a configured copy using the same model."""
+    pipeline = Mock()
+    forecaster = TabPFNForecaster(mode='client', pipeline=pipeline, max_rows_per_call=100)
+    
+    configured = forecaster.with_settings(max_rows_per_call=None, chunk_workers=4)
+    
+    assert configured.pipeline is pipeline
+    assert (configured.max_rows_per_call, configured.chunk_workers) == (None, 4)
+    assert (forecaster.max_rows_per_call, forecaster.chunk_workers) == (100, 1)
+    trimmed = forecaster.with_settings(trim_leading_nan=True, max_context_months=24)
+    assert (trimmed.trim_leading_nan, trimmed.max_context_months) == (True, 24)
+    with pytest.raises(ValueError, match='Unknown forecaster settings: mode'):
+        forecaster.with_settings(mode='local')
+    with pytest.raises(ValueError, match='client mode'):
+        TabPFNForecaster(mode='local', pipeline=pipeline).with_settings(chunk_workers=2)
+
+
+def test_forecast_trims_context(sample_wide_format_df):
+    """Test that the context sent to the pipeline is trimmed and capped."""
+    from benchmarks.stand_in_server import StandInPredictServer
+    
+    wide = sample_wide_format_df.copy()
+    wide.iloc[:4, 0] = None
+    server = StandInPredictServer(latency=0.0)
+    forecaster = TabPFNForecaster(
+        mode='client', pipeline=server, trim_leading_nan=True, max_context_months=22
+    )
+    
+    result = forecaster.forecast(wide, prediction_length=6)
+    
+    assert server.rows == 22 * len(wide.columns) - 2
+    assert result.forecast_df.index[0] == wide.index[-1] + pd.offsets.MonthBegin(1)
+
+
+def test_forecast_keeps_full_context_by_default(sample_wide_format_df):
+    """Test that leading NaN months are only trimmed on request."""
+    from benchmarks.stand_in_server import StandInPredictServer
+    
+    wide = sample_wide_format_df.copy()
+    wide.iloc[:4, 0] = None
+    server = StandInPredictServer(latency=0.0)
+    forecaster = TabPFNForecaster(mode='client', pipeline=server)
+    
+    forecaster.forecast(wide, prediction_length=6)
+    
+    assert server.rows == wide.size
@@ -15,6 +15,8 @@ from src.metrics.compute_metrics import (
     compute_swape_df,
     compute_pbias_df,
     compute_all_metrics,
+    compute_metrics_array,
+    METRIC_NAMES,
 )
 
 
@@ -319,3 +321,56 @@ def test_compute_all_metrics_all_series(simple_actual_df, simple_forecast_df, si
     for metric_name, metric_values in metrics.items():
         assert isinstance(metric_values, pd.Series)
         assert len(metric_values) == 2  # Two accounts
+
+
+# ============================================================================
+# ARRAY KERNEL
+# ============================================================================
+
+def test_compute_metrics_array_matches_df_functions(simple_actual_df, simple_forecast_df, simple_naive_df):
+    """Test that the array kernel matches the DataFrame metric functions."""
+    expected = compute_all_metrics(simple_actual_df, simple_forecast_df, simple_naive_df)
+    
+    for account in simple_actual_df.columns:
+        values = compute_metrics_array(
+            simple_actual_df[account].to_numpy(),
+            simple_forecast_df[account].to_numpy()[np.newaxis, :],
+            simple_naive_df[account].to_numpy()
+        )
+        for idx, metric_name in enumerate(METRIC_NAMES):
+            assert values[0, idx] == pytest.approx(expected[metric_name][account])
+
+
+def test_compute_metrics_array_multiple_forecasts():
+    """Test that each forecast row is scored independently."""
+    actual = np.array([100.0, 200.0, 150.0])
+    forecasts = np.array([
+        [110.0, 190.0, 160.0],
+        [100.0, 200.0, 150.0],
+    ])
+    
+    values = compute_metrics_array(actual, forecasts)
+    
+    assert values.shape == (2, len(METRIC_NAMES))
+    assert values[0, METRIC_NAMES.index('WAPE')] == pytest.approx(6.666667, rel=1e-5)
+    assert values[1, METRIC_NAMES.index('NRMSE')] == 0.0
+    # RMSSE undefined without a naive baseline
+    assert np.isnan(values[:, METRIC_NAMES.index('RMSSE')]).all()
+
+
+def test_compute_metrics_array_ignores_missing_steps():
+    """Test that NaN steps are excluded, like aligning on the common index."""
+    actual = np.array([100.0, 200.0, 150.0])
+    partial = np.array([[110.0, np.nan, 160.0]])
+    
+    values = compute_metrics_array(actual, partial)
+    expected = compute_metrics_array(actual[[0, 2]], partial[:, [0, 2]])
+    
+    np.testing.assert_allclose(values, expected)
+
+
+def test_compute_metrics_array_no_overlap():
+    """Test that a forecast without any valid step yields NaN everywhere."""
+    values = compute_metrics_array(np.array([100.0, 110.0]), np.full((1, 2), np.nan))
+    
+    assert np.isnan(values).all()
@@ -9,7 +9,9 @@ from pathlib import Path
 import pandas as pd
 import pytest
 
-from src.metrics.pipeline import compute_metrics_for_company
+from src.data.fec_loader import load_fecs
+from src.data.preprocessing import fec_to_monthly_totals
+from src.metrics.pipeline import compute_metrics_for_company, compute_metrics_from_frames
 
 
 # ============================================================================
@@ -256,3 +258,32 @@ def test_compute_metrics_for_company_missing_process(mock_company_folder):
             process_id="nonexistent-process-id",
             data_folder=mock_company_folder
         )
+
+
+def test_compute_metrics_from_frames_matches_file_pipeline(mock_company_folder):
+    """Test that in-memory metrics equal those computed from the saved files."""
+    company_path = Path(mock_company_folder) / "TEST-COMPANY"
+    company_data = json.loads((company_path / "company.json").read_text())
+    account_metadata = company_data['forecast_versions'][0]['meta_data']
+    forecast_df = pd.read_csv(company_path / "test-process-id" / "gather_result", parse_dates=['ds'], index_col='ds')
+    fecs_train, fecs_test = load_fecs(
+        company_id="TEST-COMPANY",
+        fecs_folder_path=mock_company_folder,
+        accounting_up_to_date=pd.Timestamp("2024-09-30"),
+        train_test_split=True,
+        forecast_horizon=12
+    )
+    
+    in_memory = compute_metrics_from_frames(
+        forecast_df=forecast_df,
+        monthly_train=fec_to_monthly_totals(fecs_train),
+        monthly_test=fec_to_monthly_totals(fecs_test),
+        account_metadata=account_metadata
+    )
+    from_files = compute_metrics_for_company(
+        company_id="TEST-COMPANY",
+        process_id="test-process-id",
+        data_folder=mock_company_folder
+    )
+    
+    assert in_memory == from_files
@@ -0,0 +1,117 @@
+"""
+Tests for the synthetic FEC generator and benchmark suite.
+"""
+
+import json
+
+import pandas as pd
+import pytest
+
+from benchmarks.synthetic_fec import SyntheticFECConfig, generate_company_fec, generate_dataset
+from benchmarks.run_benchmarks import SCENARIOS, BenchmarkContext, compare_reports, run_benchmarks, run_scenario
+from src.data.fec_loader import load_fecs
+from src.data.preprocessing import fec_to_monthly_totals
+
+
+@pytest.fixture
+def small_config():
+    """Create a small synthetic dataset configuration."""
+    return SyntheticFECConfig(n_companies=2, n_years=3, n_accounts=8, lines_per_month=40, seed=7)
+
+
+def test_generator_is_deterministic(small_config):
+    """Test that the same seed yields the same FEC lines."""
+    first = generate_company_fec(small_config, company_index=0)['fec']
+    second = generate_company_fec(small_config, company_index=0)['fec']
+    other = generate_company_fec(small_config, company_index=1)['fec']
+
+    pd.testing.assert_frame_equal(first, second)
+    assert not first.equals(other)
+
+
+def test_generated_fec_has_account_mix_and_journals(small_config):
+    """Test that FEC lines mix 6xx/7xx accounts with AN/AD journals."""
+    fec = generate_company_fec(small_config)['fec']
+
+    accounts = fec['CompteNum']
+    assert accounts.str.startswith('6').any()
+    assert accounts.str.startswith('7').any()
+    assert {'AN', 'AD', 'VT', 'AC'} <= set(fec['JournalCode'])
+    # Main lines plus one counterpart line each
+    assert accounts.str.startswith(('6', '7')).sum() >= 12 * 3 * 40
+
+
+def test_generated_dataset_loads_with_pipeline(tmp_path, small_config):
+    """Test that generated folders load through load_fecs and monthly totals."""
+    company_ids = generate_dataset(str(tmp_path), small_config)
+
+    assert company_ids == ['SYNTH - 1', 'SYNTH - 2']
+    with open(tmp_path / 'SYNTH - 1' / 'company.json') as f:
+        company = json.load(f)
+    assert company['forecast_versions'][0]['process_id'] == 'synthetic-forecast'
+
+    fecs_train, fecs_test = load_fecs('SYNTH - 1', str(tmp_path), pd.Timestamp('2024-12-31'))
+    assert not fecs_train['JournalCode'].isin(['AN', 'AD']).any()
+    assert fecs_test['PieceDate'].min() >= pd.Timestamp('2024-01-01')
+
+    monthly = fec_to_monthly_totals(fecs_train)
+    assert monthly['PieceDate'].nunique() == 24
+    assert monthly['CompteNum'].nunique() == 8
+
+
+def test_run_benchmarks_report(tmp_path, small_config):
+    """Test that the suite produces a comparable JSON report."""
+    report = run_benchmarks(
+        small_config,
+        scenario_names=['import_fecs', 'fec_to_monthly_totals'],
+        repeats=1,
+        data_folder=str(tmp_path)
+    )
+
+    assert [r['scenario'] for r in report['results']] == ['import_fecs', 'fec_to_monthly_totals']
+    assert all(r['best_seconds'] > 0 and r['items'] > 0 for r in report['results'])
+    assert report['config']['seed'] == 7
+    json.dumps(report)
+
+    speedups = compare_reports(report, report)
+    assert speedups == pytest.approx({'import_fecs': 1.0, 'fec_to_monthly_totals': 1.0})
+
+
+def test_run_benchmarks_batch_forecasting(tmp_path, small_config):
+    """Test that the batch forecasting scenario runs on the stub engine."""
+    report = run_benchmarks(
+        small_config,
+        scenario_names=['batch_forecasting'],
+        repeats=1,
+        data_folder=str(tmp_path)
+    )
+
+    assert report['results'][0]['items'] > 0
+
+
+def test_batch_forecasting_leaves_data_folder_unchanged(tmp_path, small_config):
+    """Test that the batch forecasting scenario saves its versions to a copy of the data."""
+    def snapshot():
+        return {
+            path.relative_to(tmp_path): path.read_bytes()
+            for path in tmp_path.rglob('*') if path.is_file()
+        }
+
+    company_ids = generate_dataset(str(tmp_path), small_config)
+    before = snapshot()
+
+    ctx = BenchmarkContext(
+        data_folder=str(tmp_path),
+        company_ids=company_ids,
+        accounting_up_to_date=pd.Timestamp(f"{small_config.end_year}-12-31")
+    )
+    result = run_scenario(SCENARIOS['batch_forecasting'], ctx, repeats=2)
+
+    assert result['items'] > 0
+    assert snapshot() == before
+
+
+def test_run_benchmarks_unknown_scenario(small_config):
+    """Test that unknown scenario names are rejected."""
+    with pytest.raises(ValueError, match="Unknown scenarios"):
+        run_benchmarks(small_config, scenario_names=['does_not_exist'])
@@ -0,0 +1,132 @@
+"""
+Import-time regression tests for the command-line entry points.
+
+Each CLI module is imported in a fresh interpreter and must not pull in the
+heavy scientific / web stack before arguments are parsed. The tests check which
+modules get imported, not wall-clock time, so they do not depend on machine load.
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+import pytest
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+# Modules that must only be imported on the code path that needs them
+HEAVY_MODULES = {
+    'tabpfn_time_series',
+    'tabpfn',
+    'torch',
+    'gluonts',
+    'pandas',
+    'numpy',
+    'statsmodels',
+    'dash',
+    'plotly',
+}
+
+ENTRY_POINTS = [
+    'src.forecasting.cli',
+    'src.metrics.cli',
+    'src.visualization.cli',
+]
+
+
+def measure_imports(module: str) -> Dict[str, int]:
+    """
+    Import a module in a fresh interpreter and collect import times.
+
+    Parameters
+    ----------
+    module : str
+        Dotted module name.
+
+    Returns
+    -------
+    Dict[str, int]
+        Cumulative import time in microseconds for every imported module.
+    """
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+
+    timings = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        timings[name.strip()] = int(cumulative)
+    return timings
+
+
+@pytest.mark.parametrize('module', ENTRY_POINTS)
+def test_entry_point_does_not_import_heavy_modules(module):
+    """Test that CLI modules do not import heavy dependencies at load time."""
+    timings = measure_imports(module)
+
+    imported_heavy = {name for name in timings if name.split('.')[0] in HEAVY_MODULES}
+    assert imported_heavy == set()
+
+
+def loaded_modules(module: str) -> List[str]:
+    """
+    Import a module in a fresh interpreter and list sys.modules afterwards.
+
+    Parameters
+    ----------
+    module : str
+        Dotted module name.
+
+    Returns
+    -------
+    List[str]
+        Names of all modules loaded once the import is done.
+    """
+    completed = subprocess.run(
+        [sys.executable, '-c', f'import json, sys, {module}; print(json.dumps(sorted(sys.modules)))'],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return json.loads(completed.stdout)
+
+
+@pytest.mark.parametrize('module', ENTRY_POINTS)
+def test_entry_point_leaves_model_stack_unloaded(module):
+    """Test that importing a CLI module does not load TabPFN or torch."""
+    loaded = {name.split('.')[0] for name in loaded_modules(module)}
+
+    assert loaded.isdisjoint({'tabpfn_time_series', 'tabpfn', 'torch'})
+
+
+def test_forecasting_help_does_not_need_tabpfn():
+    """Test that --help works without loading the forecasting stack."""
+    completed = subprocess.run(
+        [
+            sys.executable, '-c',
+            'import sys; sys.argv = ["forecast", "--help"]\n'
+            'from src.forecasting.cli import main\n'
+            'try:\n'
+            '    main()\n'
+            'except SystemExit:\n'
+            '    pass\n'
+            'print("tabpfn_time_series" in sys.modules)'
+        ],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+
+    assert '--dry-run' in completed.stdout
+    assert completed.stdout.strip().endswith('False')
@@ -0,0 +1,125 @@
+"""
+Tests for the dashboard callback cache.
+
+Tests memoization of chart and metrics table payloads.
+"""
+
+import pytest
+import pandas as pd
+from dash import Dash
+
+from src.visualization.data_loader import DashboardData
+from src.visualization.callbacks import (
+    build_chart_figure,
+    build_metrics_table,
+    register_callbacks
+)
+from src.visualization.utils.callback_cache import CallbackCache, make_cache_key
+
+
+@pytest.fixture
+def dashboard_data():
+    """Create a small DashboardData instance with two forecast versions."""
+    train_dates = pd.date_range('2023-01-01', periods=12, freq='MS')
+    test_dates = pd.date_range('2024-01-01', periods=12, freq='MS')
+    train = pd.DataFrame({'707000': [100.0 + i for i in range(12)]}, index=train_dates)
+    test = pd.DataFrame({'707000': [110.0 + i for i in range(12)]}, index=test_dates)
+    forecasts = {
+        'TabPFN': pd.DataFrame({'707000': [111.0 + i for i in range(12)]}, index=test_dates),
+        'Prophet': pd.DataFrame({'707000': [109.0 + i for i in range(12)]}, index=test_dates)
+    }
+    return DashboardData(
+        company_id='TEST',
+        accounting_up_to_date=pd.Timestamp('2024-12-31'),
+        train_data=train,
+        test_data=test,
+        forecasts=forecasts,
+        forecast_lower={},
+        forecast_upper={},
+        account_metrics={},
+        aggregated_metrics={},
+        forecast_versions=[
+            {'version_name': 'TabPFN', 'process_id': 'p1'},
+            {'version_name': 'Prophet', 'process_id': 'p2'}
+        ]
+    )
+
+
+class TestCallbackCache:
+    """Tests for CallbackCache."""
+
+    def test_hit_and_miss_counters(self):
+        """Test that repeated keys are served from the cache."""
+        cache = CallbackCache(max_entries=4)
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return {'figure': len(calls)}
+
+        first = cache.get_or_compute(('TEST', '707000', ()), compute)
+        second = cache.get_or_compute(('TEST', '707000', ()), compute)
+
+        assert first is second
+        assert len(calls) == 1
+        assert cache.stats()['hits'] == 1
+        assert cache.stats()['misses'] == 1
+
+    def test_bounded_size_evicts_least_recently_used(self):
+        """Test that the oldest unused entry is evicted when full."""
+        cache = CallbackCache(max_entries=2)
+        cache.get_or_compute('a', lambda: 1)
+        cache.get_or_compute('b', lambda: 2)
+        cache.get_or_compute('a', lambda: 1)  # 'a' becomes most recent
+        cache.get_or_compute('c', lambda: 3)  # evicts 'b'
+
+        assert len(cache) == 2
+        assert cache.get_or_compute('b', lambda: 'recomputed') == 'recomputed'
+        assert cache.stats()['misses'] == 4
+
+    def test_clear_resets_counters(self):
+        """Test that clear empties the cache and resets counters."""
+        cache = CallbackCache()
+        cache.get_or_compute('a', lambda: 1)
+        cache.clear()
+
+        assert cache.stats() == {'hits': 0, 'misses': 0, 'size': 0, 'max_entries': 256}
+
+    def test_invalid_size(self):
+        """Test that a non-positive size is rejected."""
+        with pytest.raises(ValueError, match="max_entries"):
+            CallbackCache(max_entries=0)
+
+    def test_cache_key_ignores_version_order(self):
+        """Test that the version set is order-independent."""
+        key1 = make_cache_key('TEST', '707000', [('A', '1'), ('B', '2')])
+        key2 = make_cache_key('TEST', '707000', [('B', '2'), ('A', '1')])
+        key3 = make_cache_key('TEST', '707000', [('A', '1')])
+
+        assert key1 == key2
+        assert key1 != key3
+
+
+class TestMemoizedCallbacks:
+    """Tests for the memoized chart and table builders."""
+
+    def test_register_callbacks_returns_caches(self, dashboard_data):
+        """Test that register_callbacks exposes its caches."""
+        app = Dash(__name__)
+        caches = register_callbacks(app, dashboard_data, cache_size=8)
+
+        assert set(caches.keys()) == {'chart', 'metrics_table'}
+        assert caches['chart'].max_entries == 8
+
+    def test_build_chart_figure_account(self, dashboard_data):
+        """Test chart building for an individual account."""
+        fig = build_chart_figure(dashboard_data, '707000')
+
+        # train, test and two forecasts
+        assert len(fig.data) == 4
+
+    def test_build_metrics_table_aggregated(self, dashboard_data):
+        """Test metrics table building for an aggregated view."""
+        table = build_metrics_table(dashboard_data, 'AGG:total_revenue')
+
+        assert hasattr(table, 'children')
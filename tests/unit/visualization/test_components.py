@@ -5,6 +5,7 @@ Tests visualization components for time series charts and metrics tables.
 """
 
 import pytest
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 
@@ -92,6 +93,49 @@ class TestTimeSeriesChart:
         
         assert fig.layout.yaxis.title.text == "Custom Label"
 
+    def test_chart_webgl_traces(self, sample_data):
+        """Test that WebGL rendering uses Scattergl traces."""
+        train, test, forecasts = sample_data
+
+        fig = create_forecast_comparison_chart(
+            train_series=train,
+            test_series=test,
+            forecast_series_dict=forecasts,
+            title="Test",
+            use_webgl=True
+        )
+
+        assert len(fig.data) == 4
+        assert all(isinstance(trace, go.Scattergl) for trace in fig.data)
+
+    def test_chart_compact_payload(self, sample_data):
+        """Test float32 values, short dates and smaller JSON."""
+        train, test, forecasts = sample_data
+        lower = {name: series - 10 for name, series in forecasts.items()}
+        upper = {name: series + 10 for name, series in forecasts.items()}
+        kwargs = dict(
+            train_series=train,
+            test_series=test,
+            forecast_series_dict=forecasts,
+            title="Test",
+            forecast_lower_dict=lower,
+            forecast_upper_dict=upper
+        )
+
+        default_fig = create_forecast_comparison_chart(**kwargs)
+        compact_fig = create_forecast_comparison_chart(**kwargs, compact_payload=True)
+
+        assert len(compact_fig.data) == len(default_fig.data)
+        assert compact_fig.data[0].y.dtype == np.float32
+        assert compact_fig.data[0].x[0] == '2023-01-01'
+        # Test and forecast traces have the same dates
+        test_x = compact_fig.data[1].x
+        forecast_x = [trace.x for trace in compact_fig.data if trace.name.startswith('TabPFN')][-1]
+        assert np.array_equal(test_x, forecast_x)
+        np.testing.assert_allclose(compact_fig.data[1].y, test.values, rtol=1e-6)
+
+        assert len(compact_fig.to_json()) < len(default_fig.to_json())
+
 
 class TestMetricsTable:
     """Tests for metrics table component."""
@@ -173,6 +217,28 @@ class TestMetricsTable:
         
         # Both should have the same set of metric keys
         assert set(metrics['TabPFN'].keys()) == set(metrics['Prophet'].keys())
+    
+    def test_compute_metrics_with_seasonal_naive(self):
+        """Test that RMSSE is computed when a seasonal naive series is given."""
+        dates = pd.date_range('2024-01', periods=3, freq='MS')
+        actual = pd.Series([100, 110, 105], index=dates)
+        forecasts = {'TabPFN': pd.Series([102, 108, 107], index=dates)}
+        naive = pd.Series([95, 115, 100], index=dates)
+        
+        metrics = compute_aggregated_metrics_on_the_fly(actual, forecasts, naive)
+        
+        assert metrics['TabPFN']['RMSSE'] == pytest.approx(0.4)
+    
+    def test_compute_metrics_without_seasonal_naive(self):
+        """Test that RMSSE stays None without a seasonal naive series."""
+        dates = pd.date_range('2024-01', periods=3, freq='MS')
+        actual = pd.Series([100, 110, 105], index=dates)
+        forecasts = {'TabPFN': pd.Series([102, 108, 107], index=dates)}
+        
+        metrics = compute_aggregated_metrics_on_the_fly(actual, forecasts)
+        
+        assert metrics['TabPFN']['RMSSE'] is None
+        assert metrics['TabPFN']['MAPE'] is not None
 
 
 class TestMetricsTableIntegration: